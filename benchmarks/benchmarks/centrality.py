@@ -0,0 +1,41 @@
+"""Benchmarks of centrality and link analysis."""
+import networkx as nx
+from .common import graph_kinds, make_graph
+
+
+class Betweenness(object):
+    params = [graph_kinds, [200, 1000]]
+    param_names = ['kind', 'n']
+    timeout = 300
+
+    def setup(self, kind, n):
+        self.G = make_graph(kind, n, weighted=True)
+
+    def time_betweenness_centrality(self, kind, n):
+        nx.betweenness_centrality(self.G)
+
+    def time_betweenness_centrality_weighted(self, kind, n):
+        nx.betweenness_centrality(self.G, weight='weight')
+
+    def time_betweenness_centrality_sampled(self, kind, n):
+        nx.betweenness_centrality(self.G, k=50, seed=1)
+
+    def time_edge_betweenness_centrality(self, kind, n):
+        nx.edge_betweenness_centrality(self.G)
+
+
+class PageRank(object):
+    params = [graph_kinds, [1000, 10000]]
+    param_names = ['kind', 'n']
+
+    def setup(self, kind, n):
+        self.G = make_graph(kind, n, 'DiGraph')
+
+    def time_pagerank(self, kind, n):
+        nx.pagerank(self.G)
+
+    def time_pagerank_scipy(self, kind, n):
+        nx.pagerank_scipy(self.G)
+
+    def peakmem_pagerank_scipy(self, kind, n):
+        nx.pagerank_scipy(self.G)
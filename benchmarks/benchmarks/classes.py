@@ -0,0 +1,75 @@
+"""Benchmarks of building and querying the graph classes."""
+import networkx as nx
+from .common import graph_classes, edge_list, make_graph
+
+
+class Construction(object):
+    params = [graph_classes, [1000, 10000]]
+    param_names = ['graph_class', 'n']
+
+    def setup(self, graph_class, n):
+        self.cls = getattr(nx, graph_class)
+        self.nodes = list(range(n))
+        self.edges = edge_list('gnp', n)
+        self.weighted = [(u, v, {'weight': 1.0}) for u, v in self.edges]
+
+    def time_add_nodes_from(self, graph_class, n):
+        self.cls().add_nodes_from(self.nodes)
+
+    def time_add_edges_from(self, graph_class, n):
+        self.cls().add_edges_from(self.edges)
+
+    def time_add_edges_from_data(self, graph_class, n):
+        self.cls().add_edges_from(self.weighted)
+
+    def time_add_edge(self, graph_class, n):
+        G = self.cls()
+        for u, v in self.edges:
+            G.add_edge(u, v)
+
+    def peakmem_add_edges_from(self, graph_class, n):
+        self.cls().add_edges_from(self.edges)
+
+
+class Mutation(object):
+    params = [graph_classes, [1000, 10000]]
+    param_names = ['graph_class', 'n']
+
+    def setup(self, graph_class, n):
+        self.G = make_graph('gnp', n, graph_class)
+        self.edges = self.G.edges()[::2]
+        self.nodes = self.G.nodes()[::2]
+
+    def time_remove_edges_from(self, graph_class, n):
+        self.G.copy().remove_edges_from(self.edges)
+
+    def time_remove_nodes_from(self, graph_class, n):
+        self.G.copy().remove_nodes_from(self.nodes)
+
+    def time_copy(self, graph_class, n):
+        self.G.copy()
+
+    def time_subgraph(self, graph_class, n):
+        self.G.subgraph(self.nodes)
+
+
+class Reporting(object):
+    params = [graph_classes, [1000, 10000]]
+    param_names = ['graph_class', 'n']
+
+    def setup(self, graph_class, n):
+        self.G = make_graph('gnp', n, graph_class)
+
+    def time_neighbors(self, graph_class, n):
+        G = self.G
+        for u in G:
+            for v in G.neighbors(u):
+                pass
+
+    def time_edges(self, graph_class, n):
+        for e in self.G.edges_iter(data=True):
+            pass
+
+    def time_degree(self, graph_class, n):
+        for d in self.G.degree_iter():
+            pass
@@ -0,0 +1,66 @@
+"""Synthetic graphs shared by the benchmarks.
+
+Graphs are made by the generators of NetworkX with a fixed seed and
+cached, so that every benchmark with the same parameters runs on the same
+graph and setup is only paid once per process.
+"""
+import random
+import networkx as nx
+
+graph_classes = ['Graph', 'DiGraph', 'MultiGraph', 'MultiDiGraph']
+graph_kinds = ['gnp', 'ba', 'grid']
+
+_cache = {}
+
+
+def make_graph(kind, n, graph_class='Graph', weighted=False, seed=42):
+    """Return a cached graph of about n nodes.
+
+    Parameters
+    ----------
+    kind : string
+       'gnp' for a sparse G(n, p) random graph of average degree 8, 'ba'
+       for a Barabasi-Albert graph with 4 edges per new node or 'grid'
+       for a square 2d grid.
+
+    n : int
+       Number of nodes.
+
+    graph_class : string
+       Name of the NetworkX graph class of the result.  Directed graphs
+       have an edge in each direction for every undirected edge.
+
+    weighted : bool
+       If True the edges have random integer 'weight' and 'capacity'
+       attributes between 1 and 100.
+
+    The graph must not be modified by the benchmarks; copy it first.
+    """
+    key = (kind, n, graph_class, weighted, seed)
+    if key not in _cache:
+        if kind == 'gnp':
+            G = nx.fast_gnp_random_graph(n, 8.0 / n, seed=seed)
+        elif kind == 'ba':
+            G = nx.barabasi_albert_graph(n, 4, seed=seed)
+        elif kind == 'grid':
+            side = int(round(n ** 0.5))
+            G = nx.convert_node_labels_to_integers(nx.grid_2d_graph(side,
+                                                                    side))
+        else:
+            raise ValueError('unknown graph kind %r' % (kind,))
+        H = getattr(nx, graph_class)()
+        H.add_nodes_from(G)
+        H.add_edges_from(G.edges_iter())
+        if H.is_directed():
+            H.add_edges_from((v, u) for u, v in G.edges_iter())
+        if weighted:
+            rng = random.Random(seed)
+            for u, v, d in H.edges_iter(data=True):
+                d['weight'] = d['capacity'] = rng.randint(1, 100)
+        _cache[key] = H
+    return _cache[key]
+
+
+def edge_list(kind, n, seed=42):
+    """Return the edges of make_graph(kind, n) as a list of pairs."""
+    return make_graph(kind, n, seed=seed).edges()
@@ -0,0 +1,24 @@
+"""Benchmarks of graph layouts."""
+import networkx as nx
+from .common import make_graph
+
+
+class SpringLayout(object):
+    params = [['exact', 'barnes_hut', 'multilevel'], [1000, 10000]]
+    param_names = ['method', 'n']
+
+    def setup(self, method, n):
+        try:
+            import numpy
+        except ImportError:
+            raise NotImplementedError()
+        if method == 'exact' and n > 1000:
+            # quadratic in the number of nodes
+            raise NotImplementedError()
+        self.G = make_graph('grid', n)
+
+    def time_spring_layout(self, method, n):
+        if method == 'multilevel':
+            nx.spring_layout(self.G, method='barnes_hut', multilevel=True)
+        else:
+            nx.spring_layout(self.G, method=method)
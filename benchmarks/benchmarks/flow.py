@@ -0,0 +1,37 @@
+"""Benchmarks of maximum flow and minimum cut algorithms."""
+import networkx as nx
+from networkx.algorithms import flow
+from .common import graph_kinds, make_graph
+
+flow_funcs = ['edmonds_karp', 'preflow_push', 'shortest_augmenting_path']
+
+
+class MaximumFlow(object):
+    params = [flow_funcs, graph_kinds, [200, 1000]]
+    param_names = ['flow_func', 'kind', 'n']
+
+    def setup(self, flow_func, kind, n):
+        self.G = make_graph(kind, n, 'DiGraph', weighted=True)
+        self.t = len(self.G) - 1
+        self.flow_func = getattr(flow, flow_func)
+
+    def time_maximum_flow_value(self, flow_func, kind, n):
+        nx.maximum_flow_value(self.G, 0, self.t, flow_func=self.flow_func)
+
+    def time_minimum_cut(self, flow_func, kind, n):
+        nx.minimum_cut(self.G, 0, self.t, flow_func=self.flow_func)
+
+
+class Connectivity(object):
+    params = [graph_kinds, [100, 300]]
+    param_names = ['kind', 'n']
+    timeout = 300
+
+    def setup(self, kind, n):
+        self.G = make_graph(kind, n)
+
+    def time_node_connectivity(self, kind, n):
+        nx.node_connectivity(self.G)
+
+    def time_edge_connectivity(self, kind, n):
+        nx.edge_connectivity(self.G)
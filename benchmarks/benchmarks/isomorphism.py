@@ -0,0 +1,33 @@
+"""Benchmarks of graph isomorphism."""
+import random
+import networkx as nx
+from .common import graph_kinds, make_graph
+
+
+def _shuffled(G, seed=42):
+    nodes = G.nodes()
+    labels = nodes[:]
+    random.Random(seed).shuffle(labels)
+    return nx.relabel_nodes(G, dict(zip(nodes, labels)))
+
+
+class Isomorphism(object):
+    params = [graph_kinds, [100, 300]]
+    param_names = ['kind', 'n']
+    timeout = 300
+
+    def setup(self, kind, n):
+        self.G = make_graph(kind, n)
+        self.H = _shuffled(self.G)
+        # a connected piece of H around one node
+        dist = nx.single_source_shortest_path_length(self.H, 0)
+        self.sub = self.H.subgraph(sorted(dist, key=dist.get)[:10])
+
+    def time_is_isomorphic(self, kind, n):
+        nx.is_isomorphic(self.G, self.H)
+
+    def time_could_be_isomorphic(self, kind, n):
+        nx.could_be_isomorphic(self.G, self.H)
+
+    def time_subgraph_is_isomorphic(self, kind, n):
+        nx.isomorphism.GraphMatcher(self.G, self.sub).subgraph_is_isomorphic()
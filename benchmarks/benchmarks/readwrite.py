@@ -0,0 +1,68 @@
+"""Benchmarks of reading and writing graph formats."""
+import os
+import shutil
+import tempfile
+import networkx as nx
+from networkx.readwrite import json_graph
+from .common import make_graph
+
+formats = ['edgelist', 'adjlist', 'multiline_adjlist', 'gml', 'graphml',
+           'gpickle', 'binary']
+
+
+def _write(fmt, G, path):
+    if fmt == 'edgelist':
+        nx.write_edgelist(G, path, data=['weight'])
+    else:
+        getattr(nx, 'write_' + fmt)(G, path)
+
+
+def _read(fmt, path):
+    if fmt == 'edgelist':
+        return nx.read_edgelist(path, nodetype=int,
+                                data=[('weight', int)])
+    if fmt in ('adjlist', 'multiline_adjlist'):
+        return getattr(nx, 'read_' + fmt)(path, nodetype=int)
+    return getattr(nx, 'read_' + fmt)(path)
+
+
+class ReadWrite(object):
+    params = [formats, [1000, 10000]]
+    param_names = ['format', 'n']
+
+    def setup(self, fmt, n):
+        self.G = make_graph('gnp', n, weighted=True)
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'graph.' + fmt)
+        try:
+            _write(fmt, self.G, self.path)
+        except ImportError:
+            self.teardown(fmt, n)
+            raise NotImplementedError()
+
+    def teardown(self, fmt, n):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def time_write(self, fmt, n):
+        _write(fmt, self.G, self.path)
+
+    def time_read(self, fmt, n):
+        _read(fmt, self.path)
+
+    def peakmem_read(self, fmt, n):
+        _read(fmt, self.path)
+
+
+class JSONGraph(object):
+    params = [[1000, 10000]]
+    param_names = ['n']
+
+    def setup(self, n):
+        self.G = make_graph('gnp', n, weighted=True)
+        self.data = json_graph.node_link_data(self.G)
+
+    def time_node_link_data(self, n):
+        json_graph.node_link_data(self.G)
+
+    def time_node_link_graph(self, n):
+        json_graph.node_link_graph(self.data)
@@ -0,0 +1,39 @@
+"""Benchmarks of shortest path algorithms."""
+import networkx as nx
+from .common import graph_kinds, make_graph
+
+
+class UnweightedPaths(object):
+    params = [graph_kinds, [1000, 10000]]
+    param_names = ['kind', 'n']
+
+    def setup(self, kind, n):
+        self.G = make_graph(kind, n)
+        self.t = len(self.G) - 1
+
+    def time_single_source_shortest_path_length(self, kind, n):
+        nx.single_source_shortest_path_length(self.G, 0)
+
+    def time_bidirectional_shortest_path(self, kind, n):
+        nx.bidirectional_shortest_path(self.G, 0, self.t)
+
+
+class Dijkstra(object):
+    params = [['Graph', 'DiGraph'], graph_kinds, [1000, 10000]]
+    param_names = ['graph_class', 'kind', 'n']
+
+    def setup(self, graph_class, kind, n):
+        self.G = make_graph(kind, n, graph_class, weighted=True)
+        self.t = len(self.G) - 1
+
+    def time_single_source_dijkstra(self, graph_class, kind, n):
+        nx.single_source_dijkstra(self.G, 0)
+
+    def time_single_source_dijkstra_path_length(self, graph_class, kind, n):
+        nx.single_source_dijkstra_path_length(self.G, 0)
+
+    def time_bidirectional_dijkstra(self, graph_class, kind, n):
+        nx.bidirectional_dijkstra(self.G, 0, self.t)
+
+    def peakmem_single_source_dijkstra(self, graph_class, kind, n):
+        nx.single_source_dijkstra(self.G, 0)
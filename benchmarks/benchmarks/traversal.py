@@ -0,0 +1,31 @@
+"""Benchmarks of graph traversals and connectivity."""
+import networkx as nx
+from .common import graph_kinds, make_graph
+
+
+class Traversal(object):
+    params = [graph_kinds, [1000, 10000]]
+    param_names = ['kind', 'n']
+
+    def setup(self, kind, n):
+        self.G = make_graph(kind, n)
+        self.D = make_graph(kind, n, 'DiGraph')
+
+    def time_bfs_edges(self, kind, n):
+        for e in nx.bfs_edges(self.G, 0):
+            pass
+
+    def time_dfs_edges(self, kind, n):
+        for e in nx.dfs_edges(self.G, 0):
+            pass
+
+    def time_connected_components(self, kind, n):
+        for c in nx.connected_components(self.G):
+            pass
+
+    def time_strongly_connected_components(self, kind, n):
+        for c in nx.strongly_connected_components(self.D):
+            pass
+
+    def time_core_number(self, kind, n):
+        nx.core_number(self.G)
@@ -0,0 +1,251 @@
+#!/usr/bin/env python
+"""Run the NetworkX benchmarks and compare results between commits.
+
+The benchmarks in the benchmarks package follow the conventions of
+airspeed velocity (asv, http://asv.readthedocs.org/), which can be used
+to track them over the history of the repository.  This script runs the
+same benchmarks without asv against the networkx found on the path and
+saves the results as JSON::
+
+    python benchmarks/run.py -o before.json
+    (change or check out another commit)
+    python benchmarks/run.py -o after.json
+    python benchmarks/run.py compare before.json after.json
+
+Each benchmark class may have lists of parameter values in params, with
+their names in param_names, and setup() and teardown() methods called
+with the parameters.  Methods named time_* are timed, and the peak
+memory allocated while running them once is recorded as well; methods
+named peakmem_* only have their memory recorded.  Raising
+NotImplementedError in setup() skips the benchmark.
+"""
+from __future__ import print_function
+import argparse
+import datetime
+import gc
+import importlib
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import sys
+import timeit
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def discover(pattern=None):
+    """Generate (name, class, method name) for the benchmarks whose
+    dotted name matches the regular expression pattern.
+    """
+    import benchmarks
+    for _, modname, _ in pkgutil.iter_modules(benchmarks.__path__):
+        if modname == 'common':
+            continue
+        module = importlib.import_module('benchmarks.' + modname)
+        classes = inspect.getmembers(module, inspect.isclass)
+        for clsname, cls in sorted(classes):
+            if cls.__module__ != module.__name__:
+                continue
+            for attr in sorted(dir(cls)):
+                if not attr.startswith(('time_', 'peakmem_')):
+                    continue
+                name = '.'.join((modname, clsname, attr))
+                if pattern is None or re.search(pattern, name):
+                    yield name, cls, attr
+
+
+def param_sets(cls):
+    params = getattr(cls, 'params', [])
+    if params and not isinstance(params[0], (list, tuple)):
+        params = [params]
+    return list(itertools.product(*params))
+
+
+def measure_time(func, repeat, min_time):
+    """Return the best and median time of a call of func."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        t = timer.timeit(number)
+        if t >= min_time or number >= 1e6:
+            break
+        number *= 10 if t < min_time / 10 else 2
+    times = [t / number] + [t / number
+                            for t in timer.repeat(repeat - 1, number)]
+    times.sort()
+    return times[0], times[len(times) // 2]
+
+
+def measure_memory(func):
+    """Return the peak memory in bytes allocated by a call of func."""
+    if tracemalloc is None:
+        return None
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_one(cls, attr, params, repeat, min_time):
+    bench = cls()
+    try:
+        if hasattr(bench, 'setup'):
+            bench.setup(*params)
+    except NotImplementedError:
+        return None
+    try:
+        method = getattr(bench, attr)
+        func = lambda: method(*params)
+        result = {'peakmem': measure_memory(func)}
+        if attr.startswith('time_'):
+            result['time'], result['time_median'] = \
+                measure_time(func, repeat, min_time)
+        return result
+    finally:
+        if hasattr(bench, 'teardown'):
+            bench.teardown(*params)
+
+
+def git_commit():
+    try:
+        out = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=HERE,
+                                      stderr=subprocess.STDOUT)
+        return out.decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    import networkx
+    results = {}
+    for name, cls, attr in discover(args.bench):
+        names = getattr(cls, 'param_names', [])
+        for params in param_sets(cls):
+            key = name
+            if params:
+                key += '(%s)' % ', '.join('%s=%s' % p
+                                          for p in zip(names, params))
+            try:
+                result = run_one(cls, attr, params, args.repeat,
+                                 args.min_time)
+            except Exception as e:
+                result = {'error': '%s: %s' % (type(e).__name__, e)}
+            if result is None:
+                continue
+            results[key] = result
+            print(format_result(key, result))
+            sys.stdout.flush()
+    data = {'commit': git_commit(),
+            'networkx': networkx.__version__,
+            'python': platform.python_version(),
+            'machine': platform.platform(),
+            'date': datetime.datetime.utcnow().isoformat(),
+            'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+
+
+def format_time(t):
+    for unit, scale in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if t * scale >= 1:
+            return '%.3g%s' % (t * scale, unit)
+    return '%.3gns' % (t * 1e9)
+
+
+def format_memory(m):
+    for unit, scale in (('M', 2 ** 20), ('k', 2 ** 10)):
+        if m >= scale:
+            return '%.3g%s' % (m / float(scale), unit)
+    return '%d' % m
+
+
+def format_result(key, result):
+    if 'error' in result:
+        return '%s: failed (%s)' % (key, result['error'])
+    cols = []
+    if 'time' in result:
+        cols.append(format_time(result['time']))
+    if result['peakmem'] is not None:
+        cols.append(format_memory(result['peakmem']))
+    return '%s: %s' % (key, ' '.join(cols))
+
+
+def compare(args):
+    """Print the ratios of the times and memory of two result files.
+
+    Return 1 if a benchmark got slower or bigger by more than the factor.
+    """
+    with open(args.old) as f:
+        old = json.load(f)['results']
+    with open(args.new) as f:
+        new = json.load(f)['results']
+    status = 0
+    for key in sorted(set(old) & set(new)):
+        cols = []
+        worse = changed = False
+        for field in ('time', 'peakmem'):
+            a = old[key].get(field)
+            b = new[key].get(field)
+            if not a or b is None:
+                continue
+            ratio = b / float(a)
+            worse = worse or ratio > args.factor
+            changed = changed or worse or ratio < 1.0 / args.factor
+            cols.append('%s %.2f' % (field, ratio))
+        if cols and (changed or not args.only_changed):
+            print('%s %s: %s' % ('!' if worse else ' ', key, ', '.join(cols)))
+        if worse:
+            status = 1
+    for key in sorted(set(old) ^ set(new)):
+        print('  %s: only in %s' % (key, args.old if key in old
+                                         else args.new))
+    return status
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    sub = parser.add_subparsers(dest='command')
+    p = sub.add_parser('run', help='run the benchmarks')
+    p.add_argument('-b', '--bench', default=None,
+                   help='regular expression selecting the benchmarks')
+    p.add_argument('-o', '--output', default=None,
+                   help='JSON file to save the results to')
+    p.add_argument('--repeat', type=int, default=3,
+                   help='number of timings kept for each benchmark')
+    p.add_argument('--min-time', type=float, default=0.1,
+                   help='minimum time in seconds of each timing')
+    p = sub.add_parser('compare', help='compare two result files')
+    p.add_argument('old')
+    p.add_argument('new')
+    p.add_argument('-f', '--factor', type=float, default=1.1,
+                   help='ratio above which a change is a regression')
+    p.add_argument('--only-changed', action='store_true',
+                   help='only list the benchmarks that changed by more '
+                        'than the factor')
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ('run', 'compare', '-h', '--help'):
+        argv = ['run'] + list(argv)
+    args = parser.parse_args(argv)
+    sys.path.insert(0, HERE)
+    if args.command == 'compare':
+        return compare(args)
+    run(args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -60,8 +60,10 @@ from networkx.algorithms.connectivity import (minimum_edge_cut, minimum_node_cut
     stoer_wagner, all_pairs_node_connectivity)
 # isomorphism
 from networkx.algorithms.isomorphism import (is_isomorphic, could_be_isomorphic,
-    fast_could_be_isomorphic, faster_could_be_isomorphic)
+    fast_could_be_isomorphic, faster_could_be_isomorphic,
+    weisfeiler_lehman_graph_hash, canonical_labeling, canonical_form)
 # flow
 from networkx.algorithms.flow import (maximum_flow, maximum_flow_value,
     minimum_cut, minimum_cut_value, capacity_scaling, network_simplex,
-    min_cost_flow_cost, max_flow_min_cost, min_cost_flow, cost_of_flow)
+    min_cost_flow_cost, max_flow_min_cost, min_cost_flow, cost_of_flow,
+    gomory_hu_tree, gomory_hu_cut, gomory_hu_cut_value)
@@ -4,15 +4,17 @@
 #   Jordi Torrents <jtorrents@milnou.net>
 #   All rights reserved.
 #   BSD license.
+from bisect import bisect_right
+import math
 import random
 from networkx.utils import not_implemented_for
 
-__all__ = ['average_clustering']
+__all__ = ['average_clustering', 'transitivity', 'trials_for_error']
 __author__ = """\n""".join(['Fred Morstatter <fred.morstatter@asu.edu>',
                             'Jordi Torrents <jtorrents@milnou.net>'])
 
 @not_implemented_for('directed')
-def average_clustering(G, trials=1000):
+def average_clustering(G, trials=1000, seed=None):
     r"""Estimates the average clustering coefficient of G.
 
     The local clustering of each node in `G` is the fraction of triangles
@@ -34,11 +36,28 @@ def average_clustering(G, trials=1000):
     trials : integer
         Number of trials to perform (default 1000).
 
+    seed : integer, optional
+        Seed for the random number generator.
+
     Returns
     -------
     c : float
         Approximated average clustering coefficient.
 
+    Notes
+    -----
+    Each trial is an independent 0-1 variable whose mean is the average
+    clustering coefficient, so by Hoeffding's inequality the estimate
+    is within `\epsilon` of it with probability at least
+    `1 - 2 e^{-2 t \epsilon^2}` for `t` trials, whatever the size of
+    the graph.  trials_for_error() returns the number of trials needed
+    for a given error and confidence.
+
+    See Also
+    --------
+    trials_for_error
+    networkx.average_clustering
+
     References
     ----------
     .. [1] Schank, Thomas, and Dorothea Wagner. Approximating clustering
@@ -47,6 +66,8 @@ def average_clustering(G, trials=1000):
        http://www.emis.ams.org/journals/JGAA/accepted/2005/SchankWagner2005.9.2.pdf
 
     """
+    if seed is not None:
+        random.seed(seed)
     n = len(G)
     triangles = 0
     nodes = G.nodes()
@@ -58,3 +79,116 @@ def average_clustering(G, trials=1000):
         if u in G[v]:
             triangles += 1
     return triangles / float(trials)
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def transitivity(G, trials=1000, seed=None):
+    r"""Estimates the transitivity of G.
+
+    The transitivity of `G` is the fraction of the paths of length two
+    (wedges) in `G` whose ends are connected, closing a triangle.
+
+    This function finds an approximate transitivity for G by repeating
+    `n` times (defined in `trials`) the following experiment: choose a
+    wedge uniformly at random, by choosing its center with probability
+    proportional to the number of wedges centered at each node and then
+    two of its neighbors at random, and check if its ends are
+    connected.  The approximate transitivity is the fraction of closed
+    wedges found over the number of trials [1]_.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    trials : integer
+        Number of trials to perform (default 1000).
+
+    seed : integer, optional
+        Seed for the random number generator.
+
+    Returns
+    -------
+    t : float
+        Approximated transitivity.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> from networkx.algorithms import approximation as approx
+    >>> G = nx.complete_graph(5)
+    >>> approx.transitivity(G, trials=100)
+    1.0
+
+    Notes
+    -----
+    As for average_clustering(), the estimate is within `\epsilon` of
+    the transitivity with probability at least
+    `1 - 2 e^{-2 t \epsilon^2}` for `t` trials.  Self loops are ignored.
+
+    See Also
+    --------
+    trials_for_error
+    networkx.transitivity
+
+    References
+    ----------
+    .. [1] Schank, Thomas, and Dorothea Wagner. Approximating clustering
+       coefficient and transitivity. Universität Karlsruhe, Fakultät für
+       Informatik, 2004.
+       http://www.emis.ams.org/journals/JGAA/accepted/2005/SchankWagner2005.9.2.pdf
+    """
+    if seed is not None:
+        random.seed(seed)
+    centers = []
+    cumulative = []
+    wedges = 0
+    for v, nbrs in G.adj.items():
+        d = len(nbrs) - (v in nbrs)
+        if d > 1:
+            wedges += d * (d - 1)
+            centers.append(v)
+            cumulative.append(wedges)
+    if wedges == 0:
+        return 0.0
+    closed = 0
+    for i in range(trials):
+        v = centers[bisect_right(cumulative, random.random() * wedges)]
+        u, w = random.sample([u for u in G[v] if u != v], 2)
+        if u in G[w]:
+            closed += 1
+    return closed / float(trials)
+
+
+def trials_for_error(epsilon, delta=0.05):
+    r"""Return the number of trials for which the estimates of
+    average_clustering() and transitivity() are within epsilon of the
+    exact value with probability at least 1 - delta.
+
+    The number of trials is `\lceil \ln(2/\delta) / (2 \epsilon^2)
+    \rceil` by Hoeffding's inequality, independently of the size of
+    the graph.
+
+    Parameters
+    ----------
+    epsilon : float
+        Absolute error, between 0 and 1.
+
+    delta : float
+        Probability that the error is larger than epsilon, between 0
+        and 1 (default 0.05).
+
+    Returns
+    -------
+    trials : integer
+        Number of trials.
+
+    Examples
+    --------
+    >>> from networkx.algorithms import approximation as approx
+    >>> approx.trials_for_error(0.01)
+    18445
+    """
+    if not 0 < epsilon < 1 or not 0 < delta < 1:
+        raise ValueError('epsilon and delta must be between 0 and 1.')
+    return int(math.ceil(math.log(2.0 / delta) / (2.0 * epsilon ** 2)))
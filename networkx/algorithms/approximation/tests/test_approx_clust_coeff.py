@@ -1,6 +1,8 @@
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_raises, assert_true
 import networkx as nx
 from networkx.algorithms.approximation import average_clustering
+from networkx.algorithms.approximation import transitivity
+from networkx.algorithms.approximation import trials_for_error
 
 # This approximation has to be be exact in regular graphs 
 # with no triangles or with all possible triangles.
@@ -31,3 +33,38 @@ def test_complete():
     assert_equal(average_clustering(G, trials=int(len(G)/2)), 1)
     G = nx.complete_graph(7)
     assert_equal(average_clustering(G, trials=int(len(G)/2)), 1)
+
+def test_transitivity_exact():
+    # Exact when no wedge or every wedge is closed.
+    for G in (nx.petersen_graph(), nx.complete_graph(6), nx.empty_graph(5),
+              nx.path_graph(2)):
+        assert_equal(transitivity(G, trials=10), nx.transitivity(G))
+
+def test_seed():
+    G = nx.gnp_random_graph(100, 0.1, seed=3)
+    assert_equal(average_clustering(G, seed=42),
+                 average_clustering(G, seed=42))
+    assert_equal(transitivity(G, seed=42), transitivity(G, seed=42))
+
+def test_no_seed_keeps_global_state():
+    # Without a seed the global random state is used, not reseeded.
+    import random
+    G = nx.gnp_random_graph(100, 0.1, seed=3)
+    for f in (average_clustering, transitivity):
+        values = []
+        for i in range(2):
+            random.seed(7)
+            f(G, trials=10)
+            values.append(random.random())
+        assert_equal(values[0], values[1])
+
+def test_error_bound():
+    G = nx.powerlaw_cluster_graph(300, 3, 0.5, seed=2)
+    G.add_edge(0, 0)
+    trials = trials_for_error(0.05, 0.001)
+    assert_true(abs(transitivity(G, trials, seed=1) -
+                    nx.transitivity(G)) < 0.05)
+    assert_true(abs(average_clustering(G, trials, seed=1) -
+                    nx.average_clustering(G)) < 0.05)
+    assert_raises(ValueError, trials_for_error, 0)
+    assert_raises(ValueError, trials_for_error, 0.1, 1)
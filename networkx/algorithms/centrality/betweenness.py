@@ -8,20 +8,26 @@ Betweenness centrality measures.
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
+from functools import partial
 from heapq import heappush, heappop
 from itertools import count
 import networkx as nx
+from networkx.utils import n_processes, parallel_imap
 import random
 __author__ = """Aric Hagberg (hagberg@lanl.gov)"""
 
 __all__ = ['betweenness_centrality',
            'edge_betweenness_centrality',
-           'edge_betweenness']
+           'edge_betweenness',
+           'betweenness_centrality_partial',
+           'edge_betweenness_centrality_partial',
+           'merge_betweenness',
+           'merge_edge_betweenness']
 
 
 def betweenness_centrality(G, k=None, normalized=True, weight=None,
                            endpoints=False,
-                           seed=None):
+                           seed=None, n_jobs=None):
     r"""Compute the shortest-path betweenness centrality for nodes.
 
     Betweenness centrality of a node `v` is the sum of the
@@ -59,6 +65,10 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     endpoints : bool, optional
       If True include the endpoints in the shortest path counts.
 
+    n_jobs : int, optional (default=None)
+      If not None, split the sources across this many worker processes
+      (-1 for one per CPU).  See networkx.utils.parallel_imap().
+
     Returns
     -------
     nodes : dictionary
@@ -67,6 +77,7 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
     See Also
     --------
     edge_betweenness_centrality
+    betweenness_centrality_partial
     load_centrality
 
     Notes
@@ -104,32 +115,23 @@ def betweenness_centrality(G, k=None, normalized=True, weight=None,
        http://moreno.ss.uci.edu/23.pdf
 
     """
-    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
     if k is None:
         nodes = G
     else:
         random.seed(seed)
         nodes = random.sample(G.nodes(), k)
-    for s in nodes:
-        # single source shortest paths
-        if weight is None:  # use BFS
-            S, P, sigma = _single_source_shortest_path_basic(G, s)
-        else:  # use Dijkstra's algorithm
-            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
-        # accumulation
-        if endpoints:
-            betweenness = _accumulate_endpoints(betweenness, S, P, sigma, s)
-        else:
-            betweenness = _accumulate_basic(betweenness, S, P, sigma, s)
-    # rescaling
-    betweenness = _rescale(betweenness, len(G),
-                           normalized=normalized,
-                           directed=G.is_directed(),
-                           k=k)
-    return betweenness
+    if n_jobs is None:
+        partials = [betweenness_centrality_partial(G, nodes, weight,
+                                                   endpoints)]
+    else:
+        func = partial(betweenness_centrality_partial, weight=weight,
+                       endpoints=endpoints)
+        partials = _parallel_partials(func, G, nodes, n_jobs)
+    return merge_betweenness(G, partials, normalized=normalized, k=k)
 
 
-def edge_betweenness_centrality(G, normalized=True, weight=None):
+def edge_betweenness_centrality(G, normalized=True, weight=None,
+                                n_jobs=None):
     r"""Compute betweenness centrality for edges.
 
     Betweenness centrality of an edge `e` is the sum of the
@@ -157,6 +159,10 @@ def edge_betweenness_centrality(G, normalized=True, weight=None):
       If None, all edge weights are considered equal.
       Otherwise holds the name of the edge attribute used as weight.
 
+    n_jobs : int, optional (default=None)
+      If not None, split the sources across this many worker processes
+      (-1 for one per CPU).  See networkx.utils.parallel_imap().
+
     Returns
     -------
     edges : dictionary
@@ -165,6 +171,7 @@ def edge_betweenness_centrality(G, normalized=True, weight=None):
     See Also
     --------
     betweenness_centrality
+    edge_betweenness_centrality_partial
     edge_load
 
     Notes
@@ -185,10 +192,114 @@ def edge_betweenness_centrality(G, normalized=True, weight=None):
        Social Networks 30(2):136-145, 2008.
        http://www.inf.uni-konstanz.de/algo/publications/b-vspbc-08.pdf
     """
+    if n_jobs is None:
+        partials = [edge_betweenness_centrality_partial(G, G, weight)]
+    else:
+        func = partial(edge_betweenness_centrality_partial, weight=weight)
+        partials = _parallel_partials(func, G, G, n_jobs)
+    return merge_edge_betweenness(G, partials, normalized=normalized)
+
+# obsolete name
+
+
+def edge_betweenness(G, normalized=True, weight=None):
+    return edge_betweenness_centrality(G, normalized, weight)
+
+
+def betweenness_centrality_partial(G, sources, weight=None, endpoints=False):
+    """Compute the betweenness contributions of shortest paths from sources.
+
+    The result is the unnormalized sum, over the given sources, of the
+    dependencies computed by Brandes' algorithm.  Partial results for
+    disjoint sets of sources can be computed separately, e.g. in
+    different processes or on different machines, and then combined
+    with merge_betweenness().
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    sources : iterable of nodes
+      The source nodes whose shortest paths are counted.
+
+    weight : None or string, optional
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    endpoints : bool, optional
+      If True include the endpoints in the shortest path counts.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with unnormalized partial betweenness as the
+       value.
+
+    See Also
+    --------
+    merge_betweenness
+    betweenness_centrality
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> b1 = nx.betweenness_centrality_partial(G, [0, 1])
+    >>> b2 = nx.betweenness_centrality_partial(G, [2, 3])
+    >>> b = nx.merge_betweenness(G, [b1, b2])
+    >>> b == nx.betweenness_centrality(G)
+    True
+    """
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    for s in sources:
+        # single source shortest paths
+        if weight is None:  # use BFS
+            S, P, sigma = _single_source_shortest_path_basic(G, s)
+        else:  # use Dijkstra's algorithm
+            S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
+        # accumulation
+        if endpoints:
+            betweenness = _accumulate_endpoints(betweenness, S, P, sigma, s)
+        else:
+            betweenness = _accumulate_basic(betweenness, S, P, sigma, s)
+    return betweenness
+
+
+def edge_betweenness_centrality_partial(G, sources, weight=None):
+    """Compute the edge betweenness contributions of paths from sources.
+
+    The result is the unnormalized sum, over the given sources, of the
+    edge dependencies computed by Brandes' algorithm.  Partial results
+    for disjoint sets of sources can be combined with
+    merge_edge_betweenness().
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph
+
+    sources : iterable of nodes
+      The source nodes whose shortest paths are counted.
+
+    weight : None or string, optional
+      If None, all edge weights are considered equal.
+      Otherwise holds the name of the edge attribute used as weight.
+
+    Returns
+    -------
+    edges : dictionary
+       Dictionary of edges with unnormalized partial betweenness as the
+       value.
+
+    See Also
+    --------
+    merge_edge_betweenness
+    edge_betweenness_centrality
+    """
     betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
     # b[e]=0 for e in G.edges()
     betweenness.update(dict.fromkeys(G.edges(), 0.0))
-    for s in G:
+    for s in sources:
         # single source shortest paths
         if weight is None:  # use BFS
             S, P, sigma = _single_source_shortest_path_basic(G, s)
@@ -196,19 +307,103 @@ def edge_betweenness_centrality(G, normalized=True, weight=None):
             S, P, sigma = _single_source_dijkstra_path_basic(G, s, weight)
         # accumulation
         betweenness = _accumulate_edges(betweenness, S, P, sigma, s)
-    # rescaling
     for n in G:  # remove nodes to only return edges
         del betweenness[n]
+    return betweenness
+
+
+def merge_betweenness(G, partials, normalized=True, k=None):
+    """Combine partial betweenness results into betweenness centrality.
+
+    Parameters
+    ----------
+    G : graph
+      The NetworkX graph the partial results were computed on.
+
+    partials : iterable of dictionaries
+      Results of betweenness_centrality_partial() for disjoint sets of
+      sources.
+
+    normalized : bool, optional
+      If True the betweenness values are normalized as in
+      betweenness_centrality().
+
+    k : int, optional (default=None)
+      The total number of sources if the partial results do not cover
+      all nodes; the result is then scaled as an estimate from k
+      samples.
+
+    Returns
+    -------
+    nodes : dictionary
+       Dictionary of nodes with betweenness centrality as the value.
+
+    See Also
+    --------
+    betweenness_centrality_partial
+    """
+    betweenness = dict.fromkeys(G, 0.0)  # b[v]=0 for v in G
+    for b in partials:
+        for v, c in b.items():
+            betweenness[v] += c
+    # rescaling
+    betweenness = _rescale(betweenness, len(G),
+                           normalized=normalized,
+                           directed=G.is_directed(),
+                           k=k)
+    return betweenness
+
+
+def merge_edge_betweenness(G, partials, normalized=True):
+    """Combine partial edge betweenness results into edge betweenness.
+
+    Parameters
+    ----------
+    G : graph
+      The NetworkX graph the partial results were computed on.
+
+    partials : iterable of dictionaries
+      Results of edge_betweenness_centrality_partial() for disjoint sets
+      of sources.
+
+    normalized : bool, optional
+      If True the betweenness values are normalized as in
+      edge_betweenness_centrality().
+
+    Returns
+    -------
+    edges : dictionary
+       Dictionary of edges with betweenness centrality as the value.
+
+    See Also
+    --------
+    edge_betweenness_centrality_partial
+    """
+    # b[e]=0 for e in G.edges()
+    betweenness = dict.fromkeys(G.edges(), 0.0)
+    for b in partials:
+        for (u, v), c in b.items():
+            # partials from another process may orient undirected edges
+            # the other way round
+            if (u, v) in betweenness:
+                betweenness[(u, v)] += c
+            else:
+                betweenness[(v, u)] += c
+    # rescaling
     betweenness = _rescale_e(betweenness, len(G),
                              normalized=normalized,
                              directed=G.is_directed())
     return betweenness
 
-# obsolete name
-
 
-def edge_betweenness(G, normalized=True, weight=None):
-    return edge_betweenness_centrality(G, normalized, weight)
+def _parallel_partials(func, G, sources, n_jobs):
+    """Generate func(G, chunk) for chunks of sources in worker processes."""
+    sources = list(sources)
+    n_chunks = 4 * n_processes(n_jobs)
+    size = max(-(-len(sources) // n_chunks), 1)
+    chunks = [sources[i:i + size] for i in range(0, len(sources), size)]
+    return (b for chunk, b in parallel_imap(func, G, chunks, n_jobs=n_jobs,
+                                            chunksize=1))
 
 
 # helpers for betweenness centrality
@@ -460,3 +460,41 @@ class TestWeightedEdgeBetweennessCentrality(object):
         for n in sorted(G.edges()):
             assert_almost_equal(b[n],b_answer[n]/norm)
 
+
+
+class TestPartialBetweennessCentrality(object):
+
+    def test_merge_partials(self):
+        """Betweenness centrality: merged partial results"""
+        G=nx.krackhardt_kite_graph()
+        nodes=G.nodes()
+        partials=[nx.betweenness_centrality_partial(G,nodes[:4]),
+                  nx.betweenness_centrality_partial(G,nodes[4:])]
+        b=nx.merge_betweenness(G,partials)
+        b_answer=nx.betweenness_centrality(G)
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+
+    def test_merge_edge_partials(self):
+        """Edge betweenness centrality: merged partial results"""
+        G=weighted_G()
+        partials=[nx.edge_betweenness_centrality_partial(G,[0,1,2],'weight'),
+                  nx.edge_betweenness_centrality_partial(G,[3,4,5],'weight')]
+        # orientation of undirected edges may differ between partials
+        partials[1]=dict(((v,u),c) for (u,v),c in partials[1].items())
+        b=nx.merge_edge_betweenness(G,partials)
+        b_answer=nx.edge_betweenness_centrality(G,weight='weight')
+        for e in sorted(G.edges()):
+            assert_almost_equal(b[e],b_answer[e])
+
+    def test_n_jobs(self):
+        """Betweenness centrality: worker processes"""
+        G=nx.florentine_families_graph()
+        b=nx.betweenness_centrality(G,n_jobs=2)
+        b_answer=nx.betweenness_centrality(G)
+        for n in sorted(G):
+            assert_almost_equal(b[n],b_answer[n])
+        b=nx.edge_betweenness_centrality(G,n_jobs=2)
+        b_answer=nx.edge_betweenness_centrality(G)
+        for e in G.edges():
+            assert_almost_equal(b[e],b_answer[e])
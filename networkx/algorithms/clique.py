@@ -1,3 +1,4 @@
+# -*- coding: utf-8 -*-
 """
 =======
 Cliques
@@ -24,9 +25,12 @@ try:
 except ImportError:
     pass
 import networkx
+from networkx.utils import parallel_imap
+from networkx.algorithms.core import _core_decomposition
 from networkx.utils.decorators import *
 __author__ = """Dan Schult (dschult@colgate.edu)"""
-__all__ = ['find_cliques', 'find_cliques_recursive', 'make_max_clique_graph',
+__all__ = ['find_cliques', 'find_cliques_bitset', 'find_cliques_recursive',
+           'make_max_clique_graph',
            'make_clique_bipartite' ,'graph_clique_number',
            'graph_number_of_cliques', 'node_clique_number',
            'number_of_cliques', 'cliques_containing_node',
@@ -196,6 +200,223 @@ def find_cliques(G):
         pass
 
 
+@not_implemented_for('directed')
+def find_cliques_bitset(G, min_size=1, n_jobs=None, chunksize=None):
+    """Search for all maximal cliques in a graph with bitsets.
+
+    This finds the same cliques as find_cliques() with a separate,
+    small search for each node, so that the work can be spread over
+    several processes.  The nodes are taken in a degeneracy ordering,
+    the order in which the core decomposition removes them, and the
+    cliques whose first node is v are searched for
+    among the neighbors of v only: those after v in the order, whose
+    number is bounded by the degeneracy of the graph, are candidates and
+    those before it exclude the cliques already found.  The candidate
+    and excluded sets of the search are held as bitsets (Python
+    integers) over these neighbors.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph.
+
+    min_size : int, optional (default=1)
+       Only generate the maximal cliques with at least this many nodes.
+       The branches of the search that cannot reach this size are cut.
+
+    n_jobs : int, optional (default=None)
+       If not None, split the nodes across this many worker processes
+       (-1 for one per CPU) and generate the cliques as they are found.
+       See networkx.utils.parallel_imap().
+
+    chunksize : int, optional (default=None)
+       The number of nodes sent to a worker process at once when n_jobs
+       is not None.
+
+    Returns
+    -------
+    generator of lists: generator of member list for each maximal clique
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = nx.barbell_graph(4, 0)
+    >>> sorted(sorted(c) for c in nx.find_cliques_bitset(G))
+    [[0, 1, 2, 3], [3, 4], [4, 5, 6, 7]]
+    >>> sorted(sorted(c) for c in nx.find_cliques_bitset(G, min_size=3))
+    [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+    Notes
+    -----
+    This is the algorithm of Eppstein, Löffler and Strash [1]_, which
+    runs the pivoting search of Tomita, Tanaka and Takahashi [2]_ from
+    each node of a degeneracy ordering.  The cliques are not generated
+    in the same order as by find_cliques().
+
+    This algorithm ignores self-loops and parallel edges as
+    clique is not conventionally defined with such edges.
+
+    See Also
+    --------
+    find_cliques
+    core_number
+
+    References
+    ----------
+    .. [1] D. Eppstein, M. Löffler and D. Strash,
+       Listing all maximal cliques in sparse graphs in near-optimal time,
+       Algorithms and Computation (ISAAC 2010), LNCS 6506, 403-414, 2010.
+       http://dx.doi.org/10.1007/978-3-642-17517-6_36
+
+    .. [2] Etsuji Tomita, Akira Tanaka, Haruhisa Takahashi,
+       The worst-case time complexity for generating all maximal
+       cliques and computational experiments,
+       Theoretical Computer Science, Volume 363, Issue 1, Pages 28-42, 2006.
+       http://dx.doi.org/10.1016/j.tcs.2006.06.015
+    """
+    adj = {u: set(v for v in G[u] if v != u) for u in G}
+    if G.is_multigraph() or G.number_of_selfloops() > 0:
+        H = networkx.Graph(adj)
+    else:
+        H = G
+    # The removal order of the core decomposition, not just the nodes
+    # sorted by core number, bounds the later neighbors by the degeneracy.
+    order = _core_decomposition(H)[1]
+    rank = dict(zip(order, range(len(order))))
+    shared = (adj, rank, min_size)
+    if n_jobs is None:
+        results = ((v, _local_cliques(shared, v)) for v in order)
+    else:
+        results = parallel_imap(_local_cliques, shared, order,
+                                n_jobs=n_jobs, chunksize=chunksize)
+    return (clique for v, cliques in results for clique in cliques)
+
+
+def _local_cliques(shared, v):
+    """Return the maximal cliques whose first node in the ordering is v.
+
+    shared is the tuple (adj, rank, min_size) of find_cliques_bitset().
+    """
+    adj, rank, min_size = shared
+    r = rank[v]
+    later = [u for u in adj[v] if rank[u] > r]
+    if len(later) + 1 < min_size:
+        return []
+    if not later:
+        return [[v]] if not adj[v] else []
+    # The bit of nodes[i] is 1 << i.  The later neighbors come first and
+    # need their neighbors among all the nodes, then the earlier
+    # neighbors adjacent to some of them, which only need their
+    # neighbors among the later ones.
+    nodes = list(later)
+    later_set = set(later)
+    earlier_set = adj[v] - later_set
+    index = dict(zip(later, range(len(later))))
+    nbrs = []
+    degree = []
+    common = []
+    for u in later:
+        mask = 0
+        for w in adj[u].intersection(later_set):
+            mask |= 1 << index[w]
+        nbrs.append(mask)
+        common.append(adj[u].intersection(earlier_set))
+        degree.append(_popcount(mask) + len(common[-1]))
+    cand = (1 << len(later)) - 1
+    for i in range(len(later)):
+        mask = 0
+        for w in common[i]:
+            if w not in index:
+                index[w] = len(nodes)
+                nodes.append(w)
+                nbrs.append(0)
+                degree.append(0)
+            j = index[w]
+            mask |= 1 << j
+            nbrs[j] |= 1 << i
+            degree[j] += 1
+        nbrs[i] |= mask
+    excl = ((1 << len(nodes)) - 1) ^ cand
+    return list(_bitset_cliques(nodes, nbrs, degree, cand, excl, v,
+                                min_size))
+
+
+def _popcount(x):
+    return bin(x).count('1')
+
+
+def _pivot(nbrs, degree, cand, excl):
+    """Return the index of a node of cand | excl with the most neighbors
+    in cand, or None if a node of excl is adjacent to all of cand."""
+    size = _popcount(cand)
+    best = -1
+    # The excluded nodes come first: if one of them is adjacent to all
+    # the candidates no clique can be maximal.
+    for rest, most in ((excl, size), (cand, size - 1)):
+        while rest:
+            low = rest & -rest
+            rest ^= low
+            u = low.bit_length() - 1
+            if degree[u] <= best:
+                continue
+            n = bin(cand & nbrs[u]).count('1')
+            if n > best:
+                if n == size:
+                    return None
+                best = n
+                pivot = u
+                if n == most:
+                    return pivot
+    return pivot
+
+
+def _bitset_cliques(nodes, nbrs, degree, cand, excl, v, min_size):
+    """Generate the maximal cliques containing v among the nodes with
+    the given neighbor bitsets, cand and excl being the bitsets of the
+    candidate and excluded nodes.  degree[i] is the number of bits of
+    nbrs[i].
+
+    The search is the same as in find_cliques(), unrolled in the same
+    way, with bitsets instead of sets.
+    """
+    def extensions(cand, excl):
+        pivot = _pivot(nbrs, degree, cand, excl)
+        return 0 if pivot is None else cand & ~nbrs[pivot]
+
+    Q = [v, None]
+    ext = extensions(cand, excl)
+    stack = []
+    while True:
+        if ext:
+            low = ext & -ext
+            ext ^= low
+            q = low.bit_length() - 1
+            cand ^= low
+            Q[-1] = nodes[q]
+            cand_q = cand & nbrs[q]
+            excl_q = excl & nbrs[q]
+            excl |= low
+            if not cand_q:
+                if not excl_q and len(Q) >= min_size:
+                    yield Q[:]
+            elif not cand_q & (cand_q - 1):
+                # a single candidate w: Q + [w] is the only clique left
+                w = cand_q.bit_length() - 1
+                if not excl_q & nbrs[w] and len(Q) + 1 >= min_size:
+                    yield Q + [nodes[w]]
+            elif len(Q) + _popcount(cand_q) >= min_size:
+                stack.append((cand, excl, ext))
+                Q.append(None)
+                cand = cand_q
+                excl = excl_q
+                ext = extensions(cand, excl)
+        elif stack:
+            Q.pop()
+            cand, excl, ext = stack.pop()
+        else:
+            return
+
+
 def find_cliques_recursive(G):
     """Recursive search for all maximal cliques in a graph.
 
@@ -400,13 +621,18 @@ def project_up(B,create_using=None,name=None):
              G.add_edges_from([(vname,-u) for u in B[cv] if u!=v])
     return G
 
-def graph_clique_number(G,cliques=None):
+def graph_clique_number(G,cliques=None,n_jobs=None):
     """Return the clique number (size of the largest clique) for G.
 
     An optional list of cliques can be input if already computed.
+    If n_jobs is not None the cliques are found with
+    find_cliques_bitset() in n_jobs worker processes.
     """
     if cliques is None:
-        cliques=find_cliques(G)
+        if n_jobs is None:
+            cliques=find_cliques(G)
+        else:
+            cliques=find_cliques_bitset(G,n_jobs=n_jobs)
     return   max( [len(c) for c in cliques] )
 
 
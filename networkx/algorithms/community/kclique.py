@@ -10,7 +10,7 @@ __author__ = """\n""".join(['Conrad Lee <conradlee@gmail.com>',
                             'Aric Hagberg <aric.hagberg@gmail.com>'])
 __all__ = ['k_clique_communities']
 
-def k_clique_communities(G, k, cliques=None):
+def k_clique_communities(G, k, cliques=None, n_jobs=None):
     """Find k-clique communities in graph using the percolation method.
 
     A k-clique community is the union of all cliques of size k that
@@ -26,6 +26,12 @@ def k_clique_communities(G, k, cliques=None):
     cliques: list or generator       
        Precomputed cliques (use networkx.find_cliques(G))
 
+    n_jobs : int, optional (default=None)
+       If cliques is None and n_jobs is not None, the cliques of at
+       least k nodes are found with find_cliques_bitset() in n_jobs
+       worker processes (-1 for one per CPU).
+       See networkx.utils.parallel_imap().
+
     Returns
     -------
     Yields sets of nodes, one for each k-clique community.
@@ -51,7 +57,10 @@ def k_clique_communities(G, k, cliques=None):
     if k < 2:
         raise nx.NetworkXError("k=%d, k must be greater than 1."%k)
     if cliques is None:
-        cliques = nx.find_cliques(G)
+        if n_jobs is None:
+            cliques = nx.find_cliques(G)
+        else:
+            cliques = nx.find_cliques_bitset(G, min_size=k, n_jobs=n_jobs)
     cliques = [frozenset(c) for c in cliques if len(c) >= k]
 
     # First index which nodes are in which cliques
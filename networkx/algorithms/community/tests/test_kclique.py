@@ -41,6 +41,12 @@ def test_zachary():
     assert set(k_clique_communities(z, 5)) == zachary_k5_ground_truth
     assert set(k_clique_communities(z, 6)) == zachary_k6_ground_truth
 
+def test_n_jobs():
+    z = nx.karate_club_graph()
+    for k in (2, 3, 4, 5):
+        assert_equal(set(k_clique_communities(z, k, n_jobs=2)),
+                     set(k_clique_communities(z, k)))
+
 @raises(nx.NetworkXError)
 def test_bad_k():
     c = list(k_clique_communities(nx.Graph(),1))
@@ -122,7 +122,8 @@ def attracting_component_subgraphs(G, copy=True):
 
     copy : bool
         If copy is True, graph, node, and edge attributes are copied to the 
-        subgraphs.
+        subgraphs, otherwise read-only views of G are generated (see
+        subgraph_view).
 
     See Also
     --------
@@ -134,4 +135,4 @@ def attracting_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(ac).copy()
         else:
-            yield G.subgraph(ac)
+            yield nx.subgraph_view(G, ac)
@@ -242,6 +242,11 @@ def biconnected_component_subgraphs(G, copy=True):
     G : NetworkX Graph
         An undirected graph.
 
+    copy : bool (default=True)
+        If True, graph, node, and edge attributes are copied to the
+        subgraphs, otherwise read-only views of G are generated (see
+        subgraph_view).
+
     Returns
     -------
     graphs : generator
@@ -291,7 +296,7 @@ def biconnected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(comp_nodes).copy()
         else:
-            yield G.subgraph(comp_nodes)
+            yield nx.subgraph_view(G, comp_nodes)
 
 @not_implemented_for('directed')
 def articulation_points(G):
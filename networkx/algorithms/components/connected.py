@@ -45,11 +45,20 @@ def connected_components(G):
     See Also
     --------
     strongly_connected_components
+    index_components
 
     Notes
     -----
     For undirected graphs only.
+
+    If G has a component index attached by index_components() the
+    components are read from the index.
     """
+    index = getattr(G, 'component_index', None)
+    if index is not None:
+        for c in index.components():
+            yield c
+        return
     seen={}
     for v in G:
         if v not in seen:
@@ -67,7 +76,8 @@ def connected_component_subgraphs(G, copy=True):
        An undirected graph.
 
     copy: bool (default=True)
-      If True make a copy of the graph attributes
+      If True make a copy of the graph attributes, otherwise generate
+      read-only views of G (see subgraph_view).
 
     Returns
     -------
@@ -93,7 +103,7 @@ def connected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(c).copy()
         else:
-            yield G.subgraph(c)
+            yield nx.subgraph_view(G, c)
 
 def number_connected_components(G):
     """Return the number of connected components.
@@ -116,6 +126,9 @@ def number_connected_components(G):
     -----
     For undirected graphs only.
     """
+    index = getattr(G, 'component_index', None)
+    if index is not None:
+        return index.number_of_components()
     return len(list(connected_components(G)))
 
 @not_implemented_for('directed')
@@ -149,6 +162,9 @@ def is_connected(G):
     if len(G) == 0:
         raise nx.NetworkXPointlessConcept('Connectivity is undefined ',
                                           'for the null graph.')
+    index = getattr(G, 'component_index', None)
+    if index is not None:
+        return index.number_of_components() == 1
     return len(sp_length(G, next(G.nodes_iter()))) == len(G)
 
 @not_implemented_for('directed')
@@ -176,4 +192,7 @@ def node_connected_component(G, n):
     -----
     For undirected graphs only.
     """
+    index = getattr(G, 'component_index', None)
+    if index is not None:
+        return index.component(n)
     return list(sp_length(G, n))
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+"""
+Incrementally maintained connected components.
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from itertools import chain
+import networkx as nx
+from networkx.classes.function import _attach_index, _detach_index
+from networkx.utils import UnionFind
+from networkx.utils.decorators import not_implemented_for
+from networkx.algorithms.shortest_paths \
+    import single_source_shortest_path_length as sp_length
+__all__ = ['ComponentIndex', 'index_components', 'unindex_components']
+
+
+class ComponentIndex(object):
+    """Connected components of an undirected graph kept up to date as the
+    graph changes.
+
+    Components are stored in a union-find structure together with the
+    set of members of each component.  Adding nodes and edges costs
+    nearly constant time.  Removing an edge searches from both of its
+    ends at once until they meet or the smaller side is exhausted; only
+    when the component actually falls apart is it relabelled.
+
+    An index is created and attached to a graph with index_components();
+    it is then updated by the graph's own add and remove methods.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph.
+
+    See Also
+    --------
+    index_components
+    connected_components
+    """
+
+    def __init__(self, G):
+        self.G = G
+        self._build()
+
+    def _build(self):
+        self._uf = UnionFind()
+        self._members = {}
+        for v in self.G:
+            if v not in self._uf.parents:
+                self._set_component(sp_length(self.G, v))
+
+    def _set_component(self, nodes):
+        """Make nodes, a non-empty iterable, a component of its own."""
+        nodes = set(nodes)
+        root = next(iter(nodes))
+        parents = self._uf.parents
+        for n in nodes:
+            parents[n] = root
+        self._uf.weights[root] = len(nodes)
+        self._members[root] = nodes
+
+    def __contains__(self, n):
+        try:
+            return n in self._uf.parents
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._members)
+
+    def number_of_components(self):
+        """Return the number of connected components."""
+        return len(self._members)
+
+    def component_id(self, n):
+        """Return a label for the component containing node n.
+
+        The label is a node of the component and stays the same as long
+        as the component is unchanged.
+        """
+        if n not in self:
+            raise nx.NetworkXError("The node %s is not in the graph." % (n,))
+        return self._uf[n]
+
+    def component(self, n):
+        """Return a list of the nodes in the component containing node n."""
+        return list(self._members[self.component_id(n)])
+
+    def components(self):
+        """Generate a list of nodes for each connected component."""
+        for c in list(self._members.values()):
+            yield list(c)
+
+    def same_component(self, u, v):
+        """Return True if nodes u and v are in the same component."""
+        return self.component_id(u) == self.component_id(v)
+
+    # updates, called by the methods of an indexed graph
+
+    def _add_nodes(self, nodes):
+        for n in nodes:
+            self._add_node(n)
+
+    def _add_node(self, n):
+        if n not in self._uf.parents:
+            self._uf[n]
+            self._members[n] = set([n])
+
+    def _add_edges(self, edges):
+        for u, v in edges:
+            self._add_edge(u, v)
+
+    def _add_edge(self, u, v):
+        self._add_node(u)
+        self._add_node(v)
+        ru = self._uf[u]
+        rv = self._uf[v]
+        if ru == rv:
+            return
+        self._uf.union(ru, rv)
+        root = self._uf[ru]
+        other = rv if root == ru else ru
+        self._members[root] |= self._members.pop(other)
+
+    def _remove_edges(self, edges):
+        # The edges are all gone from the graph already; those not yet
+        # accounted for are added back for the removal of the others.
+        extra = {}
+        for u, v in edges:
+            extra.setdefault(u, set()).add(v)
+            extra.setdefault(v, set()).add(u)
+        for u, v in edges:
+            extra[u].discard(v)
+            extra[v].discard(u)
+            self._remove_edge(u, v, extra)
+
+    def _remove_edge(self, u, v, extra=None):
+        if u == v or u not in self.G or v not in self.G or v in self.G[u]:
+            return
+        if extra and v in extra.get(u, ()):
+            return
+        side = self._split_side(u, v, extra)
+        if side is not None:
+            root = self._uf[u]
+            rest = self._members.pop(root) - side
+            self._set_component(side)
+            self._set_component(rest)
+
+    def _split_side(self, u, v, extra=None):
+        """Return None if u and v are connected, otherwise the set of
+        nodes reachable from the one of them with the smaller component.
+        """
+        G = self.G
+        if not extra:
+            extra = {}
+        seen = (set([u]), set([v]))
+        stacks = ([u], [v])
+        while True:
+            for i in (0, 1):
+                stack = stacks[i]
+                if not stack:
+                    return seen[i]
+                found = seen[i]
+                other = seen[1 - i]
+                w = stack.pop()
+                for z in chain(G[w], extra.get(w, ())):
+                    if z in other:
+                        return None
+                    if z not in found:
+                        found.add(z)
+                        stack.append(z)
+
+    def _remove_nodes(self, nodes):
+        parents = self._uf.parents
+        rest = set()
+        for n in nodes:
+            if n in parents:
+                root = self._uf[n]
+                if root in self._members:
+                    rest |= self._members.pop(root)
+        G = self.G
+        for n in [n for n in rest if n not in G]:
+            del parents[n]
+            self._uf.weights.pop(n, None)
+            rest.discard(n)
+        while rest:
+            c = sp_length(G, next(iter(rest)))
+            self._set_component(c)
+            rest.difference_update(c)
+
+    def _clear(self):
+        self._build()
+
+
+@not_implemented_for('directed')
+def index_components(G):
+    """Attach a connected component index to G that follows changes to G.
+
+    After this call the connected component functions answer from the
+    index instead of searching the graph, and adding or removing nodes
+    and edges through the methods of G keeps the index up to date.
+    Component queries then take nearly constant time instead of time
+    proportional to the size of the graph.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph.
+
+    Returns
+    -------
+    index : ComponentIndex
+       The index, also available as G.component_index.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> index = nx.index_components(G)
+    >>> G.add_edge(10, 11)
+    >>> nx.number_connected_components(G)
+    2
+    >>> index.same_component(0, 3)
+    True
+    >>> G.remove_edge(1, 2)
+    >>> index.same_component(0, 3)
+    False
+
+    Notes
+    -----
+    The index is attached by replacing the mutating methods of G on the
+    instance, like freeze() does.  Changes made to the adjacency
+    dictionaries directly are not seen by the index.
+
+    See Also
+    --------
+    unindex_components
+    ComponentIndex
+    """
+    _attach_index(G, 'component_index', ComponentIndex(G))
+    return G.component_index
+
+
+def unindex_components(G):
+    """Remove the connected component index attached to G, if any.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph.
+
+    See Also
+    --------
+    index_components
+    """
+    _detach_index(G, 'component_index')
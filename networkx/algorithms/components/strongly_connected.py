@@ -222,7 +222,8 @@ def strongly_connected_component_subgraphs(G, copy=True):
       A list of graphs, one for each strongly connected component of G.
     copy : boolean
       if copy is True, Graph, node, and edge attributes are copied to
-      the subgraphs.
+      the subgraphs, otherwise read-only views of G are generated (see
+      subgraph_view).
 
     See Also
     --------
@@ -232,7 +233,7 @@ def strongly_connected_component_subgraphs(G, copy=True):
         if copy:
             yield G.subgraph(comp).copy()
         else:
-            yield G.subgraph(comp)
+            yield nx.subgraph_view(G, comp)
 
 
 @not_implemented_for('undirected')
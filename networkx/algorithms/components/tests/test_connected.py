@@ -70,3 +70,144 @@ class TestConnected:
         assert_raises(NetworkXNotImplemented,nx.connected_component_subgraphs,self.DG)
         assert_raises(NetworkXNotImplemented,nx.node_connected_component,self.DG,1)
         assert_raises(NetworkXNotImplemented,nx.is_connected,self.DG)
+
+
+class TestComponentIndex:
+
+    def check(self, G):
+        expected = sorted(sorted(c) for c in nx.connected_components(
+                          nx.Graph(G)))
+        assert_equal(sorted(sorted(c) for c in nx.connected_components(G)),
+                     expected)
+        assert_equal(nx.number_connected_components(G), len(expected))
+        for c in expected:
+            assert_equal(sorted(nx.node_connected_component(G, c[0])), c)
+
+    def test_add_remove(self):
+        G = nx.path_graph(4)
+        index = nx.index_components(G)
+        assert_true(G.component_index is index)
+        G.add_edges_from([(10, 11), (11, 12)])
+        G.add_node(20)
+        G.add_nodes_from([21, (22, {'color': 'red'})])
+        self.check(G)
+        assert_equal(index.number_of_components(), 5)
+        G.add_edge(3, 10)
+        assert_true(index.same_component(0, 12))
+        self.check(G)
+        G.remove_edge(1, 2)
+        assert_false(index.same_component(0, 12))
+        self.check(G)
+        G.add_cycle([0, 5, 6])
+        G.remove_edge(0, 5)
+        assert_true(index.same_component(0, 6))
+        self.check(G)
+        G.remove_node(11)
+        self.check(G)
+        G.remove_nodes_from([2, 3, 0])
+        self.check(G)
+        assert_raises(nx.NetworkXError, index.component_id, 0)
+        G.clear()
+        assert_equal(index.number_of_components(), 0)
+
+    def test_random(self):
+        import random
+        random.seed(42)
+        G = nx.MultiGraph()
+        nx.index_components(G)
+        for i in range(200):
+            u, v = random.randint(0, 30), random.randint(0, 30)
+            if G.has_edge(u, v) and random.random() < 0.5:
+                G.remove_edge(u, v)
+            else:
+                G.add_edge(u, v)
+        self.check(G)
+
+    def test_remove_edges_from(self):
+        G = nx.star_graph(3)
+        G.add_edge(1, 4)
+        nx.index_components(G)
+        G.remove_edges_from([(0, 1), (0, 2), (0, 3)])
+        self.check(G)
+
+    def test_split_many(self):
+        # Removing the edges or the center of a star leaves one component
+        # for each of its leaves.
+        G = nx.star_graph(5)
+        G.add_edge(1, 6)
+        nx.index_components(G)
+        G.remove_edges_from([(0, 1), (0, 2), (0, 3), (0, 4)])
+        self.check(G)
+        assert_equal(nx.number_connected_components(G), 5)
+        G = nx.star_graph(5)
+        nx.index_components(G)
+        G.remove_node(0)
+        self.check(G)
+        assert_equal(nx.number_connected_components(G), 5)
+        G = nx.MultiGraph(nx.star_graph(5))
+        G.add_edge(0, 1)
+        nx.index_components(G)
+        G.remove_edges_from([(0, 1), (0, 2), (0, 3)])
+        self.check(G)
+        assert_equal(nx.number_connected_components(G), 3)
+
+    def test_multigraph(self):
+        # MultiGraph methods call other methods of the graph, which must
+        # not tell the index about the same change twice.
+        G = nx.MultiGraph([(0, 1), (1, 2)])
+        nx.index_components(G)
+        G.remove_edges_from([(0, 1)])
+        self.check(G)
+        assert_equal(nx.number_connected_components(G), 2)
+        G.add_edges_from([(0, 1), (0, 1), (3, 4)])
+        self.check(G)
+        G.remove_edge(0, 1)
+        assert_equal(nx.number_connected_components(G), 2)
+        G.remove_edge(0, 1)
+        self.check(G)
+        assert_equal(nx.number_connected_components(G), 3)
+        G = nx.MultiGraph([(0, 1), (1, 2), (2, 3)])
+        nx.index_components(G)
+        G.remove_edges_from([(0, 1), (2, 3)])
+        self.check(G)
+        assert_false(hasattr(G, '_in_indexed_method'))
+
+    def test_with_core_index(self):
+        G = nx.path_graph(4)
+        nx.index_components(G)
+        nx.index_cores(G)
+        G.add_edges_from([(3, 0), (5, 6)])
+        G.remove_edge(1, 2)
+        self.check(G)
+        nx.unindex_cores(G)
+        G.remove_edge(0, 1)
+        self.check(G)
+
+    def test_copy_unindex(self):
+        G = nx.path_graph(4)
+        nx.index_components(G)
+        H = G.copy()
+        H.remove_edge(1, 2)
+        assert_equal(nx.number_connected_components(H), 2)
+        assert_equal(nx.number_connected_components(G), 1)
+        nx.unindex_components(G)
+        assert_false(hasattr(G, 'component_index'))
+        G.remove_edge(1, 2)
+        assert_equal(nx.number_connected_components(G), 2)
+        assert_raises(NetworkXNotImplemented, nx.index_components,
+                      nx.DiGraph())
+
+    def test_pickle(self):
+        import copy
+        import pickle
+        G = nx.path_graph(4)
+        nx.index_components(G)
+        nx.index_cores(G)
+        for H in (pickle.loads(pickle.dumps(G, -1)), copy.deepcopy(G)):
+            assert_true(H.component_index.G is H)
+            assert_true(H.core_index.G is H)
+            H.remove_edge(1, 2)
+            self.check(H)
+            assert_equal(nx.number_connected_components(H), 2)
+            assert_equal(nx.core_number(H)[0], 1)
+            assert_equal(nx.number_connected_components(G), 1)
@@ -47,13 +47,14 @@ def weakly_connected_component_subgraphs(G, copy=True):
 
     copy : bool
         If copy is True, graph, node, and edge attributes are copied to the
-        subgraphs.
+        subgraphs, otherwise read-only views of G are generated (see
+        subgraph_view).
     """
     for comp in weakly_connected_components(G):
         if copy:
             yield G.subgraph(comp).copy()
         else:
-            yield G.subgraph(comp)
+            yield nx.subgraph_view(G, comp)
 
 @not_implemented_for('undirected')
 def is_weakly_connected(G):
@@ -10,11 +10,12 @@ import networkx as nx
 # Define the default maximum flow function to use in all flow based
 # connectivity algorithms. 
 from networkx.algorithms.flow import edmonds_karp, shortest_augmenting_path
-from networkx.algorithms.flow import build_residual_network
 default_flow_func = edmonds_karp
 
+from networkx.utils import parallel_imap
+from .cuts import minimum_st_edge_cut, minimum_st_node_cut
 from .utils import (build_auxiliary_node_connectivity,
-    build_auxiliary_edge_connectivity)
+    build_auxiliary_edge_connectivity, _build_residual)
 
 __author__ = '\n'.join(['Jordi Torrents <jtorrents@milnou.net>'])
 
@@ -23,7 +24,8 @@ __all__ = ['average_node_connectivity',
            'node_connectivity',
            'local_edge_connectivity',
            'edge_connectivity',
-           'all_pairs_node_connectivity']
+           'all_pairs_node_connectivity',
+           'ConnectivityEngine']
 
 
 def local_node_connectivity(G, s, t, flow_func=None, auxiliary=None,
@@ -65,9 +67,12 @@ def local_node_connectivity(G, s, t, flow_func=None, auxiliary=None,
         node names in G and in the auxiliary digraph. If provided
         it will be reused instead of recreated. Default value: None.
 
-    residual : NetworkX DiGraph
+    residual : NetworkX DiGraph or ResidualArrays
         Residual network to compute maximum flow. If provided it will be
-        reused instead of recreated. Default value: None.
+        reused instead of recreated. The flow functions that work on
+        arrays, such as the default one, convert a DiGraph to arrays on
+        every call, so build it with :meth:`build_residual_arrays` for
+        them. Default value: None.
 
     cutoff : integer, float
         If specified, the maximum flow algorithm will terminate when the 
@@ -113,9 +118,9 @@ def local_node_connectivity(G, s, t, flow_func=None, auxiliary=None,
     >>> H = build_auxiliary_node_connectivity(G)
     >>> # And the function for building the residual network from the
     >>> # flow package
-    >>> from networkx.algorithms.flow import build_residual_network
+    >>> from networkx.algorithms.flow import build_residual_arrays
     >>> # Note that the auxiliary digraph has an edge attribute named capacity
-    >>> R = build_residual_network(H, 'capacity')
+    >>> R = build_residual_arrays(H, 'capacity')
     >>> result = dict.fromkeys(G, dict())
     >>> # Reuse the auxiliary digraph and the residual network by passing them
     >>> # as parameters
@@ -318,9 +323,7 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
         neighbors = G.neighbors_iter
 
     # Reuse the auxiliary digraph and the residual network
-    H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, 'capacity')
-    kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
+    engine = ConnectivityEngine(G, flow_func)
 
     # Pick a node with minimum degree
     degree = G.degree()
@@ -330,14 +333,12 @@ def node_connectivity(G, s=None, t=None, flow_func=None):
     K = minimum_degree
     # compute local node connectivity with all its non-neighbors nodes
     for w in set(G) - set(neighbors(v)) - set([v]):
-        kwargs['cutoff'] = K
-        K = min(K, local_node_connectivity(G, v, w, **kwargs))
+        K = min(K, engine.node_connectivity(v, w, cutoff=K))
     # Also for non adjacent pairs of neighbors of v
     for x, y in iter_func(neighbors(v), 2):
         if y in G[x]:
             continue
-        kwargs['cutoff'] = K
-        K = min(K, local_node_connectivity(G, x, y, **kwargs)) 
+        K = min(K, engine.node_connectivity(x, y, cutoff=K))
 
     return K
 
@@ -396,13 +397,11 @@ def average_node_connectivity(G, flow_func=None):
         iter_func = itertools.combinations
 
     # Reuse the auxiliary digraph and the residual network
-    H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, 'capacity')
-    kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
+    engine = ConnectivityEngine(G, flow_func)
 
     num, den = 0, 0
     for u, v in iter_func(G, 2):
-        num += local_node_connectivity(G, u, v, **kwargs)
+        num += engine.node_connectivity(u, v)
         den += 1
 
     if den == 0: # Null Graph
@@ -410,7 +409,7 @@ def average_node_connectivity(G, flow_func=None):
     return num / den
 
 
-def all_pairs_node_connectivity(G, nbunch=None, flow_func=None):
+def all_pairs_node_connectivity(G, nbunch=None, flow_func=None, n_jobs=None):
     """Compute node connectivity between all pairs of nodes of G.
 
     Parameters
@@ -432,11 +431,17 @@ def all_pairs_node_connectivity(G, nbunch=None, flow_func=None):
         choice of the default function may change from version
         to version and should not be relied on. Default value: None.
 
+    n_jobs : int, optional (default=None)
+        If not None, split the pairs across this many worker processes
+        (-1 for one per CPU).  See networkx.utils.parallel_imap().
+
     Returns
     -------
     all_pairs : dict
         A dictionary with node connectivity between all pairs of nodes
-        in G, or in nbunch if provided.
+        in G, or in nbunch if provided. For undirected graphs the
+        connectivity of each pair u, v is both all_pairs[u][v] and
+        all_pairs[v][u].
 
     See also
     --------
@@ -447,31 +452,11 @@ def all_pairs_node_connectivity(G, nbunch=None, flow_func=None):
     :meth:`edmonds_karp`
     :meth:`preflow_push`
     :meth:`shortest_augmenting_path`
+    :class:`ConnectivityEngine`
 
     """
-    if nbunch is None:
-        nbunch = G
-    else:
-        nbunch = set(nbunch)
-
-    if G.is_directed():
-        iter_func = itertools.permutations
-    else:
-        iter_func = itertools.combinations
-
-    all_pairs = dict.fromkeys(nbunch, dict())
-
-    # Reuse auxiliary digraph and residual network
-    H = build_auxiliary_node_connectivity(G)
-    mapping = H.graph['mapping']
-    R = build_residual_network(H, 'capacity')
-    kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
-
-    for u, v in iter_func(nbunch, 2):
-        K = local_node_connectivity(G, u, v, **kwargs)
-        all_pairs[u][v] = K
-
-    return all_pairs
+    engine = ConnectivityEngine(G, flow_func)
+    return engine.all_pairs_node_connectivity(nbunch, n_jobs=n_jobs)
 
 
 def local_edge_connectivity(G, u, v, flow_func=None, auxiliary=None,
@@ -512,9 +497,12 @@ def local_edge_connectivity(G, u, v, flow_func=None, auxiliary=None,
         Auxiliary digraph for computing flow based edge connectivity. If
         provided it will be reused instead of recreated. Default value: None.
 
-    residual : NetworkX DiGraph
+    residual : NetworkX DiGraph or ResidualArrays
         Residual network to compute maximum flow. If provided it will be
-        reused instead of recreated. Default value: None.
+        reused instead of recreated. The flow functions that work on
+        arrays, such as the default one, convert a DiGraph to arrays on
+        every call, so build it with :meth:`build_residual_arrays` for
+        them. Default value: None.
 
     cutoff : integer, float
         If specified, the maximum flow algorithm will terminate when the 
@@ -560,9 +548,9 @@ def local_edge_connectivity(G, u, v, flow_func=None, auxiliary=None,
     >>> H = build_auxiliary_edge_connectivity(G)
     >>> # And the function for building the residual network from the
     >>> # flow package
-    >>> from networkx.algorithms.flow import build_residual_network
+    >>> from networkx.algorithms.flow import build_residual_arrays
     >>> # Note that the auxiliary digraph has an edge attribute named capacity
-    >>> R = build_residual_network(H, 'capacity')
+    >>> R = build_residual_arrays(H, 'capacity')
     >>> result = dict.fromkeys(G, dict())
     >>> # Reuse the auxiliary digraph and the residual network by passing them
     >>> # as parameters
@@ -738,9 +726,7 @@ def edge_connectivity(G, s=None, t=None, flow_func=None):
 
     # Global edge connectivity
     # reuse auxiliary digraph and residual network
-    H = build_auxiliary_edge_connectivity(G)
-    R = build_residual_network(H, 'capacity')
-    kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
+    engine = ConnectivityEngine(G, flow_func)
 
     if G.is_directed():
         # Algorithm 8 in [1]
@@ -752,13 +738,12 @@ def edge_connectivity(G, s=None, t=None, flow_func=None):
         nodes = G.nodes()
         n = len(nodes)
         for i in range(n):
-            kwargs['cutoff'] = L
             try:
-                L = min(L, local_edge_connectivity(G, nodes[i], nodes[i+1],
-                                                   **kwargs))
+                L = min(L, engine.edge_connectivity(nodes[i], nodes[i+1],
+                                                    cutoff=L))
             except IndexError: # last node!
-                L = min(L, local_edge_connectivity(G, nodes[i], nodes[0],
-                                                   **kwargs))
+                L = min(L, engine.edge_connectivity(nodes[i], nodes[0],
+                                                    cutoff=L))
         return L
     else: # undirected
         # Algorithm 6 in [1]
@@ -780,7 +765,166 @@ def edge_connectivity(G, s=None, t=None, flow_func=None):
             return L
 
         for w in D:
-            kwargs['cutoff'] = L
-            L = min(L, local_edge_connectivity(G, v, w, **kwargs))
+            L = min(L, engine.edge_connectivity(v, w, cutoff=L))
 
         return L
+
+
+class ConnectivityEngine(object):
+    """Answer repeated flow based connectivity and cut queries on a graph.
+
+    The local connectivity and cut functions build an auxiliary digraph
+    and a residual network for every query unless they are passed in.
+    An engine builds them once per graph, the first time a query needs
+    them, and keeps the residual networks as residual network arrays
+    whose flows are reset in place between queries.  Queries over many
+    pairs of nodes can be split across worker processes.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Directed or undirected graph.
+
+    flow_func : function
+        A function for computing the maximum flow among a pair of nodes,
+        see :meth:`local_node_connectivity`. If flow_func is None, the
+        default maximum flow function (:meth:`edmonds_karp`) is used.
+        Default value: None.
+
+    Examples
+    --------
+    >>> from networkx.algorithms.connectivity import ConnectivityEngine
+    >>> G = nx.icosahedral_graph()
+    >>> engine = ConnectivityEngine(G)
+    >>> engine.node_connectivity(0, 6)
+    5
+    >>> engine.edge_connectivity(0, 6)
+    5
+    >>> len(engine.minimum_st_node_cut(0, 6))
+    5
+    >>> C = engine.all_pairs_node_connectivity([0, 6, 11])
+    >>> C[0][6]
+    5
+
+    Notes
+    -----
+    The auxiliary digraphs are built from G as it is when they are first
+    needed. Changes to G made afterwards are not seen by the engine.
+
+    See also
+    --------
+    :meth:`local_node_connectivity`
+    :meth:`local_edge_connectivity`
+    :meth:`minimum_st_node_cut`
+    :meth:`minimum_st_edge_cut`
+    :meth:`build_residual_arrays`
+    """
+
+    def __init__(self, G, flow_func=None):
+        if flow_func is None:
+            flow_func = default_flow_func
+        self.G = G
+        self.flow_func = flow_func
+        self._auxiliary = {}
+
+    def _structures(self, kind):
+        """Return the auxiliary digraph and residual network for node or
+        edge connectivity.
+        """
+        if kind not in self._auxiliary:
+            if kind == 'node':
+                H = build_auxiliary_node_connectivity(self.G)
+            else:
+                H = build_auxiliary_edge_connectivity(self.G)
+            self._auxiliary[kind] = (H, _build_residual(H, self.flow_func))
+        return self._auxiliary[kind]
+
+    def node_connectivity(self, s, t, cutoff=None):
+        """Return the local node connectivity of nodes s and t.
+
+        See :meth:`local_node_connectivity` for the cutoff parameter.
+        """
+        H, R = self._structures('node')
+        return local_node_connectivity(self.G, s, t, flow_func=self.flow_func,
+                                       auxiliary=H, residual=R, cutoff=cutoff)
+
+    def edge_connectivity(self, s, t, cutoff=None):
+        """Return the local edge connectivity of nodes s and t.
+
+        See :meth:`local_edge_connectivity` for the cutoff parameter.
+        """
+        H, R = self._structures('edge')
+        return local_edge_connectivity(self.G, s, t, flow_func=self.flow_func,
+                                       auxiliary=H, residual=R, cutoff=cutoff)
+
+    def minimum_st_node_cut(self, s, t):
+        """Return a set of nodes of minimum cardinality that disconnects
+        s and t.
+        """
+        H, R = self._structures('node')
+        return minimum_st_node_cut(self.G, s, t, flow_func=self.flow_func,
+                                   auxiliary=H, residual=R)
+
+    def minimum_st_edge_cut(self, s, t):
+        """Return a set of edges of minimum cardinality that disconnects
+        s and t.
+        """
+        H, R = self._structures('edge')
+        return minimum_st_edge_cut(self.G, s, t, flow_func=self.flow_func,
+                                   auxiliary=H, residual=R)
+
+    def all_pairs_node_connectivity(self, nbunch=None, n_jobs=None):
+        """Compute node connectivity between all pairs of nodes.
+
+        Parameters
+        ----------
+        nbunch: container
+            Container of nodes. If provided node connectivity will be
+            computed only over pairs of nodes in nbunch.
+
+        n_jobs : int, optional (default=None)
+            If not None, split the pairs across this many worker processes
+            (-1 for one per CPU).  Each worker receives the engine, with
+            its auxiliary digraph and residual network, once.
+
+        Returns
+        -------
+        all_pairs : dict
+            A dictionary with node connectivity between all pairs of nodes
+            in G, or in nbunch if provided. For undirected graphs the
+            connectivity of each pair u, v is both all_pairs[u][v] and
+            all_pairs[v][u].
+        """
+        if nbunch is None:
+            nodes = list(self.G)
+        else:
+            nodes = list(set(nbunch))
+
+        # Each row holds a node and the nodes to pair it with.
+        if self.G.is_directed():
+            rows = ((u, [v for v in nodes if v != u]) for u in nodes)
+        else:
+            rows = ((u, nodes[i + 1:]) for i, u in enumerate(nodes))
+
+        # Build the auxiliary digraph before the engine is sent to workers.
+        self._structures('node')
+        if n_jobs is None:
+            results = ((row, _node_connectivity_row(self, row))
+                       for row in rows)
+        else:
+            results = parallel_imap(_node_connectivity_row, self, rows,
+                                    n_jobs=n_jobs, chunksize=1)
+
+        all_pairs = dict((u, {}) for u in nodes)
+        directed = self.G.is_directed()
+        for (u, targets), K in results:
+            all_pairs[u].update(K)
+            if not directed:
+                for v, k in K.items():
+                    all_pairs[v][u] = k
+        return all_pairs
+
+
+def _node_connectivity_row(engine, row):
+    u, targets = row
+    return dict((v, engine.node_connectivity(u, v)) for v in targets)
@@ -8,11 +8,10 @@ import networkx as nx
 # Define the default maximum flow function to use in all flow based
 # cut algorithms.
 from networkx.algorithms.flow import edmonds_karp, shortest_augmenting_path
-from networkx.algorithms.flow import build_residual_network
 default_flow_func = edmonds_karp
 
 from .utils import (build_auxiliary_node_connectivity,
-    build_auxiliary_edge_connectivity)
+    build_auxiliary_edge_connectivity, _build_residual)
 
 __author__ = '\n'.join(['Jordi Torrents <jtorrents@milnou.net>'])
 
@@ -59,9 +58,12 @@ def minimum_st_edge_cut(G, s, t, flow_func=None, auxiliary=None,
         details. The choice of the default function may change from version
         to version and should not be relied on. Default value: None.
 
-    residual : NetworkX DiGraph
+    residual : NetworkX DiGraph or ResidualArrays
         Residual network to compute maximum flow. If provided it will be
-        reused instead of recreated. Default value: None.
+        reused instead of recreated. The flow functions that work on
+        arrays, such as the default one, convert a DiGraph to arrays on
+        every call, so build it with :meth:`build_residual_arrays` for
+        them. Default value: None.
 
     Returns
     -------
@@ -113,9 +115,9 @@ def minimum_st_edge_cut(G, s, t, flow_func=None, auxiliary=None,
     >>> H = build_auxiliary_edge_connectivity(G)
     >>> # And the function for building the residual network from the
     >>> # flow package
-    >>> from networkx.algorithms.flow import build_residual_network
+    >>> from networkx.algorithms.flow import build_residual_arrays
     >>> # Note that the auxiliary digraph has an edge attribute named capacity
-    >>> R = build_residual_network(H, 'capacity')
+    >>> R = build_residual_arrays(H, 'capacity')
     >>> result = dict.fromkeys(G, dict())
     >>> # Reuse the auxiliary digraph and the residual network by passing them
     >>> # as parameters
@@ -191,9 +193,12 @@ def minimum_st_node_cut(G, s, t, flow_func=None, auxiliary=None, residual=None):
         node names in G and in the auxiliary digraph. If provided
         it will be reused instead of recreated. Default value: None.
 
-    residual : NetworkX DiGraph
+    residual : NetworkX DiGraph or ResidualArrays
         Residual network to compute maximum flow. If provided it will be
-        reused instead of recreated. Default value: None.
+        reused instead of recreated. The flow functions that work on
+        arrays, such as the default one, convert a DiGraph to arrays on
+        every call, so build it with :meth:`build_residual_arrays` for
+        them. Default value: None.
 
     Returns
     -------
@@ -231,9 +236,9 @@ def minimum_st_node_cut(G, s, t, flow_func=None, auxiliary=None, residual=None):
     >>> H = build_auxiliary_node_connectivity(G)
     >>> # And the function for building the residual network from the
     >>> # flow package
-    >>> from networkx.algorithms.flow import build_residual_network
+    >>> from networkx.algorithms.flow import build_residual_arrays
     >>> # Note that the auxiliary digraph has an edge attribute named capacity
-    >>> R = build_residual_network(H, 'capacity')
+    >>> R = build_residual_arrays(H, 'capacity')
     >>> # Reuse the auxiliary digraph and the residual network by passing them
     >>> # as parameters
     >>> len(minimum_st_node_cut(G, 0, 6, auxiliary=H, residual=R))
@@ -418,7 +423,7 @@ def minimum_node_cut(G, s=None, t=None, flow_func=None):
 
     # Reuse the auxiliary digraph and the residual network.
     H = build_auxiliary_node_connectivity(G)
-    R = build_residual_network(H, 'capacity')
+    R = _build_residual(H, flow_func)
     kwargs = dict(flow_func=flow_func, auxiliary=H, residual=R)
 
     # Choose a node with minimum degree.
@@ -539,7 +544,7 @@ def minimum_edge_cut(G, s=None, t=None, flow_func=None):
 
     # reuse auxiliary digraph and residual network
     H = build_auxiliary_edge_connectivity(G)
-    R = build_residual_network(H, 'capacity')
+    R = _build_residual(H, flow_func)
     kwargs = dict(flow_func=flow_func, residual=R, auxiliary=H)
 
     # Local minimum edge cut if s and t are not None
@@ -9,7 +9,7 @@ flow_funcs = [edmonds_karp, preflow_push, shortest_augmenting_path]
 
 # connectivity functions not imported to the base namespace
 from networkx.algorithms.connectivity import (local_edge_connectivity,
-    local_node_connectivity)
+    local_node_connectivity, minimum_st_node_cut, ConnectivityEngine)
 
 
 msg = "Assertion failed in function: {0}"
@@ -290,9 +290,9 @@ class TestConnectivityPairs(object):
         G = nx.Graph()
         nodes = [0, 1, 2, 3]
         G.add_path(nodes)
-        A = dict.fromkeys(G, dict())
+        A = dict((n, {}) for n in G)
         for u, v in itertools.combinations(nodes,2):
-            A[u][v] = nx.node_connectivity(G, u, v)
+            A[u][v] = A[v][u] = nx.node_connectivity(G, u, v)
         C = nx.all_pairs_node_connectivity(G)
         assert_equal(sorted((k, sorted(v)) for k, v in A.items()),
                      sorted((k, sorted(v)) for k, v in C.items()))
@@ -301,7 +301,7 @@ class TestConnectivityPairs(object):
         G = nx.DiGraph()
         nodes = [0, 1, 2, 3]
         G.add_path(nodes)
-        A = dict.fromkeys(G, dict())
+        A = dict((n, {}) for n in G)
         for u, v in itertools.permutations(nodes, 2):
             A[u][v] = nx.node_connectivity(G, u, v)
         C = nx.all_pairs_node_connectivity(G)
@@ -311,9 +311,9 @@ class TestConnectivityPairs(object):
     def test_all_pairs_connectivity_nbunch(self):
         G = nx.complete_graph(5)
         nbunch = [0, 2, 3]
-        A = dict.fromkeys(nbunch, dict())
+        A = dict((n, {}) for n in nbunch)
         for u, v in itertools.combinations(nbunch, 2):
-            A[u][v] = nx.node_connectivity(G, u, v)
+            A[u][v] = A[v][u] = nx.node_connectivity(G, u, v)
         C = nx.all_pairs_node_connectivity(G, nbunch=nbunch)
         assert_equal(sorted((k, sorted(v)) for k, v in A.items()),
                      sorted((k, sorted(v)) for k, v in C.items()))
@@ -321,9 +321,72 @@ class TestConnectivityPairs(object):
     def test_all_pairs_connectivity_nbunch_iter(self):
         G = nx.complete_graph(5)
         nbunch = [0, 2, 3]
-        A = dict.fromkeys(nbunch, dict())
+        A = dict((n, {}) for n in nbunch)
         for u, v in itertools.combinations(nbunch, 2):
-            A[u][v] = nx.node_connectivity(G, u, v)
+            A[u][v] = A[v][u] = nx.node_connectivity(G, u, v)
         C = nx.all_pairs_node_connectivity(G, nbunch=iter(nbunch))
         assert_equal(sorted((k, sorted(v)) for k, v in A.items()),
                      sorted((k, sorted(v)) for k, v in C.items()))
+
+    def test_all_pairs_connectivity_values(self):
+        G = nx.DiGraph(nx.karate_club_graph())
+        G.remove_edges_from([(0, 1), (2, 3), (0, 31)])
+        nbunch = [0, 1, 2, 3, 31, 33]
+        C = nx.all_pairs_node_connectivity(G, nbunch=nbunch)
+        for u, v in itertools.permutations(nbunch, 2):
+            assert_equal(C[u][v], nx.node_connectivity(G, u, v))
+        assert_equal(nx.all_pairs_node_connectivity(G, nbunch=nbunch,
+                                                    n_jobs=2), C)
+
+
+class TestConnectivityEngine(object):
+
+    def setUp(self):
+        self.G = nx.karate_club_graph()
+
+    def test_queries(self):
+        G = self.G
+        pairs = [(0, 33), (2, 9), (11, 4), (16, 25)]
+        for flow_func in flow_funcs:
+            engine = ConnectivityEngine(G, flow_func=flow_func)
+            for _ in range(2):
+                for u, v in pairs:
+                    assert_equal(engine.node_connectivity(u, v),
+                                 local_node_connectivity(G, u, v),
+                                 msg=msg.format(flow_func.__name__))
+                    assert_equal(engine.edge_connectivity(u, v),
+                                 local_edge_connectivity(G, u, v),
+                                 msg=msg.format(flow_func.__name__))
+                    assert_equal(engine.minimum_st_node_cut(u, v),
+                                 minimum_st_node_cut(G, u, v))
+                    cut = engine.minimum_st_edge_cut(u, v)
+                    assert_equal(len(cut), local_edge_connectivity(G, u, v))
+                    H = G.copy()
+                    H.remove_edges_from(cut)
+                    assert_false(nx.has_path(H, u, v))
+
+    def test_cutoff(self):
+        engine = ConnectivityEngine(nx.complete_graph(8))
+        assert_equal(engine.node_connectivity(0, 7), 7)
+        assert_equal(engine.node_connectivity(0, 7, cutoff=3), 3)
+        assert_equal(engine.edge_connectivity(0, 7, cutoff=3), 3)
+
+    def test_custom_flow_func(self):
+        # Flow functions not known to work on residual network arrays get
+        # a DiGraph residual network.
+        def flow_func(G, s, t, **kwargs):
+            return edmonds_karp(G, s, t, **kwargs)
+        G = self.G
+        engine = ConnectivityEngine(G, flow_func=flow_func)
+        assert_equal(engine.node_connectivity(0, 33),
+                     local_node_connectivity(G, 0, 33))
+        assert_equal(engine.edge_connectivity(0, 33),
+                     local_edge_connectivity(G, 0, 33))
+
+    def test_all_pairs_parallel(self):
+        G = nx.petersen_graph()
+        engine = ConnectivityEngine(G)
+        C = engine.all_pairs_node_connectivity()
+        assert_true(all(sorted(C[u]) == [v for v in G if v != u] for u in G))
+        assert_true(all(k == 3 for u in C for k in C[u].values()))
+        assert_equal(engine.all_pairs_node_connectivity(n_jobs=2), C)
@@ -3,6 +3,9 @@
 Utilities for connectivity package
 """
 import networkx as nx
+from networkx.algorithms.flow import build_residual_arrays
+from networkx.algorithms.flow import build_residual_network
+from networkx.algorithms.flow.maxflow import array_flow_funcs
 
 __author__ = '\n'.join(['Jordi Torrents <jtorrents@milnou.net>'])
 
@@ -87,3 +90,14 @@ def build_auxiliary_edge_connectivity(G):
         for (source, target) in G.edges_iter():
             H.add_edges_from([(source, target), (target, source)], capacity=1)
         return H
+
+
+def _build_residual(H, flow_func):
+    """Return a residual network of the auxiliary digraph H for flow_func.
+
+    It is a ResidualArrays if flow_func, or the default flow function if
+    it is None, can work on one, and a DiGraph otherwise.
+    """
+    if flow_func is None or flow_func in array_flow_funcs:
+        return build_residual_arrays(H, 'capacity')
+    return build_residual_network(H, 'capacity')
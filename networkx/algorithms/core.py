@@ -20,9 +20,15 @@ __author__ = "\n".join(['Dan Schult (dschult@colgate.edu)',
 #    Pieter Swart <swart@lanl.gov>
 #    All rights reserved.
 #    BSD license.
-__all__ = ['core_number','k_core','k_shell','k_crust','k_corona','find_cores']
+__all__ = ['core_number','k_core','k_shell','k_crust','k_corona','find_cores',
+           'CoreIndex','index_cores','unindex_cores']
 
+from bisect import bisect_left, bisect_right
+from heapq import heappop, heappush
+from itertools import chain
 import networkx as nx
+from networkx.classes.function import _attach_index, _detach_index
+from networkx.utils import not_implemented_for
 
 def core_number(G):
     """Return the core number for each vertex.
@@ -54,12 +60,30 @@ def core_number(G):
     For directed graphs the node degree is defined to be the
     in-degree + out-degree.
 
+    The nodes are kept in an array of buckets by current degree, so
+    that the decomposition takes O(m) time with no sorting [1]_.  If G
+    has a core index attached by index_cores() the core numbers are
+    read from the index.
+
+    See Also
+    --------
+    index_cores
+
     References
     ----------
     .. [1] An O(m) Algorithm for Cores Decomposition of Networks
        Vladimir Batagelj and Matjaz Zaversnik, 2003.
        http://arxiv.org/abs/cs.DS/0310049
     """
+    index = getattr(G, 'core_index', None)
+    if index is not None:
+        return index.core_number()
+    return _core_decomposition(G)[0]
+
+def _core_decomposition(G):
+    """Return the core numbers of G and a list of the nodes in the order
+    in which they are removed: every node has at most its core number
+    of neighbors after it in the list."""
     if G.is_multigraph():
         raise nx.NetworkXError(
                 'MultiGraph and MultiDiGraph types not supported.')
@@ -70,37 +94,44 @@ def core_number(G):
                 'Consider using G.remove_edges_from(G.selfloop_edges()).')
 
     if G.is_directed():
-        import itertools
         def neighbors(v):
-            return itertools.chain.from_iterable([G.predecessors_iter(v),
-                                                  G.successors_iter(v)])
+            return chain(G.pred[v],G.succ[v])
     else:
-        neighbors=G.neighbors_iter
-    degrees=G.degree()
-    # sort nodes by degree
-    nodes=sorted(degrees,key=degrees.get)
-    bin_boundaries=[0]
-    curr_degree=0
-    for i,v in enumerate(nodes):
-        if degrees[v]>curr_degree:
-            bin_boundaries.extend([i]*(degrees[v]-curr_degree))
-            curr_degree=degrees[v]
-    node_pos = dict((v,pos) for pos,v in enumerate(nodes))
+        neighbors=G.adj.__getitem__
     # initial guesses for core is degree
-    core=degrees
-    nbrs=dict((v,set(neighbors(v))) for v in G)
+    core=G.degree()
+    # bucket the nodes by degree: the nodes of degree d are
+    # nodes[bin_start[d]:bin_start[d+1]]
+    counts=[0]*(max(core.values())+2 if core else 1)
+    for d in core.values():
+        counts[d+1]+=1
+    bin_start=counts
+    for d in range(1,len(bin_start)):
+        bin_start[d]+=bin_start[d-1]
+    nodes=[None]*len(core)
+    node_pos={}
+    next_pos=bin_start[:]
+    for v,d in core.items():
+        node_pos[v]=next_pos[d]
+        nodes[next_pos[d]]=v
+        next_pos[d]+=1
     for v in nodes:
-        for u in nbrs[v]:
-            if core[u] > core[v]:
-                nbrs[u].remove(v)
+        core_v=core[v]
+        for u in neighbors(v):
+            core_u=core[u]
+            if core_u > core_v:
+                # move u to the start of its bucket and shrink the bucket
                 pos=node_pos[u]
-                bin_start=bin_boundaries[core[u]]
-                node_pos[u]=bin_start
-                node_pos[nodes[bin_start]]=pos
-                nodes[bin_start],nodes[pos]=nodes[pos],nodes[bin_start]
-                bin_boundaries[core[u]]+=1
-                core[u]-=1
-    return core
+                start=bin_start[core_u]
+                w=nodes[start]
+                if w != u:
+                    nodes[pos]=w
+                    node_pos[w]=pos
+                    nodes[start]=u
+                    node_pos[u]=start
+                bin_start[core_u]+=1
+                core[u]=core_u-1
+    return core,nodes
 
 find_cores=core_number
 
@@ -321,3 +352,376 @@ def k_corona(G, k, core_number=None):
              if core_number[n] == k
              and len([v for v in G[n] if core_number[v] >= k]) == k)
     return G.subgraph(nodes).copy()
+
+
+class CoreIndex(object):
+    """Core numbers of an undirected graph kept up to date as the graph
+    changes.
+
+    Besides the core numbers the index keeps the nodes in an order in
+    which they could be removed by the decomposition, each node having
+    at most its core number k of neighbors after it, and that number
+    for every node.  Adding an edge from u to a later node increases
+    the count of u; only if it exceeds k are the following nodes of core
+    number k scanned, in order, for those that enter the (k+1)-core,
+    skipping the nodes that have no such neighbor before them [1]_.
+    Removing edges or nodes lowers, one step at a time, the core number
+    of the nodes left with fewer neighbors of at least their core number
+    than that number, starting from the ends of the removed edges; they
+    are moved to the end of the nodes of their new core number [1]_ [2]_.
+    Only nodes near the change are visited.
+
+    An index is created and attached to a graph with index_cores(); it
+    is then updated by the graph's own add and remove methods.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph without self loops or parallel edges.
+
+    See Also
+    --------
+    index_cores
+    core_number
+
+    References
+    ----------
+    .. [1] Yikai Zhang, Jeffrey Xu Yu, Ying Zhang and Lu Qin, A fast
+       order-based approach for core maintenance. IEEE 33rd International
+       Conference on Data Engineering (ICDE), 337-348, 2017.
+    .. [2] Ahmet Erdem Sarıyüce, Buğra Gedik, Gabriela Jacques-Silva,
+       Kun-Lung Wu and Ümit V. Çatalyürek, Streaming algorithms for k-core
+       decomposition. Proceedings of the VLDB Endowment 6(6), 433-444,
+       2013.
+    """
+
+    def __init__(self, G):
+        self.G = G
+        self._build()
+
+    def _build(self):
+        core, nodes = _core_decomposition(self.G)
+        self._core = core
+        # The order is that of (core number, label).  The nodes of each
+        # core number k are kept in _shells[k], a list of (label, node)
+        # sorted by label.
+        self._label = {}
+        self._shells = {}
+        for n in nodes:
+            self._append(n)
+        self._later = {}
+        for n in nodes:
+            self._count_later(n)
+
+    def __contains__(self, n):
+        try:
+            return n in self._core
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._core)
+
+    def __getitem__(self, n):
+        """Return the core number of node n."""
+        if n not in self:
+            raise nx.NetworkXError("The node %s is not in the graph." % (n,))
+        return self._core[n]
+
+    def core_number(self):
+        """Return a dictionary keyed by node to the core number."""
+        return dict(self._core)
+
+    def _neighbors(self, n, hidden=None):
+        """Return a list of the neighbors of n, without n itself or the
+        nodes in hidden[n]."""
+        skip = hidden.get(n) if hidden else None
+        return [u for u in self.G[n]
+                if u != n and (not skip or u not in skip)]
+
+    def _count_later(self, n, hidden=None):
+        """Count the neighbors of n after it in the order."""
+        core, label = self._core, self._label
+        c = core[n]
+        l = label[n]
+        self._later[n] = sum(1 for u in self._neighbors(n, hidden)
+                             if core[u] > c or (core[u] == c and label[u] > l))
+
+    def _before(self, u, v):
+        core = self._core
+        return (core[u], self._label[u]) < (core[v], self._label[v])
+
+    def _append(self, n):
+        """Put n last among the nodes of its core number."""
+        shell = self._shells.setdefault(self._core[n], [])
+        label = shell[-1][0] + 1.0 if shell else 0.0
+        self._label[n] = label
+        shell.append((label, n))
+
+    def _prepend(self, nodes):
+        """Put nodes, of equal core numbers, first among the nodes of
+        their core number, in the given order."""
+        shell = self._shells.setdefault(self._core[nodes[0]], [])
+        first = shell[0][0] if shell else 0.0
+        items = [(first - len(nodes) + i, n) for i, n in enumerate(nodes)]
+        for label, n in items:
+            self._label[n] = label
+        shell[0:0] = items
+
+    def _insert_after(self, v, nodes):
+        """Put nodes, of the core number of v, right after v in the given
+        order."""
+        shell = self._shells[self._core[v]]
+        i = bisect_right(shell, (self._label[v], v))
+        low = self._label[v]
+        high = shell[i][0] if i < len(shell) else low + 1.0
+        step = (high - low) / (len(nodes) + 1)
+        if low + step == low or low + step * len(nodes) >= high:
+            # out of room between the labels: number the nodes again
+            for j, (label, n) in enumerate(shell):
+                shell[j] = (float(j), n)
+                self._label[n] = float(j)
+            low = self._label[v]
+            step = 1.0 / (len(nodes) + 1)
+        items = [(low + step * (j + 1), n) for j, n in enumerate(nodes)]
+        for label, n in items:
+            self._label[n] = label
+        shell[i:i] = items
+
+    def _detach(self, n):
+        """Take n out of the order."""
+        c = self._core[n]
+        shell = self._shells[c]
+        del shell[bisect_left(shell, (self._label[n], n))]
+        if not shell:
+            del self._shells[c]
+
+    # updates, called by the methods of an indexed graph
+
+    def _add_nodes(self, nodes):
+        for n in nodes:
+            if n not in self._core:
+                self._core[n] = 0
+                self._append(n)
+                self._later[n] = 0
+
+    def _add_edges(self, edges):
+        self._add_nodes(chain.from_iterable(edges))
+        edges = [(u, v) for u, v in edges if u != v]
+        # The edges are all in the graph already; those not yet
+        # accounted for are hidden from the update of the others.
+        hidden = {}
+        for u, v in edges:
+            hidden.setdefault(u, set()).add(v)
+            hidden.setdefault(v, set()).add(u)
+        for u, v in edges:
+            hidden[u].discard(v)
+            hidden[v].discard(u)
+            self._insert(u, v, hidden)
+
+    def _insert(self, u, v, hidden):
+        core, label, later = self._core, self._label, self._later
+        if self._before(v, u):
+            u, v = v, u
+        later[u] += 1
+        k = core[u]
+        if later[u] <= k:
+            return
+        # Scan the nodes of core number k from u in order.  A node is a
+        # candidate for the (k+1)-core if its neighbors after it and the
+        # candidates before it are more than k.  When a node that is not
+        # a candidate is met, the candidates that lose their support,
+        # and those that depend on them, are moved right after it.
+        before = {u: 0}
+        support = {}
+        kept = set()
+        heap = [(label[u], u)]
+        while heap:
+            w = heappop(heap)[1]
+            if w in support or w in kept:
+                continue
+            n_before = before.pop(w, 0)
+            if n_before == 0 and w != u:
+                continue
+            w_nbrs = self._neighbors(w, hidden)
+            if n_before + later[w] > k:
+                support[w] = n_before + later[w]
+                for x in w_nbrs:
+                    if core[x] == k and label[x] > label[w]:
+                        if not before.get(x):
+                            heappush(heap, (label[x], x))
+                        before[x] = before.get(x, 0) + 1
+                continue
+            kept.add(w)
+            moved = []
+            for x in w_nbrs:
+                if x in support:
+                    support[x] -= 1
+                    if support[x] <= k:
+                        del support[x]
+                        moved.append(x)
+            i = 0
+            while i < len(moved):
+                y = moved[i]
+                i += 1
+                kept.add(y)
+                for x in self._neighbors(y, hidden):
+                    if x in support:
+                        support[x] -= 1
+                        if support[x] <= k:
+                            del support[x]
+                            moved.append(x)
+                    elif (x in before and x not in kept and
+                          label[x] > label[y]):
+                        before[x] -= 1
+            if moved:
+                for y in moved:
+                    self._detach(y)
+                self._insert_after(w, moved)
+        # The candidates left enter the (k+1)-core, first in its order.
+        promoted = sorted(support, key=label.__getitem__)
+        if promoted:
+            for w in promoted:
+                self._detach(w)
+                core[w] = k + 1
+            self._prepend(promoted)
+        for w in chain(promoted, kept):
+            self._count_later(w, hidden)
+
+    def _remove_edges(self, edges):
+        for u, v in edges:
+            if u != v:
+                if self._before(v, u):
+                    u, v = v, u
+                self._later[u] -= 1
+        self._demote(set(n for e in edges for n in e))
+
+    def _remove_nodes(self, nbrs):
+        for n in nbrs:
+            for u in nbrs[n]:
+                if u != n and u in self.G and self._before(u, n):
+                    self._later[u] -= 1
+        for n in nbrs:
+            self._detach(n)
+            del self._core[n]
+            del self._label[n]
+            del self._later[n]
+        self._demote(set(u for n in nbrs for u in nbrs[n] if u in self.G))
+
+    def _demote(self, roots):
+        """Lower the core numbers of roots, and of the nodes that lose
+        their support, until every node has at least as many neighbors
+        of at least its core number as that number."""
+        core = self._core
+        demoted = set()
+        while roots:
+            support = {}
+            pending = set()
+            stack = []
+
+            def check(n):
+                if n not in support:
+                    c = core[n]
+                    support[n] = sum(1 for x in self._neighbors(n)
+                                     if core[x] >= c)
+                if support[n] < core[n] and n not in pending:
+                    pending.add(n)
+                    stack.append(n)
+
+            for n in roots:
+                check(n)
+            # Each node is lowered at most once per round, to the end of
+            # the order of its new core number; the nodes lowered are
+            # checked again at their new core number in the next round.
+            lowered = set()
+            while stack:
+                w = stack.pop()
+                c = core[w]
+                self._detach(w)
+                core[w] = c - 1
+                self._append(w)
+                lowered.add(w)
+                for x in self._neighbors(w):
+                    if core[x] == c and x not in lowered:
+                        if x in support:
+                            support[x] -= 1
+                        check(x)
+            demoted |= lowered
+            roots = lowered
+        for n in set(chain(demoted, *(self.G[n] for n in demoted))):
+            if n in core:
+                self._count_later(n)
+
+    def _clear(self):
+        self._build()
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def index_cores(G):
+    """Attach a core index to G that follows changes to G.
+
+    After this call core_number(), and with it k_core(), k_shell(),
+    k_crust() and k_corona(), answer from the index instead of
+    decomposing the graph again, and adding or removing nodes and edges
+    through the methods of G keeps the index up to date.  An update
+    only visits nodes near the change.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph without self loops.
+
+    Returns
+    -------
+    index : CoreIndex
+       The index, also available as G.core_index.
+
+    Raises
+    ------
+    NetworkXError
+       If G has self loops.
+
+    Examples
+    --------
+    >>> G = nx.complete_graph(4)
+    >>> index = nx.index_cores(G)
+    >>> G.add_edge(3, 4)
+    >>> index[4]
+    1
+    >>> G.add_edges_from([(0, 4), (1, 4)])
+    >>> nx.core_number(G)[4]
+    3
+    >>> G.remove_node(0)
+    >>> sorted(nx.k_core(G, 3))
+    []
+
+    Notes
+    -----
+    The index is attached by replacing the mutating methods of G on the
+    instance, like freeze() does.  Changes made to the adjacency
+    dictionaries directly are not seen by the index.  Self loops added
+    to G after the index is attached are ignored.
+
+    See Also
+    --------
+    unindex_cores
+    CoreIndex
+    """
+    _attach_index(G, 'core_index', CoreIndex(G))
+    return G.core_index
+
+
+def unindex_cores(G):
+    """Remove the core index attached to G, if any.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+       An undirected graph.
+
+    See Also
+    --------
+    index_cores
+    """
+    _detach_index(G, 'core_index')
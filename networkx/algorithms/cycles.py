@@ -102,7 +102,7 @@ def cycle_basis(G,root=None):
 
 
 @not_implemented_for('undirected')
-def simple_cycles(G):
+def simple_cycles(G, length_bound=None, n_jobs=None, chunksize=None):
     """Find simple cycles (elementary circuits) of a directed graph.
 
     An simple cycle, or elementary circuit, is a closed path where no
@@ -118,17 +118,38 @@ def simple_cycles(G):
     G : NetworkX DiGraph
        A directed graph
 
+    length_bound : int, optional (default=None)
+       If not None, only the cycles of at most length_bound nodes are
+       generated, and branches of the search that cannot close such a
+       cycle are pruned [4]_.
+
+    n_jobs : int, optional (default=None)
+       If not None, split the search by strongly connected component and
+       starting node across this many worker processes (-1 for one per
+       CPU). See networkx.utils.parallel_imap().
+
+    chunksize : int, optional (default=None)
+       The number of starting nodes sent to a worker process at once when
+       n_jobs is not None.
+
     Returns
     -------
     cycle_generator: generator
        A generator that produces elementary cycles of the graph.  Each cycle is
        a list of nodes with the first and last nodes being the same.
 
+    Raises
+    ------
+    NetworkXError
+       If length_bound is negative.
+
     Examples
     --------
     >>> G = nx.DiGraph([(0, 0), (0, 1), (0, 2), (1, 2), (2, 0), (2, 1), (2, 2)])
     >>> list(nx.simple_cycles(G))
     [[2], [2, 1], [2, 0], [2, 0, 1], [0]]
+    >>> sorted(len(c) for c in nx.simple_cycles(G, length_bound=2))
+    [1, 1, 2, 2]
 
     Notes
     -----
@@ -137,6 +158,16 @@ def simple_cycles(G):
     The time complexity is `O((n+e)(c+1))` for `n` nodes, `e` edges and `c`
     elementary circuits.
 
+    When length_bound or n_jobs is given, the nodes are ranked by strongly
+    connected component and each node is the starting node of the cycles
+    made of it and nodes ranked after it in its component.  The searches
+    from different starting nodes are then independent, and with a
+    length bound each one only visits the nodes that can get back to its
+    starting node within the bound, found by a breadth-first search along
+    the reversed edges, so short cycles of large sparse graphs are found
+    without searching the whole graph from every node.  The order in which the
+    cycles are generated then differs from the one of Johnson's algorithm.
+
     To filter the cycles so that they don't include certain nodes or edges,
     copy your graph and eliminate those nodes or edges before calling::
 
@@ -156,71 +187,191 @@ def simple_cycles(G):
     .. [3] A search strategy for the elementary cycles of a directed graph.
        J.L. Szwarcfiter and P.E. Lauer, BIT NUMERICAL MATHEMATICS,
        v. 16, no. 2, 192-204, 1976.
+    .. [4] Finding all bounded-length simple cycles in a directed graph.
+       A. Gupta and T. Suzumura, arXiv:2105.10094, 2021.
 
     See Also
     --------
     cycle_basis
     """
-    def _unblock(thisnode,blocked,B):
-        stack=set([thisnode])
-        while stack:
-            node=stack.pop()
-            if node in blocked:
-                blocked.remove(node)
-                stack.update(B[node])
-                B[node].clear()
-
+    if length_bound is not None and length_bound < 0:
+        raise nx.NetworkXError('length_bound must be non-negative')
+    if length_bound is None and n_jobs is None:
+        return _johnson_cycles(G)
+    if length_bound == 0:
+        return iter([])
+    # Rank the nodes by component and keep the edges inside components.
+    sccs = list(nx.strongly_connected_components(G))
+    comp = {}
+    rank = {}
+    for i, scc in enumerate(sccs):
+        for v in scc:
+            comp[v] = i
+            rank[v] = len(rank)
+    adj = {}
+    pred = defaultdict(list)
+    order = []
+    for scc in sccs:
+        for v in scc:
+            nbrs = [w for w in G[v] if comp[w] == comp[v]]
+            if nbrs:
+                adj[v] = nbrs
+                order.append(v)
+                for w in nbrs:
+                    pred[w].append(v)
+    shared = (adj, pred, rank, length_bound)
+    if n_jobs is None:
+        return (c for v in order for c in _start_cycles(shared, v))
+    results = parallel_imap(_cycles_from, shared, order,
+                            n_jobs=n_jobs, chunksize=chunksize)
+    return (c for v, cycles in results for c in cycles)
+
+
+def _start_cycles(shared, start):
+    """Generate the cycles made of start and nodes ranked after it.
+
+    shared is the tuple (adj, pred, rank, length_bound) of simple_cycles().
+    """
+    adj, pred, rank, length_bound = shared
+    r = rank[start]
+    if length_bound is None:
+        succ = lambda v: [w for w in adj[v] if rank[w] >= r]
+        return _johnson_cycle_search(succ, start)
+    # Only the nodes close enough to return to start are searched.
+    dist = {start: 0}
+    level = [start]
+    for d in range(1, length_bound):
+        nextlevel = []
+        for v in level:
+            for u in pred[v]:
+                if u not in dist and rank[u] > r:
+                    dist[u] = d
+                    nextlevel.append(u)
+        level = nextlevel
+    succ = lambda v: [w for w in adj[v] if w in dist]
+    return _bounded_cycle_search(succ, start, length_bound, dist)
+
+
+def _cycles_from(shared, start):
+    return list(_start_cycles(shared, start))
+
+
+def _johnson_cycles(G):
     # Johnson's algorithm requires some ordering of the nodes.
     # We assign the arbitrary ordering given by the strongly connected comps
     # There is no need to track the ordering as each node removed as processed.
     subG = type(G)(G.edges_iter()) # save the actual graph so we can mutate it here
                               # We only take the edges because we do not want to
                               # copy edge and node attributes here.
+    succ = lambda v: list(subG[v])  # subG gives component nbrs
     sccs = list(nx.strongly_connected_components(subG))
     while sccs:
         scc=sccs.pop()
         # order of scc determines ordering of nodes
         startnode = scc.pop()
         # Processing node runs "circuit" routine from recursive version
-        path=[startnode]
-        blocked = set() # vertex: blocked from search?
-        closed = set() # nodes involved in a cycle
-        blocked.add(startnode)
-        B=defaultdict(set) # graph portions that yield no elementary circuit
-        stack=[ (startnode,list(subG[startnode])) ]  # subG gives component nbrs
-        while stack:
-            thisnode,nbrs = stack[-1]
-            if nbrs:
-                nextnode = nbrs.pop()
-#                    print thisnode,nbrs,":",nextnode,blocked,B,path,stack,startnode
-#                    f=raw_input("pause")
-                if nextnode == startnode:
-                    yield path[:]
-                    closed.update(path)
-#                        print "Found a cycle",path,closed
-                elif nextnode not in blocked:
-                    path.append(nextnode)
-                    stack.append( (nextnode,list(subG[nextnode])) )
-                    closed.discard(nextnode)
-                    blocked.add(nextnode)
-                    continue
-            # done with nextnode... look for more neighbors
-            if not nbrs:  # no more nbrs
-                if thisnode in closed:
-                    _unblock(thisnode,blocked,B)
-                else:
-                    for nbr in subG[thisnode]:
-                        if thisnode not in B[nbr]:
-                            B[nbr].add(thisnode)
-                stack.pop()
-#                assert path[-1]==thisnode
-                path.pop()
+        for cycle in _johnson_cycle_search(succ, startnode):
+            yield cycle
         # done processing this node
         subG.remove_node(startnode)
         H=subG.subgraph(scc)  # make smaller to avoid work in SCC routine
         sccs.extend(list(nx.strongly_connected_components(H)))
 
 
+def _johnson_cycle_search(succ, startnode):
+    """Generate the cycles through startnode in the graph whose successor
+    lists are given by the function succ.
+    """
+    def _unblock(thisnode,blocked,B):
+        stack=set([thisnode])
+        while stack:
+            node=stack.pop()
+            if node in blocked:
+                blocked.remove(node)
+                stack.update(B[node])
+                B[node].clear()
+
+    path=[startnode]
+    blocked = set() # vertex: blocked from search?
+    closed = set() # nodes involved in a cycle
+    blocked.add(startnode)
+    B=defaultdict(set) # graph portions that yield no elementary circuit
+    stack=[ (startnode,succ(startnode)) ]
+    while stack:
+        thisnode,nbrs = stack[-1]
+        if nbrs:
+            nextnode = nbrs.pop()
+            if nextnode == startnode:
+                yield path[:]
+                closed.update(path)
+            elif nextnode not in blocked:
+                path.append(nextnode)
+                stack.append( (nextnode,succ(nextnode)) )
+                closed.discard(nextnode)
+                blocked.add(nextnode)
+                continue
+        # done with nextnode... look for more neighbors
+        if not nbrs:  # no more nbrs
+            if thisnode in closed:
+                _unblock(thisnode,blocked,B)
+            else:
+                for nbr in succ(thisnode):
+                    if thisnode not in B[nbr]:
+                        B[nbr].add(thisnode)
+            stack.pop()
+            path.pop()
+
+
+def _bounded_cycle_search(succ, start, length_bound, dist):
+    """Generate the cycles of at most length_bound nodes through start in
+    the graph whose successor lists are given by the function succ.
+
+    dist is a dictionary of lower bounds on the distances from the nodes
+    to start.
+
+    Instead of Johnson's blocked set each node has a lock: the node is
+    only entered by paths shorter than its lock.  A node is locked at its
+    position in the path when it is entered, and the lock is raised again
+    when a way back to start is found from it that is short enough.
+    """
+    path = [start]
+    lock = {start: 0}
+    B = defaultdict(set)
+    # blen[i]: lower bound on the length of the ways back to start from path[i]
+    blen = [length_bound]
+    stack = [iter(succ(start))]
+    while stack:
+        for w in stack[-1]:
+            if w == start:
+                yield path[:]
+                blen[-1] = 1
+            elif (len(path) + dist[w] <= length_bound and
+                  len(path) < lock.get(w, length_bound)):
+                path.append(w)
+                lock[w] = len(path)
+                blen.append(length_bound)
+                stack.append(iter(succ(w)))
+                break
+        else:
+            stack.pop()
+            v = path.pop()
+            bl = blen.pop()
+            if blen:
+                blen[-1] = min(blen[-1], bl)
+            if bl < length_bound:
+                # unlock v and the nodes that were waiting on it
+                relax = [(bl, v)]
+                while relax:
+                    bl, u = relax.pop()
+                    if lock.get(u, length_bound) < length_bound - bl + 1:
+                        lock[u] = length_bound - bl + 1
+                        relax.extend((bl + 1, x) for x in B[u]
+                                     if x not in path)
+            else:
+                for w in succ(v):
+                    B[w].add(v)
+
+
 @not_implemented_for('undirected')
 def recursive_simple_cycles(G):
     """Find simple cycles (elementary circuits) of a directed graph.
@@ -5,7 +5,9 @@ from .preflowpush import *
 from .shortestaugmentingpath import *
 from .capacityscaling import *
 from .networksimplex import *
+from .gomoryhu import *
 from .utils import build_flow_dict, build_residual_network
+from .utils import ResidualArrays, build_residual_arrays
 
 
 __all__ = sum([maxflow.__all__,
@@ -15,4 +17,5 @@ __all__ = sum([maxflow.__all__,
                 shortestaugmentingpath.__all__,
                 capacityscaling.__all__,
                 networksimplex.__all__,
+                gomoryhu.__all__,
             ], [])
@@ -10,39 +10,33 @@ __author__ = """ysitu <ysitu@users.noreply.github.com>"""
 
 import networkx as nx
 from networkx.algorithms.flow.utils import *
+from networkx.algorithms.flow.utils import _residual_arrays, _residual_result
 
 __all__ = ['edmonds_karp']
 
 
 def edmonds_karp_core(R, s, t, cutoff):
-    """Implementation of the Edmonds-Karp algorithm.
+    """Implementation of the Edmonds-Karp algorithm on the residual network
+    arrays R between the nodes numbered s and t.
     """
-    R_node = R.node
-    R_pred = R.pred
-    R_succ = R.succ
+    R_head = R.head
+    R_capacity = R.capacity
+    R_flow = R.flow
+    R_arcs = R.arcs
 
     inf = R.graph['inf']
     def augment(path):
-        """Augment flow along a path from s to t.
+        """Augment flow along a path of arcs from s to t.
         """
         # Determine the path residual capacity.
-        flow = inf
-        it = iter(path)
-        u = next(it)
-        for v in it:
-            attr = R_succ[u][v]
-            flow = min(flow, attr['capacity'] - attr['flow'])
-            u = v
+        flow = min(R_capacity[a] - R_flow[a] for a in path)
         if flow * 2 > inf:
             raise nx.NetworkXUnbounded(
                 'Infinite capacity path, flow unbounded above.')
         # Augment flow along the path.
-        it = iter(path)
-        u = next(it)
-        for v in it:
-            R_succ[u][v]['flow'] += flow
-            R_succ[v][u]['flow'] -= flow
-            u = v
+        for a in path:
+            R_flow[a] += flow
+            R_flow[a ^ 1] -= flow
         return flow
 
     def bidirectional_bfs():
@@ -56,9 +50,10 @@ def edmonds_karp_core(R, s, t, cutoff):
             q = []
             if len(q_s) <= len(q_t):
                 for u in q_s:
-                    for v, attr in R_succ[u].items():
-                        if v not in pred and attr['flow'] < attr['capacity']:
-                            pred[v] = u
+                    for a in R_arcs[u]:
+                        v = R_head[a]
+                        if v not in pred and R_flow[a] < R_capacity[a]:
+                            pred[v] = a
                             if v in succ:
                                 return v, pred, succ
                             q.append(v)
@@ -67,9 +62,11 @@ def edmonds_karp_core(R, s, t, cutoff):
                 q_s = q
             else:
                 for u in q_t:
-                    for v, attr in R_pred[u].items():
-                        if v not in succ and attr['flow'] < attr['capacity']:
-                            succ[v] = u
+                    for a in R_arcs[u]:
+                        v = R_head[a]
+                        a ^= 1
+                        if v not in succ and R_flow[a] < R_capacity[a]:
+                            succ[v] = a
                             if v in pred:
                                 return v, pred, succ
                             q.append(v)
@@ -83,18 +80,20 @@ def edmonds_karp_core(R, s, t, cutoff):
         v, pred, succ = bidirectional_bfs()
         if pred is None:
             break
-        path = [v]
+        path = []
         # Trace a path from s to v.
         u = v
         while u != s:
-            u = pred[u]
-            path.append(u)
+            a = pred[u]
+            path.append(a)
+            u = R_head[a ^ 1]
         path.reverse()
         # Trace a path from v to t.
         u = v
         while u != t:
-            u = succ[u]
-            path.append(u)
+            a = succ[u]
+            path.append(a)
+            u = R_head[a]
         flow_value += augment(path)
 
     return flow_value
@@ -110,19 +109,15 @@ def edmonds_karp_impl(G, s, t, capacity, residual, cutoff):
     if s == t:
         raise nx.NetworkXError('source and sink are the same node')
 
-    if residual is None:
-        R = build_residual_network(G, capacity)
-    else:
-        R = residual
+    R = _residual_arrays(G, capacity, residual)
 
     # Initialize/reset the residual network.
-    for u in R:
-        for e in R[u].values():
-            e['flow'] = 0
+    R.reset()
 
     if cutoff is None:
         cutoff = float('inf')
-    R.graph['flow_value'] = edmonds_karp_core(R, s, t, cutoff)
+    R.graph['flow_value'] = edmonds_karp_core(R, R.index[s], R.index[t],
+                                              cutoff)
 
     return R
 
@@ -158,9 +153,11 @@ def edmonds_karp(G, s, t, capacity='capacity', residual=None, value_only=False,
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ResidualArrays
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If it is a ResidualArrays, as
+        built by :meth:`build_residual_arrays`, the flow is computed in it
+        and it is returned instead of a DiGraph. Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -173,8 +170,9 @@ def edmonds_karp(G, s, t, capacity='capacity', residual=None, value_only=False,
 
     Returns
     -------
-    R : NetworkX DiGraph
-        Residual network after computing the maximum flow.
+    R : NetworkX DiGraph or ResidualArrays
+        Residual network after computing the maximum flow. It is the
+        residual argument if that was given.
 
     Raises
     ------
@@ -246,4 +244,4 @@ def edmonds_karp(G, s, t, capacity='capacity', residual=None, value_only=False,
     """
     R = edmonds_karp_impl(G, s, t, capacity, residual, cutoff)
     R.graph['algorithm'] = 'edmonds_karp'
-    return R
+    return _residual_result(R, residual)
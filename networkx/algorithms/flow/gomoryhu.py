@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+"""
+Gomory-Hu trees of undirected capacitated graphs.
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+from networkx.utils import not_implemented_for
+
+from .maxflow import array_flow_funcs, default_flow_func, minimum_cut
+from .utils import build_residual_arrays
+
+__all__ = ['gomory_hu_tree',
+           'gomory_hu_cut',
+           'gomory_hu_cut_value']
+
+
+@not_implemented_for('directed')
+def gomory_hu_tree(G, capacity='capacity', flow_func=None):
+    """Return the Gomory-Hu tree of an undirected capacitated graph.
+
+    A Gomory-Hu tree of G is a weighted tree on the nodes of G such that,
+    for any pair of nodes u and v, the minimum weight of an edge on the
+    path between them in the tree is the value of a minimum u-v cut in
+    G, and removing that edge from the tree splits the nodes into the two
+    sides of such a cut.  Building it takes n - 1 maximum flow
+    computations, after which the minimum cut between any pair of nodes
+    can be read from the tree with gomory_hu_cut_value() and
+    gomory_hu_cut().
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        Undirected graph.
+
+    capacity : string
+        Edges of the graph G are expected to have an attribute capacity
+        that indicates how much flow the edge can support. If this
+        attribute is not present, the edge is considered to have
+        infinite capacity. Default value: 'capacity'.
+
+    flow_func : function
+        A function for computing the maximum flow among a pair of nodes,
+        as in :meth:`minimum_cut`. If flow_func is None, the default
+        maximum flow function is used. Default value: None.
+
+    Returns
+    -------
+    T : NetworkX graph
+        The Gomory-Hu tree of G. The attribute 'weight' of each of its
+        edges holds the value of the minimum cut it stands for.
+
+    Raises
+    ------
+    NetworkXNotImplemented
+        If G is directed.
+
+    NetworkXError
+        If G has no nodes.
+
+    NetworkXUnbounded
+        If two nodes of G are joined by a path of infinite capacity.
+
+    Examples
+    --------
+    >>> G = nx.karate_club_graph()
+    >>> nx.set_edge_attributes(G, 'capacity', 1)
+    >>> T = nx.gomory_hu_tree(G)
+    >>> nx.gomory_hu_cut_value(T, 0, 33) == nx.minimum_cut_value(G, 0, 33)
+    True
+    >>> value, (S, _) = nx.gomory_hu_cut(T, 11, 33)
+    >>> value, sorted(S)
+    (1, [11])
+
+    Notes
+    -----
+    This implements Gusfield's algorithm [1]_, which finds the cuts of a
+    Gomory-Hu tree in the original graph, without the graph contractions
+    of the algorithm of Gomory and Hu [2]_. When flow_func can work on
+    residual network arrays, the same arrays are reused for all the
+    maximum flow computations.
+
+    See also
+    --------
+    gomory_hu_cut
+    gomory_hu_cut_value
+    minimum_cut
+
+    References
+    ----------
+    .. [1] Gusfield, D. Very simple methods for all pairs network flow
+       analysis. SIAM Journal on Computing 19(1), 143-155, 1990.
+    .. [2] Gomory, R. E. and Hu, T. C. Multi-terminal network flows.
+       Journal of the SIAM 9(4), 551-570, 1961.
+    """
+    if len(G) == 0:
+        raise nx.NetworkXError('Empty graph does not have a Gomory-Hu tree.')
+
+    if flow_func is None:
+        flow_func = default_flow_func
+    kwargs = dict(capacity=capacity, flow_func=flow_func)
+    if flow_func in array_flow_funcs:
+        kwargs['residual'] = build_residual_arrays(G, capacity)
+
+    nodes = list(G)
+    root = nodes[0]
+    parent = dict.fromkeys(nodes, root)
+    value = {}
+    for s in nodes[1:]:
+        t = parent[s]
+        cut_value, (S, _) = minimum_cut(G, s, t, **kwargs)
+        value[s] = cut_value
+        # Nodes on the s side of the cut that hang from t now hang from s.
+        for u in S:
+            if u != s and parent[u] == t:
+                parent[u] = s
+        if parent[t] in S:
+            parent[s] = parent[t]
+            parent[t] = s
+            value[s] = value[t]
+            value[t] = cut_value
+
+    T = nx.Graph()
+    T.add_nodes_from(nodes)
+    T.add_weighted_edges_from((u, parent[u], value[u]) for u in nodes[1:])
+    return T
+
+
+def _minimum_edge(T, u, v, weight):
+    """Return the edge of minimum weight on the path from u to v in T."""
+    if u == v:
+        raise nx.NetworkXError('source and sink are the same node')
+    path = nx.shortest_path(T, u, v)
+    return min(zip(path, path[1:]), key=lambda e: T[e[0]][e[1]][weight])
+
+
+def gomory_hu_cut_value(T, u, v, weight='weight'):
+    """Return the value of a minimum u-v cut from a Gomory-Hu tree.
+
+    Parameters
+    ----------
+    T : NetworkX graph
+        A Gomory-Hu tree, as returned by :meth:`gomory_hu_tree`.
+
+    u, v : nodes
+        Two distinct nodes of T.
+
+    weight : string
+        Edge attribute holding the cut values. Default value: 'weight'.
+
+    Returns
+    -------
+    cut_value : integer, float
+        Value of a minimum u-v cut in the graph the tree was built from.
+
+    Examples
+    --------
+    >>> G = nx.Graph()
+    >>> G.add_edge(0, 1, capacity=3)
+    >>> G.add_edge(1, 2, capacity=1)
+    >>> G.add_edge(0, 2, capacity=2)
+    >>> T = nx.gomory_hu_tree(G)
+    >>> nx.gomory_hu_cut_value(T, 0, 1)
+    4
+
+    See also
+    --------
+    gomory_hu_tree
+    gomory_hu_cut
+    """
+    x, y = _minimum_edge(T, u, v, weight)
+    return T[x][y][weight]
+
+
+def gomory_hu_cut(T, u, v, weight='weight'):
+    """Return the value and partition of a minimum u-v cut from a
+    Gomory-Hu tree.
+
+    Parameters
+    ----------
+    T : NetworkX graph
+        A Gomory-Hu tree, as returned by :meth:`gomory_hu_tree`.
+
+    u, v : nodes
+        Two distinct nodes of T.
+
+    weight : string
+        Edge attribute holding the cut values. Default value: 'weight'.
+
+    Returns
+    -------
+    cut_value : integer, float
+        Value of a minimum u-v cut in the graph the tree was built from.
+
+    partition : pair of node sets
+        The sides of the cut, the first one containing u and the second
+        one containing v.
+
+    Examples
+    --------
+    >>> G = nx.Graph()
+    >>> G.add_edge(0, 1, capacity=3)
+    >>> G.add_edge(1, 2, capacity=1)
+    >>> G.add_edge(0, 2, capacity=2)
+    >>> T = nx.gomory_hu_tree(G)
+    >>> cut_value, (S, V) = nx.gomory_hu_cut(T, 0, 2)
+    >>> cut_value, sorted(S), sorted(V)
+    (3, [0, 1], [2])
+
+    See also
+    --------
+    gomory_hu_tree
+    gomory_hu_cut_value
+    """
+    x, y = _minimum_edge(T, u, v, weight)
+    # The side of u is what remains reachable from u without the edge.
+    side = set([x])
+    stack = [x]
+    while stack:
+        w = stack.pop()
+        for z in T[w]:
+            if z not in side and (w, z) != (x, y):
+                side.add(z)
+                stack.append(z)
+    return (T[x][y][weight], (side, set(T) - side))
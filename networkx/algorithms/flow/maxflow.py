@@ -9,7 +9,10 @@ from .edmondskarp import edmonds_karp
 from .preflowpush import preflow_push
 from .shortestaugmentingpath import shortest_augmenting_path
 from .utils import build_flow_dict
+from .utils import ResidualArrays, build_residual_arrays
 default_flow_func = preflow_push
+# Flow functions that can work on residual network arrays.
+array_flow_funcs = (edmonds_karp, preflow_push, shortest_augmenting_path)
 
 __all__ = ['maximum_flow',
            'maximum_flow_value',
@@ -155,6 +158,10 @@ def maximum_flow(G, s, t, capacity='capacity', flow_func=None, **kwargs):
     if not callable(flow_func):
         raise nx.NetworkXError("flow_func has to be callable.")
 
+    if flow_func in array_flow_funcs and kwargs.get('residual') is None:
+        # Nobody needs a DiGraph residual network: work on arrays.
+        kwargs['residual'] = build_residual_arrays(G, capacity)
+
     R = flow_func(G, s, t, capacity=capacity, value_only=False, **kwargs)
     flow_dict = build_flow_dict(G, R)
 
@@ -293,6 +300,10 @@ def maximum_flow_value(G, s, t, capacity='capacity', flow_func=None, **kwargs):
     if not callable(flow_func):
         raise nx.NetworkXError("flow_func has to be callable.")
 
+    if flow_func in array_flow_funcs and kwargs.get('residual') is None:
+        # Nobody needs a DiGraph residual network: work on arrays.
+        kwargs['residual'] = build_residual_arrays(G, capacity)
+
     R = flow_func(G, s, t, capacity=capacity, value_only=True, **kwargs)
 
     return R.graph['flow_value']
@@ -442,10 +453,18 @@ def minimum_cut(G, s, t, capacity='capacity', flow_func=None, **kwargs):
         raise nx.NetworkXError("flow_func has to be callable.")
 
     if (kwargs.get('cutoff') is not None and
-        flow_func in (edmonds_karp, preflow_push, shortest_augmenting_path)):
+        flow_func in array_flow_funcs):
         raise nx.NetworkXError("cutoff should not be specified.")
 
+    if flow_func in array_flow_funcs and kwargs.get('residual') is None:
+        # Nobody needs a DiGraph residual network: work on arrays.
+        kwargs['residual'] = build_residual_arrays(G, capacity)
+
     R = flow_func(G, s, t, capacity=capacity, value_only=True, **kwargs)
+    if isinstance(R, ResidualArrays):
+        non_reachable = R.sink_side(t)
+        return (R.graph['flow_value'], (set(G) - non_reachable, non_reachable))
+
     # Remove saturated edges from the residual network 
     cutset = [(u, v, d) for u, v, d in R.edges(data=True)
               if d['flow'] == d['capacity']]
@@ -593,9 +612,13 @@ def minimum_cut_value(G, s, t, capacity='capacity', flow_func=None, **kwargs):
         raise nx.NetworkXError("flow_func has to be callable.")
 
     if (kwargs.get('cutoff') is not None and
-        flow_func in (edmonds_karp, preflow_push, shortest_augmenting_path)):
+        flow_func in array_flow_funcs):
         raise nx.NetworkXError("cutoff should not be specified.")
 
+    if flow_func in array_flow_funcs and kwargs.get('residual') is None:
+        # Nobody needs a DiGraph residual network: work on arrays.
+        kwargs['residual'] = build_residual_arrays(G, capacity)
+
     R = flow_func(G, s, t, capacity=capacity, value_only=True, **kwargs)
 
     return R.graph['flow_value']
@@ -12,6 +12,7 @@ from collections import deque
 from itertools import islice
 import networkx as nx
 from networkx.algorithms.flow.utils import *
+from networkx.algorithms.flow.utils import _residual_arrays, _residual_result
 
 __all__ = ['preflow_push']
 
@@ -32,22 +33,22 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
     if global_relabel_freq < 0:
         raise nx.NetworkXError('global_relabel_freq must be nonnegative.')
 
-    if residual is None:
-        R = build_residual_network(G, capacity)
-    else:
-        R = residual
+    R = _residual_arrays(G, capacity, residual)
 
     detect_unboundedness(R, s, t)
 
-    R_node = R.node
-    R_pred = R.pred
-    R_succ = R.succ
+    R_head = R.head
+    R_arcs = R.arcs
 
     # Initialize/reset the residual network.
-    for u in R:
-        R_node[u]['excess'] = 0
-        for e in R_succ[u].values():
-            e['flow'] = 0
+    R.reset()
+    R_capacity = R.capacity
+    R_flow = R.flow
+
+    s = R.index[s]
+    t = R.index[t]
+    n = len(R)
+    R_excess = R.excess = [0] * n
 
     def reverse_bfs(src):
         """Perform a reverse breadth-first search from src in the residual
@@ -58,8 +59,9 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
         while q:
             u, height = q.popleft()
             height += 1
-            for v, attr in R_pred[u].items():
-                if v not in heights and attr['flow'] < attr['capacity']:
+            for a in R_arcs[u]:
+                v = R_head[a]
+                if v not in heights and R_flow[a ^ 1] < R_capacity[a ^ 1]:
                     heights[v] = height
                     q.append((v, height))
         return heights
@@ -73,40 +75,38 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
         R.graph['flow_value'] = 0
         return R
 
-    n = len(R)
     # max_height represents the height of the highest level below level n with
     # at least one active node.
     max_height = max(heights[u] for u in heights if u != s)
     heights[s] = n
 
-    grt = GlobalRelabelThreshold(n, R.size(), global_relabel_freq)
+    grt = GlobalRelabelThreshold(n, R.number_of_arcs(), global_relabel_freq)
 
-    # Initialize heights and 'current edge' data structures of the nodes.
-    for u in R:
-        R_node[u]['height'] = heights[u] if u in heights else n + 1
-        R_node[u]['curr_edge'] = CurrentEdge(R_succ[u])
+    # Initialize heights and 'current arc' positions of the nodes.
+    R_height = [heights.get(u, n + 1) for u in range(n)]
+    R_curr = [0] * n
 
-    def push(u, v, flow):
-        """Push flow units of flow from u to v.
+    def push(u, v, a, flow):
+        """Push flow units of flow from u to v along the arc a.
         """
-        R_succ[u][v]['flow'] += flow
-        R_succ[v][u]['flow'] -= flow
-        R_node[u]['excess'] -= flow
-        R_node[v]['excess'] += flow
+        R_flow[a] += flow
+        R_flow[a ^ 1] -= flow
+        R_excess[u] -= flow
+        R_excess[v] += flow
 
     # The maximum flow must be nonzero now. Initialize the preflow by
     # saturating all edges emanating from s.
-    for u, attr in R_succ[s].items():
-        flow = attr['capacity']
+    for a in R_arcs[s]:
+        flow = R_capacity[a]
         if flow > 0:
-            push(s, u, flow)
+            push(s, R_head[a], a, flow)
 
     # Partition nodes into levels.
     levels = [Level() for i in range(2 * n - 1)]
-    for u in R:
+    for u in range(n):
         if u != s and u != t:
-            level = levels[R_node[u]['height']]
-            if R_node[u]['excess'] > 0:
+            level = levels[R_height[u]]
+            if R_excess[u] > 0:
                 level.active.add(u)
             else:
                 level.inactive.add(u)
@@ -115,7 +115,7 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
         """Move a node from the inactive set to the active set of its level.
         """
         if v != s and v != t:
-            level = levels[R_node[v]['height']]
+            level = levels[R_height[v]]
             if v in level.inactive:
                 level.inactive.remove(v)
                 level.active.add(v)
@@ -123,38 +123,37 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
     def relabel(u):
         """Relabel a node to create an admissible edge.
         """
-        grt.add_work(len(R_succ[u]))
-        return min(R_node[v]['height'] for v, attr in R_succ[u].items()
-                   if attr['flow'] < attr['capacity']) + 1
+        grt.add_work(len(R_arcs[u]))
+        return min(R_height[R_head[a]] for a in R_arcs[u]
+                   if R_flow[a] < R_capacity[a]) + 1
 
     def discharge(u, is_phase1):
         """Discharge a node until it becomes inactive or, during phase 1 (see
         below), its height reaches at least n. The node is known to have the
         largest height among active nodes.
         """
-        height = R_node[u]['height']
-        curr_edge = R_node[u]['curr_edge']
+        height = R_height[u]
+        arcs = R_arcs[u]
         # next_height represents the next height to examine after discharging
         # the current node. During phase 1, it is capped to below n.
         next_height = height
         levels[height].active.remove(u)
         while True:
-            v, attr = curr_edge.get()
-            if (height == R_node[v]['height'] + 1 and
-                attr['flow'] < attr['capacity']):
-                flow = min(R_node[u]['excess'],
-                           attr['capacity'] - attr['flow'])
-                push(u, v, flow)
+            a = arcs[R_curr[u]]
+            v = R_head[a]
+            if height == R_height[v] + 1 and R_flow[a] < R_capacity[a]:
+                flow = min(R_excess[u], R_capacity[a] - R_flow[a])
+                push(u, v, a, flow)
                 activate(v)
-                if R_node[u]['excess'] == 0:
+                if R_excess[u] == 0:
                     # The node has become inactive.
                     levels[height].inactive.add(u)
                     break
-            try:
-                curr_edge.move_to_next()
-            except StopIteration:
+            R_curr[u] += 1
+            if R_curr[u] == len(arcs):
                 # We have run off the end of the adjacency list, and there can
                 # be no more admissible edges. Relabel the node to create one.
+                R_curr[u] = 0
                 height = relabel(u)
                 if is_phase1 and height >= n - 1:
                     # Although the node is still active, with a height at least
@@ -167,7 +166,7 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
                 # structure is not rewound. Use height instead of (height - 1)
                 # in case other active nodes at the same level are missed.
                 next_height = height
-        R_node[u]['height'] = height
+        R_height[u] = height
         return next_height
 
     def gap_heuristic(height):
@@ -176,9 +175,9 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
         # Move all nodes at levels (height + 1) to max_height to level n + 1.
         for level in islice(levels, height + 1, max_height + 1):
             for u in level.active:
-                R_node[u]['height'] = n + 1
+                R_height[u] = n + 1
             for u in level.inactive:
-                R_node[u]['height'] = n + 1
+                R_height[u] = n + 1
             levels[n + 1].active.update(level.active)
             level.active.clear()
             levels[n + 1].inactive.update(level.inactive)
@@ -196,8 +195,8 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
         if from_sink:
             # Also mark nodes from which t is unreachable for relabeling. This
             # serves the same purpose as the gap heuristic.
-            for u in R:
-                if u not in heights and R_node[u]['height'] < n:
+            for u in range(n):
+                if u not in heights and R_height[u] < n:
                     heights[u] = n + 1
         else:
             # Shift the computed heights because the height of s is n.
@@ -206,7 +205,7 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
             max_height += n
         del heights[src]
         for u, new_height in heights.items():
-            old_height = R_node[u]['height']
+            old_height = R_height[u]
             if new_height != old_height:
                 if u in levels[old_height].active:
                     levels[old_height].active.remove(u)
@@ -214,7 +213,7 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
                 else:
                     levels[old_height].inactive.remove(u)
                     levels[new_height].inactive.add(u)
-                R_node[u]['height'] = new_height
+                R_height[u] = new_height
         return max_height
 
     # Phase 1: Find the maximum preflow by pushing as much flow as possible to
@@ -257,7 +256,7 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
     # A maximum preflow has been found. The excess at t is the maximum flow
     # value.
     if value_only:
-        R.graph['flow_value'] = R_node[t]['excess']
+        R.graph['flow_value'] = R_excess[t]
         return R
 
     # Phase 2: Convert the maximum preflow into a maximum flow by returning the
@@ -284,7 +283,7 @@ def preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
                 height = global_relabel(False)
                 grt.clear_work()
 
-    R.graph['flow_value'] = R_node[t]['excess']
+    R.graph['flow_value'] = R_excess[t]
     return R
 
 
@@ -320,9 +319,11 @@ def preflow_push(G, s, t, capacity='capacity', residual=None,
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ResidualArrays
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If it is a ResidualArrays, as
+        built by :meth:`build_residual_arrays`, the flow is computed in it
+        and it is returned instead of a DiGraph. Default value: None.
 
     global_relabel_freq : integer, float
         Relative frequency of applying the global relabeling heuristic to speed
@@ -336,8 +337,9 @@ def preflow_push(G, s, t, capacity='capacity', residual=None,
 
     Returns
     -------
-    R : NetworkX DiGraph
-        Residual network after computing the maximum flow.
+    R : NetworkX DiGraph or ResidualArrays
+        Residual network after computing the maximum flow. It is the
+        residual argument if that was given.
 
     Raises
     ------
@@ -421,4 +423,4 @@ def preflow_push(G, s, t, capacity='capacity', residual=None,
     R = preflow_push_impl(G, s, t, capacity, residual, global_relabel_freq,
                           value_only)
     R.graph['algorithm'] = 'preflow_push'
-    return R
+    return _residual_result(R, residual)
@@ -11,6 +11,7 @@ __author__ = """ysitu <ysitu@users.noreply.github.com>"""
 from collections import deque
 import networkx as nx
 from .utils import *
+from .utils import _residual_arrays, _residual_result
 from .edmondskarp import edmonds_karp_core
 
 __all__ = ['shortest_augmenting_path']
@@ -27,19 +28,18 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
     if s == t:
         raise nx.NetworkXError('source and sink are the same node')
 
-    if residual is None:
-        R = build_residual_network(G, capacity)
-    else:
-        R = residual
+    R = _residual_arrays(G, capacity, residual)
 
-    R_node = R.node
-    R_pred = R.pred
-    R_succ = R.succ
+    R_head = R.head
+    R_arcs = R.arcs
 
     # Initialize/reset the residual network.
-    for u in R:
-        for e in R_succ[u].values():
-            e['flow'] = 0
+    R.reset()
+    R_capacity = R.capacity
+    R_flow = R.flow
+
+    s = R.index[s]
+    t = R.index[t]
 
     # Initialize heights of the nodes.
     heights = {t: 0}
@@ -47,8 +47,9 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
     while q:
         u, height = q.popleft()
         height += 1
-        for v, attr in R_pred[u].items():
-            if v not in heights and attr['flow'] < attr['capacity']:
+        for a in R_arcs[u]:
+            v = R_head[a]
+            if v not in heights and R_flow[a ^ 1] < R_capacity[a ^ 1]:
                 heights[v] = height
                 q.append((v, height))
 
@@ -58,50 +59,40 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
         R.graph['flow_value'] = 0
         return R
 
-    n = len(G)
-    m = R.size() / 2
+    n = len(R)
+    m = R.number_of_arcs() / 2
 
-    # Initialize heights and 'current edge' data structures of the nodes.
-    for u in R:
-        R_node[u]['height'] = heights[u] if u in heights else n
-        R_node[u]['curr_edge'] = CurrentEdge(R_succ[u])
+    # Initialize heights and 'current arc' positions of the nodes.
+    R_height = [heights.get(u, n) for u in range(n)]
+    R_curr = [0] * n
 
     # Initialize counts of nodes in each level.
     counts = [0] * (2 * n - 1)
-    for u in R:
-        counts[R_node[u]['height']] += 1
+    for height in R_height:
+        counts[height] += 1
 
     inf = R.graph['inf']
     def augment(path):
-        """Augment flow along a path from s to t.
+        """Augment flow along a path of arcs from s to t.
         """
         # Determine the path residual capacity.
-        flow = inf
-        it = iter(path)
-        u = next(it)
-        for v in it:
-            attr = R_succ[u][v]
-            flow = min(flow, attr['capacity'] - attr['flow'])
-            u = v
+        flow = min(R_capacity[a] - R_flow[a] for a in path)
         if flow * 2 > inf:
             raise nx.NetworkXUnbounded(
                 'Infinite capacity path, flow unbounded above.')
         # Augment flow along the path.
-        it = iter(path)
-        u = next(it)
-        for v in it:
-            R_succ[u][v]['flow'] += flow
-            R_succ[v][u]['flow'] -= flow
-            u = v
+        for a in path:
+            R_flow[a] += flow
+            R_flow[a ^ 1] -= flow
         return flow
 
     def relabel(u):
         """Relabel a node to create an admissible edge.
         """
         height = n - 1
-        for v, attr in R_succ[u].items():
-            if attr['flow'] < attr['capacity']:
-                height = min(height, R_node[v]['height'])
+        for a in R_arcs[u]:
+            if R_flow[a] < R_capacity[a]:
+                height = min(height, R_height[R_head[a]])
         return height + 1
 
     if cutoff is None:
@@ -110,25 +101,25 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
     # Phase 1: Look for shortest augmenting paths using depth-first search.
 
     flow_value = 0
-    path = [s]
+    path = []
     u = s
     d = n if not two_phase else int(min(m ** 0.5, 2 * n ** (2. / 3)))
-    done = R_node[s]['height'] >= d
+    done = R_height[s] >= d
     while not done:
-        height = R_node[u]['height']
-        curr_edge = R_node[u]['curr_edge']
+        height = R_height[u]
+        arcs = R_arcs[u]
         # Depth-first search for the next node on the path to t.
         while True:
-            v, attr = curr_edge.get()
-            if (height == R_node[v]['height'] + 1 and
-                attr['flow'] < attr['capacity']):
+            a = arcs[R_curr[u]]
+            v = R_head[a]
+            if height == R_height[v] + 1 and R_flow[a] < R_capacity[a]:
                 # Advance to the next node following an admissible edge.
-                path.append(v)
+                path.append(a)
                 u = v
                 break
-            try:
-                curr_edge.move_to_next()
-            except StopIteration:
+            R_curr[u] += 1
+            if R_curr[u] == len(arcs):
+                R_curr[u] = 0
                 counts[height] -= 1
                 if counts[height] == 0:
                     # Gap heuristic: If relabeling causes a level to become
@@ -148,12 +139,11 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
                         done = True
                         break
                 counts[height] += 1
-                R_node[u]['height'] = height
+                R_height[u] = height
                 if u != s:
                     # After relabeling, the last edge on the path is no longer
                     # admissible. Retreat one step to look for an alternative.
-                    path.pop()
-                    u = path[-1]
+                    u = R_head[path.pop() ^ 1]
                     break
         if u == t:
             # t is reached. Augment flow along the path and reset it for a new
@@ -162,7 +152,7 @@ def shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
             if flow_value >= cutoff:
                 R.graph['flow_value'] = flow_value
                 return R
-            path = [s]
+            path = []
             u = s
 
     # Phase 2: Look for shortest augmenting paths using breadth-first search.
@@ -204,9 +194,11 @@ def shortest_augmenting_path(G, s, t, capacity='capacity', residual=None,
         attribute is not present, the edge is considered to have
         infinite capacity. Default value: 'capacity'.
 
-    residual : NetworkX graph
+    residual : NetworkX graph or ResidualArrays
         Residual network on which the algorithm is to be executed. If None, a
-        new residual network is created. Default value: None.
+        new residual network is created. If it is a ResidualArrays, as
+        built by :meth:`build_residual_arrays`, the flow is computed in it
+        and it is returned instead of a DiGraph. Default value: None.
 
     value_only : bool
         If True compute only the value of the maximum flow. This parameter
@@ -224,8 +216,9 @@ def shortest_augmenting_path(G, s, t, capacity='capacity', residual=None,
 
     Returns
     -------
-    R : NetworkX DiGraph
-        Residual network after computing the maximum flow.
+    R : NetworkX DiGraph or ResidualArrays
+        Residual network after computing the maximum flow. It is the
+        residual argument if that was given.
 
     Raises
     ------
@@ -298,4 +291,4 @@ def shortest_augmenting_path(G, s, t, capacity='capacity', residual=None,
     R = shortest_augmenting_path_impl(G, s, t, capacity, residual, two_phase,
                                       cutoff)
     R.graph['algorithm'] = 'shortest_augmenting_path'
-    return R
+    return _residual_result(R, residual)
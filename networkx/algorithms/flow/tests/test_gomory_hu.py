@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Gomory-Hu tree test suite.
+"""
+import itertools
+from nose.tools import *
+
+import networkx as nx
+from networkx.algorithms.flow import (edmonds_karp, preflow_push,
+    shortest_augmenting_path)
+
+flow_funcs = [edmonds_karp, preflow_push, shortest_augmenting_path]
+
+msg = "Assertion failed in function: {0}"
+
+
+def cut_capacity(G, partition, capacity='capacity'):
+    S, V = partition
+    return sum(G[u][v][capacity] for u in S for v in G[u] if v in V)
+
+
+class TestGomoryHuTree:
+
+    def setUp(self):
+        G = nx.gnm_random_graph(15, 35, seed=7)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['capacity'] = i % 4 + 1
+        self.G = G
+
+    def test_tree(self):
+        G = self.G
+        T = nx.gomory_hu_tree(G)
+        assert_true(nx.is_tree(T))
+        assert_equal(sorted(T), sorted(G))
+
+    def test_cut_values(self):
+        G = self.G
+        for flow_func in flow_funcs:
+            T = nx.gomory_hu_tree(G, flow_func=flow_func)
+            for u, v in itertools.combinations(G, 2):
+                assert_equal(nx.gomory_hu_cut_value(T, u, v),
+                             nx.minimum_cut_value(G, u, v),
+                             msg=msg.format(flow_func.__name__))
+
+    def test_cut_partitions(self):
+        G = self.G
+        T = nx.gomory_hu_tree(G)
+        for u, v in itertools.combinations(G, 2):
+            cut_value, partition = nx.gomory_hu_cut(T, u, v)
+            assert_true(u in partition[0])
+            assert_true(v in partition[1])
+            assert_equal(set(G), partition[0] | partition[1])
+            assert_equal(cut_value, cut_capacity(G, partition))
+
+    def test_edge_connectivity(self):
+        G = nx.karate_club_graph()
+        nx.set_edge_attributes(G, 'weight', 1)
+        T = nx.gomory_hu_tree(G, capacity='weight')
+        for u, v in [(0, 33), (11, 33), (4, 5), (2, 24)]:
+            assert_equal(nx.gomory_hu_cut_value(T, u, v),
+                         nx.edge_connectivity(G, u, v))
+
+    def test_disconnected(self):
+        G = nx.Graph()
+        G.add_edge(0, 1, capacity=2)
+        G.add_edge(2, 3, capacity=5)
+        T = nx.gomory_hu_tree(G)
+        assert_equal(nx.gomory_hu_cut_value(T, 0, 1), 2)
+        assert_equal(nx.gomory_hu_cut_value(T, 0, 3), 0)
+        cut_value, partition = nx.gomory_hu_cut(T, 2, 3)
+        assert_equal(cut_value, 5)
+        assert_true(2 in partition[0] and 3 in partition[1])
+        assert_equal(cut_capacity(G, partition), 5)
+
+    def test_single_node(self):
+        G = nx.Graph()
+        G.add_node(0)
+        T = nx.gomory_hu_tree(G)
+        assert_equal(list(T), [0])
+        assert_equal(T.number_of_edges(), 0)
+
+    def test_exceptions(self):
+        assert_raises(nx.NetworkXNotImplemented, nx.gomory_hu_tree,
+                      nx.DiGraph([(0, 1)]))
+        assert_raises(nx.NetworkXError, nx.gomory_hu_tree, nx.Graph())
+        assert_raises(nx.NetworkXUnbounded, nx.gomory_hu_tree,
+                      nx.path_graph(3))
+        T = nx.gomory_hu_tree(self.G)
+        assert_raises(nx.NetworkXError, nx.gomory_hu_cut_value, T, 0, 0)
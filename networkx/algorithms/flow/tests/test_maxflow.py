@@ -5,6 +5,7 @@ from nose.tools import *
 
 import networkx as nx
 from networkx.algorithms.flow import build_flow_dict, build_residual_network
+from networkx.algorithms.flow import build_residual_arrays, ResidualArrays
 from networkx.algorithms.flow import edmonds_karp, preflow_push, shortest_augmenting_path
 
 flow_funcs = [edmonds_karp, preflow_push, shortest_augmenting_path]
@@ -74,6 +75,13 @@ def compare_flows_and_cuts(G, s, t, solnFlows, solnValue, capacity='capacity'):
         flow_dict = build_flow_dict(G, R)
         assert_equal(flow_value, solnValue, msg=msg.format(flow_func.__name__))
         validate_flows(G, s, t, flow_dict, solnValue, capacity, flow_func)
+        # Residual network arrays
+        R = build_residual_arrays(G, capacity)
+        assert_true(flow_func(G, s, t, capacity, residual=R) is R)
+        assert_equal(R.graph['flow_value'], solnValue,
+                     msg=msg.format(flow_func.__name__))
+        validate_flows(G, s, t, build_flow_dict(G, R), solnValue, capacity,
+                       flow_func)
         # Minimum cut
         cut_value, partition = nx.minimum_cut(G, s, t, capacity=capacity,
                                               flow_func=flow_func)
@@ -425,6 +433,65 @@ class TestMaxFlowMinCutInterface:
                                                  interface_func.__name__))
 
 
+class TestResidualArrays:
+
+    def setup(self):
+        G = nx.DiGraph()
+        G.add_edge('x', 'a', capacity=3.0)
+        G.add_edge('a', 'x', capacity=1.0)
+        G.add_edge('x', 'b', capacity=1.0)
+        G.add_edge('b', 'x', capacity=0)
+        G.add_edge('a', 'c')
+        G.add_edge('b', 'c', capacity=5.0)
+        G.add_edge('c', 'b', capacity=2.0)
+        G.add_edge('c', 'c', capacity=2.0)
+        G.add_edge('c', 'y', capacity=2.0)
+        G.add_edge('b', 'y', capacity=3.0)
+        self.G = G
+
+    def test_same_as_residual_network(self):
+        for G in [self.G, self.G.to_undirected()]:
+            R = build_residual_network(G, 'capacity')
+            A = build_residual_arrays(G, 'capacity')
+            assert_equal(A.graph, R.graph)
+            H = A.to_residual_network()
+            assert_equal(sorted(H), sorted(R))
+            for u, v, d in R.edges_iter(data=True):
+                d['flow'] = 0
+            assert_equal(sorted(H.edges(data=True)),
+                         sorted(R.edges(data=True)))
+            B = ResidualArrays.from_residual_network(R)
+            assert_equal(sorted(B.to_residual_network().edges(data=True)),
+                         sorted(R.edges(data=True)))
+
+    def test_residual_results(self):
+        G = self.G
+        for flow_func in flow_funcs:
+            R = flow_func(G, 'x', 'y')
+            A = build_residual_arrays(G, 'capacity')
+            flow_func(G, 'x', 'y', residual=A)
+            assert_equal(A.graph, R.graph)
+            assert_equal(sorted(A.to_residual_network().edges(data=True)),
+                         sorted(R.edges(data=True)))
+            # A DiGraph residual network gets the flows.
+            H = build_residual_network(G, 'capacity')
+            assert_true(flow_func(G, 'x', 'y', residual=H) is H)
+            assert_equal(H.graph['flow_value'], 4.0)
+            assert_equal(build_flow_dict(G, H), build_flow_dict(G, A))
+
+    def test_reusing_arrays(self):
+        G = self.G
+        A = build_residual_arrays(G, 'capacity')
+        for flow_func in flow_funcs:
+            for s, t, fv in [('x', 'y', 4.0), ('c', 'y', 4.0), ('y', 'x', 0)]:
+                assert_equal(nx.maximum_flow_value(G, s, t, residual=A,
+                                                   flow_func=flow_func), fv)
+                cut_value, partition = nx.minimum_cut(G, s, t, residual=A,
+                                                      flow_func=flow_func)
+                assert_equal(cut_value, fv)
+                assert_true(t in partition[1])
+
+
 # Tests specific to one algorithm
 def test_preflow_push_global_relabel_freq():
     G = nx.DiGraph()
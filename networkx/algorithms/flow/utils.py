@@ -12,7 +12,8 @@ from collections import deque
 import networkx as nx
 
 __all__ = ['CurrentEdge', 'Level', 'GlobalRelabelThreshold',
-           'build_residual_network', 'detect_unboundedness', 'build_flow_dict']
+           'build_residual_network', 'detect_unboundedness', 'build_flow_dict',
+           'ResidualArrays', 'build_residual_arrays']
 
 
 class CurrentEdge(object):
@@ -142,9 +143,294 @@ def build_residual_network(G, capacity):
     return R
 
 
+class ResidualArrays(object):
+    """A residual network stored in flat arrays.
+
+    This is a compact form of the residual network built by
+    build_residual_network, on which the maximum flow algorithms work
+    directly.  Nodes are numbered from 0 to n - 1 in the order of
+    ``nodes``, and ``index`` maps each node to its number.  Arcs are
+    numbered in pairs: arc ``a`` goes from node ``head[a ^ 1]`` to node
+    ``head[a]`` and arc ``a ^ 1`` is its reverse.  ``capacity[a]`` and
+    ``flow[a]`` hold the capacity and the flow of arc ``a``, and
+    ``arcs[i]`` lists the arcs leaving node ``i``.  ``excess`` is None or,
+    after preflow_push, the list of the excesses of the nodes.  ``graph``
+    holds the same attributes as the graph attribute dictionary of a
+    residual network, such as 'inf' and 'flow_value'.
+
+    Passing an instance as the residual argument of edmonds_karp,
+    preflow_push or shortest_augmenting_path makes them compute the flow
+    in it and return it instead of a DiGraph.  Use to_residual_network()
+    to obtain the equivalent DiGraph.
+
+    See Also
+    --------
+    build_residual_arrays
+    build_residual_network
+    """
+
+    def __init__(self, nodes):
+        self.nodes = list(nodes)
+        self.index = dict(zip(self.nodes, range(len(self.nodes))))
+        self.head = []
+        self.capacity = []
+        self.flow = []
+        self.arcs = [[] for u in self.nodes]
+        self.excess = None
+        self.graph = {}
+        self._zeros = []
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def _add_arcs(self, i, j, capacity, reverse_capacity):
+        """Add the pair of arcs between nodes i and j and return the number
+        of the arc from i to j.
+        """
+        a = len(self.head)
+        self.head.extend((j, i))
+        self.capacity.extend((capacity, reverse_capacity))
+        self.flow.extend((0, 0))
+        self.arcs[i].append(a)
+        self.arcs[j].append(a + 1)
+        return a
+
+    def number_of_arcs(self):
+        """Return the number of arcs, that is of edges of the residual
+        network.
+        """
+        return len(self.head)
+
+    def reset(self):
+        """Set the flow of all arcs to zero.
+
+        The flow list is overwritten in place, from a list of zeros kept
+        for the purpose, so that resetting arrays reused for many flow
+        computations allocates nothing.
+        """
+        flow = self.flow
+        if len(self._zeros) != len(flow):
+            self._zeros = [0] * len(flow)
+        flow[:] = self._zeros
+        self.excess = None
+
+    def sink_side(self, t):
+        """Return the set of nodes from which t can be reached using only
+        arcs that are not saturated.
+
+        After a maximum flow to t has been computed, these nodes form the
+        sink side of a minimum cut.
+        """
+        head = self.head
+        capacity = self.capacity
+        flow = self.flow
+        arcs = self.arcs
+        t = self.index[t]
+        seen = set([t])
+        q = [t]
+        for u in q:
+            for a in arcs[u]:
+                v = head[a]
+                if v not in seen and flow[a ^ 1] < capacity[a ^ 1]:
+                    seen.add(v)
+                    q.append(v)
+        nodes = self.nodes
+        return set(nodes[i] for i in seen)
+
+    @classmethod
+    def from_residual_network(cls, R):
+        """Return the arrays of a residual network R.
+
+        Capacities and graph attributes are taken from R and flows are
+        set to zero.
+        """
+        A = cls(R)
+        index = A.index
+        R_succ = R.succ
+        for u, nbrs in R_succ.items():
+            i = index[u]
+            for v, attr in nbrs.items():
+                j = index[v]
+                if i < j:
+                    A._add_arcs(i, j, attr['capacity'],
+                                R_succ[v][u]['capacity'])
+        A.graph = dict(R.graph)
+        return A
+
+    def to_residual_network(self):
+        """Return the residual network as a DiGraph.
+
+        The DiGraph follows the conventions of build_residual_network and
+        has the flows, excesses and graph attributes of the arrays.
+        """
+        R = nx.DiGraph()
+        if self.excess is None:
+            R.add_nodes_from(self.nodes)
+        else:
+            R.add_nodes_from((u, {'excess': excess})
+                             for u, excess in zip(self.nodes, self.excess))
+        nodes = self.nodes
+        head = self.head
+        capacity = self.capacity
+        flow = self.flow
+        R.add_edges_from((nodes[head[a ^ 1]], nodes[head[a]],
+                          {'capacity': capacity[a], 'flow': flow[a]})
+                         for a in range(len(head)))
+        R.graph.update(self.graph)
+        return R
+
+    def update_residual_network(self, R):
+        """Copy the flows, excesses and graph attributes of the arrays to the
+        residual network R they were built from.
+        """
+        R_succ = R.succ
+        nodes = self.nodes
+        if self.excess is not None:
+            R_node = R.node
+            for u, excess in zip(nodes, self.excess):
+                R_node[u]['excess'] = excess
+        head = self.head
+        for a, flow in enumerate(self.flow):
+            R_succ[nodes[head[a ^ 1]]][nodes[head[a]]]['flow'] = flow
+        R.graph.update(self.graph)
+
+
+def build_residual_arrays(G, capacity):
+    """Build the residual network of G in arrays and initialize a zero flow.
+
+    The result holds the same residual network as build_residual_network
+    returns, with nodes and arcs numbered instead of stored in
+    dictionaries.  It is much faster to build, and the maximum flow
+    algorithms work on it directly when it is passed as their residual
+    argument.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+        A graph or directed graph.
+
+    capacity : string
+        Edge attribute holding the capacity of an edge.  Edges without it
+        have infinite capacity.
+
+    Returns
+    -------
+    R : ResidualArrays
+        The residual network.
+
+    Raises
+    ------
+    NetworkXError
+        If G is a multigraph.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> from networkx.algorithms.flow import build_residual_arrays
+    >>> from networkx.algorithms.flow import edmonds_karp
+    >>> G = nx.DiGraph()
+    >>> G.add_edge('x', 'a', capacity=3.0)
+    >>> G.add_edge('a', 'y', capacity=2.0)
+    >>> R = build_residual_arrays(G, 'capacity')
+    >>> R is edmonds_karp(G, 'x', 'y', residual=R)
+    True
+    >>> R.graph['flow_value']
+    2.0
+    >>> R.to_residual_network()['a']['y']
+    {'capacity': 2.0, 'flow': 2.0}
+
+    See Also
+    --------
+    ResidualArrays
+    build_residual_network
+    """
+    if G.is_multigraph():
+        raise nx.NetworkXError(
+            'MultiGraph and MultiDiGraph not supported (yet).')
+
+    R = ResidualArrays(G)
+    index = R.index
+    add_arcs = R._add_arcs
+
+    inf = float('inf')
+    # Extract edges with positive capacities. Self loops excluded.
+    edge_list = [(u, v, attr) for u, v, attr in G.edges_iter(data=True)
+                 if u != v and attr.get(capacity, inf) > 0]
+    # Simulate infinity as build_residual_network does.
+    inf = 3 * sum(attr[capacity] for u, v, attr in edge_list
+                  if capacity in attr and attr[capacity] != inf) or 1
+    if G.is_directed():
+        G_succ = G.succ
+        # Arcs from v to u added with the edge (u, v), waiting for the
+        # capacity of the edge (v, u).
+        pending = {}
+        for u, v, attr in edge_list:
+            r = min(attr.get(capacity, inf), inf)
+            if u in G_succ[v] and G_succ[v][u].get(capacity, 1) > 0:
+                a = pending.pop((u, v), None)
+                if a is not None:
+                    R.capacity[a] = r
+                else:
+                    pending[(v, u)] = add_arcs(index[u], index[v], r, 0) ^ 1
+            else:
+                add_arcs(index[u], index[v], r, 0)
+    else:
+        for u, v, attr in edge_list:
+            r = min(attr.get(capacity, inf), inf)
+            add_arcs(index[u], index[v], r, r)
+
+    # Record the value simulating infinity.
+    R.graph['inf'] = inf
+
+    return R
+
+
+def _residual_arrays(G, capacity, residual):
+    """Return the residual network in arrays for a maximum flow algorithm
+    given its residual argument.
+    """
+    if residual is None:
+        return build_residual_arrays(G, capacity)
+    if isinstance(residual, ResidualArrays):
+        return residual
+    return ResidualArrays.from_residual_network(residual)
+
+
+def _residual_result(R, residual):
+    """Return what a maximum flow algorithm that worked on the arrays R
+    returns given its residual argument.
+    """
+    if residual is R:
+        return R
+    if residual is None:
+        return R.to_residual_network()
+    R.update_residual_network(residual)
+    return residual
+
+
 def detect_unboundedness(R, s, t):
     """Detect an infinite-capacity s-t path in R.
     """
+    if isinstance(R, ResidualArrays):
+        head = R.head
+        capacity = R.capacity
+        arcs = R.arcs
+        inf = R.graph['inf']
+        s = R.index[s]
+        t = R.index[t]
+        q = deque([s])
+        seen = set([s])
+        while q:
+            u = q.popleft()
+            for a in arcs[u]:
+                v = head[a]
+                if capacity[a] == inf and v not in seen:
+                    if v == t:
+                        raise nx.NetworkXUnbounded(
+                            'Infinite capacity path, flow unbounded above.')
+                    seen.add(v)
+                    q.append(v)
+        return
     q = deque([s])
     seen = set([s])
     inf = R.graph['inf']
@@ -162,6 +448,14 @@ def detect_unboundedness(R, s, t):
 def build_flow_dict(G, R):
     """Build a flow dictionary from a residual network.
     """
+    if isinstance(R, ResidualArrays):
+        flow_dict = dict((u, dict((v, 0) for v in G[u])) for u in G)
+        nodes = R.nodes
+        head = R.head
+        for a, flow in enumerate(R.flow):
+            if flow > 0:
+                flow_dict[nodes[head[a ^ 1]]][nodes[head[a]]] = flow
+        return flow_dict
     flow_dict = {}
     for u in G:
         flow_dict[u] = dict((v, 0) for v in G[u])
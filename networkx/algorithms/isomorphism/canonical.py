@@ -0,0 +1,322 @@
+# -*- coding: utf-8 -*-
+"""
+Graph hashing and canonical forms.
+
+A graph hash is equal for isomorphic graphs and a canonical form is equal
+for isomorphic graphs only, so large collections of graphs can be grouped
+into isomorphism classes by bucketing them on their hash and comparing
+canonical forms within the buckets, instead of testing all pairs of
+graphs with is_isomorphic().
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from collections import Counter
+from hashlib import md5
+import networkx as nx
+from networkx.utils import UnionFind
+
+__all__ = ['weisfeiler_lehman_graph_hash',
+           'canonical_labeling',
+           'canonical_form']
+
+
+def _node_labels(G, node_attr):
+    if node_attr is None:
+        return dict.fromkeys(G, '')
+    return dict((v, str(d.get(node_attr))) for v, d in G.nodes_iter(data=True))
+
+
+def _edge_label(G, data, edge_attr):
+    """Return a string label for the edge data of G between two nodes."""
+    if G.is_multigraph():
+        if edge_attr is None:
+            return str(len(data))
+        return str(sorted(str(d.get(edge_attr)) for d in data.values()))
+    if edge_attr is None:
+        return ''
+    return str(data.get(edge_attr))
+
+
+def _labelled_adjacency(G, edge_attr):
+    """Return for each node of G the list of (direction, edge label,
+    neighbor) triples, with direction 0 for successors and 1 for
+    predecessors.
+    """
+    adj = {}
+    for v, nbrs in G.adjacency_iter():
+        adj[v] = [(0, _edge_label(G, d, edge_attr), w)
+                  for w, d in nbrs.items()]
+    if G.is_directed():
+        for v, nbrs in G.pred.items():
+            adj[v].extend((1, _edge_label(G, d, edge_attr), u)
+                          for u, d in nbrs.items())
+    return adj
+
+
+def _hash(s):
+    return md5(s.encode('utf-8')).hexdigest()
+
+
+def weisfeiler_lehman_graph_hash(G, node_attr=None, edge_attr=None,
+                                 iterations=3):
+    """Return a Weisfeiler-Lehman hash of the graph G.
+
+    Isomorphic graphs have the same hash.  Graphs that are not isomorphic
+    usually have different hashes, but some, such as regular graphs with
+    the same number of nodes and degree, cannot be told apart.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph
+
+    node_attr : string, optional (default=None)
+       If not None, the node attribute whose values take part in the hash.
+
+    edge_attr : string, optional (default=None)
+       If not None, the edge attribute whose values take part in the hash.
+
+    iterations : int, optional (default=3)
+       Number of refinement steps, the radius of the neighborhoods
+       summarized in the labels of the nodes.
+
+    Returns
+    -------
+    h : string
+       A hexadecimal string.
+
+    Examples
+    --------
+    >>> G1 = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3)])
+    >>> G2 = nx.Graph([('a', 'b'), ('b', 'c'), ('c', 'a'), ('a', 'd')])
+    >>> G3 = nx.path_graph(4)
+    >>> h1 = nx.weisfeiler_lehman_graph_hash(G1)
+    >>> h1 == nx.weisfeiler_lehman_graph_hash(G2)
+    True
+    >>> h1 == nx.weisfeiler_lehman_graph_hash(G3)
+    False
+
+    Notes
+    -----
+    At each step the label of each node is replaced by a hash of the label
+    and the sorted labels of its neighbors [1]_, together with the labels
+    of the edges to them.  The hash of the graph is a hash of the counts
+    of the labels of all steps.  It takes `O(k m log m)` time for k
+    iterations and m edges, and does not depend on the hash randomization
+    of Python, so it can be stored and compared between processes.
+
+    References
+    ----------
+    .. [1] N. Shervashidze, P. Schweitzer, E. J. van Leeuwen, K. Mehlhorn
+       and K. M. Borgwardt, Weisfeiler-Lehman graph kernels, Journal of
+       Machine Learning Research 12, 2539-2561, 2011.
+
+    See Also
+    --------
+    canonical_form
+    """
+    adj = _labelled_adjacency(G, edge_attr)
+    labels = _node_labels(G, node_attr)
+    counts = Counter(labels.values())
+    for i in range(iterations):
+        labels = dict((v, _hash(labels[v] + '(' + ','.join(sorted(
+            '%d%s:%s' % (k, l, labels[w]) for k, l, w in adj[v])) + ')'))
+            for v in adj)
+        counts.update(labels.values())
+    return _hash('%s%s' % (G.is_directed(), sorted(counts.items())))
+
+
+def _recolor(keys):
+    """Return colors numbering the distinct keys in sorted order."""
+    index = dict((k, i) for i, k in enumerate(sorted(set(keys.values()))))
+    return dict((v, index[k]) for v, k in keys.items())
+
+
+def _refine(colors, adj):
+    """Return the coarsest equitable refinement of the coloring."""
+    n = len(set(colors.values()))
+    while True:
+        colors = _recolor(dict(
+            (v, (colors[v], tuple(sorted((k, l, colors[w])
+                                         for k, l, w in adj[v]))))
+            for v in colors))
+        m = len(set(colors.values()))
+        if m == n:
+            return colors
+        n = m
+
+
+def _certificate(G, order, labels, adj):
+    pos = dict((v, i) for i, v in enumerate(order))
+    directed = G.is_directed()
+    edges = sorted((pos[v], pos[w], l) for v in order for k, l, w in adj[v]
+                   if k == 0 and (directed or pos[v] <= pos[w]))
+    return (directed, tuple(labels[v] for v in order), tuple(edges))
+
+
+def _canonical(G, node_attr, edge_attr):
+    """Return the canonical order of the nodes of G and its certificate."""
+    labels = _node_labels(G, node_attr)
+    adj = _labelled_adjacency(G, edge_attr)
+    automorphisms = []
+    best = best_order = best_prefix = None
+    # Search tree of individualized nodes, with automorphism pruning.
+    colors = _refine(_recolor(labels), adj)
+    stack = [(colors, [], None, [])]
+    while stack:
+        colors, prefix, cell, tried = stack[-1]
+        if cell is None:
+            cells = {}
+            for v in G:
+                cells.setdefault(colors[v], []).append(v)
+            nonsingleton = [c for c in sorted(cells) if len(cells[c]) > 1]
+            if not nonsingleton:
+                order = sorted(G, key=colors.__getitem__)
+                cert = _certificate(G, order, labels, adj)
+                if best is None or cert < best:
+                    best, best_order, best_prefix = cert, order, prefix
+                    stack.pop()
+                elif cert == best:
+                    # The automorphism maps the subtree of the common
+                    # ancestor leading here onto the one leading to the
+                    # best leaf, which has been searched already.
+                    automorphisms.append(dict(zip(order, best_order)))
+                    depth = 0
+                    while (depth < len(prefix) and
+                           prefix[depth] == best_prefix[depth]):
+                        depth += 1
+                    del stack[depth + 1:]
+                else:
+                    stack.pop()
+                continue
+            cell = cells[nonsingleton[0]]
+            stack[-1] = (colors, prefix, cell, tried)
+        # Nodes in the same orbit of the automorphisms fixing the prefix
+        # lead to the same leaves; only one of them is searched.
+        orbits = UnionFind()
+        for gamma in automorphisms:
+            if all(gamma[v] == v for v in prefix):
+                for v in cell:
+                    orbits.union(v, gamma[v])
+        done = set(orbits[v] for v in tried)
+        for v in cell:
+            if v not in tried and orbits[v] not in done:
+                break
+        else:
+            stack.pop()
+            continue
+        tried.append(v)
+        keys = dict((u, (c, u != v)) for u, c in colors.items())
+        stack.append((_refine(_recolor(keys), adj), prefix + [v], None, []))
+    return best_order, best
+
+
+def canonical_labeling(G, node_attr=None, edge_attr=None):
+    """Return the nodes of G in a canonical order.
+
+    Relabelling isomorphic graphs with the positions of their nodes in
+    the canonical order gives equal graphs.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph
+
+    node_attr : string, optional (default=None)
+       If not None, the node attribute whose values must be preserved by
+       the isomorphisms.
+
+    edge_attr : string, optional (default=None)
+       If not None, the edge attribute whose values must be preserved by
+       the isomorphisms.
+
+    Returns
+    -------
+    nodes : list
+       The nodes of G.
+
+    Examples
+    --------
+    >>> G = nx.star_graph(3)
+    >>> H = nx.relabel_nodes(G, {0: 3, 3: 0})
+    >>> nx.canonical_labeling(G)[-1], nx.canonical_labeling(H)[-1]
+    (0, 3)
+
+    See Also
+    --------
+    canonical_form
+    """
+    return _canonical(G, node_attr, edge_attr)[0] or []
+
+
+def canonical_form(G, node_attr=None, edge_attr=None):
+    """Return a certificate of the isomorphism class of G.
+
+    Two graphs have equal certificates if and only if they are isomorphic,
+    by an isomorphism preserving the given node and edge attributes.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph
+
+    node_attr : string, optional (default=None)
+       If not None, the node attribute whose values must be preserved by
+       the isomorphisms.  The values are compared by their string
+       representation.
+
+    edge_attr : string, optional (default=None)
+       If not None, the edge attribute whose values must be preserved by
+       the isomorphisms.  The values are compared by their string
+       representation.
+
+    Returns
+    -------
+    certificate : tuple
+       A hashable tuple of the labels and edges of G renumbered by the
+       canonical order of its nodes.
+
+    Examples
+    --------
+    Group graphs into isomorphism classes, bucketed by hash first:
+
+    >>> graphs = [nx.path_graph(4), nx.star_graph(3),
+    ...           nx.Graph([(0, 3), (3, 1), (1, 2)])]
+    >>> classes = {}
+    >>> for G in graphs:
+    ...     key = (nx.weisfeiler_lehman_graph_hash(G), nx.canonical_form(G))
+    ...     classes.setdefault(key, []).append(G)
+    >>> sorted(len(c) for c in classes.values())
+    [1, 2]
+
+    Notes
+    -----
+    The canonical order is found by individualization and refinement [1]_:
+    the nodes are colored by their labels, the coloring is refined until
+    nodes of the same color have the same number of neighbors of each
+    color, and while some color is shared by several nodes each of them in
+    turn is given a color of its own and the coloring refined again.  The
+    orders found at the leaves of this search are compared by the graph
+    they give and the smallest one is kept.  Automorphisms found when two
+    leaves give the same graph prune the search.  This is fast for most
+    graphs but can take exponential time on some highly symmetric ones.
+
+    References
+    ----------
+    .. [1] B. D. McKay and A. Piperno, Practical graph isomorphism, II,
+       Journal of Symbolic Computation 60, 94-112, 2014.
+
+    See Also
+    --------
+    canonical_labeling
+    weisfeiler_lehman_graph_hash
+    is_isomorphic
+    """
+    cert = _canonical(G, node_attr, edge_attr)[1]
+    if cert is None:
+        cert = (G.is_directed(), (), ())
+    return cert
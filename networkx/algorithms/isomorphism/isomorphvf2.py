@@ -41,8 +41,8 @@ True
 
 GM.mapping stores the isomorphism mapping from G1 to G2.
 
->>> GM.mapping
-{0: 0, 1: 1, 2: 2, 3: 3}
+>>> sorted(GM.mapping.items())
+[(0, 0), (1, 1), (2, 2), (3, 3)]
 
 
 Suppose G1 and G2 are isomorphic directed graphs
@@ -56,8 +56,8 @@ True
 
 DiGM.mapping stores the isomorphism mapping from G1 to G2.
 
->>> DiGM.mapping
-{0: 0, 1: 1, 2: 2, 3: 3}
+>>> sorted(DiGM.mapping.items())
+[(0, 0), (1, 1), (2, 2), (3, 3)]
 
 
 
@@ -112,6 +112,10 @@ References
       pp. 149-159, 2001.
       http://amalfi.dis.unina.it/graph/db/papers/vf-algorithm.pdf
 
+[3]   Alpár Jüttner and Péter Madarasi, "VF2++ - An Improved Subgraph
+      Isomorphism Algorithm", Discrete Applied Mathematics, vol. 242,
+      pp. 69-81, 2018.
+
 See Also
 --------
 syntactic_feasibliity(), semantic_feasibility()
@@ -121,6 +125,13 @@ Notes
 Modified to handle undirected graphs.
 Modified to handle multiple edges.
 
+The search is a depth-first search kept on an explicit stack, so the
+size of the graphs is not limited by the recursion limit of Python.  As
+in VF2++ [3], the nodes of G2 are matched in a fixed order computed
+before the search, breadth first from the nodes with the fewest
+possible partners, and each one is only paired with neighbors of the
+partner of an already matched neighbor whose degrees allow the match.
+
 
 In general, this problem is NP-Complete.
 
@@ -138,7 +149,10 @@ In general, this problem is NP-Complete.
 #    Complexity Sciences Center and Physics Department, UC Davis.
 
 import sys
+from bisect import bisect_left
+from heapq import heappush, heappop
 import networkx as nx
+from networkx.utils import parallel_imap
 
 __all__ = ['GraphMatcher',
            'DiGraphMatcher']
@@ -170,68 +184,58 @@ class GraphMatcher(object):
         self.G1_nodes = set(G1.nodes())
         self.G2_nodes = set(G2.nodes())
 
-        # Set recursion limit.
+        # The search is not recursive, so the recursion limit is unchanged.
         self.old_recursion_limit = sys.getrecursionlimit()
-        expected_max_recursion_level = len(self.G2)
-        if self.old_recursion_limit < 1.5 * expected_max_recursion_level:
-            # Give some breathing room.
-            sys.setrecursionlimit(int(1.5 * expected_max_recursion_level))
 
         # Declare that we will be searching for a graph-graph isomorphism.
         self.test = 'graph'
 
+        # The test for which the match order was last computed.
+        self._order_test = None
+
         # Initialize state
         self.initialize()
 
     def reset_recursion_limit(self):
-        """Restores the recursion limit."""
-        ### TODO:
-        ###     Currently, we use recursion and set the recursion level higher.
-        ###     It would be nice to restore the level, but because the
-        ###     (Di)GraphMatcher classes make use of cyclic references, garbage
-        ###     collection will never happen when we define __del__() to
-        ###     restore the recursion level. The result is a memory leak.
-        ###     So for now, we do not automatically restore the recursion level,
-        ###     and instead provide a method to do this manually. Eventually,
-        ###     we should turn this into a non-recursive implementation.
+        """Restores the recursion limit.
+
+        The search no longer changes the recursion limit; this method is
+        kept for compatibility.
+        """
         sys.setrecursionlimit(self.old_recursion_limit)
 
     def candidate_pairs_iter(self):
-        """Iterator over candidate pairs of nodes in G1 and G2."""
+        """Iterator over candidate pairs of nodes in G1 and G2.
 
-        # All computations are done using the current state!
-
-        G1_nodes = self.G1_nodes
-        G2_nodes = self.G2_nodes
-
-        # First we compute the inout-terminal sets.
-        T1_inout = [node for node in G1_nodes if (node in self.inout_1) and (node not in self.core_1)]
-        T2_inout = [node for node in G2_nodes if (node in self.inout_2) and (node not in self.core_2)]
-
-        # If T1_inout and T2_inout are both nonempty.
-        # P(s) = T1_inout x {min T2_inout}
-        if T1_inout and T2_inout:
-            for node in T1_inout:
-                yield node, min(T2_inout)
+        The nodes of G2 are matched one at a time in the order computed by
+        match_order().  The next one is paired with the unmatched nodes of
+        G1 of suitable degree, among the neighbors of the partner of its
+        parent when it has one.
+        """
 
+        # All computations are done using the current state!
+        G2_node = self._order[len(self.core_2)]
+        parent = self._parent[G2_node]
+        if parent is None:
+            nodes = self.G1
         else:
-            # If T1_inout and T2_inout were both empty....
-            # P(s) = (N_1 - M_1) x {min (N_2 - M_2)}
-            ##if not (T1_inout or T2_inout):       # as suggested by  [2], incorrect
-            if 1:                                  # as inferred from [1], correct
-                # First we determine the candidate node for G2
-                other_node = min(G2_nodes - set(self.core_2))
-                for node in self.G1:
-                    if node not in self.core_1:
-                        yield node, other_node
-
-        # For all other cases, we don't have any candidate pairs.
+            nodes = self.G1[self.core_2[parent]]
+        core_1 = self.core_1
+        deg1 = self._deg1
+        d = self._deg2[G2_node]
+        if self.test == 'graph':
+            candidates = [n for n in nodes if n not in core_1 and deg1[n] == d]
+        else:
+            candidates = [n for n in nodes if n not in core_1 and deg1[n] >= d]
+        for G1_node in candidates:
+            yield G1_node, G2_node
 
     def initialize(self):
         """Reinitializes the state of the algorithm.
 
-        This method should be redefined if using something other than GMState.
-        If only subclassing GraphMatcher, a redefinition is not necessary.
+        This method should be redefined if using something other than the
+        core and inout vectors to hold the state.  If only subclassing
+        GraphMatcher, a redefinition is not necessary.
 
         """
 
@@ -253,11 +257,77 @@ class GraphMatcher(object):
         self.inout_2 = {}
         # Practically, these sets simply store the nodes in the subgraph.
 
-        self.state = GMState(self)
+        # For each pair in the mapping, the pair and the nodes it added to
+        # the vectors above, so that it can be removed again.
+        self._added = []
 
         # Provide a convienient way to access the isomorphism mapping.
         self.mapping = self.core_1.copy()
 
+    def match_order(self):
+        """Compute the order in which the nodes of G2 are matched.
+
+        Following VF2++ [3]_, each connected part of G2 is ordered breadth
+        first from its node with the fewest possible partners in G1 (the
+        number of nodes of G1 with a suitable degree).  Within a level the
+        node with the most neighbors already ordered goes first, then the
+        one of highest degree, then the rarest.  The earlier neighbor from
+        which a node was reached is its parent.
+        """
+        G1, G2 = self.G1, self.G2
+        self._deg1 = self._degrees(G1)
+        self._deg2 = self._degrees(G2)
+        deg = G2.degree()
+        degs = sorted(G1.degree().values())
+        rarity = {}
+        for m, d in deg.items():
+            if self.test == 'graph':
+                rarity[m] = bisect_left(degs, d + 1) - bisect_left(degs, d)
+            else:
+                rarity[m] = len(degs) - bisect_left(degs, d)
+        index = dict((m, i) for i, m in enumerate(G2))
+        key = lambda m: (rarity[m], -deg[m], index[m])
+        order = []
+        parent = {}
+        remaining = set(G2)
+        while remaining:
+            root = min(remaining, key=key)
+            parent[root] = None
+            level = [root]
+            while level:
+                conn = {}
+                heap = []
+                for m in level:
+                    conn[m] = sum(1 for w in self._neighbors(G2, m)
+                                  if w not in remaining)
+                    heappush(heap, (-conn[m],) + key(m) + (m,))
+                nextlevel = []
+                while heap:
+                    entry = heappop(heap)
+                    m = entry[-1]
+                    if m not in remaining or -entry[0] != conn[m]:
+                        continue
+                    remaining.remove(m)
+                    order.append(m)
+                    for w in self._neighbors(G2, m):
+                        if w in conn:
+                            if w in remaining:
+                                conn[w] += 1
+                                heappush(heap, (-conn[w],) + key(w) + (w,))
+                        elif w not in parent:
+                            parent[w] = m
+                            nextlevel.append(w)
+                level = nextlevel
+        self._order = order
+        self._parent = parent
+        self._order_test = self.test
+
+    def _degrees(self, G):
+        return G.degree()
+
+    def _neighbors(self, G, n):
+        return G[n]
+
     def is_isomorphic(self):
         """Returns True if G1 and G2 are isomorphic graphs."""
 
@@ -279,8 +349,17 @@ class GraphMatcher(object):
         except StopIteration:
             return False
 
-    def isomorphisms_iter(self):
-        """Generator over isomorphisms between G1 and G2."""
+    def isomorphisms_iter(self, resume=None):
+        """Generator over isomorphisms between G1 and G2.
+
+        If resume is a state returned by search_state(), the search
+        continues after the isomorphism found in that state.
+        """
+        if resume is not None:
+            return self.subproblem_iter((), 'graph', resume)
+        return self._isomorphisms_iter()
+
+    def _isomorphisms_iter(self):
         # Declare that we are looking for a graph-graph isomorphism.
         self.test = 'graph'
         self.initialize()
@@ -290,10 +369,11 @@ class GraphMatcher(object):
     def match(self):
         """Extends the isomorphism mapping.
 
-        This function is called recursively to determine if a complete
-        isomorphism can be found between G1 and G2.  It cleans up the class
-        variables after each recursive call. If an isomorphism is found,
-        we yield the mapping.
+        This function performs a depth-first search to determine if a
+        complete isomorphism can be found between G1 and G2.  The search
+        keeps an iterator over candidate pairs for each level on an
+        explicit stack, and cleans up the class variables as it backtracks.
+        If an isomorphism is found, we yield the mapping.
 
         """
         if len(self.core_1) == len(self.G2):
@@ -301,17 +381,68 @@ class GraphMatcher(object):
             self.mapping = self.core_1.copy()
             # The mapping is complete.
             yield self.mapping
-        else:
-            for G1_node, G2_node in self.candidate_pairs_iter():
+            return
+        self.match_order()
+        for mapping in self._search():
+            yield mapping
+
+    def _search(self, resume=(), size=None):
+        """Generate the extensions of the partial mapping to size nodes.
+
+        The partial mapping is extended in match order and the search
+        starts after the state resume, a longer mapping, if given.
+        """
+        if size is None:
+            size = len(self.G2)
+        depth = len(self.core_1)
+        stack = [self.candidate_pairs_iter()]
+        for i in range(depth, len(resume)):
+            # Move the candidate iterators past the pairs of resume.
+            for pair in stack[-1]:
+                if pair == tuple(resume[i]):
+                    break
+            else:
+                raise nx.NetworkXError('The state does not belong to this '
+                                       'search.')
+            if i < len(resume) - 1:
+                self.add_pair(*pair)
+                stack.append(self.candidate_pairs_iter())
+        while stack:
+            for G1_node, G2_node in stack[-1]:
                 if self.syntactic_feasibility(G1_node, G2_node):
                     if self.semantic_feasibility(G1_node, G2_node):
-                        # Recursive call, adding the feasible state.
-                        newstate = self.state.__class__(self, G1_node, G2_node)
-                        for mapping in self.match():
-                            yield mapping
-
-                        # restore data structures
-                        newstate.restore()
+                        self.add_pair(G1_node, G2_node)
+                        if len(self.core_1) < size:
+                            stack.append(self.candidate_pairs_iter())
+                            break
+                        # The mapping is complete.
+                        self.mapping = self.core_1.copy()
+                        yield self.mapping
+                        self.remove_pair()
+            else:
+                # done with this level, restore data structures
+                stack.pop()
+                if len(self.core_1) > depth:
+                    self.remove_pair()
+
+    def add_pair(self, G1_node, G2_node):
+        """Adds the pair (G1_node, G2_node) to the partial mapping."""
+        self.core_1[G1_node] = G2_node
+        self.core_2[G2_node] = G1_node
+        depth = len(self.core_1)
+        self._added.append((G1_node, G2_node,
+                            _enter(self.inout_1, G1_node, self.G1[G1_node],
+                                   depth),
+                            _enter(self.inout_2, G2_node, self.G2[G2_node],
+                                   depth)))
+
+    def remove_pair(self):
+        """Removes the pair added last from the partial mapping."""
+        G1_node, G2_node, added_1, added_2 = self._added.pop()
+        del self.core_1[G1_node]
+        del self.core_2[G2_node]
+        _leave(self.inout_1, added_1)
+        _leave(self.inout_2, added_2)
 
     def semantic_feasibility(self, G1_node, G2_node):
         """Returns True if adding (G1_node, G2_node) is symantically feasible.
@@ -359,14 +490,186 @@ class GraphMatcher(object):
 
 #    subgraph_is_isomorphic.__doc__ += "\n" + subgraph.replace('\n','\n'+indent)
 
-    def subgraph_isomorphisms_iter(self):
-        """Generator over isomorphisms between a subgraph of G1 and G2."""
+    def subgraph_isomorphisms_iter(self, resume=None):
+        """Generator over isomorphisms between a subgraph of G1 and G2.
+
+        If resume is a state returned by search_state(), the search
+        continues after the isomorphism found in that state.
+
+        Examples
+        --------
+        A long search can be stopped and resumed later, for instance in
+        another process, from a saved state:
+
+        >>> from networkx.algorithms import isomorphism
+        >>> GM = isomorphism.GraphMatcher(nx.cycle_graph(6), nx.path_graph(3))
+        >>> mappings = GM.subgraph_isomorphisms_iter()
+        >>> first = [next(mappings) for i in range(5)]
+        >>> state = GM.search_state()
+        >>> rest = list(GM.subgraph_isomorphisms_iter(resume=state))
+        >>> len(first) + len(rest)
+        12
+        """
+        if resume is not None:
+            return self.subproblem_iter((), 'subgraph', resume)
+        return self._subgraph_isomorphisms_iter()
+
+    def _subgraph_isomorphisms_iter(self):
         # Declare that we are looking for graph-subgraph isomorphism.
         self.test = 'subgraph'
         self.initialize()
         for mapping in self.match():
             yield mapping
 
+    def search_state(self):
+        """Returns the state of a search paused at a mapping it generated.
+
+        The state is a tuple of the (G1_node, G2_node) pairs of the mapping
+        in the order in which they were matched, or None if the search
+        has not generated a mapping.  It can be saved, for instance with
+        pickle, and passed as resume to isomorphisms_iter(),
+        subgraph_isomorphisms_iter() or subproblem_iter() to continue the
+        search after that mapping.  The graphs must be the same, with
+        their nodes and edges in the same order.
+        """
+        if not self.core_1:
+            return None
+        return tuple(added[:2] for added in self._added)
+
+    def subproblems(self, depth=1, test='subgraph'):
+        """Generator over the subproblems of a search.
+
+        The search is split on the first depth nodes of G2 in match order:
+        each subproblem is a partial mapping of these nodes which may
+        extend to a complete one.  The subproblems are independent and
+        together give all the mappings of the search.
+
+        Parameters
+        ----------
+        depth : int, optional (default=1)
+            The number of nodes of G2 mapped in each subproblem.  Deeper
+            splits give more and smaller subproblems.
+
+        test : 'graph' or 'subgraph', optional (default='subgraph')
+            Whether the search is for isomorphisms between G1 and G2, or
+            between subgraphs of G1 and G2.
+
+        Returns
+        -------
+        subproblems : generator
+            Tuples of (G1_node, G2_node) pairs to be passed to
+            subproblem_iter().
+        """
+        if test not in ('graph', 'subgraph'):
+            raise nx.NetworkXError("test must be 'graph' or 'subgraph'.")
+        self.test = test
+        self.initialize()
+        if test == 'graph' and len(self.G1) != len(self.G2):
+            return
+        if depth <= 0 or len(self.G2) == 0:
+            yield ()
+            return
+        self.match_order()
+        for mapping in self._search(size=min(depth, len(self.G2))):
+            yield self.search_state()
+
+    def subproblem_iter(self, subproblem, test='subgraph', resume=None):
+        """Generator over the mappings of a subproblem of a search.
+
+        Parameters
+        ----------
+        subproblem : tuple
+            A partial mapping generated by subproblems(), or () for the
+            whole search.
+
+        test : 'graph' or 'subgraph', optional (default='subgraph')
+            Whether the search is for isomorphisms between G1 and G2, or
+            between subgraphs of G1 and G2.
+
+        resume : tuple, optional (default=None)
+            A state returned by search_state() during a search of the same
+            subproblem.  If given, the search continues after the mapping
+            of that state.
+
+        Returns
+        -------
+        mappings : generator
+            The mappings of the subproblem.
+        """
+        if test not in ('graph', 'subgraph'):
+            raise nx.NetworkXError("test must be 'graph' or 'subgraph'.")
+        self.test = test
+        self.initialize()
+        if test == 'graph' and len(self.G1) != len(self.G2):
+            return
+        if self._order_test != test:
+            self.match_order()
+        subproblem = tuple(tuple(pair) for pair in subproblem)
+        if [m for n, m in subproblem] != self._order[:len(subproblem)]:
+            raise nx.NetworkXError('The subproblem does not belong to this '
+                                   'search.')
+        if resume is not None:
+            resume = tuple(tuple(pair) for pair in resume)
+            if resume[:len(subproblem)] != subproblem:
+                raise nx.NetworkXError('The state does not belong to this '
+                                       'subproblem.')
+        for G1_node, G2_node in subproblem:
+            self.add_pair(G1_node, G2_node)
+        if len(self.core_1) == len(self.G2):
+            # The subproblem is a complete mapping.
+            if resume is None:
+                self.mapping = self.core_1.copy()
+                yield self.mapping
+            return
+        for mapping in self._search(resume or ()):
+            yield mapping
+
+    def parallel_subgraph_isomorphisms_iter(self, depth=1, n_jobs=-1,
+                                            chunksize=None,
+                                            subproblems=None):
+        """Generator over isomorphisms between a subgraph of G1 and G2,
+        searched in parallel.
+
+        The search is split into the subproblems given by subproblems(),
+        which are searched by a pool of worker processes.  The mappings
+        of a subproblem are generated as soon as it is done, so they come
+        in no particular order.  After the mappings of a subproblem have
+        been generated, it is added to the set completed_subproblems, so
+        an interrupted search can be restarted with the subproblems that
+        were not completed.
+
+        Parameters
+        ----------
+        depth : int, optional (default=1)
+            The number of nodes of G2 mapped in each subproblem.
+
+        n_jobs : int, optional (default=-1)
+            The number of worker processes (-1 for one per CPU).  See
+            networkx.utils.parallel_imap().
+
+        chunksize : int, optional (default=None)
+            The number of subproblems sent to a worker at once.
+
+        subproblems : iterable, optional (default=None)
+            The subproblems to search, by default all of them.
+
+        Examples
+        --------
+        >>> from networkx.algorithms import isomorphism
+        >>> GM = isomorphism.GraphMatcher(nx.cycle_graph(6), nx.path_graph(3))
+        >>> len(list(GM.parallel_subgraph_isomorphisms_iter(n_jobs=1)))
+        12
+        """
+        if subproblems is None:
+            subproblems = list(self.subproblems(depth, 'subgraph'))
+        self.completed_subproblems = set()
+        results = parallel_imap(_subproblem_mappings, self, subproblems,
+                                n_jobs=n_jobs, chunksize=chunksize)
+        for subproblem, mappings in results:
+            for mapping in mappings:
+                yield mapping
+            self.completed_subproblems.add(subproblem)
+
 #    subgraph_isomorphisms_iter.__doc__ += "\n" + subgraph.replace('\n','\n'+indent)
 
     def syntactic_feasibility(self, G1_node, G2_node):
@@ -498,56 +801,41 @@ class DiGraphMatcher(GraphMatcher):
         super(DiGraphMatcher, self).__init__(G1, G2)
 
     def candidate_pairs_iter(self):
-        """Iterator over candidate pairs of nodes in G1 and G2."""
-
-        # All computations are done using the current state!
+        """Iterator over candidate pairs of nodes in G1 and G2.
 
-        G1_nodes = self.G1_nodes
-        G2_nodes = self.G2_nodes
-
-        # First we compute the out-terminal sets.
-        T1_out = [node for node in G1_nodes if (node in self.out_1) and (node not in self.core_1)]
-        T2_out = [node for node in G2_nodes if (node in self.out_2) and (node not in self.core_2)]
-
-        # If T1_out and T2_out are both nonempty.
-        # P(s) = T1_out x {min T2_out}
-        if T1_out and T2_out:
-            node_2 = min(T2_out)
-            for node_1 in T1_out:
-                yield node_1, node_2
-
-        # If T1_out and T2_out were both empty....
-        # We compute the in-terminal sets.
-
-        ##elif not (T1_out or T2_out):   # as suggested by [2], incorrect
-        else:                            # as suggested by [1], correct
-            T1_in = [node for node in G1_nodes if (node in self.in_1) and (node not in self.core_1)]
-            T2_in = [node for node in G2_nodes if (node in self.in_2) and (node not in self.core_2)]
-
-            # If T1_in and T2_in are both nonempty.
-            # P(s) = T1_out x {min T2_out}
-            if T1_in and T2_in:
-                node_2 = min(T2_in)
-                for node_1 in T1_in:
-                    yield node_1, node_2
-
-            # If all terminal sets are empty...
-            # P(s) = (N_1 - M_1) x {min (N_2 - M_2)}
-
-            ##elif not (T1_in or T2_in):   # as suggested by  [2], incorrect
-            else:                          # as inferred from [1], correct
-                node_2 = min(G2_nodes - set(self.core_2))
-                for node_1 in G1_nodes:
-                    if node_1 not in self.core_1:
-                        yield node_1, node_2
+        The nodes of G2 are matched one at a time in the order computed by
+        match_order().  The next one is paired with the unmatched nodes of
+        G1 of suitable in and out degrees, among the successors or the
+        predecessors of the partner of its parent when it has one.
+        """
 
-        # For all other cases, we don't have any candidate pairs.
+        # All computations are done using the current state!
+        G2_node = self._order[len(self.core_2)]
+        parent = self._parent[G2_node]
+        if parent is None:
+            nodes = self.G1
+        elif G2_node in self.G2.succ[parent]:
+            nodes = self.G1.succ[self.core_2[parent]]
+        else:
+            nodes = self.G1.pred[self.core_2[parent]]
+        core_1 = self.core_1
+        deg1 = self._deg1
+        d_in, d_out = self._deg2[G2_node]
+        if self.test == 'graph':
+            candidates = [n for n in nodes if n not in core_1 and
+                          deg1[n] == (d_in, d_out)]
+        else:
+            candidates = [n for n in nodes if n not in core_1 and
+                          deg1[n][0] >= d_in and deg1[n][1] >= d_out]
+        for G1_node in candidates:
+            yield G1_node, G2_node
 
     def initialize(self):
         """Reinitializes the state of the algorithm.
 
-        This method should be redefined if using something other than DiGMState.
-        If only subclassing GraphMatcher, a redefinition is not necessary.
+        This method should be redefined if using something other than the
+        core, in and out vectors to hold the state.  If only subclassing
+        GraphMatcher, a redefinition is not necessary.
         """
 
         # core_1[n] contains the index of the node paired with n, which is m,
@@ -572,11 +860,43 @@ class DiGraphMatcher(GraphMatcher):
         self.out_1 = {}
         self.out_2 = {}
 
-        self.state = DiGMState(self)
+        # For each pair in the mapping, the pair and the nodes it added to
+        # the vectors above, so that it can be removed again.
+        self._added = []
 
         # Provide a convienient way to access the isomorphism mapping.
         self.mapping = self.core_1.copy()
 
+    def _degrees(self, G):
+        in_deg = G.in_degree()
+        out_deg = G.out_degree()
+        return dict((n, (in_deg[n], out_deg[n])) for n in G)
+
+    def _neighbors(self, G, n):
+        return set(G.pred[n]) | set(G.succ[n])
+
+    def add_pair(self, G1_node, G2_node):
+        """Adds the pair (G1_node, G2_node) to the partial mapping."""
+        G1, G2 = self.G1, self.G2
+        self.core_1[G1_node] = G2_node
+        self.core_2[G2_node] = G1_node
+        depth = len(self.core_1)
+        self._added.append((G1_node, G2_node,
+                            _enter(self.in_1, G1_node, G1.pred[G1_node], depth),
+                            _enter(self.out_1, G1_node, G1.succ[G1_node], depth),
+                            _enter(self.in_2, G2_node, G2.pred[G2_node], depth),
+                            _enter(self.out_2, G2_node, G2.succ[G2_node], depth)))
+
+    def remove_pair(self):
+        """Removes the pair added last from the partial mapping."""
+        G1_node, G2_node, in_1, out_1, in_2, out_2 = self._added.pop()
+        del self.core_1[G1_node]
+        del self.core_2[G2_node]
+        _leave(self.in_1, in_1)
+        _leave(self.out_1, out_1)
+        _leave(self.in_2, in_2)
+        _leave(self.out_2, out_2)
+
     def syntactic_feasibility(self, G1_node, G2_node):
         """Returns True if adding (G1_node, G2_node) is syntactically feasible.
 
@@ -776,13 +1096,35 @@ class DiGraphMatcher(GraphMatcher):
         return True
 
 
+def _subproblem_mappings(GM, subproblem):
+    return list(GM.subproblem_iter(subproblem, 'subgraph'))
+
+
+def _enter(vector, node, nbrs, depth):
+    """Enter node and its neighbors nbrs in vector at the given depth if
+    they are not there yet, and return the list of the nodes entered.
+    """
+    added = []
+    if node not in vector:
+        vector[node] = depth
+        added.append(node)
+    for n in nbrs:
+        if n not in vector:
+            vector[n] = depth
+            added.append(n)
+    return added
+
+
+def _leave(vector, added):
+    for n in added:
+        del vector[n]
+
+
 class GMState(object):
     """Internal representation of state for the GraphMatcher class.
 
-    This class is used internally by the GraphMatcher class.  It is used
-    only to store state specific data. There will be at most G2.order() of
-    these objects in memory at a time, due to the depth-first search
-    strategy employed by the VF2 algorithm.
+    The GraphMatcher class now updates its state with add_pair() and
+    remove_pair() instead; this class is kept for subclasses that use it.
     """
     def __init__(self, GM, G1_node=None, G2_node=None):
         """Initializes GMState object.
@@ -862,11 +1204,8 @@ class GMState(object):
 class DiGMState(object):
     """Internal representation of state for the DiGraphMatcher class.
 
-    This class is used internally by the DiGraphMatcher class.  It is used
-    only to store state specific data. There will be at most G2.order() of
-    these objects in memory at a time, due to the depth-first search
-    strategy employed by the VF2 algorithm.
-
+    The DiGraphMatcher class now updates its state with add_pair() and
+    remove_pair() instead; this class is kept for subclasses that use it.
     """
     def __init__(self, GM, G1_node=None, G2_node=None):
         """Initializes DiGMState object.
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+import random
+from nose.tools import *
+import networkx as nx
+from networkx.algorithms import isomorphism as iso
+
+
+def shuffled(G, seed):
+    nodes = list(G)
+    random.Random(seed).shuffle(nodes)
+    return nx.relabel_nodes(G, dict(zip(G, nodes)))
+
+
+class TestWeisfeilerLehmanHash:
+
+    def test_isomorphic(self):
+        for G in [nx.petersen_graph(), nx.gnm_random_graph(30, 60, seed=1),
+                  nx.gnm_random_graph(20, 50, seed=2, directed=True)]:
+            H = shuffled(G, 3)
+            assert_equal(iso.weisfeiler_lehman_graph_hash(G),
+                         iso.weisfeiler_lehman_graph_hash(H))
+
+    def test_not_isomorphic(self):
+        G = nx.path_graph(5)
+        H = nx.star_graph(4)
+        assert_not_equal(iso.weisfeiler_lehman_graph_hash(G),
+                         iso.weisfeiler_lehman_graph_hash(H))
+        D = nx.DiGraph(G)
+        assert_not_equal(iso.weisfeiler_lehman_graph_hash(G),
+                         iso.weisfeiler_lehman_graph_hash(D))
+
+    def test_attributes(self):
+        G = nx.path_graph(3)
+        H = nx.path_graph(3)
+        G.node[0]['color'] = 'red'
+        H.node[1]['color'] = 'red'
+        assert_equal(iso.weisfeiler_lehman_graph_hash(G),
+                     iso.weisfeiler_lehman_graph_hash(H))
+        assert_not_equal(iso.weisfeiler_lehman_graph_hash(G, 'color'),
+                         iso.weisfeiler_lehman_graph_hash(H, 'color'))
+        G[0][1]['w'] = 2
+        H[1][2]['w'] = 2
+        assert_equal(iso.weisfeiler_lehman_graph_hash(G, edge_attr='w'),
+                     iso.weisfeiler_lehman_graph_hash(H, edge_attr='w'))
+        H[1][2]['w'] = 3
+        assert_not_equal(iso.weisfeiler_lehman_graph_hash(G, edge_attr='w'),
+                         iso.weisfeiler_lehman_graph_hash(H, edge_attr='w'))
+
+
+class TestCanonicalForm:
+
+    def test_isomorphic(self):
+        graphs = [nx.petersen_graph(), nx.complete_graph(7),
+                  nx.hypercube_graph(4), nx.cycle_graph(12),
+                  nx.gnm_random_graph(30, 60, seed=1),
+                  nx.gnm_random_graph(20, 50, seed=2, directed=True),
+                  nx.MultiGraph([(0, 1), (0, 1), (1, 2), (2, 2)])]
+        for G in graphs:
+            for seed in range(3):
+                H = shuffled(G, seed)
+                assert_equal(iso.canonical_form(G), iso.canonical_form(H))
+
+    def test_against_is_isomorphic(self):
+        rng = random.Random(42)
+        for directed in (False, True):
+            graphs = [nx.gnm_random_graph(6, rng.randint(3, 9), directed=directed,
+                                          seed=rng.randint(0, 10 ** 6))
+                      for _ in range(40)]
+            for G in graphs:
+                for H in graphs:
+                    assert_equal(iso.canonical_form(G) == iso.canonical_form(H),
+                                 nx.is_isomorphic(G, H))
+
+    def test_labeling(self):
+        G = nx.gnm_random_graph(15, 30, seed=5)
+        H = shuffled(G, 1)
+        for K in (G, H):
+            order = iso.canonical_labeling(K)
+            assert_equal(sorted(order), sorted(K))
+        edges = []
+        for K in (G, H):
+            pos = dict((v, i) for i, v in enumerate(iso.canonical_labeling(K)))
+            edges.append(sorted(tuple(sorted((pos[u], pos[v])))
+                                for u, v in K.edges()))
+        assert_equal(edges[0], edges[1])
+
+    def test_attributes(self):
+        G = nx.path_graph(3)
+        H = nx.path_graph(3)
+        G.node[0]['color'] = 'red'
+        H.node[1]['color'] = 'red'
+        assert_equal(iso.canonical_form(G), iso.canonical_form(H))
+        assert_not_equal(iso.canonical_form(G, node_attr='color'),
+                         iso.canonical_form(H, node_attr='color'))
+        H.node[1]['color'] = None
+        H.node[2]['color'] = 'red'
+        assert_equal(iso.canonical_form(G, node_attr='color'),
+                     iso.canonical_form(H, node_attr='color'))
+        G[0][1]['w'] = 1
+        H[1][2]['w'] = 1
+        assert_equal(iso.canonical_form(G, edge_attr='w'),
+                     iso.canonical_form(H, edge_attr='w'))
+        assert_not_equal(iso.canonical_form(G, edge_attr='w'),
+                         iso.canonical_form(nx.path_graph(3), edge_attr='w'))
+
+    def test_empty(self):
+        assert_equal(iso.canonical_form(nx.Graph()), (False, (), ()))
+        assert_equal(iso.canonical_labeling(nx.Graph()), [])
+        assert_not_equal(iso.canonical_form(nx.empty_graph(3)),
+                         iso.canonical_form(nx.empty_graph(2)))
@@ -6,7 +6,7 @@ import os
 import struct
 import random
 
-from nose.tools import assert_true, assert_equal
+from nose.tools import assert_true, assert_equal, assert_raises
 from nose import SkipTest
 import networkx as nx
 from networkx.algorithms import isomorphism as iso
@@ -228,3 +228,69 @@ def test_multiple():
 #            assert_true(m['B'] == 'B')
 #            assert_true('C' not in m)
 
+
+def test_large_path():
+    # The search must not be limited by the recursion limit
+    import sys
+    n = 2 * sys.getrecursionlimit()
+    g1 = nx.path_graph(n)
+    g2 = nx.relabel_nodes(g1, dict((i, n - 1 - i) for i in g1))
+    gm = iso.GraphMatcher(g1, g2)
+    assert_true(gm.is_isomorphic())
+    assert_equal(len(gm.mapping), n)
+    gm = iso.DiGraphMatcher(nx.DiGraph(g1), nx.DiGraph(g2))
+    assert_true(gm.is_isomorphic())
+
+def test_subgraph_isomorphisms_count():
+    # 2-paths in a 5-cycle: 5 induced paths of 3 nodes, in 2 directions
+    g1 = nx.cycle_graph(5)
+    g2 = nx.path_graph(3)
+    gm = iso.GraphMatcher(g1, g2)
+    mappings = list(gm.subgraph_isomorphisms_iter())
+    assert_equal(len(mappings), 10)
+    for m in mappings:
+        inv = dict((v, k) for k, v in m.items())
+        assert_true(g1.has_edge(inv[0], inv[1]))
+        assert_true(g1.has_edge(inv[1], inv[2]))
+        assert_true(not g1.has_edge(inv[0], inv[2]))
+    # triangles are not induced paths
+    gm = iso.GraphMatcher(nx.complete_graph(4), g2)
+    assert_equal(list(gm.subgraph_isomorphisms_iter()), [])
+
+def _mapping_keys(mappings):
+    return sorted(tuple(sorted(m.items())) for m in mappings)
+
+def test_subproblems():
+    for directed in (False, True):
+        g1 = nx.gnm_random_graph(12, 25, seed=1, directed=directed)
+        g2 = nx.gnm_random_graph(4, 4, seed=2, directed=directed)
+        if directed:
+            gm = iso.DiGraphMatcher(g1, g2)
+        else:
+            gm = iso.GraphMatcher(g1, g2)
+        expected = _mapping_keys(gm.subgraph_isomorphisms_iter())
+        for depth in (0, 1, 2, 4):
+            subproblems = list(gm.subproblems(depth))
+            assert_true(all(len(s) == depth for s in subproblems))
+            found = [m for s in subproblems for m in gm.subproblem_iter(s)]
+            assert_equal(_mapping_keys(found), expected)
+            found = gm.parallel_subgraph_isomorphisms_iter(depth, n_jobs=2)
+            assert_equal(_mapping_keys(found), expected)
+            assert_equal(gm.completed_subproblems, set(subproblems))
+
+def test_resume():
+    g1 = nx.gnm_random_graph(10, 20, seed=3)
+    g2 = nx.path_graph(3)
+    expected = list(iso.GraphMatcher(g1, g2).subgraph_isomorphisms_iter())
+    for stop in range(len(expected)):
+        gm = iso.GraphMatcher(g1, g2)
+        mappings = gm.subgraph_isomorphisms_iter()
+        found = [next(mappings) for i in range(stop + 1)]
+        state = gm.search_state()
+        gm = iso.GraphMatcher(g1, g2)
+        found.extend(gm.subgraph_isomorphisms_iter(resume=state))
+        assert_equal(found, expected)
+    # a state from another search is rejected
+    gm = iso.GraphMatcher(g1, nx.path_graph(4))
+    assert_raises(nx.NetworkXError, list,
+                  gm.subgraph_isomorphisms_iter(resume=state))
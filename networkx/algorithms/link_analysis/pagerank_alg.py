@@ -11,7 +11,8 @@ from networkx.exception import NetworkXError
 from networkx.utils import not_implemented_for
 __author__ = """\n""".join(["Aric Hagberg <aric.hagberg@gmail.com>",
                             "Brandon Liu <brandon.k.liu@gmail.com"])
-__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix']
+__all__ = ['pagerank', 'pagerank_numpy', 'pagerank_scipy', 'google_matrix',
+           'PageRankEngine']
 
 
 @not_implemented_for('multigraph')
@@ -403,7 +404,7 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
 
     See Also
     --------
-    pagerank, pagerank_numpy, google_matrix
+    pagerank, pagerank_numpy, google_matrix, PageRankEngine
 
     References
     ----------
@@ -414,62 +415,245 @@ def pagerank_scipy(G, alpha=0.85, personalization=None,
        The PageRank citation ranking: Bringing order to the Web. 1999
        http://dbpubs.stanford.edu:8090/pub/showDoc.Fulltext?lang=en&doc=1999-66&format=pdf
     """
-    import scipy.sparse
-
     N = len(G)
     if N == 0:
         return {}
 
-    nodelist = G.nodes()
-    M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist, weight=weight,
-                                  dtype=float)
-    S = scipy.array(M.sum(axis=1)).flatten()
-    S[S != 0] = 1.0 / S[S != 0]
-    Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format='csr')
-    M = Q * M
-
-    # initial vector
-    x = scipy.repeat(1.0 / N, N)
-
-    # Personalization vector
-    if personalization is None:
-        p = scipy.repeat(1.0 / N, N)
-    else:
-        missing = set(nodelist) - set(personalization)
+    if personalization is not None:
+        missing = set(G) - set(personalization)
         if missing:
             raise NetworkXError('Personalization vector dictionary '
                                 'must have a value for every node. '
                                 'Missing nodes %s' % missing)
-        p = scipy.array([personalization[n] for n in nodelist],
-                        dtype=float)
-        p = p / p.sum()
-
-    # Dangling nodes
-    if dangling is None:
-        dangling_weights = p
-    else:
-        missing = set(nodelist) - set(dangling)
+    if dangling is not None:
+        missing = set(G) - set(dangling)
         if missing:
             raise NetworkXError('Dangling node dictionary '
                                 'must have a value for every node. '
                                 'Missing nodes %s' % missing)
-        # Convert the dangling dictionary into an array in nodelist order
-        dangling_weights = scipy.array([dangling[n] for n in nodelist],
-                                       dtype=float)
-        dangling_weights /= dangling_weights.sum()
-    is_dangling = scipy.where(S == 0)[0]
+    engine = PageRankEngine(G, alpha=alpha, weight=weight, dangling=dangling)
+    return engine.pagerank(personalization, max_iter=max_iter, tol=tol)
 
-    # power iteration: make up to max_iter iterations
-    for _ in range(max_iter):
-        xlast = x
-        x = alpha * (x * M + sum(x[is_dangling]) * dangling_weights) + \
-            (1 - alpha) * p
-        # check convergence, l1 norm
-        err = scipy.absolute(x - xlast).sum()
-        if err < N * tol:
-            return dict(zip(nodelist, map(float, x)))
-    raise NetworkXError('pagerank_scipy: power iteration failed to converge '
-                        'in %d iterations.' % max_iter)
+
+class PageRankEngine(object):
+    """Reusable sparse PageRank solver for a fixed graph.
+
+    The column-stochastic transition operator of the graph is built once
+    with SciPy when the engine is created.  Many PageRank vectors, for
+    example one per personalization, can then be computed without
+    rebuilding it, and a batch of personalizations is solved together as
+    a single sparse matrix times dense block power iteration.
+
+    Parameters
+    ----------
+    G : graph
+      A NetworkX graph.  Undirected graphs will be converted to a directed
+      graph with two directed edges for each undirected edge.
+
+    alpha : float, optional
+      Damping parameter for PageRank, default=0.85.
+
+    weight : key, optional
+      Edge data key to use as weight.  If None weights are set to 1.
+
+    dangling: dict, optional
+      The outedges to be assigned to any "dangling" nodes, i.e., nodes
+      without any outedges.  Nodes missing from the dictionary get
+      weight 0.  By default, dangling nodes are given outedges according
+      to the personalization vector of each computation.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph(nx.path_graph(4))
+    >>> engine = nx.PageRankEngine(G, alpha=0.9)
+    >>> pr = engine.pagerank()
+    >>> prs = engine.pagerank_batch([{0: 1}, {3: 1}, {1: 1, 2: 1}])
+
+    After a small change to the graph, the engine can be rebuilt and the
+    previous result used as the starting vector:
+
+    >>> G.add_edge(3, 0)
+    >>> engine.update(G)
+    >>> pr = engine.pagerank(nstart=pr)
+
+    Notes
+    -----
+    Unlike pagerank_scipy(), personalization and starting vectors may
+    omit nodes, which are then given the value 0.  This makes sparse
+    personalizations, e.g. a handful of seed nodes, cheap to specify.
+
+    For multigraphs the weight between two nodes is set to be the sum of
+    all edge weights between those nodes.
+
+    See Also
+    --------
+    pagerank_scipy
+    """
+
+    def __init__(self, G, alpha=0.85, weight='weight', dangling=None):
+        self.alpha = alpha
+        self.weight = weight
+        self.dangling = dangling
+        self.update(G)
+
+    def update(self, G):
+        """Rebuild the transition operator from the graph G.
+
+        Use this after editing the graph.  Results computed before the
+        update remain valid starting vectors for pagerank() and
+        pagerank_batch() even if nodes were added or removed.
+
+        Parameters
+        ----------
+        G : graph
+          A NetworkX graph.
+        """
+        import scipy.sparse
+        nodelist = G.nodes()
+        self.nodelist = nodelist
+        self.index = dict(zip(nodelist, range(len(nodelist))))
+        N = len(nodelist)
+        if N == 0:
+            self._MT = None
+            self._is_dangling = []
+            self._dangling_weights = None
+            return
+        M = nx.to_scipy_sparse_matrix(G, nodelist=nodelist,
+                                      weight=self.weight, dtype=float)
+        S = scipy.array(M.sum(axis=1)).flatten()
+        S[S != 0] = 1.0 / S[S != 0]
+        Q = scipy.sparse.spdiags(S.T, 0, *M.shape, format='csr')
+        # x * (Q * M) is evaluated as (Q * M).T * x for a block of columns
+        self._MT = (Q * M).T.tocsr()
+        self._is_dangling = scipy.where(S == 0)[0]
+        if self.dangling is None:
+            self._dangling_weights = None
+        else:
+            d = self._vector(self.dangling, 'Dangling node dictionary')
+            self._dangling_weights = d[:, None]
+
+    def _vector(self, values, name):
+        """Return a normalized array in nodelist order from a dictionary."""
+        import scipy
+        x = scipy.zeros(len(self.nodelist))
+        index = self.index
+        for n, value in values.items():
+            if n in index:
+                x[index[n]] = value
+        s = x.sum()
+        if s == 0:
+            raise NetworkXError('%s must have a nonzero value for at '
+                                'least one node.' % name)
+        return x / s
+
+    def pagerank(self, personalization=None, max_iter=100, tol=1.0e-6,
+                 nstart=None):
+        """Return the PageRank of the nodes in the graph.
+
+        Parameters
+        ----------
+        personalization: dict, optional
+          The "personalization vector" keyed by node.  Missing nodes get
+          the value 0.  By default, a uniform distribution is used.
+
+        max_iter : integer, optional
+          Maximum number of iterations in power method eigenvalue solver.
+
+        tol : float, optional
+          Error tolerance used to check convergence in power method solver.
+
+        nstart : dictionary, optional
+          Starting value of PageRank iteration for each node, e.g. the
+          result of an earlier computation.
+
+        Returns
+        -------
+        pagerank : dictionary
+           Dictionary of nodes with PageRank as value
+        """
+        return self.pagerank_batch([personalization], max_iter=max_iter,
+                                   tol=tol, nstart=[nstart])[0]
+
+    def pagerank_batch(self, personalizations, max_iter=100, tol=1.0e-6,
+                       nstart=None):
+        """Return the PageRank of the nodes for several personalizations.
+
+        All vectors are computed together; each one stops being updated
+        as soon as it has converged.
+
+        Parameters
+        ----------
+        personalizations : list
+          A list of personalization dictionaries as for pagerank().  None
+          entries stand for the uniform distribution.
+
+        max_iter : integer, optional
+          Maximum number of iterations in power method eigenvalue solver.
+
+        tol : float, optional
+          Error tolerance used to check convergence in power method solver.
+
+        nstart : list, optional
+          A list with a starting dictionary (or None) for each
+          personalization.
+
+        Returns
+        -------
+        pageranks : list
+           A list of dictionaries of nodes with PageRank as value, in the
+           order of personalizations.
+
+        Raises
+        ------
+        NetworkXError
+           If some vector fails to converge within max_iter iterations.
+        """
+        import scipy
+        personalizations = list(personalizations)
+        N = len(self.nodelist)
+        if N == 0:
+            return [{} for p in personalizations]
+        k = len(personalizations)
+        if nstart is None:
+            nstart = [None] * k
+        elif len(nstart) != k:
+            raise NetworkXError('nstart must have one entry per '
+                                'personalization.')
+
+        uniform = scipy.repeat(1.0 / N, N)
+        P = scipy.empty((N, k))
+        X = scipy.empty((N, k))
+        for j, (p, x) in enumerate(zip(personalizations, nstart)):
+            P[:, j] = uniform if p is None else \
+                self._vector(p, 'Personalization vector dictionary')
+            X[:, j] = uniform if x is None else \
+                self._vector(x, 'Starting vector dictionary')
+
+        alpha = self.alpha
+        MT = self._MT
+        is_dangling = self._is_dangling
+        # columns of X that have not converged yet
+        active = scipy.arange(k)
+        x, p = X, P
+        for _ in range(max_iter):
+            if self._dangling_weights is None:
+                d = p
+            else:
+                d = self._dangling_weights
+            xlast = x
+            x = alpha * (MT * x + x[is_dangling].sum(axis=0) * d) + \
+                (1 - alpha) * p
+            # check convergence, l1 norm of each column
+            done = scipy.absolute(x - xlast).sum(axis=0) < N * tol
+            X[:, active] = x
+            if done.all():
+                return [dict(zip(self.nodelist, map(float, X[:, j])))
+                        for j in range(k)]
+            active = active[~done]
+            x = x[:, ~done]
+            p = p[:, ~done]
+        raise NetworkXError('PageRankEngine: power iteration failed to '
+                            'converge in %d iterations.' % max_iter)
 
 
 # fixture for nose tests
@@ -158,3 +158,43 @@ class TestPageRankScipy(TestPageRank):
     def test_empty_scipy(self):
         G = networkx.Graph()
         assert_equal(networkx.pagerank_scipy(G), {})
+
+    def test_engine_batch(self):
+        G = self.G
+        engine = networkx.PageRankEngine(G, alpha=0.9)
+        personalizations = [None, {1: 1}, dict((n, n) for n in G)]
+        prs = engine.pagerank_batch(personalizations, tol=1.e-08)
+        assert_equal(len(prs), 3)
+        p = networkx.pagerank(G, alpha=0.9, tol=1.e-08)
+        for n in G:
+            assert_almost_equal(prs[0][n], p[n], places=4)
+        for pers, pr in zip(personalizations[1:], prs[1:]):
+            full = dict((n, pers.get(n, 0)) for n in G)
+            p = networkx.pagerank(G, alpha=0.9, tol=1.e-08,
+                                  personalization=full)
+            for n in G:
+                assert_almost_equal(pr[n], p[n], places=4)
+        assert_raises(networkx.NetworkXError, engine.pagerank,
+                      personalization={7: 1})
+        assert_raises(networkx.NetworkXError, engine.pagerank, max_iter=0)
+
+    def test_engine_warm_start(self):
+        G = self.G
+        engine = networkx.PageRankEngine(G, alpha=0.9,
+                                         dangling=self.dangling_edges)
+        pr = engine.pagerank(tol=1.e-08)
+        p = networkx.pagerank(G, alpha=0.9, tol=1.e-08,
+                              dangling=self.dangling_edges)
+        for n in G:
+            assert_almost_equal(pr[n], p[n], places=4)
+        # a converged solution converges again in one iteration
+        engine.pagerank(nstart=pr, max_iter=1)
+        H = G.copy()
+        H.add_edge(6, 7)
+        engine.update(H)
+        p = engine.pagerank(nstart=pr, tol=1.e-08)
+        dangling = dict((n, self.dangling_edges.get(n, 0)) for n in H)
+        p_answer = networkx.pagerank_scipy(H, alpha=0.9, tol=1.e-08,
+                                           dangling=dangling)
+        for n in H:
+            assert_almost_equal(p[n], p_answer[n], places=4)
@@ -11,12 +11,14 @@
 
 from heapq import heappush, heappop
 from itertools import count
+import random
 from networkx import NetworkXError
 import networkx as nx
 
 __author__ = "\n".join(["Salim Fadhley <salimfadhley@gmail.com>",
                         "Matteo Dell'Amico <matteodellamico@gmail.com>"])
-__all__ = ['astar_path', 'astar_path_length']
+__all__ = ['astar_path', 'astar_path_length', 'bidirectional_astar',
+           'LandmarkIndex']
 
 
 def astar_path(G, source, target, heuristic=None, weight='weight'):
@@ -162,3 +164,303 @@ def astar_path_length(G, source, target, heuristic=None, weight='weight'):
     """
     path = astar_path(G, source, target, heuristic, weight)
     return sum(G[u][v].get(weight, 1) for u, v in zip(path[:-1], path[1:]))
+
+
+class LandmarkIndex(object):
+    """Precomputed landmark distances for goal-directed shortest paths.
+
+    Shortest path distances between a few landmark nodes and all other
+    nodes give lower bounds on the distance between any two nodes by the
+    triangle inequality.  These bounds are used as heuristics by
+    bidirectional_astar() and astar_path() ("ALT" search: A*, landmarks
+    and triangle inequality [1]_).
+
+    The index holds only the landmarks and their distances, not the
+    graph, and can be pickled to store the preprocessing.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    landmarks : list, optional (default=None)
+       The landmark nodes.  By default k landmarks are selected, each one
+       as far as possible from the landmarks selected before.
+
+    k : integer, optional (default=8)
+       The number of landmarks to select if landmarks is not given.
+
+    weight : string, optional (default='weight')
+       Edge data key corresponding to the edge weight.
+
+    seed : integer, optional (default=None)
+       Seed for the random choice of the node the landmark selection
+       starts from.
+
+    Examples
+    --------
+    >>> G = nx.grid_2d_graph(10, 10)
+    >>> index = nx.LandmarkIndex(G, k=4, seed=1)
+    >>> length, path = nx.bidirectional_astar(G, (0, 0), (9, 9), index)
+    >>> length
+    18
+    >>> index.bound((0, 0), (9, 9)) <= length
+    True
+
+    Notes
+    -----
+    The bounds are only valid for the graph the index was computed on;
+    recompute the index after adding edges or decreasing edge weights.
+    Edge weights must be nonnegative.
+
+    References
+    ----------
+    .. [1] A. V. Goldberg and C. Harrelson,
+       Computing the shortest path: A* search meets graph theory.
+       Proc. 16th ACM-SIAM Symposium on Discrete Algorithms, 2005.
+    """
+
+    def __init__(self, G, landmarks=None, k=8, weight='weight', seed=None):
+        self.weight = weight
+        self.directed = G.is_directed()
+        if self.directed:
+            R = nx.reverse_view(G)
+        inf = float('inf')
+        self.landmarks = []
+        # distances from and to each landmark, per node
+        dist_from = dict((v, []) for v in G)
+        dist_to = dict((v, []) for v in G) if self.directed else dist_from
+        if landmarks is None:
+            # start with the node farthest from a random node, then add
+            # the node farthest from the landmarks already selected
+            if len(G) == 0:
+                landmarks = []
+            else:
+                if seed is not None:
+                    random.seed(seed)
+                d = nx.single_source_dijkstra_path_length(
+                    G, random.choice(G.nodes()), weight=weight)
+                landmarks = [max(d, key=d.get)]
+            closest = dict.fromkeys(G, inf)
+        else:
+            landmarks = list(landmarks)
+            k = len(landmarks)
+        while landmarks and len(self.landmarks) < k:
+            L = landmarks.pop(0)
+            self.landmarks.append(L)
+            d = nx.single_source_dijkstra_path_length(G, L, weight=weight)
+            for v, dv in dist_from.items():
+                dv.append(d.get(v, inf))
+            if self.directed:
+                d = nx.single_source_dijkstra_path_length(R, L,
+                                                          weight=weight)
+                for v, dv in dist_to.items():
+                    dv.append(d.get(v, inf))
+            if not landmarks and len(self.landmarks) < k:
+                chosen = set(self.landmarks)
+                candidates = [v for v in G if v not in chosen]
+                if candidates:
+                    for v in candidates:
+                        dv = dist_from[v][-1]
+                        if dv < closest[v]:
+                            closest[v] = dv
+                    landmarks.append(max(candidates, key=closest.get))
+        self.dist_from = dict((v, tuple(dv)) for v, dv in dist_from.items())
+        if self.directed:
+            self.dist_to = dict((v, tuple(dv)) for v, dv in dist_to.items())
+        else:
+            self.dist_to = self.dist_from
+
+    def bound(self, u, v):
+        """Return a lower bound on the distance from node u to node v.
+
+        The bound is infinite if the landmark distances show that v is not
+        reachable from u, and 0 if either node is not in the index.
+        """
+        inf = float('inf')
+        try:
+            from_u = self.dist_from[u]
+            from_v = self.dist_from[v]
+            to_u = self.dist_to[u]
+            to_v = self.dist_to[v]
+        except KeyError:
+            return 0
+        best = 0
+        # d(u,v) >= d(L,v) - d(L,u)
+        for a, b in zip(from_v, from_u):
+            if b != inf:
+                if a == inf:
+                    return inf
+                if a - b > best:
+                    best = a - b
+        # d(u,v) >= d(u,L) - d(v,L)
+        for a, b in zip(to_u, to_v):
+            if b != inf:
+                if a == inf:
+                    return inf
+                if a - b > best:
+                    best = a - b
+        return best
+
+    def heuristic(self, u, v):
+        """Return the lower bound from u to v, for use with astar_path()."""
+        return self.bound(u, v)
+
+
+def bidirectional_astar(G, source, target, landmarks=None, weight='weight'):
+    """Return the length and a shortest path from source to target using
+    bidirectional A* search with landmark bounds.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    source : node
+       Starting node for path
+
+    target : node
+       Ending node for path
+
+    landmarks : LandmarkIndex, optional (default=None)
+       Landmark distances computed on G with the same weight.  Without
+       landmarks the search is a bidirectional Dijkstra search.
+
+    weight: string, optional (default='weight')
+       Edge data key corresponding to the edge weight.
+
+    Returns
+    -------
+    length, path : number and list
+       The length of a shortest path and the path as a list of nodes.
+
+    Raises
+    ------
+    NetworkXNoPath
+        If no path exists between source and target.
+
+    NetworkXError
+        If the landmarks were computed for another weight.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(5)
+    >>> index = nx.LandmarkIndex(G, landmarks=[0])
+    >>> nx.bidirectional_astar(G, 1, 4, index)
+    (3, [1, 2, 3, 4])
+
+    Notes
+    -----
+    Both searches use the average of the landmark bounds to the target
+    and from the source as potential [1]_, so that they work on the same
+    reduced edge costs and may stop as soon as the sum of their smallest
+    keys reaches the length of the best path seen.  Nodes the landmarks
+    show to be on no path from source to target are not explored.
+
+    See Also
+    --------
+    LandmarkIndex, astar_path, bidirectional_dijkstra
+
+    References
+    ----------
+    .. [1] A. V. Goldberg and C. Harrelson,
+       Computing the shortest path: A* search meets graph theory.
+       Proc. 16th ACM-SIAM Symposium on Discrete Algorithms, 2005.
+    """
+    if source not in G or target not in G:
+        raise nx.NetworkXError("Either source %s or target %s is not in G"
+                               % (source, target))
+    if landmarks is not None and landmarks.weight != weight:
+        raise nx.NetworkXError("The landmark distances were computed for "
+                               "weight %r." % (landmarks.weight,))
+    if source == target:
+        return (0, [source])
+    inf = float('inf')
+    push = heappush
+    pop = heappop
+    multigraph = G.is_multigraph()
+    if G.is_directed():
+        neighbors = [G.succ, G.pred]
+    else:
+        neighbors = [G.adj, G.adj]
+
+    # forward potential of each node, None if it is on no path
+    potentials = {}
+    if landmarks is None:
+        def potential(v):
+            return 0
+    else:
+        bound = landmarks.bound
+
+        def potential(v):
+            try:
+                return potentials[v]
+            except KeyError:
+                to_target = bound(v, target)
+                from_source = bound(source, v)
+                if to_target == inf or from_source == inf:
+                    p = None
+                else:
+                    p = (to_target - from_source) / 2.0
+                potentials[v] = p
+                return p
+
+    # Init:   Forward             Backward
+    dists = [{}, {}]  # dictionary of final distances
+    preds = [{source: None}, {target: None}]  # predecessors towards the ends
+    seen = [{source: 0}, {target: 0}]  # distances to nodes seen
+    fringe = [[], []]  # heaps of (key, count, node)
+    c = count()
+    if potential(source) is None:
+        raise nx.NetworkXNoPath("No path between %s and %s."
+                                % (source, target))
+    push(fringe[0], (potential(source), next(c), source))
+    push(fringe[1], (-potential(target), next(c), target))
+    best = inf
+    meet = None
+    while fringe[0] and fringe[1]:
+        if fringe[0][0][0] + fringe[1][0][0] >= best:
+            break
+        # expand the direction with the smaller key
+        dir = 0 if fringe[0][0][0] <= fringe[1][0][0] else 1
+        _, _, v = pop(fringe[dir])
+        if v in dists[dir]:
+            continue
+        dist = seen[dir][v]
+        dists[dir][v] = dist
+        sign = 1 - 2 * dir
+        seen_dir = seen[dir]
+        seen_other = seen[1 - dir]
+        for w, e in neighbors[dir][v].items():
+            if w in dists[dir]:
+                continue
+            if multigraph:
+                cost = min(d.get(weight, 1) for d in e.values())
+            else:
+                cost = e.get(weight, 1)
+            vw_dist = dist + cost
+            if w not in seen_dir or vw_dist < seen_dir[w]:
+                p = potential(w)
+                if p is None:
+                    continue
+                seen_dir[w] = vw_dist
+                preds[dir][w] = v
+                push(fringe[dir], (vw_dist + sign * p, next(c), w))
+                if w in seen_other and vw_dist + seen_other[w] < best:
+                    best = vw_dist + seen_other[w]
+                    meet = w
+        if v in seen_other and dist + seen_other[v] < best:
+            best = dist + seen_other[v]
+            meet = v
+    if meet is None:
+        raise nx.NetworkXNoPath("No path between %s and %s."
+                                % (source, target))
+    path = []
+    v = meet
+    while v is not None:
+        path.append(v)
+        v = preds[0][v]
+    path.reverse()
+    v = preds[1][meet]
+    while v is not None:
+        path.append(v)
+        v = preds[1][v]
+    return (best, path)
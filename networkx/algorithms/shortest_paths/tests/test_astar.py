@@ -135,3 +135,84 @@ class TestAStar:
         path=nx.algorithms.shortest_paths.astar.astar_path(G, node_1, node_4)
 
 
+
+
+class TestBidirectionalAStar:
+
+    def check(self, G, index, pairs):
+        for s, t in pairs:
+            try:
+                expected = nx.dijkstra_path_length(G, s, t)
+            except nx.NetworkXNoPath:
+                assert_raises(nx.NetworkXNoPath, nx.bidirectional_astar,
+                              G, s, t, index)
+                continue
+            length, path = nx.bidirectional_astar(G, s, t, index)
+            assert_equal(length, expected)
+            assert_equal(path[0], s)
+            assert_equal(path[-1], t)
+            assert_equal(sum(G[u][v]['weight']
+                             for u, v in zip(path[:-1], path[1:])), length)
+            assert_true(index.bound(s, t) <= length)
+
+    def weighted(self, G):
+        import random
+        random.seed(7)
+        for u, v in G.edges():
+            G[u][v]['weight'] = random.randint(1, 20)
+        return G
+
+    def test_undirected(self):
+        G = self.weighted(nx.gnm_random_graph(100, 200, seed=3))
+        index = nx.LandmarkIndex(G, k=5, seed=2)
+        assert_equal(len(index.landmarks), 5)
+        pairs = [(u, v) for u in range(0, 100, 9) for v in range(0, 100, 7)]
+        self.check(G, index, pairs)
+
+    def test_directed(self):
+        G = self.weighted(nx.gnm_random_graph(80, 240, seed=4, directed=True))
+        index = nx.LandmarkIndex(G, k=4, seed=2)
+        pairs = [(u, v) for u in range(0, 80, 7) for v in range(0, 80, 5)]
+        self.check(G, index, pairs)
+        length, path = nx.bidirectional_astar(G, 0, 79)
+        assert_equal(length, nx.dijkstra_path_length(G, 0, 79))
+
+    def test_given_landmarks(self):
+        G = nx.grid_2d_graph(5, 5)
+        for u, v in G.edges():
+            G[u][v]['weight'] = 1
+        index = nx.LandmarkIndex(G, landmarks=[(0, 0), (4, 4)])
+        assert_equal(index.landmarks, [(0, 0), (4, 4)])
+        assert_equal(index.bound((0, 0), (4, 4)), 8)
+        assert_equal(nx.astar_path_length(G, (0, 4), (4, 0),
+                                          index.heuristic), 8)
+        self.check(G, index, [((0, 4), (4, 0)), ((2, 2), (2, 2))])
+        assert_raises(nx.NetworkXError, nx.bidirectional_astar, G, (0, 0),
+                      (1, 1), index, 'cost')
+        assert_raises(nx.NetworkXError, nx.bidirectional_astar, G, (0, 0),
+                      (9, 9), index)
+
+    def test_no_seed_keeps_global_state(self):
+        import random
+        G = nx.path_graph(10)
+        random.seed(7)
+        nx.LandmarkIndex(G, k=2)
+        x = random.random()
+        random.seed(7)
+        random.choice(G.nodes())
+        assert_equal(random.random(), x)
+
+    def test_pickle(self):
+        import pickle
+        G = nx.path_graph(6)
+        index = pickle.loads(pickle.dumps(nx.LandmarkIndex(G, k=2)))
+        assert_equal(nx.bidirectional_astar(G, 1, 5, index),
+                     (4, [1, 2, 3, 4, 5]))
+
+    def test_multigraph(self):
+        G = nx.MultiGraph()
+        G.add_edge(0, 1, weight=5)
+        G.add_edge(0, 1, weight=1)
+        G.add_edge(1, 2, weight=1)
+        index = nx.LandmarkIndex(G, k=1)
+        assert_equal(nx.bidirectional_astar(G, 0, 2, index), (2, [0, 1, 2]))
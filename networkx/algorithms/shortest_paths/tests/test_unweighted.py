@@ -66,6 +66,15 @@ class TestUnweightedPath:
         l=nx.all_pairs_shortest_path_length(self.grid)
         assert_equal(l[1][16],6)
 
+    def test_all_pairs_shortest_path_length_n_jobs(self):
+        l=nx.all_pairs_shortest_path_length(self.grid)
+        assert_equal(dict(nx.all_pairs_shortest_path_length(self.grid,
+                                                            n_jobs=2)),l)
+        l=nx.all_pairs_shortest_path_length(self.grid,cutoff=2)
+        assert_equal(dict(nx.all_pairs_shortest_path_length(self.grid,
+                                                            cutoff=2,
+                                                            n_jobs=1)),l)
+
     def test_predecessor(self):
         G=nx.path_graph(4)
         assert_equal(nx.predecessor(G,0),{0: [], 1: [0], 2: [1], 3: [2]})
@@ -1,4 +1,5 @@
 from nose.tools import *
+from nose import SkipTest
 import networkx as nx
 
 
@@ -112,6 +113,14 @@ class TestWeightedPath:
         assert_equal(
             nx.single_source_dijkstra(self.cycle, 0, 0), ({0: 0}, {0: [0]}))
 
+    def test_all_pairs_dijkstra_path_length_n_jobs(self):
+        apl = nx.all_pairs_dijkstra_path_length
+        assert_equal(dict(apl(self.XG, n_jobs=2)), apl(self.XG))
+        assert_equal(dict(apl(self.MXG4, cutoff=3, n_jobs=2)),
+                     apl(self.MXG4, cutoff=3))
+        assert_equal(dict(apl(self.XG, weight=None, n_jobs=1)),
+                     apl(self.XG, weight=None))
+
     def test_bidirectional_dijkstra(self):
         validate_length_path(
             self.XG, 's', 'v', 9, *nx.bidirectional_dijkstra(self.XG, 's', 'v'))
@@ -303,3 +312,68 @@ class TestBellmanFordAndGoldbergRadizk:
                       ((1, 0), (0, 0)), ((1, 1), (0, 1))])
         assert_equal(sorted(dist.items()),
                      [((0, 0), 0), ((0, 1), 1), ((1, 0), 1), ((1, 1), 2)])
+
+
+class TestDijkstraArrays(object):
+    numpy = 1  # nosetests attribute, use nosetests -a 'not numpy' to skip test
+
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        try:
+            import numpy
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        _setUp(self)
+        self.XG = nx.convert_node_labels_to_integers(self.XG,
+                                                     ordering='sorted')
+
+    def test_return_arrays(self):
+        pl = nx.single_source_dijkstra_path_length
+        d = pl(self.XG, 0)
+        a = pl(self.XG, 0, return_arrays=True)
+        assert_equal(a.tolist(), [d[i] for i in range(len(self.XG))])
+        a = pl(self.XG, 0, cutoff=8, return_arrays=True)
+        assert_equal(a[2], numpy.inf)
+        pred, dist = nx.dijkstra_predecessor_and_distance(self.XG, 0,
+                                                          return_arrays=True)
+        assert_equal(pred.tolist(), [-1, 3, 1, 0, 3])
+        assert_equal(dist.tolist(), [0, 8, 9, 5, 7])
+        G = nx.MultiGraph(self.MXG4)
+        assert_equal(pl(G, 0, return_arrays=True)[2], 4)
+
+    def test_return_arrays_requires_integer_nodes(self):
+        pl = nx.single_source_dijkstra_path_length
+        assert_raises(nx.NetworkXError, pl, self.G, 's', return_arrays=True)
+        G = nx.Graph([(1, 2), (2, 3)])
+        assert_raises(nx.NetworkXError, pl, G, 1, return_arrays=True)
+        assert_raises(KeyError, pl, nx.path_graph(3), 7, return_arrays=True)
+
+    def test_csr_graph(self):
+        G = nx.CSRDiGraph(self.XG)
+        assert_equal(nx.single_source_dijkstra_path_length(G, 0),
+                     nx.single_source_dijkstra_path_length(self.XG, 0))
+        assert_equal(nx.dijkstra_predecessor_and_distance(G, 0),
+                     nx.dijkstra_predecessor_and_distance(self.XG, 0))
+        G = nx.CSRGraph(nx.grid_2d_graph(2, 2))
+        pred, dist = nx.dijkstra_predecessor_and_distance(G, (0, 0))
+        assert_equal(sorted((n, sorted(p)) for n, p in pred.items()),
+                     [((0, 0), []), ((0, 1), [(0, 0)]),
+                      ((1, 0), [(0, 0)]), ((1, 1), [(0, 1), (1, 0)])])
+        assert_equal(sorted(dist.items()),
+                     [((0, 0), 0), ((0, 1), 1), ((1, 0), 1), ((1, 1), 2)])
+        C = nx.CSRGraph(self.XG3)
+        assert_equal(nx.single_source_dijkstra_path_length(C, 0, cutoff=5),
+                     {0: 0, 1: 2})
+
+    def test_csr_graph_cutoff(self):
+        G = nx.CSRGraph(nx.path_graph(1000))
+        pred, dist = nx.dijkstra_predecessor_and_distance(G, 500, cutoff=1)
+        assert_equal(pred, {499: [500], 500: [], 501: [500]})
+        assert_equal(dist, {499: 1, 500: 0, 501: 1})
+        a = nx.single_source_dijkstra_path_length(G, 0, cutoff=1,
+                                                  return_arrays=True)
+        assert_equal(a[:3].tolist(), [0, 1, numpy.inf])
+        assert_equal(len(a), 1000)
@@ -17,8 +17,9 @@ __all__ = ['bidirectional_shortest_path',
            'all_pairs_shortest_path_length',
            'predecessor']
 
-
+from functools import partial
 import networkx as nx
+from networkx.utils import parallel_imap
 
 def single_source_shortest_path_length(G,source,cutoff=None):
     """Compute the shortest path lengths from source to all reachable nodes.
@@ -66,7 +67,7 @@ def single_source_shortest_path_length(G,source,cutoff=None):
     return seen  # return all path lengths as dictionary
 
 
-def all_pairs_shortest_path_length(G,cutoff=None):
+def all_pairs_shortest_path_length(G,cutoff=None,n_jobs=None):
     """ Compute the shortest path lengths between all nodes in G.
 
     Parameters
@@ -76,15 +77,26 @@ def all_pairs_shortest_path_length(G,cutoff=None):
     cutoff : integer, optional
         depth to stop the search. Only paths of length <= cutoff are returned.
 
+    n_jobs : integer, optional
+        If given, split the sources across this many worker processes
+        (-1 for one per CPU) and return a generator instead of a
+        dictionary.  See networkx.utils.parallel_imap().
+
     Returns
     -------
-    lengths : dictionary
+    lengths : dictionary or generator
         Dictionary of shortest path lengths keyed by source and target.
+        If n_jobs is given, a generator of (source, lengths) pairs in
+        arbitrary order.
 
     Notes
     -----
     The dictionary returned only has keys for reachable node pairs.
 
+    With n_jobs the graph is copied once to each worker process and the
+    results are streamed back, so only a few single-source results are
+    held in memory at a time.
+
     Examples
     --------
     >>> G=nx.path_graph(5)
@@ -93,8 +105,14 @@ def all_pairs_shortest_path_length(G,cutoff=None):
     3
     >>> length[1]
     {0: 1, 1: 0, 2: 1, 3: 2, 4: 3}
+    >>> length=dict(nx.all_pairs_shortest_path_length(G,n_jobs=1))
+    >>> print(length[1][4])
+    3
 
     """
+    if n_jobs is not None:
+        func=partial(single_source_shortest_path_length,cutoff=cutoff)
+        return parallel_imap(func,G,G.nodes(),n_jobs=n_jobs)
     paths={}
     for n in G:
         paths[n]=single_source_shortest_path_length(G,n,cutoff=cutoff)
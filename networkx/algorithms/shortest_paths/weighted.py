@@ -26,10 +26,11 @@ __all__ = ['dijkstra_path',
            'goldberg_radzik']
 
 from collections import deque
+from functools import partial
 from heapq import heappush, heappop
 from itertools import count
 import networkx as nx
-from networkx.utils import generate_unique_node
+from networkx.utils import generate_unique_node, parallel_imap
 
 
 def dijkstra_path(G, source, target, weight='weight'):
@@ -177,7 +178,7 @@ def single_source_dijkstra_path(G, source, cutoff=None, weight='weight'):
 
 
 def single_source_dijkstra_path_length(G, source, cutoff=None,
-                                       weight='weight'):
+                                       weight='weight', return_arrays=False):
     """Compute the shortest path length between source and all other
     reachable nodes for a weighted graph.
 
@@ -194,10 +195,17 @@ def single_source_dijkstra_path_length(G, source, cutoff=None,
     cutoff : integer or float, optional
        Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    return_arrays : bool, optional (default=False)
+       If True return a NumPy array instead of a dictionary.  The nodes
+       of G must be the integers 0 to n-1 (see
+       convert_node_labels_to_integers()) unless G is a CSRGraph.
+
     Returns
     -------
-    length : dictionary
-       Dictionary of shortest lengths keyed by target.
+    length : dictionary or NumPy array
+       Dictionary of shortest lengths keyed by target.  If return_arrays
+       is True, an array indexed by node (by position in G.nodes() for
+       a CSRGraph) with inf for unreachable nodes.
 
     Examples
     --------
@@ -213,11 +221,23 @@ def single_source_dijkstra_path_length(G, source, cutoff=None,
     Edge weight attributes must be numerical.
     Distances are calculated as sums of weighted edges traversed.
 
+    For a CSRGraph, or when return_arrays is True, the search runs on
+    node indices instead of node labels.  Only a CSRGraph is searched
+    faster, by reading its flat index and weight arrays; other graphs,
+    even with the nodes 0 to n-1, are searched through their dictionaries
+    as usual.  Convert a graph that is searched many times with
+    CSRGraph(G) or CSRDiGraph(G).
+
     See Also
     --------
     single_source_dijkstra()
 
     """
+    if return_arrays or isinstance(G, nx.CSRGraph):
+        pred, dist = _dijkstra_indices(G, source, cutoff, weight, False)
+        if return_arrays:
+            return _index_array(G, dist, float('inf'), float)
+        return _index_dict(G, dist)
     push = heappush
     pop = heappop
     dist = {}  # dictionary of final distances
@@ -354,7 +374,8 @@ def single_source_dijkstra(G, source, target=None, cutoff=None, weight='weight')
     return (dist, paths)
 
 
-def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
+def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight',
+                                      return_arrays=False):
     """Compute shortest path length and predecessors on shortest paths
     in weighted graphs.
 
@@ -371,11 +392,20 @@ def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
     cutoff : integer or float, optional
        Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    return_arrays : bool, optional (default=False)
+       If True return NumPy arrays instead of dictionaries.  The nodes
+       of G must be the integers 0 to n-1 (see
+       convert_node_labels_to_integers()) unless G is a CSRGraph.
+
     Returns
     -------
-    pred,distance : dictionaries
+    pred,distance : dictionaries or NumPy arrays
        Returns two dictionaries representing a list of predecessors
-       of a node and the distance to each node.
+       of a node and the distance to each node.  If return_arrays is
+       True, pred is an integer array holding one predecessor of each
+       node on a shortest path (-1 for the source and unreachable nodes)
+       and distance is an array with inf for unreachable nodes.  Both
+       are indexed by node (by position in G.nodes() for a CSRGraph).
 
     Notes
     -----
@@ -384,7 +414,34 @@ def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
 
     The list of predecessors contains more than one element only when
     there are more than one shortest paths to the key node.
+
+    For a CSRGraph, or when return_arrays is True, the search runs on
+    node indices instead of node labels.  Only a CSRGraph is searched
+    faster, by reading its flat index and weight arrays; other graphs,
+    even with the nodes 0 to n-1, are searched through their dictionaries
+    as usual.  Convert a graph that is searched many times with
+    CSRGraph(G) or CSRDiGraph(G).
+
+    Examples
+    --------
+    >>> G=nx.path_graph(4)
+    >>> pred,dist=nx.dijkstra_predecessor_and_distance(G,0)
+    >>> sorted(pred.items())
+    [(0, []), (1, [0]), (2, [1]), (3, [2])]
     """
+    if return_arrays or isinstance(G, nx.CSRGraph):
+        pred, dist = _dijkstra_indices(G, source, cutoff, weight,
+                                       not return_arrays)
+        if return_arrays:
+            import numpy as np
+            return (_index_array(G, pred, -1, np.int64),
+                    _index_array(G, dist, float('inf'), float))
+        index_pred = _index_dict(G, pred)
+        if isinstance(G, nx.CSRGraph):
+            labels = G._nodes
+            index_pred = dict((n, [labels[u] for u in p])
+                              for n, p in index_pred.items())
+        return (index_pred, _index_dict(G, dist))
     push = heappush
     pop = heappop
     dist = {}  # dictionary of final distances
@@ -424,7 +481,95 @@ def dijkstra_predecessor_and_distance(G, source, cutoff=None, weight='weight'):
     return (pred, dist)
 
 
-def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
+def _dijkstra_indices(G, source, cutoff, weight, all_preds):
+    """Dijkstra's algorithm on node indices.
+
+    G must be a CSRGraph, whose arrays are scanned directly, or have the
+    nodes 0 to n-1.  Returns dictionaries pred and dist keyed by the
+    indices of the reached nodes only, so that a search limited by
+    cutoff takes time proportional to the part of G it explores.  If
+    all_preds is True pred holds lists of all predecessors on shortest
+    paths, otherwise a single predecessor or -1.
+    """
+    if isinstance(G, nx.CSRGraph):
+        s = G._index[source]
+        indptr, indices = G.indptr, G.indices
+        weights = G._weight_array(weight)
+        if weights is None:
+            def edges(v):
+                lo, hi = indptr[v], indptr[v + 1]
+                cols = indices[lo:hi].tolist()
+                return zip(cols, [1] * len(cols))
+        else:
+            def edges(v):
+                lo, hi = indptr[v], indptr[v + 1]
+                return zip(indices[lo:hi].tolist(), weights[lo:hi].tolist())
+    else:
+        n = len(G)
+        if not all(i in G for i in range(n)):
+            raise nx.NetworkXError("The nodes of G must be the integers "
+                                   "0 to n-1; see "
+                                   "convert_node_labels_to_integers().")
+        s = source
+        adj = G.adj
+        if G.is_multigraph():
+            def edges(v):
+                return ((w, min(dd.get(weight, 1) for dd in keydata.values()))
+                        for w, keydata in adj[v].items())
+        else:
+            def edges(v):
+                return ((w, dd.get(weight, 1)) for w, dd in adj[v].items())
+        adj[s]  # raise KeyError for a missing source like the dict version
+    push = heappush
+    pop = heappop
+    dist = {}
+    seen = {s: 0}
+    pred = {s: [] if all_preds else -1}
+    # node indices are integers so they break distance ties in the heap
+    fringe = [(0, s)]
+    while fringe:
+        (d, v) = pop(fringe)
+        if v in dist:
+            continue  # already searched this node.
+        dist[v] = d
+        for w, vw_weight in edges(v):
+            vw_dist = d + vw_weight
+            if cutoff is not None:
+                if vw_dist > cutoff:
+                    continue
+            if w in dist:
+                if vw_dist < dist[w]:
+                    raise ValueError('Contradictory paths found:',
+                                     'negative weights?')
+            elif w not in seen or vw_dist < seen[w]:
+                seen[w] = vw_dist
+                push(fringe, (vw_dist, w))
+                pred[w] = [v] if all_preds else v
+            elif all_preds and vw_dist == seen[w]:
+                pred[w].append(v)
+    return (pred, dist)
+
+
+def _index_array(G, values, default, dtype):
+    # values keyed by node index as an array with default for the others
+    import numpy as np
+    a = np.empty(len(G), dtype=dtype)
+    a.fill(default)
+    if values:
+        a[list(values)] = list(values.values())
+    return a
+
+
+def _index_dict(G, values):
+    # values keyed by node label instead of node index
+    if isinstance(G, nx.CSRGraph):
+        labels = G._nodes
+        return dict((labels[i], x) for i, x in values.items())
+    return values
+
+
+def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight',
+                                   n_jobs=None):
     """ Compute shortest path lengths between all nodes in a weighted graph.
 
     Parameters
@@ -437,10 +582,17 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
     cutoff : integer or float, optional
        Depth to stop the search. Only paths of length <= cutoff are returned.
 
+    n_jobs : integer, optional
+       If given, split the sources across this many worker processes
+       (-1 for one per CPU) and return a generator instead of a
+       dictionary.  See networkx.utils.parallel_imap().
+
     Returns
     -------
-    distance : dictionary
+    distance : dictionary or generator
        Dictionary, keyed by source and target, of shortest path lengths.
+       If n_jobs is given, a generator of (source, distance) pairs in
+       arbitrary order.
 
     Examples
     --------
@@ -457,7 +609,15 @@ def all_pairs_dijkstra_path_length(G, cutoff=None, weight='weight'):
     Distances are calculated as sums of weighted edges traversed.
 
     The dictionary returned only has keys for reachable node pairs.
+
+    With n_jobs the graph is copied once to each worker process and the
+    results are streamed back, so only a few single-source results are
+    held in memory at a time.
     """
+    if n_jobs is not None:
+        func = partial(single_source_dijkstra_path_length, cutoff=cutoff,
+                       weight=weight)
+        return parallel_imap(func, G, G.nodes(), n_jobs=n_jobs)
     paths = {}
     for n in G:
         paths[n] = single_source_dijkstra_path_length(G, n, cutoff=cutoff,
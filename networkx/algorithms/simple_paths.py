@@ -55,6 +55,11 @@ def all_simple_paths(G, source, target, cutoff=None):
     number of simple paths in a graph can be very large, e.g. `O(n!)` in
     the complete graph of order n.
 
+    The distances to target are found first by a breadth-first search
+    along the reversed edges, and the search for paths does not enter
+    nodes that cannot reach the target, or cannot reach it within the
+    cutoff, so dead branches of the graph are not explored.
+
     References
     ----------
     .. [1] R. Sedgewick, "Algorithms in C, Part 5: Graph Algorithms",
@@ -70,55 +75,66 @@ def all_simple_paths(G, source, target, cutoff=None):
         raise nx.NetworkXError('target node %s not in graph'%target)
     if cutoff is None:
         cutoff = len(G)-1
+    dist = _distances_to(G, target, cutoff)
     if G.is_multigraph():
-        return _all_simple_paths_multigraph(G, source, target, cutoff=cutoff)
+        return _all_simple_paths_multigraph(G, source, target, cutoff, dist)
     else:
-        return _all_simple_paths_graph(G, source, target, cutoff=cutoff)
+        return _all_simple_paths_graph(G, source, target, cutoff, dist)
+
+def _distances_to(G, target, cutoff):
+    """Return the distances to target of the nodes within cutoff of it."""
+    pred = G.pred if G.is_directed() else G.adj
+    dist = {target: 0}
+    level = [target]
+    d = 0
+    while level and d < cutoff:
+        d += 1
+        nextlevel = []
+        for v in level:
+            for u in pred[v]:
+                if u not in dist:
+                    dist[u] = d
+                    nextlevel.append(u)
+        level = nextlevel
+    return dist
 
-def _all_simple_paths_graph(G, source, target, cutoff=None):
+def _all_simple_paths_graph(G, source, target, cutoff, dist):
     if cutoff < 1:
         return
     visited = [source]
+    onpath = set(visited)
     stack = [iter(G[source])]
     while stack:
         children = stack[-1]
         child = next(children, None)
         if child is None:
             stack.pop()
-            visited.pop()
-        elif len(visited) < cutoff:
-            if child == target:
-                yield visited + [target]
-            elif child not in visited:
-                visited.append(child)
-                stack.append(iter(G[child]))
-        else: #len(visited) == cutoff:
-            if child == target or target in children:
-                yield visited + [target]
-            stack.pop()
-            visited.pop()
+            onpath.discard(visited.pop())
+        elif child == target:
+            yield visited + [target]
+        elif (child not in onpath and
+              len(visited) + dist.get(child, cutoff) <= cutoff):
+            visited.append(child)
+            onpath.add(child)
+            stack.append(iter(G[child]))
 
 
-def _all_simple_paths_multigraph(G, source, target, cutoff=None):
+def _all_simple_paths_multigraph(G, source, target, cutoff, dist):
     if cutoff < 1:
         return
     visited = [source]
+    onpath = set(visited)
     stack = [(v for u,v in G.edges(source))]
     while stack:
         children = stack[-1]
         child = next(children, None)
         if child is None:
             stack.pop()
-            visited.pop()
-        elif len(visited) < cutoff:
-            if child == target:
-                yield visited + [target]
-            elif child not in visited:
-                visited.append(child)
-                stack.append((v for u,v in G.edges(child)))
-        else: #len(visited) == cutoff:
-            count = ([child]+list(children)).count(target)
-            for i in range(count):
-                yield visited + [target]
-            stack.pop()
-            visited.pop()
+            onpath.discard(visited.pop())
+        elif child == target:
+            yield visited + [target]
+        elif (child not in onpath and
+              len(visited) + dist.get(child, cutoff) <= cutoff):
+            visited.append(child)
+            onpath.add(child)
+            stack.append((v for u,v in G.edges(child)))
@@ -35,10 +35,45 @@ class TestCliques:
         assert_equal(sorted(map(sorted, hcl)),
                      [[1, 2], [1, 4, 5, 6], [2, 3], [3, 4, 6]])
 
+    def test_find_cliques_bitset(self):
+        for G in (self.G, self.H, nx.karate_club_graph(),
+                  nx.gnp_random_graph(40, 0.3, seed=11)):
+            expected = sorted(map(sorted, nx.find_cliques(G)))
+            cl = nx.find_cliques_bitset(G)
+            assert_equal(sorted(map(sorted, cl)), expected)
+            cl = nx.find_cliques_bitset(G, n_jobs=2)
+            assert_equal(sorted(map(sorted, cl)), expected)
+            for k in (2, 3, 4):
+                cl = nx.find_cliques_bitset(G, min_size=k)
+                assert_equal(sorted(map(sorted, cl)),
+                             [c for c in expected if len(c) >= k])
+
+    def test_find_cliques_bitset_selfloops(self):
+        self.G.add_edge(1, 1)
+        self.G.add_node(12)
+        cl = nx.find_cliques_bitset(self.G)
+        assert_equal(sorted(map(sorted, cl)),
+                     [[1, 2, 3, 6], [2, 4, 6], [4, 5, 7], [8, 9], [10, 11],
+                      [12]])
+
+    def test_find_cliques_bitset_star(self):
+        # Most leaves of this star have core number 1 and come before its
+        # center in a degeneracy ordering, whatever their labels.
+        G = nx.star_graph(1000)
+        G.add_edge(1, 2)
+        cl = sorted(map(sorted, nx.find_cliques_bitset(G)))
+        assert_equal(cl, sorted(map(sorted, nx.find_cliques(G))))
+        cl = nx.find_cliques_bitset(nx.MultiGraph(G))
+        assert_equal(len(list(cl)), 999)
+        from networkx.algorithms.core import _core_decomposition
+        order = _core_decomposition(G)[1]
+        assert_true(order.index(0) >= len(G) - 3)
+
     def test_clique_number(self):
         G = self.G
         assert_equal(nx.graph_clique_number(G), 4)
         assert_equal(nx.graph_clique_number(G, cliques=self.cl), 4)
+        assert_equal(nx.graph_clique_number(G, n_jobs=2), 4)
 
     def test_number_of_cliques(self):
         G = self.G
@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 from nose.tools import *
+from nose import SkipTest
 import networkx as nx
 
 class TestTriangles:
@@ -35,6 +36,35 @@ class TestTriangles:
         assert_equal(nx.triangles(G,1),3)
 
 
+    def test_selfloops(self):
+        G = nx.complete_graph(5)
+        G.add_edges_from([(0, 0), (3, 3)])
+        assert_equal(nx.triangles(G), {0: 6, 1: 6, 2: 6, 3: 6, 4: 6})
+        assert_equal(nx.triangles(G, 3), 6)
+
+    def test_sparse(self):
+        try:
+            import scipy
+        except ImportError:
+            raise SkipTest('SciPy not available.')
+        for G in (nx.empty_graph(3), nx.cubical_graph(), nx.complete_graph(5),
+                  nx.powerlaw_cluster_graph(100, 3, 0.4, seed=5)):
+            G.add_edge(1, 1)
+            t = nx.triangles(G)
+            assert_equal(nx.triangles(G, method='sparse'), t)
+            assert_equal(nx.triangles(G, [1, 2], method='sparse'),
+                         {1: t[1], 2: t[2]})
+            assert_equal(nx.triangles(G, 2, method='sparse'), t[2])
+            assert_almost_equal(nx.transitivity(G, method='sparse'),
+                                nx.transitivity(G))
+            assert_almost_equal(nx.average_clustering(G, method='sparse'),
+                                nx.average_clustering(G))
+
+    def test_bad_method(self):
+        assert_raises(nx.NetworkXError, nx.triangles, nx.path_graph(3),
+                      method='foo')
+
+
 class TestWeightedClustering:
 
     def test_clustering(self):
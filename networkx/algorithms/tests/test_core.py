@@ -57,6 +57,14 @@ class TestCore:
         assert_equal(nodes_by_core[1],[1, 3])
         assert_equal(nodes_by_core[2],[2, 4, 5, 6])
 
+    def test_directed(self):
+        # in-degree + out-degree, counting both edges between two nodes
+        G = nx.gnp_random_graph(30, 0.15, seed=8, directed=True)
+        cores = nx.core_number(G)
+        for k in set(cores.values()):
+            H = G.subgraph(n for n in G if cores[n] >= k)
+            assert_true(min(H.degree().values()) >= k)
+
     def test_main_core(self):
         main_core_subgraph=nx.k_core(self.H)
         assert_equal(sorted(main_core_subgraph.nodes()),[2,4,5,6])
@@ -112,3 +120,69 @@ class TestCore:
         # k=2
         k_corona_subgraph=nx.k_corona(self.H,k=0)
         assert_equal(sorted(k_corona_subgraph.nodes()),[0])
+
+
+class TestCoreIndex:
+
+    def check(self, G):
+        H = nx.Graph(G)
+        H.remove_edges_from(H.selfloop_edges())
+        expected = nx.core_number(H)
+        assert_equal(nx.core_number(G), expected)
+        assert_equal(nx.k_core(G).nodes(), nx.k_core(H).nodes())
+
+    def test_add_remove(self):
+        t = nx.tetrahedral_graph()
+        G = nx.disjoint_union(t, t)
+        index = nx.index_cores(G)
+        assert_true(G.core_index is index)
+        assert_equal(index[0], 3)
+        G.add_edges_from([(0, 4), (1, 5), (2, 6), (3, 7)])
+        assert_equal(index[0], 4)
+        self.check(G)
+        G.remove_edge(0, 1)
+        self.check(G)
+        G.add_node(10)
+        G.add_nodes_from([11, (12, {'color': 'red'})])
+        G.add_edge(10, 11)
+        G.add_edge(12, 12)
+        self.check(G)
+        G.remove_node(4)
+        self.check(G)
+        G.remove_nodes_from([5, 6, 10])
+        self.check(G)
+        assert_raises(nx.NetworkXError, index.__getitem__, 4)
+        G.clear()
+        assert_equal(len(index), 0)
+
+    def test_random(self):
+        import random
+        random.seed(42)
+        G = nx.gnp_random_graph(30, 0.15, seed=42)
+        nx.index_cores(G)
+        for i in range(200):
+            r = random.random()
+            if r < 0.4:
+                G.add_edge(random.randint(0, 35), random.randint(0, 35))
+            elif r < 0.5:
+                G.add_edges_from((random.randint(0, 35), random.randint(0, 35))
+                                 for j in range(5))
+            elif r < 0.8 and G.number_of_edges() > 5:
+                G.remove_edge(*random.choice(G.edges()))
+            elif r < 0.9 and G.number_of_edges() > 5:
+                G.remove_edges_from(random.sample(G.edges(), 5))
+            elif len(G) > 3:
+                G.remove_nodes_from(random.sample(G.nodes(), 3))
+            self.check(G)
+
+    def test_unindex(self):
+        G = nx.complete_graph(4)
+        nx.index_cores(G)
+        nx.unindex_cores(G)
+        assert_false(hasattr(G, 'core_index'))
+        G.remove_edge(0, 1)
+        assert_equal(nx.core_number(G)[0], 2)
+        assert_raises(nx.NetworkXNotImplemented, nx.index_cores,
+                      nx.DiGraph())
+        G.add_edge(0, 0)
+        assert_raises(nx.NetworkXError, nx.index_cores, G)
@@ -142,6 +142,45 @@ class TestCycles:
         for rc in rcc:
             assert_true(any(self.is_cyclic_permutation(rc,c) for c in cc))
 
+    def test_simple_cycles_length_bound(self):
+        # K_n has C(n, l) * (l - 1)! cycles of length l
+        G = nx.DiGraph(nx.complete_graph(6))
+        for bound, count in [(0, 0), (1, 0), (2, 15), (3, 55), (4, 145),
+                             (6, 409)]:
+            cc = list(nx.simple_cycles(G, length_bound=bound))
+            assert_equal(len(cc), count)
+            assert_true(all(len(c) <= bound for c in cc))
+        G = nx.DiGraph([(0, 0), (0, 1), (0, 2), (1, 2), (2, 0), (2, 1), (2, 2)])
+        cc = sorted(nx.simple_cycles(G, length_bound=2))
+        ca = [[0], [0, 2], [1, 2], [2]]
+        assert_equal(len(cc), len(ca))
+        for c in cc:
+            assert_true(any(self.is_cyclic_permutation(c,rc) for rc in ca))
+
+    def test_simple_cycles_length_bound_worst_case(self):
+        for k in range(3,7):
+            G=self.worst_case_graph(k)
+            cc=list(nx.simple_cycles(G))
+            for bound in range(2, 2*k+4):
+                bc=list(nx.simple_cycles(G, length_bound=bound))
+                assert_equal(len(bc), sum(1 for c in cc if len(c) <= bound))
+
+    def test_simple_cycles_n_jobs(self):
+        G=self.worst_case_graph(4)
+        G.add_edge(1, 1)
+        cc=list(nx.simple_cycles(G))
+        for bound in (None, 3):
+            pc=list(nx.simple_cycles(G, length_bound=bound, n_jobs=2))
+            expected=[c for c in cc if bound is None or len(c) <= bound]
+            assert_equal(len(pc), len(expected))
+            for c in pc:
+                assert_true(any(self.is_cyclic_permutation(c,rc)
+                                for rc in expected))
+
+    @raises(nx.NetworkXError)
+    def test_simple_cycles_negative_length_bound(self):
+        nx.simple_cycles(nx.DiGraph([(0, 1)]), length_bound=-1)
+
 # These tests might fail with hash randomization since they depend on
 # edge_dfs. For more information, see the comments in:
 #    networkx/algorithms/traversal/tests/test_edgedfs.py
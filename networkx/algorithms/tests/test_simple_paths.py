@@ -37,6 +37,18 @@ def test_all_simple_paths_empty():
     paths = nx.all_simple_paths(G,0,3,cutoff=2)
     assert_equal(list(list(p) for p in paths),[])
 
+def test_all_simple_paths_dead_ends():
+    G = nx.DiGraph()
+    G.add_path([0,1,2,3])
+    G.add_path([0,4,5,6])
+    G.add_path([1,7,8,9,3])
+    paths = nx.all_simple_paths(G,0,3)
+    assert_equal(sorted(list(p) for p in paths),[[0,1,2,3],[0,1,7,8,9,3]])
+    paths = nx.all_simple_paths(G,0,3,cutoff=3)
+    assert_equal(list(list(p) for p in paths),[[0,1,2,3]])
+    paths = nx.all_simple_paths(G,4,3)
+    assert_equal(list(list(p) for p in paths),[])
+
 def hamiltonian_path(G,source):
     source = next(G.nodes_iter())
     neighbors = set(G[source])-set([source])
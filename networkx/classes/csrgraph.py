@@ -0,0 +1,767 @@
+"""Read-only graph classes backed by compressed sparse row (CSR) arrays.
+
+CSRGraph and CSRDiGraph hold the adjacency structure in NumPy arrays
+instead of a dict-of-dicts.  They implement the read-only part of the
+Graph and DiGraph interfaces so most algorithms run on them unchanged,
+while using a small fraction of the memory for large graphs.
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+import networkx as nx
+from networkx.classes.graph import Graph
+from networkx.classes.digraph import DiGraph
+from networkx.classes.function import frozen
+from networkx.exception import NetworkXError
+
+__all__ = ['CSRGraph', 'CSRDiGraph']
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("CSRGraph requires NumPy: http://scipy.org/")
+    return np
+
+
+def _csr_from_adjacency(np, nodes, index, adj, weight):
+    """Return (indptr, indices, weights) for the adjacency dict adj.
+
+    Rows follow the order of nodes and each row is sorted by column
+    index.  weights is None if no edge carries the weight attribute.
+    """
+    n = len(nodes)
+    counts = np.fromiter((len(adj[u]) for u in nodes), dtype=np.int64,
+                         count=n)
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    nnz = int(indptr[-1])
+    itype = np.int32 if n < 2 ** 31 else np.int64
+    indices = np.fromiter((index[v] for u in nodes for v in adj[u]),
+                          dtype=itype, count=nnz)
+    weights = None
+    if weight is not None:
+        values = [d.get(weight, 1) for u in nodes for d in adj[u].values()]
+        if any(weight in d for u in nodes for d in adj[u].values()):
+            weights = np.array(values)
+            if weights.dtype.kind not in 'biuf':
+                raise NetworkXError(
+                    "Edge attribute %r must be numeric." % (weight,))
+    # sort columns within each row so lookups can bisect
+    rows = np.repeat(np.arange(n, dtype=itype), counts)
+    order = np.lexsort((indices, rows))
+    indices = indices[order]
+    if weights is not None:
+        weights = weights[order]
+    return indptr, indices, weights
+
+
+def _csr_transpose(np, n, indptr, indices, weights):
+    """Return the CSR arrays of the transpose of a CSR matrix."""
+    counts = np.diff(indptr)
+    rows = np.repeat(np.arange(n, dtype=indices.dtype), counts)
+    order = np.lexsort((rows, indices))
+    t_indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(indices, minlength=n), out=t_indptr[1:])
+    t_indices = rows[order]
+    t_weights = None if weights is None else weights[order]
+    return t_indptr, t_indices, t_weights
+
+
+class _CSRNeighbors(Mapping):
+    """Read-only neighbor -> edge data mapping of one CSR row.
+
+    Edge data dictionaries are created on access and only hold the
+    edge weight; modifying them does not change the graph.
+    """
+    __slots__ = ('_adj', '_lo', '_hi')
+
+    def __init__(self, adj, lo, hi):
+        self._adj = adj
+        self._lo = lo
+        self._hi = hi
+
+    def _position(self, key):
+        adj = self._adj
+        try:
+            j = adj._index[key]
+        except (KeyError, TypeError):
+            raise KeyError(key)
+        indices = adj._indices
+        lo, hi = self._lo, self._hi
+        k = lo + int(indices[lo:hi].searchsorted(j))
+        if k == hi or indices[k] != j:
+            raise KeyError(key)
+        return k
+
+    def __getitem__(self, key):
+        return self._adj._data(self._position(key))
+
+    def __contains__(self, key):
+        try:
+            self._position(key)
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        labels = self._adj._labels
+        return (labels[j]
+                for j in self._adj._indices[self._lo:self._hi].tolist())
+
+    def __len__(self):
+        return self._hi - self._lo
+
+    def items(self):
+        adj = self._adj
+        labels = adj._labels
+        lo, hi = self._lo, self._hi
+        cols = adj._indices[lo:hi].tolist()
+        if adj._weights is None:
+            return [(labels[j], {}) for j in cols]
+        key = adj._weight
+        return [(labels[j], {key: w})
+                for j, w in zip(cols, adj._weights[lo:hi].tolist())]
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _CSRAdjacency(Mapping):
+    """Read-only node -> neighbors mapping over CSR arrays."""
+
+    def __init__(self, labels, index, indptr, indices, weights, weight):
+        self._labels = labels
+        self._index = index
+        self._indptr = indptr
+        self._indices = indices
+        self._weights = weights
+        self._weight = weight
+
+    def _data(self, k):
+        if self._weights is None:
+            return {}
+        return {self._weight: self._weights[k].item()}
+
+    def _row(self, i):
+        indptr = self._indptr
+        return _CSRNeighbors(self, int(indptr[i]), int(indptr[i + 1]))
+
+    def __getitem__(self, n):
+        return self._row(self._index[n])
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def items(self):
+        return ((n, self._row(i)) for i, n in enumerate(self._labels))
+
+    def values(self):
+        return (self._row(i) for i in range(len(self._labels)))
+
+
+class _CSRNodeData(Mapping):
+    """Read-only node -> attribute dict mapping.
+
+    Only nodes with attributes are stored; other nodes map to a new
+    empty dict.
+    """
+
+    def __init__(self, labels, index, attr):
+        self._labels = labels
+        self._index = index
+        self._attr = attr
+
+    def __getitem__(self, n):
+        if n not in self._index:
+            raise KeyError(n)
+        return self._attr.get(n, {})
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    def __len__(self):
+        return len(self._labels)
+
+
+class CSRGraph(Graph):
+    """
+    Read-only undirected graph stored in compressed sparse row arrays.
+
+    The adjacency structure is held in three NumPy arrays: ``indptr``,
+    ``indices`` and ``weights``.  The neighbors of the node with index
+    ``i`` are ``indices[indptr[i]:indptr[i+1]]`` (sorted) and the
+    corresponding edge weights are in the same slice of ``weights``.
+    Node labels are kept in a list together with a label -> index dict.
+
+    A CSRGraph supports the reporting methods of Graph (``G[n]``,
+    ``neighbors_iter``, ``edges_iter``, ``degree_iter``, ``has_edge``,
+    ``nbunch_iter``, ...) so algorithms that only read the graph run on
+    it unchanged.  Methods that add or remove nodes or edges raise
+    NetworkXError.
+
+    Parameters
+    ----------
+    data : input graph
+        Data to initialize graph.  Any input accepted by the Graph
+        constructor can be used; it is converted to a Graph first if
+        it is not already one.
+    weight : string or None, optional (default='weight')
+        The edge attribute to keep.  All other edge attributes are
+        discarded.  If None, or if no edge has this attribute, no edge
+        data is stored.
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRDiGraph
+    Graph
+    freeze
+
+    Notes
+    -----
+    Edge data dictionaries such as ``G[u][v]`` are created on access and
+    only hold the stored weight, so changing them does not change the
+    graph.  The same holds for the attribute dictionary of a node that
+    had no attributes when the graph was built.
+
+    The memory used per edge is one index (4 bytes for fewer than 2**31
+    nodes) plus one weight (8 bytes) if weights are stored, for each
+    direction of the edge.
+
+    Examples
+    --------
+    >>> G = nx.CSRGraph(nx.path_graph(4))
+    >>> G[1]
+    {0: {}, 2: {}}
+    >>> sorted(G.edges())
+    [(0, 1), (1, 2), (2, 3)]
+    >>> nx.shortest_path_length(G, 0, 3)
+    3
+    >>> try:
+    ...     G.add_edge(3, 4)
+    ... except nx.NetworkXError as e:
+    ...     print(str(e))
+    Frozen graph can't be modified
+    """
+    add_node = frozen
+    add_nodes_from = frozen
+    remove_node = frozen
+    remove_nodes_from = frozen
+    add_edge = frozen
+    add_edges_from = frozen
+    add_weighted_edges_from = frozen
+    remove_edge = frozen
+    remove_edges_from = frozen
+    add_star = frozen
+    add_path = frozen
+    add_cycle = frozen
+    clear = frozen
+    frozen = True
+
+    def __init__(self, data=None, weight='weight', **attr):
+        np = _import_numpy()
+        if not (isinstance(data, Graph) and not data.is_multigraph() and
+                data.is_directed() == self.is_directed()):
+            data = self._dict_graph_class()(data)
+        nodes = list(data)
+        index = dict(zip(nodes, range(len(nodes))))
+        node_attr = dict((n, d) for n, d in data.node.items() if d)
+        self._setup(nodes, index,
+                    _csr_from_adjacency(np, nodes, index, data.adj, weight),
+                    weight, node_attr, data.graph.copy())
+        self.graph.update(attr)
+
+    @staticmethod
+    def _dict_graph_class():
+        return nx.Graph
+
+    @classmethod
+    def from_arrays(cls, nodes, indptr, indices, weights=None,
+                    weight='weight', node_attr=None, **attr):
+        """Return a graph built directly from CSR arrays.
+
+        No copy of the arrays is made, so they may be memory-mapped.
+
+        Parameters
+        ----------
+        nodes : sequence
+            The node labels; node ``nodes[i]`` has index ``i``.
+        indptr, indices : arrays
+            The CSR structure.  The column indices of each row must be
+            sorted.  For undirected graphs both directions of every
+            non-loop edge must be present.
+        weights : array, optional (default=None)
+            Edge weights aligned with ``indices``.
+        weight : string, optional (default='weight')
+            The edge attribute name used to report ``weights``.
+        node_attr : dict, optional (default=None)
+            Node attribute dicts keyed by node label.
+        attr : keyword arguments, optional (default= no attributes)
+            Attributes to add to graph as key=value pairs.
+
+        Returns
+        -------
+        G : CSRGraph or CSRDiGraph
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = nx.CSRGraph.from_arrays(['a', 'b'], np.array([0, 1, 2]),
+        ...                             np.array([1, 0]))
+        >>> G.edges()
+        [('a', 'b')]
+        """
+        np = _import_numpy()
+        if hasattr(nodes, 'tolist'):
+            nodes = nodes.tolist()
+        nodes = list(nodes)
+        indptr = np.asarray(indptr)
+        indices = np.asarray(indices)
+        if len(indptr) != len(nodes) + 1:
+            raise NetworkXError("indptr must have one entry more than nodes.")
+        if int(indptr[-1]) != len(indices):
+            raise NetworkXError("indptr and indices are inconsistent.")
+        if weights is not None:
+            weights = np.asarray(weights)
+            if len(weights) != len(indices):
+                raise NetworkXError("weights and indices differ in length.")
+        index = dict(zip(nodes, range(len(nodes))))
+        if len(index) != len(nodes):
+            raise NetworkXError("Node labels must be unique.")
+        G = cls.__new__(cls)
+        G._setup(nodes, index, (indptr, indices, weights), weight,
+                 dict(node_attr or {}), attr)
+        return G
+
+    def _setup(self, nodes, index, csr, weight, node_attr, graph_attr):
+        self._nodes = nodes
+        self._index = index
+        self._weight = weight
+        self.indptr, self.indices, self.weights = csr
+        self.graph = graph_attr
+        self.node = _CSRNodeData(nodes, index, node_attr)
+        self.adj = _CSRAdjacency(nodes, index, self.indptr,
+                                 self.indices, self.weights, weight)
+        self.edge = self.adj
+
+    def _row(self, n):
+        try:
+            i = self._index[n]
+        except (KeyError, TypeError):
+            raise NetworkXError("The node %s is not in the graph." % (n,))
+        return i, int(self.indptr[i]), int(self.indptr[i + 1])
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __contains__(self, n):
+        try:
+            return n in self._index
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def nodes_iter(self, data=False):
+        """Return an iterator over the nodes, see Graph.nodes_iter."""
+        if data:
+            return ((n, self.node[n]) for n in self._nodes)
+        return iter(self._nodes)
+
+    def has_edge(self, u, v):
+        """Return True if the edge (u,v) is in the graph."""
+        try:
+            return v in self.adj[u]
+        except (KeyError, TypeError):
+            return False
+
+    def neighbors_iter(self, n):
+        """Return an iterator over all neighbors of node n."""
+        i, lo, hi = self._row(n)
+        labels = self._nodes
+        return (labels[j] for j in self.indices[lo:hi].tolist())
+
+    def neighbors(self, n):
+        """Return a list of the nodes connected to the node n."""
+        return list(self.neighbors_iter(n))
+
+    def _weight_array(self, weight):
+        # weights of the stored attribute; any other attribute is 1
+        if weight is not None and weight == self._weight:
+            return self.weights
+        return None
+
+    def _edges(self, indptr, indices, bunch, data, skip_seen):
+        labels = self._nodes
+        weights = self.weights if data else None
+        seen = set()
+        for n in bunch:
+            i = self._index[n]
+            lo, hi = int(indptr[i]), int(indptr[i + 1])
+            cols = indices[lo:hi].tolist()
+            if weights is not None:
+                key = self._weight
+                for j, w in zip(cols, weights[lo:hi].tolist()):
+                    if j not in seen:
+                        yield (n, labels[j], {key: w})
+            elif data:
+                for j in cols:
+                    if j not in seen:
+                        yield (n, labels[j], {})
+            else:
+                for j in cols:
+                    if j not in seen:
+                        yield (n, labels[j])
+            if skip_seen:
+                seen.add(i)
+
+    def edges_iter(self, nbunch=None, data=False):
+        """Return an iterator over the edges, see Graph.edges_iter."""
+        return self._edges(self.indptr, self.indices,
+                           self.nbunch_iter(nbunch), data, True)
+
+    def _degree(self, indptr, weights, bunch, loops):
+        index = self._index
+        for n in bunch:
+            i = index[n]
+            lo, hi = int(indptr[i]), int(indptr[i + 1])
+            if weights is None:
+                d = hi - lo
+                if loops and i in self._selfloops:
+                    d += 1
+            else:
+                d = weights[lo:hi].sum().item()
+                if loops and i in self._selfloops:
+                    d += self._selfloops[i]
+            yield (n, d)
+
+    @property
+    def _selfloops(self):
+        # index -> weight (1 if unweighted) of the nodes with self loops
+        try:
+            return self.__selfloops
+        except AttributeError:
+            np = _import_numpy()
+            indptr, indices = self.indptr, self.indices
+            rows = np.repeat(np.arange(len(self._nodes)), np.diff(indptr))
+            pos = np.nonzero(indices == rows)[0]
+            if self.weights is None:
+                loops = dict((i, 1) for i in indices[pos].tolist())
+            else:
+                loops = dict(zip(indices[pos].tolist(),
+                                 self.weights[pos].tolist()))
+            self.__selfloops = loops
+            return loops
+
+    def degree_iter(self, nbunch=None, weight=None):
+        """Return an iterator for (node, degree), see Graph.degree_iter."""
+        return self._degree(self.indptr, self._weight_array(weight),
+                            self.nbunch_iter(nbunch), True)
+
+    def nodes_with_selfloops(self):
+        """Return a list of nodes with self loops."""
+        return [self._nodes[i] for i in sorted(self._selfloops)]
+
+    def selfloop_edges(self, data=False):
+        """Return a list of selfloop edges."""
+        if data:
+            return [(n, n, self.adj[n][n])
+                    for n in self.nodes_with_selfloops()]
+        return [(n, n) for n in self.nodes_with_selfloops()]
+
+    def number_of_selfloops(self):
+        """Return the number of selfloop edges."""
+        return len(self._selfloops)
+
+    def number_of_edges(self, u=None, v=None):
+        """Return the number of edges between two nodes, or in total."""
+        if u is None:
+            return (len(self.indices) + len(self._selfloops)) // 2
+        return int(self.has_edge(u, v))
+
+    def subgraph(self, nbunch):
+        """Return the subgraph induced on nodes in nbunch.
+
+        The subgraph is a new graph of the same class built with array
+        operations; node attribute dicts are shared with this graph.
+
+        Examples
+        --------
+        >>> G = nx.CSRGraph(nx.path_graph(4))
+        >>> H = G.subgraph([0,1,2])
+        >>> H.edges()
+        [(0, 1), (1, 2)]
+        """
+        np = _import_numpy()
+        keep = sorted(set(self._index[n] for n in self.nbunch_iter(nbunch)))
+        keep = np.array(keep, dtype=np.int64)
+        csr = self._sub_csr(keep, self.indptr, self.indices, self.weights)
+        nodes = [self._nodes[i] for i in keep.tolist()]
+        attr = self.node._attr
+        node_attr = dict((n, attr[n]) for n in nodes if n in attr)
+        H = self.__class__.__new__(self.__class__)
+        H._setup(nodes, dict(zip(nodes, range(len(nodes)))), csr,
+                 self._weight, node_attr, self.graph)
+        return H
+
+    def _sub_csr(self, keep, indptr, indices, weights):
+        np = _import_numpy()
+        n = len(self._nodes)
+        relabel = np.full(n, -1, dtype=np.int64)
+        relabel[keep] = np.arange(len(keep))
+        starts, stops = indptr[keep], indptr[keep + 1]
+        counts = stops - starts
+        # positions of all entries in the selected rows
+        pos = np.repeat(stops - counts.cumsum(), counts) + np.arange(
+            int(counts.sum()))
+        rows = np.repeat(np.arange(len(keep)), counts)
+        cols = relabel[indices[pos]]
+        mask = cols >= 0
+        sub_indptr = np.zeros(len(keep) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows[mask], minlength=len(keep)),
+                  out=sub_indptr[1:])
+        sub_indices = cols[mask].astype(indices.dtype)
+        sub_weights = None if weights is None else weights[pos[mask]]
+        return sub_indptr, sub_indices, sub_weights
+
+    def to_directed(self):
+        """Return a CSRDiGraph with both directions of each edge.
+
+        The arrays are shared with this graph.
+        """
+        attr = self.node._attr
+        G = CSRDiGraph.from_arrays(self._nodes, self.indptr, self.indices,
+                                   self.weights, self._weight, attr,
+                                   in_indptr=self.indptr,
+                                   in_indices=self.indices,
+                                   in_weights=self.weights)
+        G.graph = self.graph.copy()
+        return G
+
+    def to_undirected(self):
+        """Return an undirected copy of the graph."""
+        return self.copy()
+
+
+class CSRDiGraph(CSRGraph, DiGraph):
+    """
+    Read-only directed graph stored in compressed sparse row arrays.
+
+    Successors are stored in ``indptr``, ``indices`` and ``weights`` and
+    predecessors in ``in_indptr``, ``in_indices`` and ``in_weights``.
+    See CSRGraph for details.
+
+    Parameters
+    ----------
+    data : input graph
+        Data to initialize graph.  Any input accepted by the DiGraph
+        constructor can be used; it is converted to a DiGraph first if
+        it is not already one.
+    weight : string or None, optional (default='weight')
+        The edge attribute to keep.  All other edge attributes are
+        discarded.  If None, or if no edge has this attribute, no edge
+        data is stored.
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    CSRGraph
+    DiGraph
+
+    Examples
+    --------
+    >>> G = nx.CSRDiGraph(nx.DiGraph([(0, 1), (1, 2)]))
+    >>> G.successors(1)
+    [2]
+    >>> G.predecessors(1)
+    [0]
+    """
+    @staticmethod
+    def _dict_graph_class():
+        return nx.DiGraph
+
+    @classmethod
+    def from_arrays(cls, nodes, indptr, indices, weights=None,
+                    weight='weight', node_attr=None, in_indptr=None,
+                    in_indices=None, in_weights=None, **attr):
+        """Return a digraph built directly from CSR arrays.
+
+        See CSRGraph.from_arrays.  The predecessor arrays ``in_indptr``,
+        ``in_indices`` and ``in_weights`` are computed by transposing
+        the successor arrays if they are not given.
+        """
+        G = super(CSRDiGraph, cls).from_arrays(nodes, indptr, indices,
+                                               weights, weight, node_attr,
+                                               **attr)
+        np = _import_numpy()
+        if in_indptr is None or in_indices is None:
+            pred = _csr_transpose(np, len(G._nodes), G.indptr, G.indices,
+                                  G.weights)
+        else:
+            pred = (np.asarray(in_indptr), np.asarray(in_indices),
+                    None if in_weights is None else np.asarray(in_weights))
+        G._setup_pred(pred)
+        return G
+
+    def __init__(self, data=None, weight='weight', **attr):
+        super(CSRDiGraph, self).__init__(data, weight, **attr)
+        self._setup_pred(_csr_transpose(_import_numpy(), len(self._nodes),
+                                        self.indptr, self.indices,
+                                        self.weights))
+
+    def _setup(self, nodes, index, csr, weight, node_attr, graph_attr):
+        super(CSRDiGraph, self)._setup(nodes, index, csr, weight, node_attr,
+                                       graph_attr)
+        self.succ = self.adj
+
+    def _setup_pred(self, csr):
+        self.in_indptr, self.in_indices, self.in_weights = csr
+        self.pred = _CSRAdjacency(self._nodes, self._index,
+                                  self.in_indptr, self.in_indices,
+                                  self.in_weights, self._weight)
+
+    def has_successor(self, u, v):
+        """Return True if node u has successor v."""
+        return self.has_edge(u, v)
+
+    def has_predecessor(self, u, v):
+        """Return True if node u has predecessor v."""
+        try:
+            return v in self.pred[u]
+        except (KeyError, TypeError):
+            return False
+
+    def successors_iter(self, n):
+        """Return an iterator over successor nodes of n."""
+        return CSRGraph.neighbors_iter(self, n)
+
+    def predecessors_iter(self, n):
+        """Return an iterator over predecessor nodes of n."""
+        i, lo, hi = self._row(n)
+        lo, hi = int(self.in_indptr[i]), int(self.in_indptr[i + 1])
+        labels = self._nodes
+        return (labels[j] for j in self.in_indices[lo:hi].tolist())
+
+    neighbors_iter = successors_iter
+
+    def edges_iter(self, nbunch=None, data=False):
+        """Return an iterator over the out-edges, see DiGraph.edges_iter."""
+        return self._edges(self.indptr, self.indices,
+                           self.nbunch_iter(nbunch), data, False)
+
+    out_edges_iter = edges_iter
+
+    def in_edges_iter(self, nbunch=None, data=False):
+        """Return an iterator over the in-edges, see DiGraph.in_edges_iter."""
+        labels = self._nodes
+        weights = self.in_weights if data else None
+        key = self._weight
+        for n in self.nbunch_iter(nbunch):
+            i = self._index[n]
+            lo, hi = int(self.in_indptr[i]), int(self.in_indptr[i + 1])
+            cols = self.in_indices[lo:hi].tolist()
+            if weights is not None:
+                for j, w in zip(cols, weights[lo:hi].tolist()):
+                    yield (labels[j], n, {key: w})
+            elif data:
+                for j in cols:
+                    yield (labels[j], n, {})
+            else:
+                for j in cols:
+                    yield (labels[j], n)
+
+    def degree_iter(self, nbunch=None, weight=None):
+        """Return an iterator for (node, degree), see DiGraph.degree_iter."""
+        out_degree = self.out_degree_iter(nbunch, weight)
+        in_degree = self.in_degree_iter(nbunch, weight)
+        for (n, d_out), (n2, d_in) in zip(out_degree, in_degree):
+            yield (n, d_out + d_in)
+
+    def in_degree_iter(self, nbunch=None, weight=None):
+        """Return an iterator for (node, in-degree)."""
+        weights = self.in_weights if self._weight_array(weight) is not None \
+            else None
+        return self._degree(self.in_indptr, weights,
+                            self.nbunch_iter(nbunch), False)
+
+    def out_degree_iter(self, nbunch=None, weight=None):
+        """Return an iterator for (node, out-degree)."""
+        return self._degree(self.indptr, self._weight_array(weight),
+                            self.nbunch_iter(nbunch), False)
+
+    def number_of_edges(self, u=None, v=None):
+        """Return the number of edges between two nodes, or in total."""
+        if u is None:
+            return len(self.indices)
+        return int(self.has_edge(u, v))
+
+    def subgraph(self, nbunch):
+        """Return the subgraph induced on nodes in nbunch.
+
+        See CSRGraph.subgraph.
+        """
+        H = super(CSRDiGraph, self).subgraph(nbunch)
+        np = _import_numpy()
+        keep = np.array([self._index[n] for n in H._nodes], dtype=np.int64)
+        H._setup_pred(self._sub_csr(keep, self.in_indptr, self.in_indices,
+                                    self.in_weights))
+        return H
+
+    def reverse(self, copy=True):
+        """Return the reverse of the graph.
+
+        The reversed graph shares its arrays with this graph.  If copy
+        is False this graph is reversed in place.
+        """
+        succ = (self.indptr, self.indices, self.weights)
+        pred = (self.in_indptr, self.in_indices, self.in_weights)
+        if copy:
+            H = self.__class__.__new__(self.__class__)
+            H._setup(self._nodes, self._index, pred, self._weight,
+                     self.node._attr, self.graph.copy())
+        else:
+            H = self
+            H._setup(self._nodes, self._index, pred, self._weight,
+                     self.node._attr, self.graph)
+        H._setup_pred(succ)
+        return H
+
+    def to_directed(self):
+        """Return a copy of the graph."""
+        return self.copy()
+
+    def to_undirected(self, reciprocal=False):
+        """Return an undirected CSRGraph of the digraph.
+
+        See DiGraph.to_undirected.
+        """
+        D = nx.DiGraph(self)
+        return CSRGraph(D.to_undirected(reciprocal=reciprocal),
+                        weight=self._weight)
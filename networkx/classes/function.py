@@ -7,6 +7,7 @@
 #    All rights reserved.
 #    BSD license.
 #
+from functools import partial
 import networkx as nx
 from networkx.utils import not_implemented_for
 import itertools
@@ -216,6 +217,196 @@ def is_frozen(G):
         return False
 
 
+# Indexes attached to a graph, such as the connected component index of
+# index_components(), are kept up to date by replacing the mutating
+# methods of the graph on the instance, like freeze() does.  The
+# replacements call the method of the graph class and then tell each
+# attached index what changed by calling its methods
+#
+#   _add_nodes(nodes)      nodes added, or already present
+#   _add_edges(edges)      (u, v) edges that were not in the graph
+#   _remove_edges(edges)   (u, v) edges that are no longer in the graph
+#   _remove_nodes(nbrs)    removed nodes mapped to their former neighbors
+#   _clear()
+#
+# once the graph has been changed.  The replacements are stored as
+# functools.partial objects of module level functions, not as bound
+# methods, so that graphs with indexes can be pickled and deep copied.
+# Methods of the graph class that call other methods of the graph, such
+# as MultiGraph.remove_edges_from() calling remove_edge(), run with the
+# flag _in_indexed_method set on the graph, so that the indexes are only
+# told once, by the outermost replacement.
+
+def _attach_index(G, name, index):
+    """Attach index to G as the attribute name and make the mutating
+    methods of G keep it up to date."""
+    indexes = G.__dict__.setdefault('_indexes', {})
+    indexes[name] = index
+    setattr(G, name, index)
+    for method, replacement in _indexed_methods.items():
+        setattr(G, method, partial(replacement, G))
+
+
+def _detach_index(G, name):
+    """Remove the index attached to G as the attribute name, if any."""
+    indexes = G.__dict__.get('_indexes', {})
+    if name not in indexes:
+        return
+    del indexes[name]
+    delattr(G, name)
+    if not indexes:
+        del G._indexes
+        for method in _indexed_methods:
+            G.__dict__.pop(method, None)
+
+
+def _node_keys(G, nodes):
+    """Return the nodes of G in nodes, which may hold (node, attrdict)
+    tuples as in add_nodes_from()."""
+    keys = []
+    for n in nodes:
+        try:
+            if n in G:
+                keys.append(n)
+                continue
+        except TypeError:
+            pass
+        keys.append(n[0])
+    return keys
+
+
+def _edge_pairs(G, ebunch, present):
+    """Return the distinct (u, v) pairs of the edges in ebunch that are
+    in G if present is True, or not in G otherwise."""
+    pairs = []
+    seen = set()
+    for e in ebunch:
+        u, v = e[0], e[1]
+        if G.has_edge(u, v) != present or (u, v) in seen:
+            continue
+        seen.add((u, v))
+        if not G.is_directed():
+            seen.add((v, u))
+        pairs.append((u, v))
+    return pairs
+
+
+def _former_neighbors(G, nodes):
+    nbrs = {}
+    for n in nodes:
+        if n in G and n not in nbrs:
+            if G.is_directed():
+                nbrs[n] = list(all_neighbors(G, n))
+            else:
+                nbrs[n] = list(G[n])
+    return nbrs
+
+
+def _call_method(G, name, *args, **kwds):
+    """Call the method name of the class of G with the indexes of G
+    not told about changes made by the methods it calls in turn."""
+    G._in_indexed_method = True
+    try:
+        return getattr(G.__class__, name)(G, *args, **kwds)
+    finally:
+        del G._in_indexed_method
+
+
+def _add_node(G, n, *args, **kwds):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.add_node(G, n, *args, **kwds)
+    _call_method(G, 'add_node', n, *args, **kwds)
+    for index in G._indexes.values():
+        index._add_nodes([n])
+
+
+def _add_nodes_from(G, nodes, *args, **kwds):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.add_nodes_from(G, nodes, *args, **kwds)
+    nodes = list(nodes)
+    _call_method(G, 'add_nodes_from', nodes, *args, **kwds)
+    nodes = _node_keys(G, nodes)
+    for index in G._indexes.values():
+        index._add_nodes(nodes)
+
+
+def _add_edge(G, u, v, *args, **kwds):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.add_edge(G, u, v, *args, **kwds)
+    edges = _edge_pairs(G, [(u, v)], False)
+    _call_method(G, 'add_edge', u, v, *args, **kwds)
+    for index in G._indexes.values():
+        index._add_edges(edges)
+
+
+def _add_edges_from(G, ebunch, *args, **kwds):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.add_edges_from(G, ebunch, *args, **kwds)
+    ebunch = list(ebunch)
+    edges = _edge_pairs(G, ebunch, False)
+    _call_method(G, 'add_edges_from', ebunch, *args, **kwds)
+    for index in G._indexes.values():
+        index._add_edges(edges)
+
+
+def _remove_edge(G, u, v, *args, **kwds):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.remove_edge(G, u, v, *args, **kwds)
+    _call_method(G, 'remove_edge', u, v, *args, **kwds)
+    edges = _edge_pairs(G, [(u, v)], False)
+    for index in G._indexes.values():
+        index._remove_edges(edges)
+
+
+def _remove_edges_from(G, ebunch, *args, **kwds):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.remove_edges_from(G, ebunch, *args, **kwds)
+    ebunch = list(ebunch)
+    edges = _edge_pairs(G, ebunch, True)
+    _call_method(G, 'remove_edges_from', ebunch, *args, **kwds)
+    edges = _edge_pairs(G, edges, False)
+    for index in G._indexes.values():
+        index._remove_edges(edges)
+
+
+def _remove_node(G, n):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.remove_node(G, n)
+    nbrs = _former_neighbors(G, [n])
+    _call_method(G, 'remove_node', n)
+    for index in G._indexes.values():
+        index._remove_nodes(nbrs)
+
+
+def _remove_nodes_from(G, nodes):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.remove_nodes_from(G, nodes)
+    nodes = list(nodes)
+    nbrs = _former_neighbors(G, nodes)
+    _call_method(G, 'remove_nodes_from', nodes)
+    for index in G._indexes.values():
+        index._remove_nodes(nbrs)
+
+
+def _clear(G):
+    if '_in_indexed_method' in G.__dict__:
+        return G.__class__.clear(G)
+    _call_method(G, 'clear')
+    for index in G._indexes.values():
+        index._clear()
+
+
+_indexed_methods = {'add_node': _add_node,
+                    'add_nodes_from': _add_nodes_from,
+                    'add_edge': _add_edge,
+                    'add_edges_from': _add_edges_from,
+                    'remove_edge': _remove_edge,
+                    'remove_edges_from': _remove_edges_from,
+                    'remove_node': _remove_node,
+                    'remove_nodes_from': _remove_nodes_from,
+                    'clear': _clear}
+
+
 def subgraph(G, nbunch):
     """Return the subgraph induced on nodes in nbunch.
 
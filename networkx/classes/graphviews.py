@@ -0,0 +1,268 @@
+"""Read-only views of graphs.
+
+A view presents a graph derived from another graph, such as the
+subgraph induced by some nodes or the reverse of a directed graph,
+without copying its adjacency structure or attribute dictionaries.
+Nodes and edges are filtered, or the successors and predecessors
+swapped, on the fly as the view is used, so changes to the underlying
+graph are seen by the view.
+
+Views are frozen graphs of a subclass of the type of the graph they are
+taken from.  Use the copy() method of a view to obtain an independent
+graph of that type.
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from copy import deepcopy
+import networkx as nx
+from networkx.classes.function import freeze
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+__all__ = ['subgraph_view', 'reverse_view', 'is_view']
+
+
+class _FilterNodes(Mapping):
+    """Read-only mapping restricting a node-keyed mapping to a node set."""
+    __slots__ = ('_data', '_nodes')
+
+    def __init__(self, data, nodes):
+        self._data = data
+        self._nodes = nodes
+
+    def __getitem__(self, n):
+        if n in self:
+            return self._data[n]
+        raise KeyError(n)
+
+    def __contains__(self, n):
+        try:
+            return n in self._nodes
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class _FilterAdjacency(_FilterNodes):
+    """Read-only adjacency mapping restricted to a node set."""
+    __slots__ = ()
+
+    def __getitem__(self, n):
+        if n in self:
+            return _FilterNodes(self._data[n], _Intersection(self._data[n],
+                                                              self._nodes))
+        raise KeyError(n)
+
+
+class _Intersection(object):
+    """Lazy set-like intersection of neighbors with a node set."""
+    __slots__ = ('_nbrs', '_nodes')
+
+    def __init__(self, nbrs, nodes):
+        self._nbrs = nbrs
+        self._nodes = nodes
+
+    def __contains__(self, n):
+        return n in self._nodes and n in self._nbrs
+
+    def __iter__(self):
+        nbrs, nodes = self._nbrs, self._nodes
+        if len(nbrs) <= len(nodes):
+            return (n for n in nbrs if n in nodes)
+        return (n for n in nodes if n in nbrs)
+
+    def __len__(self):
+        return sum(1 for n in self)
+
+
+def is_view(G):
+    """Return True if G is a view of another graph."""
+    return '_view_of' in G.__dict__
+
+
+def _copy(G):
+    """Return an independent copy of the view G.
+
+    The copy is an ordinary, mutable graph of the type of the view with
+    copies of the graph, node and edge attributes.
+    """
+    H = G._graph_class()
+    if G.is_multigraph():
+        edges = G.edges_iter(keys=True, data=True)
+    else:
+        edges = G.edges_iter(data=True)
+    graph, nodes, edges = deepcopy((G.graph, list(G.nodes_iter(data=True)),
+                                    list(edges)))
+    H.graph = graph
+    H.add_nodes_from(nodes)
+    H.add_edges_from(edges)
+    return H
+
+
+class _GraphView(object):
+    """Base of the classes of views, mixed in before the graph class.
+
+    A view is pickled as the function and arguments that made it, so it
+    is restored as a view of the restored graph.  A deep copy of a view
+    is an independent copy of the view only, not of the whole graph.
+    """
+
+    copy = _copy
+
+    def __new__(cls, *args, **kwargs):
+        # Graphs made with G.__class__() from a view G are ordinary graphs.
+        return cls._graph_class(*args, **kwargs)
+
+    def __reduce__(self):
+        return self._view_args
+
+    def __deepcopy__(self, memo):
+        H = memo[id(self)] = _copy(self)
+        return H
+
+
+_view_classes = {}
+
+
+def _view_class(cls):
+    """Return the class of the views of graphs of class cls."""
+    try:
+        return _view_classes[cls]
+    except KeyError:
+        view_cls = type(cls.__name__ + 'View', (_GraphView, cls),
+                        {'_graph_class': cls, '__module__': cls.__module__})
+        return _view_classes.setdefault(cls, view_cls)
+
+
+def _view(G, func, *args):
+    """Return an empty, frozen graph object of the type of G that is
+    rebuilt by func(G, *args) when pickled."""
+    if isinstance(G, nx.CSRGraph):
+        cls = nx.DiGraph if G.is_directed() else nx.Graph
+    else:
+        cls = getattr(G, '_graph_class', G.__class__)
+    view_cls = _view_class(cls)
+    H = object.__new__(view_cls)
+    H.graph = G.graph
+    H._view_of = G
+    H._view_args = (func, (G,) + args)
+    freeze(H)
+    return H
+
+
+def subgraph_view(G, nbunch):
+    """Return a read-only view of the subgraph of G induced on nbunch.
+
+    Unlike G.subgraph(nbunch) no adjacency dictionaries are built: the
+    view filters the nodes and edges of G as it is used.  Creating the
+    view only takes time and memory proportional to the number of nodes
+    in nbunch.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph
+
+    nbunch : list, iterable
+       A container of nodes which will be iterated through once.
+
+    Returns
+    -------
+    H : graph
+       A frozen graph of the same type as G that shares the graph, node
+       and edge attribute dictionaries of G.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> H = nx.subgraph_view(G, [0, 1, 2])
+    >>> sorted(H.edges())
+    [(0, 1), (1, 2)]
+    >>> G.add_edge(0, 2)
+    >>> sorted(H.edges())
+    [(0, 1), (0, 2), (1, 2)]
+    >>> K = H.copy()
+    >>> nx.is_frozen(K)
+    False
+
+    Notes
+    -----
+    Nodes removed from G remain in the view and must not be used.
+
+    See Also
+    --------
+    reverse_view
+    Graph.subgraph
+    """
+    nodes = set(G.nbunch_iter(nbunch))
+    H = _view(G, subgraph_view, list(nodes))
+    H.node = _FilterNodes(G.node, nodes)
+    if G.is_directed():
+        H.succ = _FilterAdjacency(G.succ, nodes)
+        H.pred = _FilterAdjacency(G.pred, nodes)
+        H.adj = H.succ
+    else:
+        H.adj = _FilterAdjacency(G.adj, nodes)
+    H.edge = H.adj
+    return H
+
+
+def reverse_view(G):
+    """Return a read-only view of the directed graph G with its edges
+    reversed.
+
+    Unlike G.reverse() nothing is copied: the view swaps the successors
+    and predecessors of G.
+
+    Parameters
+    ----------
+    G : directed graph
+       A NetworkX directed graph
+
+    Returns
+    -------
+    H : directed graph
+       A frozen graph of the same type as G that shares the graph, node
+       and edge attribute dictionaries of G.
+
+    Raises
+    ------
+    NetworkXError
+       If G is undirected.
+
+    Examples
+    --------
+    >>> G = nx.DiGraph([(0, 1), (1, 2)])
+    >>> R = nx.reverse_view(G)
+    >>> sorted(R.edges())
+    [(1, 0), (2, 1)]
+
+    See Also
+    --------
+    subgraph_view
+    DiGraph.reverse
+    """
+    if not G.is_directed():
+        raise nx.NetworkXError("reverse_view is not defined for "
+                               "undirected graphs.")
+    H = _view(G, reverse_view)
+    H.node = G.node
+    H.succ = G.pred
+    H.pred = G.succ
+    H.adj = H.succ
+    H.edge = H.adj
+    return H
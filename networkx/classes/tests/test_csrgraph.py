@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+from nose import SkipTest
+from nose.tools import *
+import networkx as nx
+
+
+class TestCSRGraph(object):
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G = nx.Graph()
+        G.add_edge('a', 'b', weight=2, color='red')
+        G.add_edge('b', 'c', weight=3)
+        G.add_edge('c', 'c', weight=4)
+        G.add_edge('c', 'd')
+        G.add_node('e', size=7)
+        self.G = G
+        self.C = nx.CSRGraph(G)
+
+    def test_nodes(self):
+        C = self.C
+        assert_equal(sorted(C), ['a', 'b', 'c', 'd', 'e'])
+        assert_equal(len(C), 5)
+        assert_true('a' in C)
+        assert_false('z' in C)
+        assert_false([] in C)
+        assert_equal(C.node['e'], {'size': 7})
+        assert_equal(C.node['a'], {})
+        assert_equal(dict(C.nodes(data=True)), self.G.node)
+
+    def test_adjacency(self):
+        C = self.C
+        assert_equal(dict(C['b'].items()),
+                     {'a': {'weight': 2}, 'c': {'weight': 3}})
+        assert_equal(C['c']['d'], {'weight': 1})
+        assert_equal(sorted(C.neighbors('c')), ['b', 'c', 'd'])
+        assert_equal(sorted(C.neighbors_iter('a')), ['b'])
+        assert_raises(nx.NetworkXError, C.neighbors, 'z')
+        assert_raises(KeyError, C.__getitem__, 'z')
+        assert_true(C.has_edge('a', 'b'))
+        assert_true(C.has_edge('b', 'a'))
+        assert_false(C.has_edge('a', 'c'))
+        assert_false(C.has_edge('a', 'z'))
+        assert_equal(C.get_edge_data('a', 'c', default=0), 0)
+
+    def test_edges(self):
+        C, G = self.C, self.G
+        assert_equal(C.number_of_edges(), 4)
+        assert_equal(sorted(map(sorted, C.edges())),
+                     sorted(map(sorted, G.edges())))
+        assert_equal(sorted(C.edges('c', data=True)),
+                     [('c', 'b', {'weight': 3}), ('c', 'c', {'weight': 4}),
+                      ('c', 'd', {'weight': 1})])
+        assert_equal(C.selfloop_edges(), [('c', 'c')])
+        assert_equal(C.nodes_with_selfloops(), ['c'])
+
+    def test_degree(self):
+        C, G = self.C, self.G
+        assert_equal(C.degree(), G.degree())
+        assert_equal(C.degree(weight='weight'), G.degree(weight='weight'))
+        assert_equal(C.degree(weight='other'), G.degree(weight='other'))
+        assert_equal(C.degree('c'), 4)
+        assert_equal(C.size(weight='weight'), G.size(weight='weight'))
+
+    def test_unweighted(self):
+        C = nx.CSRGraph(self.G, weight=None)
+        assert_true(C.weights is None)
+        assert_equal(C['a']['b'], {})
+        C = nx.CSRGraph(nx.path_graph(3))
+        assert_true(C.weights is None)
+        assert_equal(C.degree(weight='weight'), {0: 1, 1: 2, 2: 1})
+
+    def test_frozen(self):
+        C = self.C
+        assert_true(nx.is_frozen(C))
+        assert_raises(nx.NetworkXError, C.add_edge, 'a', 'c')
+        assert_raises(nx.NetworkXError, C.add_node, 'z')
+        assert_raises(nx.NetworkXError, C.remove_node, 'a')
+        assert_raises(nx.NetworkXError, C.clear)
+
+    def test_algorithms(self):
+        G = nx.gnm_random_graph(100, 300, seed=42)
+        for i, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = i % 7 + 1
+        C = nx.CSRGraph(G)
+        assert_equal(list(nx.bfs_edges(C, 0)), list(nx.bfs_edges(C, 0)))
+        assert_equal(sorted(nx.bfs_edges(C, 0)),
+                     sorted(nx.bfs_edges(nx.Graph(C), 0)))
+        assert_equal(nx.single_source_dijkstra_path_length(C, 0),
+                     nx.single_source_dijkstra_path_length(G, 0))
+        assert_equal(sorted(map(sorted, nx.connected_components(C))),
+                     sorted(map(sorted, nx.connected_components(G))))
+
+    def test_subgraph(self):
+        H = self.C.subgraph(['a', 'b', 'c'])
+        assert_true(isinstance(H, nx.CSRGraph))
+        assert_equal(sorted(H), ['a', 'b', 'c'])
+        assert_equal(sorted(map(sorted, H.edges())),
+                     [['a', 'b'], ['b', 'c'], ['c', 'c']])
+        assert_equal(H['b']['c'], {'weight': 3})
+
+    def test_conversion(self):
+        G = nx.Graph(self.C)
+        assert_equal(G.node['e'], {'size': 7})
+        assert_equal(G['a']['b'], {'weight': 2})
+        D = self.C.to_directed()
+        assert_true(isinstance(D, nx.CSRDiGraph))
+        assert_equal(D.number_of_edges(), 7)
+        C = self.C.copy()
+        assert_equal(sorted(C.edges()), sorted(self.C.edges()))
+
+    def test_from_arrays(self):
+        C = nx.CSRGraph.from_arrays(['x', 'y', 'z'], np.array([0, 1, 3, 4]),
+                                    np.array([1, 0, 2, 1]),
+                                    np.array([1.5, 1.5, 2.0, 2.0]))
+        assert_equal(sorted(C.edges(data=True)),
+                     [('x', 'y', {'weight': 1.5}),
+                      ('y', 'z', {'weight': 2.0})])
+        assert_raises(nx.NetworkXError, nx.CSRGraph.from_arrays,
+                      ['x', 'y'], [0, 1], [1])
+        assert_raises(nx.NetworkXError, nx.CSRGraph.from_arrays,
+                      ['x', 'x'], [0, 0, 0], [])
+
+
+class TestCSRDiGraph(object):
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G = nx.DiGraph()
+        G.add_edge(0, 1, weight=2)
+        G.add_edge(1, 2, weight=3)
+        G.add_edge(2, 0, weight=4)
+        G.add_edge(2, 3, weight=1)
+        G.add_edge(3, 3, weight=5)
+        self.G = G
+        self.C = nx.CSRDiGraph(G)
+
+    def test_successors_predecessors(self):
+        C = self.C
+        assert_true(C.is_directed())
+        assert_equal(sorted(C.successors(2)), [0, 3])
+        assert_equal(sorted(C.neighbors(2)), [0, 3])
+        assert_equal(sorted(C.predecessors(0)), [2])
+        assert_equal(sorted(C.predecessors(3)), [2, 3])
+        assert_true(C.has_successor(0, 1))
+        assert_false(C.has_successor(1, 0))
+        assert_true(C.has_predecessor(1, 0))
+        assert_raises(nx.NetworkXError, C.predecessors, 7)
+        assert_equal(C.pred[1][0], {'weight': 2})
+
+    def test_edges_degree(self):
+        C, G = self.C, self.G
+        assert_equal(sorted(C.edges(data=True)), sorted(G.edges(data=True)))
+        assert_equal(sorted(C.in_edges(data=True)),
+                     sorted(G.in_edges(data=True)))
+        assert_equal(C.number_of_edges(), G.number_of_edges())
+        assert_equal(C.degree(), G.degree())
+        assert_equal(C.in_degree(weight='weight'),
+                     G.in_degree(weight='weight'))
+        assert_equal(C.out_degree(weight='weight'),
+                     G.out_degree(weight='weight'))
+
+    def test_reverse(self):
+        R = self.C.reverse()
+        assert_equal(sorted(R.edges(data=True)),
+                     sorted(self.G.reverse().edges(data=True)))
+        assert_equal(sorted(self.C.edges()), sorted(self.G.edges()))
+        self.C.reverse(copy=False)
+        assert_equal(sorted(self.C.edges()), sorted(R.edges()))
+
+    def test_subgraph(self):
+        H = self.C.subgraph([0, 1, 2])
+        assert_equal(sorted(H.edges()), [(0, 1), (1, 2), (2, 0)])
+        assert_equal(sorted(H.in_edges(0)), [(2, 0)])
+
+    def test_to_undirected(self):
+        U = self.C.to_undirected()
+        assert_true(isinstance(U, nx.CSRGraph))
+        assert_false(U.is_directed())
+        assert_equal(U.number_of_edges(), 5)
+
+    def test_algorithms(self):
+        C = self.C
+        assert_equal(sorted(map(sorted, nx.strongly_connected_components(C))),
+                     [[0, 1, 2], [3]])
+        assert_equal(list(nx.bfs_edges(C, 3, reverse=True)), [(3, 2), (2, 1),
+                                                             (1, 0)])
+        assert_equal(nx.dijkstra_path_length(C, 0, 3), 6)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+from nose.tools import *
+import networkx as nx
+
+
+class TestSubgraphView(object):
+
+    def setUp(self):
+        self.G = nx.Graph(name='test')
+        self.G.add_path([0, 1, 2, 3, 4], weight=2)
+        self.G.add_edge(4, 4)
+        self.G.add_node(0, color='red')
+        self.DG = nx.DiGraph(self.G)
+        self.MG = nx.MultiGraph(self.G)
+        self.MG.add_edge(1, 2, key=5)
+
+    def check(self, G, nbunch):
+        H = nx.subgraph_view(G, nbunch)
+        S = G.subgraph(nbunch)
+        assert_true(nx.is_view(H))
+        assert_true(nx.is_frozen(H))
+        assert_true(isinstance(H, type(G)))
+        assert_equal(type(H.copy()), type(G))
+        assert_equal(sorted(H), sorted(S))
+        assert_equal(len(H), len(S))
+        assert_equal(sorted(H.edges(data=True), key=str),
+                     sorted(S.edges(data=True), key=str))
+        assert_equal(H.degree(), S.degree())
+        assert_equal(H.number_of_edges(), S.number_of_edges())
+        assert_equal(H.graph, G.graph)
+        assert_raises(nx.NetworkXError, H.add_edge, 0, 1)
+        return H
+
+    def test_graph(self):
+        H = self.check(self.G, [0, 1, 2, 4, 7])
+        assert_equal(H.node[0], {'color': 'red'})
+        assert_true(H.has_edge(1, 2))
+        assert_false(H.has_edge(2, 3))
+        assert_false(3 in H)
+        assert_false([] in H)
+        assert_raises(KeyError, H.__getitem__, 3)
+        assert_raises(KeyError, H[2].__getitem__, 3)
+        assert_equal(sorted(H.neighbors(2)), [1])
+        # edge data is shared and later edges are seen
+        H[0][1]['weight'] = 5
+        assert_equal(self.G[0][1]['weight'], 5)
+        self.G.add_edge(0, 2)
+        assert_true(H.has_edge(0, 2))
+
+    def test_digraph(self):
+        H = self.check(self.DG, [1, 2, 3])
+        assert_equal(sorted(H.in_edges()), sorted(H.out_edges()))
+        assert_equal(sorted(H.predecessors(2)), [1, 3])
+
+    def test_multigraph(self):
+        H = self.check(self.MG, [1, 2, 3])
+        assert_equal(sorted(H[1][2]), [0, 5])
+        assert_equal(sorted(H.edges(keys=True)),
+                     sorted(self.MG.subgraph([1, 2, 3]).edges(keys=True)))
+
+    def test_view_of_view(self):
+        H = nx.subgraph_view(nx.subgraph_view(self.G, [0, 1, 2, 3]), [1, 2])
+        assert_equal(H.edges(), [(1, 2)])
+
+    def test_copy(self):
+        H = nx.subgraph_view(self.G, [0, 1, 2])
+        K = H.copy()
+        assert_false(nx.is_view(K))
+        assert_false(nx.is_frozen(K))
+        assert_equal(sorted(K.edges(data=True)), sorted(H.edges(data=True)))
+        assert_equal(K.node[0], {'color': 'red'})
+        K[0][1]['weight'] = 7
+        K.graph['name'] = 'other'
+        assert_equal(self.G[0][1]['weight'], 2)
+        assert_equal(self.G.graph['name'], 'test')
+        K.add_edge(0, 9)
+        assert_false(9 in self.G)
+        M = nx.subgraph_view(self.MG, [1, 2]).copy()
+        assert_equal(sorted(M.edges(keys=True)), [(1, 2, 0), (1, 2, 5)])
+
+    def test_class(self):
+        H = nx.subgraph_view(self.MG, [1, 2])
+        assert_true(isinstance(H, nx.MultiGraph))
+        assert_equal(type(H.copy()), nx.MultiGraph)
+        K = H.__class__()
+        assert_equal(type(K), nx.MultiGraph)
+        K.add_edge(1, 2)
+        assert_equal(type(nx.subgraph_view(H, [1]).copy()), nx.MultiGraph)
+
+    def test_pickle_deepcopy(self):
+        import copy
+        import pickle
+        H = nx.subgraph_view(self.G, [0, 1, 2])
+        P = pickle.loads(pickle.dumps(H, -1))
+        assert_true(nx.is_view(P))
+        assert_true(nx.is_frozen(P))
+        assert_equal(sorted(P.edges(data=True)), sorted(H.edges(data=True)))
+        assert_equal(sorted(P._view_of), sorted(self.G))
+        # A deep copy holds the nodes of the view only.
+        D = copy.deepcopy(H)
+        assert_false(nx.is_view(D))
+        assert_equal(sorted(D), [0, 1, 2])
+        assert_equal(sorted(D.edges(data=True)), sorted(H.edges(data=True)))
+        D[0][1]['weight'] = 7
+        assert_equal(self.G[0][1]['weight'], 2)
+        R = nx.reverse_view(self.DG)
+        P = pickle.loads(pickle.dumps(R, -1))
+        assert_equal(sorted(P.edges()), sorted(R.edges()))
+
+    def test_component_subgraphs(self):
+        for H in nx.connected_component_subgraphs(self.G, copy=False):
+            assert_true(nx.is_view(H))
+        for H in nx.strongly_connected_component_subgraphs(self.DG,
+                                                            copy=False):
+            assert_true(nx.is_view(H))
+            assert_equal(sorted(H), [0, 1, 2, 3, 4])
+
+
+class TestReverseView(object):
+
+    def test_reverse(self):
+        G = nx.DiGraph()
+        G.add_edge(0, 1, weight=3)
+        G.add_edge(1, 2)
+        G.add_node(0, color='red')
+        R = nx.reverse_view(G)
+        assert_true(nx.is_view(R))
+        assert_equal(sorted(R.edges(data=True)),
+                     sorted(G.reverse().edges(data=True)))
+        assert_equal(R.in_degree(), G.out_degree())
+        assert_equal(R.node[0], {'color': 'red'})
+        G.add_edge(2, 3)
+        assert_true(R.has_edge(3, 2))
+        assert_raises(nx.NetworkXError, R.remove_edge, 1, 0)
+        K = R.copy()
+        assert_equal(sorted(K.edges()), [(1, 0), (2, 1), (3, 2)])
+        K.add_edge(0, 1)
+        assert_false(G.has_edge(1, 0))
+        assert_raises(nx.NetworkXError, nx.reverse_view, nx.Graph())
+
+    def test_multidigraph(self):
+        G = nx.MultiDiGraph([(0, 1), (0, 1), (1, 2)])
+        R = nx.reverse_view(G)
+        assert_equal(sorted(R.edges(keys=True)),
+                     [(1, 0, 0), (1, 0, 1), (2, 1, 0)])
+
+    def test_csr(self):
+        try:
+            import numpy
+        except ImportError:
+            from nose import SkipTest
+            raise SkipTest('NumPy not available.')
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0), (2, 3)])
+        R = nx.reverse_view(nx.CSRDiGraph(G))
+        assert_true(isinstance(R, nx.DiGraph))
+        assert_equal(type(R.copy()), nx.DiGraph)
+        assert_equal(sorted(R.edges()), sorted(G.reverse().edges()))
+        H = nx.subgraph_view(nx.CSRDiGraph(G), [0, 1, 2])
+        assert_equal(sorted(H.edges()), [(0, 1), (1, 2), (2, 0)])
@@ -22,6 +22,10 @@ nx_pygraphviz, nx_pydot
 #    All rights reserved.
 #    BSD license.
 import warnings
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 import networkx as nx
 __author__ = """\n""".join(['Aric Hagberg <aric.hagberg@gmail.com>',
                            'Pieter Swart (swart@lanl.gov)',
@@ -93,7 +97,7 @@ def to_networkx_graph(data,create_using=None,multigraph_input=False):
                     multigraph_input=data.is_multigraph())
             if hasattr(data,'graph') and isinstance(data.graph,dict):
                 result.graph=data.graph.copy()
-            if hasattr(data,'node') and isinstance(data.node,dict):
+            if hasattr(data,'node') and isinstance(data.node,Mapping):
                 result.node=dict( (n,dd.copy()) for n,dd in data.node.items() )
             return result
         except:
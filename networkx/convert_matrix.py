@@ -27,6 +27,7 @@ nx_pygraphviz, nx_pydot
 #    All rights reserved.
 #    BSD license.
 import warnings
+from itertools import chain
 import networkx as nx
 from networkx.convert import _prep_create_using
 from networkx.utils import not_implemented_for
@@ -37,6 +38,49 @@ __all__ = ['from_numpy_matrix', 'to_numpy_matrix',
            'to_numpy_recarray',
            'from_scipy_sparse_matrix', 'to_scipy_sparse_matrix']
 
+
+def _node_index(G, nodelist=None):
+    """Return the list of nodes and the map of the nodes to their positions.
+
+    The map is cached on G and reused as long as the list of nodes is the
+    same, so the nodes are only hashed again when they change.
+    """
+    if nodelist is None:
+        nodelist = list(G)
+    else:
+        nodelist = list(nodelist)
+    cached = G.__dict__.get('_node_index')
+    if cached is not None and cached[0] == nodelist:
+        return cached
+    index = dict(zip(nodelist, range(len(nodelist))))
+    if len(index) != len(nodelist):
+        msg = "Ambiguous ordering: `nodelist` contained duplicates."
+        raise nx.NetworkXError(msg)
+    G._node_index = (nodelist, index)
+    return nodelist, index
+
+
+def _adjacency_rows(G, nodelist, index):
+    """Return the neighbor dicts of the nodes in nodelist, restricted
+    to the nodes of index."""
+    adj = G.adj
+    if len(index) == len(G) and all(n in G for n in nodelist):
+        return [adj[u] for u in nodelist]
+    return [dict((v, d) for v, d in adj[u].items() if v in index)
+            if u in G else {} for u in nodelist]
+
+
+def _adjacency_indices(rows, index):
+    """Return the row and column indices of the entries of rows, an
+    adjacency list of neighbor dicts, as NumPy arrays."""
+    import numpy as np
+    counts = np.fromiter(map(len, rows), np.intp, len(rows))
+    row = np.repeat(np.arange(len(rows)), counts)
+    col = np.fromiter(map(index.__getitem__, chain.from_iterable(rows)),
+                      np.intp, len(row))
+    return row, col
+
+
 def to_numpy_matrix(G, nodelist=None, dtype=None, order=None,
                     multigraph_weight=sum, weight='weight', nonedge=0.0):
     """Return the graph adjacency matrix as a NumPy matrix.
@@ -95,6 +139,8 @@ def to_numpy_matrix(G, nodelist=None, dtype=None, order=None,
 
     When `nodelist` does not contain every node in `G`, the matrix is built
     from the subgraph of `G` that is induced by the nodes in `nodelist`.
+    The map of the nodes to their positions is cached on `G` and reused
+    while the nodes and their order stay the same.
 
     The convention used for self-loop edges in graphs is to assign the
     diagonal matrix entry value to the weight attributr of the edge
@@ -124,16 +170,10 @@ def to_numpy_matrix(G, nodelist=None, dtype=None, order=None,
             [ 0.,  0.,  4.]])
     """
     import numpy as np
-    if nodelist is None:
-        nodelist = G.nodes()
-    nodeset = set(nodelist)
-    if len(nodelist) != len(nodeset):
-        msg = "Ambiguous ordering: `nodelist` contained duplicates."
-        raise nx.NetworkXError(msg)
-
-    nlen=len(nodelist)
-    undirected = not G.is_directed()
-    index=dict(zip(nodelist,range(nlen)))
+    nodelist, index = _node_index(G, nodelist)
+    nlen = len(nodelist)
+    rows = _adjacency_rows(G, nodelist, index)
+    row, col = _adjacency_indices(rows, index)
 
     # Initially, we start with an array of nans.  Then we populate the matrix
     # using data from the graph.  Afterwards, any leftover nans will be
@@ -169,7 +209,6 @@ def to_numpy_matrix(G, nodelist=None, dtype=None, order=None,
 
     if G.is_multigraph():
         # Handle MultiGraphs and MultiDiGraphs
-        M = np.zeros((nlen, nlen), dtype=dtype, order=order) + np.nan
         # use numpy nan-aware operations
         operator={sum:np.nansum, min:np.nanmin, max:np.nanmax}
         try:
@@ -177,24 +216,18 @@ def to_numpy_matrix(G, nodelist=None, dtype=None, order=None,
         except:
             raise ValueError('multigraph_weight must be sum, min, or max')
 
-        for u,v,attrs in G.edges_iter(data=True):
-            if (u in nodeset) and (v in nodeset):
-                i, j = index[u], index[v]
-                e_weight = attrs.get(weight, 1)
-                M[i,j] = op([e_weight, M[i,j]])
-                if undirected:
-                    M[j,i] = M[i,j]
+        def combine(keydict):
+            weights = [attrs.get(weight, 1) for attrs in keydict.values()]
+            w = multigraph_weight(weights)
+            if w != w:
+                # Some weights are nan; they are ignored.
+                w = op(weights)
+            return w
+        data = [combine(keydict) for nbrs in rows for keydict in nbrs.values()]
     else:
-        # Graph or DiGraph, this is much faster than above
-        M = np.zeros((nlen,nlen), dtype=dtype, order=order) + np.nan
-        for u,nbrdict in G.adjacency_iter():
-            for v,d in nbrdict.items():
-                try:
-                    M[index[u],index[v]] = d.get(weight,1)
-                except KeyError:
-                    # This occurs when there are fewer desired nodes than
-                    # there are nodes in the graph: len(nodelist) < len(G)
-                    pass
+        data = [d.get(weight, 1) for nbrs in rows for d in nbrs.values()]
+    M = np.zeros((nlen, nlen), dtype=dtype, order=order) + np.nan
+    M[row, col] = data
 
     M[np.isnan(M)] = nonedge
     M = np.asmatrix(M)
@@ -406,9 +439,13 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
     When `nodelist` does not contain every node in `G`, the matrix is built
     from the subgraph of `G` that is induced by the nodes in `nodelist`.
 
-    Uses coo_matrix format. To convert to other formats specify the
+    Uses csr_matrix format. To convert to other formats specify the
     format= keyword.
 
+    The matrix is built from arrays of the indices and weights gathered
+    from the adjacency of `G`.  The map of the nodes to their positions is
+    cached on `G` and reused while the nodes and their order stay the same.
+
     The convention used for self-loop edges in graphs is to assign the
     diagonal matrix entry value to the weight attribute of the edge
     (or the number 1 if the edge has no weight attribute).  If the
@@ -442,43 +479,34 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
     .. [1] Scipy Dev. References, "Sparse Matrices",
        http://docs.scipy.org/doc/scipy/reference/sparse.html
     """
+    import numpy as np
     from scipy import sparse
-    if nodelist is None:
-        nodelist = G
+    nodelist, index = _node_index(G, nodelist)
     nlen = len(nodelist)
     if nlen == 0:
         raise nx.NetworkXError("Graph has no nodes or edges")
 
-    if len(nodelist) != len(set(nodelist)):
-        msg = "Ambiguous ordering: `nodelist` contained duplicates."
-        raise nx.NetworkXError(msg)
-
-    index = dict(zip(nodelist,range(nlen)))
-    if G.number_of_edges() == 0:
-        row,col,data=[],[],[]
-    else:
-        row,col,data = zip(*((index[u],index[v],d.get(weight,1))
-                             for u,v,d in G.edges_iter(nodelist, data=True)
-                             if u in index and v in index))
-    if G.is_directed():
-        M = sparse.coo_matrix((data,(row,col)),
-                              shape=(nlen,nlen), dtype=dtype)
+    # The adjacency of undirected graphs holds both directions of each
+    # edge, and self-loops once, so it gives the rows of the matrix as is.
+    rows = _adjacency_rows(G, nodelist, index)
+    row, col = _adjacency_indices(rows, index)
+    if G.is_multigraph():
+        data = [sum(d.get(weight, 1) for d in keydict.values())
+                for nbrs in rows for keydict in nbrs.values()]
+    elif weight is None:
+        data = np.ones(len(col), dtype=dtype or int)
     else:
-        # symmetrize matrix
-        d = data + data
-        r = row + col
-        c = col + row
-        # selfloop entries get double counted when symmetrizing
-        # so we subtract the data on the diagonal
-        selfloops = G.selfloop_edges(data=True)
-        if selfloops:
-            diag_index,diag_data = zip(*((index[u],-d.get(weight,1))
-                                         for u,v,d in selfloops
-                                         if u in index and v in index))
-            d += diag_data
-            r += diag_index
-            c += diag_index
-        M = sparse.coo_matrix((d, (r, c)), shape=(nlen,nlen), dtype=dtype)
+        data = [d.get(weight, 1) for nbrs in rows for d in nbrs.values()]
+    data = np.asarray(data)
+    if dtype is not None and data.dtype != dtype:
+        # Casting an array, unlike a list, silently maps NaN to an integer.
+        if (np.dtype(dtype).kind in 'biu' and data.dtype.kind in 'fc'
+                and np.isnan(data).any()):
+            raise ValueError("cannot convert float NaN to integer")
+        data = data.astype(dtype)
+    indptr = np.zeros(nlen + 1, dtype=np.intp)
+    np.cumsum(np.bincount(row, minlength=nlen), out=indptr[1:])
+    M = sparse.csr_matrix((data, col, indptr), shape=(nlen, nlen))
     try:
         return M.asformat(format)
     except AttributeError:
@@ -487,26 +515,24 @@ def to_scipy_sparse_matrix(G, nodelist=None, dtype=None,
 
 def _csr_gen_triples(A):
     # Helper function for conversion from csr formatted scipy.sparse matrix.
+    # The indices are expanded with NumPy and converted to lists at once.
+    import numpy as np
     nrows = A.shape[0]
-    data, indices, indptr = A.data, A.indices, A.indptr
-    for i in range(nrows):
-        for j in range(indptr[i], indptr[i+1]):
-            yield i, indices[j], data[j]
+    row = np.repeat(np.arange(nrows), np.diff(A.indptr))
+    return zip(row.tolist(), A.indices.tolist(), A.data.tolist())
 
 
 def _csc_gen_triples(A):
     # Helper function for conversion from csc formatted scipy.sparse matrix.
+    import numpy as np
     ncols = A.shape[1]
-    data, indices, indptr = A.data, A.indices, A.indptr
-    for i in range(ncols):
-        for j in range(indptr[i], indptr[i+1]):
-            yield indices[j], i, data[j]
+    col = np.repeat(np.arange(ncols), np.diff(A.indptr))
+    return zip(A.indices.tolist(), col.tolist(), A.data.tolist())
 
 
 def _coo_gen_triples(A):
     # Helper function for conversion from coo formatted scipy.sparse matrix.
-    row, col, data = A.row, A.col, A.data
-    return zip(row, col, data)
+    return zip(A.row.tolist(), A.col.tolist(), A.data.tolist())
 
 
 def _dok_gen_triples(A):
@@ -165,7 +165,10 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
                                 fixed=None,
                                 iterations=50,
                                 weight='weight',
-                                scale=1.0):
+                                scale=1.0,
+                                method='auto',
+                                theta=1.0,
+                                multilevel=False):
     """Position nodes using Fruchterman-Reingold force-directed algorithm. 
 
     Parameters
@@ -200,12 +203,41 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
         Scale factor for positions. The nodes are positioned 
         in a box of size [0,scale] x [0,scale].  
 
+    method : string  optional (default='auto')
+        How the repulsive forces between all pairs of nodes are
+        computed: 'exact' computes them all, which takes time and
+        memory quadratic in the number of nodes, and 'barnes_hut'
+        approximates the forces of groups of distant nodes, which
+        takes time `O(n \log n)` per iteration.  'auto' uses 'exact'
+        for graphs of less than 500 nodes and 'barnes_hut' otherwise.
+        Earlier versions used 'exact' for all graphs, so graphs of 500
+        nodes or more get different layouts by default; pass
+        method='exact' to keep them.
+
+    theta : float  optional (default=1.0)
+        The accuracy of the 'barnes_hut' method.  Two groups of nodes
+        repel each other as two single nodes when the sum of the sizes
+        of their cells is less than theta times the distance between
+        them.  Smaller values are more accurate and slower.
+
+    multilevel : bool  optional (default=False)
+        If True lay out a sequence of coarser and coarser graphs obtained
+        by merging matched pairs of adjacent nodes, from the coarsest one
+        to G, each layout starting from the previous one.  This gives
+        better layouts of large graphs in less time.  Only used with the
+        'barnes_hut' method and without fixed nodes.
+
 
     Returns
     -------
     dict :
        A dictionary of positions keyed by node
 
+    Raises
+    ------
+    NetworkXError
+       If method is not one of 'auto', 'exact' or 'barnes_hut'.
+
     Examples
     --------
     >>> G=nx.path_graph(4)
@@ -213,6 +245,31 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
 
     # The same using longer function name
     >>> pos=nx.fruchterman_reingold_layout(G)
+
+    # Large graphs
+    >>> G=nx.grid_2d_graph(10, 10)
+    >>> pos=nx.spring_layout(G, method='barnes_hut', multilevel=True)
+
+    Notes
+    -----
+    The 'barnes_hut' method builds a quadtree (an octree in three
+    dimensions) of the node positions at every iteration, with the
+    number and center of the nodes in each cell [1]_, and finds the
+    pairs of well separated cells from the top of the tree down.  It
+    does not require SciPy and takes memory linear in the size of the
+    graph.  The multilevel scheme follows Walshaw [2]_: the graphs are
+    coarsened by random maximal matchings, the coarsest graph is laid out
+    with the given number of iterations and the finer ones with fewer
+    and fewer, down to a few on G itself, so the multilevel layout is
+    faster than the single level one.
+
+    References
+    ----------
+    .. [1] J. Barnes and P. Hut. A hierarchical O(N log N)
+       force-calculation algorithm. Nature 324, 446-449, 1986.
+    .. [2] C. Walshaw. A multilevel algorithm for force-directed
+       graph-drawing. Journal of Graph Algorithms and Applications
+       7(3), 253-285, 2003.
     """
     try:
         import numpy as np
@@ -237,6 +294,24 @@ def fruchterman_reingold_layout(G,dim=2,k=None,
     if len(G)==1:
         return {G.nodes()[0]:(1,)*dim}
 
+    if method not in ('auto', 'exact', 'barnes_hut'):
+        raise nx.NetworkXError("Unknown layout method %s." % (method,))
+    if method == 'barnes_hut' or (method == 'auto' and len(G) >= 500):
+        if k is None and fixed is not None:
+            k=dom_size/np.sqrt(len(G))
+        if pos_arr is None:
+            pos_arr=np.asarray(np.random.random((len(G),dim)))
+        edges=_edge_arrays(G,weight)
+        if multilevel and fixed is None:
+            pos=_multilevel_fruchterman_reingold(edges,pos_arr,k,
+                                                 iterations,theta)
+        else:
+            pos=_barnes_hut_fruchterman_reingold(edges,pos_arr,k,fixed,
+                                                 iterations,theta)
+        if fixed is None:
+            pos=_rescale_layout(pos,scale=scale)
+        return dict(zip(G,pos))
+
     try:
         # Sparse matrix
         if len(G) < 500:  # sparse solver for large graphs
@@ -396,6 +471,281 @@ def _sparse_fruchterman_reingold(A, dim=2, k=None, pos=None, fixed=None,
     return pos
 
 
+def _edge_arrays(G, weight='weight'):
+    # Return arrays (u, v, w) with the edges of G as node indices and
+    # their weights; the edges of undirected graphs are given in both
+    # directions, as in the adjacency matrix.
+    import numpy as np
+    index=dict(zip(G,range(len(G))))
+    u=[]
+    v=[]
+    w=[]
+    for a,b,d in G.edges_iter(data=True):
+        if a!=b:
+            u.append(index[a])
+            v.append(index[b])
+            w.append(1 if weight is None else d.get(weight,1))
+    u=np.array(u,dtype=np.int64)
+    v=np.array(v,dtype=np.int64)
+    w=np.array(w,dtype=float)
+    if not G.is_directed():
+        u,v,w=np.concatenate((u,v)),np.concatenate((v,u)),np.concatenate((w,w))
+    return u,v,w
+
+
+def _ranges(np, starts, counts):
+    # Concatenation of the ranges starts[i], ..., starts[i]+counts[i]-1.
+    total=counts.sum()
+    if total==0:
+        return np.zeros(0,dtype=np.int64)
+    ends=np.cumsum(counts)
+    return np.arange(total)+np.repeat(starts-ends+counts,counts)
+
+
+def _barnes_hut_repulsion(np, pos, mass, k, theta):
+    # Return the repulsive displacement k*k*mass[i]*mass[j]/distance of
+    # every node, approximated with a Barnes-Hut tree of the positions.
+    n,dim=pos.shape
+    lo=pos.min(axis=0)
+    size=(pos.max(axis=0)-lo).max()
+    if size==0:
+        size=1.0
+    # quantize the positions and interleave the bits of the coordinates
+    # so that the nodes of every cell of the tree are consecutive
+    bits=min(30,63//dim)
+    q=((pos-lo)*((2**bits)/size)).astype(np.int64)
+    np.clip(q,0,2**bits-1,out=q)
+    code=np.zeros(n,dtype=np.int64)
+    for b in range(bits-1,-1,-1):
+        for i in range(dim):
+            code=(code<<1)|((q[:,i]>>b)&1)
+    order=np.argsort(code,kind='mergesort')
+    code=code[order]
+    x=pos[order]
+    m=mass[order]
+    mx=x*m[:,None]
+    # cells of each level: number of nodes, mass, center and children
+    counts=[]
+    masses=[]
+    centers=[]
+    first_child=[]
+    prefix=np.zeros(1,dtype=np.int64)
+    cell_start=np.zeros(1,dtype=np.int64)
+    for level in range(bits+1):
+        cm=np.add.reduceat(m,cell_start)
+        counts.append(np.diff(np.append(cell_start,n)))
+        masses.append(cm)
+        centers.append(np.add.reduceat(mx,cell_start)/cm[:,None])
+        if level==bits or counts[-1].max()==1:
+            break
+        child=code>>(dim*(bits-level-1))
+        cell_start=np.flatnonzero(np.diff(child))+1
+        cell_start=np.concatenate(([0],cell_start))
+        child=child[cell_start]
+        first_child.append(np.searchsorted(child>>dim,prefix))
+        first_child[-1]=np.append(first_child[-1],len(child))
+        prefix=child
+    # walk down the tree with the pairs of cells still to be resolved,
+    # each pair once; the forces between well separated cells are
+    # accumulated per unit of mass and then passed down to the nodes
+    last=len(counts)-1
+    force=[np.zeros((len(c),dim)) for c in masses]
+    target=np.zeros(1,dtype=np.int64)
+    source=np.zeros(1,dtype=np.int64)
+    width=size
+    for level in range(last+1):
+        if not len(target):
+            break
+        same=target==source
+        delta=centers[level][target]-centers[level][source]
+        dist2=(delta**2).sum(axis=1)
+        accept=~same
+        if level<last:
+            single=(counts[level][target]==1)&(counts[level][source]==1)
+            accept&=single|(4*width*width<theta*theta*dist2)
+        ta,sa=target[accept],source[accept]
+        delta=delta[accept]*(k*k/np.maximum(dist2[accept],1e-4))[:,None]
+        ncells=len(masses[level])
+        for i in range(dim):
+            force[level][:,i]+=np.bincount(ta,weights=delta[:,i]*masses[level][sa],
+                                           minlength=ncells)
+            force[level][:,i]-=np.bincount(sa,weights=delta[:,i]*masses[level][ta],
+                                           minlength=ncells)
+        if level==last:
+            break
+        # a cell of one node has nothing left to do with itself
+        expand=~accept&~(same&(counts[level][target]==1))
+        target=target[expand]
+        source=source[expand]
+        same=same[expand]
+        fc=first_child[level]
+        nt=fc[target+1]-fc[target]
+        ns=fc[source+1]-fc[source]
+        pair=np.repeat(np.arange(len(target)),nt*ns)
+        r=_ranges(np,np.zeros(len(target),dtype=np.int64),nt*ns)
+        target=fc[target][pair]+r//ns[pair]
+        source=fc[source][pair]+r%ns[pair]
+        # the pairs of children of the same cell are taken once
+        keep=~same[pair]|(target<=source)
+        target=target[keep]
+        source=source[keep]
+        width/=2.0
+    for level in range(last):
+        force[level+1]+=np.repeat(force[level],np.diff(first_child[level]),
+                                  axis=0)
+    disp=np.repeat(force[last],counts[last],axis=0)*m[:,None]
+    result=np.empty_like(disp)
+    result[order]=disp
+    return result
+
+
+def _barnes_hut_fruchterman_reingold(edges, pos, k=None, fixed=None,
+                                     iterations=50, theta=1.0, mass=None,
+                                     t=None):
+    # Position nodes using Fruchterman-Reingold with the repulsive forces
+    # approximated by the Barnes-Hut method.  edges are arrays (u, v, w)
+    # of the arcs and their weights, as returned by _edge_arrays().
+    # Entry point for NetworkX graph is fruchterman_reingold_layout()
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("_barnes_hut_fruchterman_reingold() requires numpy: http://scipy.org/ ")
+    u,v,w=edges
+    pos=np.array(pos,dtype=float)
+    nnodes,dim=pos.shape
+    if mass is None:
+        mass=np.ones(nnodes)
+    # optimal distance between nodes
+    if k is None:
+        k=np.sqrt(1.0/nnodes)
+    # the initial "temperature" is about .1 of the domain size
+    if t is None:
+        t=(pos.max(axis=0)-pos.min(axis=0)).max()*0.1
+    dt=t/float(iterations+1)
+    for iteration in range(iterations):
+        displacement=_barnes_hut_repulsion(np,pos,mass,k,theta)
+        # attraction along the edges
+        delta=pos[u]-pos[v]
+        distance=np.sqrt((delta**2).sum(axis=1))
+        for i in range(dim):
+            displacement[:,i]-=np.bincount(u,weights=delta[:,i]*w*distance/k,
+                                           minlength=nnodes)
+        # update positions
+        length=np.sqrt((displacement**2).sum(axis=1))
+        length=np.where(length<0.01,0.1,length)
+        delta_pos=displacement*(t/length)[:,None]
+        if fixed is not None:
+            # don't change positions of fixed nodes
+            delta_pos[fixed]=0.0
+        pos+=delta_pos
+        # cool temperature
+        t-=dt
+    return pos
+
+
+def _coarsen(np, nnodes, edges, mass):
+    # Merge the nodes matched by a random maximal matching of the edges.
+    # Return the coarse node of every node, the number of coarse nodes
+    # and the arcs and masses of the coarse graph.
+    u,v,w=edges
+    # random keys, the same for both arcs of an edge
+    su=np.concatenate((u,v))
+    sv=np.concatenate((v,u))
+    _,inverse=np.unique(np.minimum(su,sv)*nnodes+np.maximum(su,sv),
+                        return_inverse=True)
+    key=np.random.random(len(su))[inverse]
+    mate=np.full(nnodes,-1,dtype=np.int64)
+    while True:
+        # every unmatched node proposes the free edge of least key; the
+        # edges proposed by both ends are matched
+        free=(mate[su]<0)&(mate[sv]<0)
+        if not free.any():
+            break
+        fu,fv,fk=su[free],sv[free],key[free]
+        order=np.lexsort((fk,fu))
+        fu,fv=fu[order],fv[order]
+        head=np.concatenate(([True],fu[1:]!=fu[:-1]))
+        choice=np.full(nnodes,-1,dtype=np.int64)
+        choice[fu[head]]=fv[head]
+        a=fu[head]
+        b=fv[head]
+        both=choice[b]==a
+        mate[a[both]]=b[both]
+    # number the coarse nodes; as the matching is maximal the neighbors
+    # of the nodes left unmatched are matched, and each such node joins
+    # the pair of one of them, which shrinks stars
+    rep=np.where((mate>=0)&(mate<np.arange(nnodes)),mate,np.arange(nnodes))
+    if len(su):
+        order=np.lexsort((key,su))
+        head=np.concatenate(([True],su[order][1:]!=su[order][:-1]))
+        a=su[order][head]
+        b=sv[order][head]
+        alone=mate[a]<0
+        rep[a[alone]]=rep[b[alone]]
+    roots,coarse=np.unique(rep,return_inverse=True)
+    nc=len(roots)
+    cu,cv=coarse[u],coarse[v]
+    keep=cu!=cv
+    arcs,inverse=np.unique(cu[keep]*nc+cv[keep],return_inverse=True)
+    cw=np.bincount(inverse,weights=w[keep]) if len(arcs) else np.zeros(0)
+    cmass=np.bincount(coarse,weights=mass,minlength=nc)
+    return coarse,nc,(arcs//nc,arcs%nc,cw),cmass
+
+
+def _level_iterations(sizes, iterations):
+    # Iterations of the layouts of graphs of sizes nodes, from the finest
+    # to the coarsest.  They are spent on the coarse graphs, which are
+    # small; the finer graphs start from a good layout and only need a few
+    # cooling steps, fewer the larger they are (Walshaw).
+    steps=min(iterations,5)
+    return [max(iterations*sizes[-1]//n,steps) for n in sizes]
+
+
+def _multilevel_fruchterman_reingold(edges, pos, k=None, iterations=50,
+                                     theta=1.0):
+    # Position nodes using the Barnes-Hut Fruchterman-Reingold layout on
+    # a sequence of coarsened graphs, from the coarsest to the original.
+    # Entry point for NetworkX graph is fruchterman_reingold_layout()
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("_multilevel_fruchterman_reingold() requires numpy: http://scipy.org/ ")
+    nnodes,dim=pos.shape
+    if k is None:
+        k=np.sqrt(1.0/nnodes)
+    mass=np.ones(nnodes)
+    levels=[(nnodes,edges,mass,None)]
+    while levels[-1][0]>50:
+        n,e,m,_=levels[-1]
+        coarse,nc,ce,cm=_coarsen(np,n,e,m)
+        if nc>0.75*n:
+            break
+        levels.append((nc,ce,cm,coarse))
+    # initial positions of the coarser graphs: centers of their nodes
+    positions=[np.asarray(pos,dtype=float)]
+    for n,e,m,coarse in levels[1:]:
+        fine=positions[-1]*levels[len(positions)-1][2][:,None]
+        cpos=np.array([np.bincount(coarse,weights=fine[:,i],minlength=n)
+                       for i in range(dim)]).T/m[:,None]
+        positions.append(cpos)
+    pos=positions[-1]
+    t=None
+    level_iterations=_level_iterations([n for n,e,m,c in levels],
+                                       iterations)
+    for i in range(len(levels)-1,-1,-1):
+        n,e,m,coarse=levels[i]
+        if i<len(levels)-1:
+            # start from the positions of the coarse nodes, perturbed a
+            # little, with moves about as long as their spacing at first
+            extent=(pos.max(axis=0)-pos.min(axis=0)).max()
+            spacing=extent/levels[i+1][0]**(1.0/dim)
+            pos=pos[levels[i+1][3]]+(np.random.random((n,dim))-0.5)*0.1*spacing
+            t=spacing
+        pos=_barnes_hut_fruchterman_reingold(e,pos,k,None,
+                                             level_iterations[i],theta,m,t)
+    return pos
+
+
 def spectral_layout(G, dim=2, weight='weight', scale=1):
     """Position nodes using the eigenvectors of the graph Laplacian. 
 
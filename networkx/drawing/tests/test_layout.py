@@ -1,7 +1,7 @@
 """Unit tests for layout functions."""
 import sys
 from nose import SkipTest
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_true, assert_raises
 import networkx as nx
 
 class TestLayout(object):
@@ -59,3 +59,69 @@ class TestLayout(object):
 
         pos=nx.drawing.layout._sparse_fruchterman_reingold(A,dim=3)
         assert_equal(pos.shape,(6,3))
+
+    def test_barnes_hut(self):
+        G=self.bigG
+        for multilevel in (False, True):
+            pos=nx.spring_layout(G,method='barnes_hut',multilevel=multilevel,
+                                 iterations=10)
+            assert_equal(sorted(pos),sorted(G))
+            assert_true(all(0<=c<=1 for p in pos.values() for c in p))
+        pos=nx.spring_layout(self.Gs,dim=3,method='barnes_hut',
+                             multilevel=True)
+        assert_equal(len(pos['a']),3)
+        pos=nx.spring_layout(G,iterations=5)
+        assert_equal(len(pos),len(G))
+        assert_raises(nx.NetworkXError,nx.spring_layout,G,method='fast')
+
+    def test_level_iterations(self):
+        # The fine levels only get a few iterations, so the multilevel
+        # layout does less work than the single level one.
+        from networkx.drawing.layout import _level_iterations
+        sizes=[2500,1300,680,350,180,95,50]
+        its=_level_iterations(sizes,50)
+        assert_equal(its[0],5)
+        assert_equal(its[-1],50)
+        assert_equal(its,sorted(its))
+        assert_true(sum(n*i for n,i in zip(sizes,its))<50*2500)
+        assert_equal(_level_iterations([40],50),[50])
+        assert_equal(_level_iterations([100,50],3),[3,3])
+
+    def test_barnes_hut_fixed(self):
+        G=self.Gi
+        init={(0,0):(0.0,0.0),(4,4):(1.0,1.0)}
+        pos=nx.spring_layout(G,pos=init,fixed=list(init),
+                             method='barnes_hut',multilevel=True)
+        assert_equal(tuple(pos[(0,0)]),(0.0,0.0))
+        assert_equal(tuple(pos[(4,4)]),(1.0,1.0))
+
+    def test_barnes_hut_repulsion(self):
+        from networkx.drawing.layout import _barnes_hut_repulsion
+        np=numpy
+        rs=np.random.RandomState(0)
+        for dim in (1,2,3):
+            pos=rs.random_sample((100,dim))
+            pos[1]=pos[0]
+            mass=rs.randint(1,4,100).astype(float)
+            delta=pos[:,None,:]-pos[None,:,:]
+            distance2=np.maximum((delta**2).sum(axis=-1),1e-4)
+            force=0.01*mass[:,None]*mass[None,:]/distance2
+            np.fill_diagonal(force,0)
+            exact=(delta*force[:,:,None]).sum(axis=1)
+            approx=_barnes_hut_repulsion(np,pos,mass,0.1,0.0)
+            assert_true(np.allclose(approx,exact))
+            approx=_barnes_hut_repulsion(np,pos,mass,0.1,0.5)
+            assert_true(abs(approx-exact).max()<0.1*abs(exact).max())
+
+    def test_coarsen(self):
+        from networkx.drawing.layout import _coarsen,_edge_arrays
+        np=numpy
+        G=nx.star_graph(20)
+        G.add_edge(30,31)
+        G.add_node(40)
+        n=len(G)
+        coarse,nc,edges,mass=_coarsen(np,n,_edge_arrays(G),np.ones(n))
+        # the star and the edge collapse; the isolated node stays
+        assert_equal(nc,3)
+        assert_equal(sorted(mass.tolist()),[1.0,2.0,21.0])
+        assert_equal(len(edges[0]),0)
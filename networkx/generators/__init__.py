@@ -11,6 +11,7 @@ from networkx.generators.geometric import *
 from networkx.generators.hybrid import *
 from networkx.generators.line import *
 from networkx.generators.random_graphs import *
+from networkx.generators.random_edges import *
 from networkx.generators.small import *
 from networkx.generators.stochastic import *
 from networkx.generators.social import *
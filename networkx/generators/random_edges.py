@@ -0,0 +1,510 @@
+# -*- coding: utf-8 -*-
+"""
+Vectorized generators of the edges of large random graphs.
+
+The generators in this module draw the random numbers of a model in
+blocks with NumPy instead of one at a time, and generate the edges as
+pairs of integer arrays ``(u, v)`` holding about ``chunksize`` edges
+each.  The nodes are the integers ``0, ..., n - 1``.  The chunks can be
+fed to ``add_edges_from`` or assembled into a CSR graph with
+graph_from_edge_chunks(), which makes graphs with billions of edges
+practical to generate.
+
+Each generator uses its own ``numpy.random.RandomState`` seeded with
+``seed``, so the same seed always gives the same edges, independently
+of the ``random`` module.
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+
+__all__ = ['gnp_random_edges',
+           'gnm_random_edges',
+           'expected_degree_edges',
+           'barabasi_albert_edges',
+           'graph_from_edge_chunks']
+
+CHUNKSIZE = 1 << 20
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("random_edges requires NumPy: http://scipy.org/")
+    return np
+
+
+def _skip_sample(np, N, p, rs, chunksize):
+    """Generate sorted arrays of the indices in range(N), each one kept
+    independently with probability p.
+
+    The gaps between kept indices are geometric random variables, which
+    are drawn chunksize at a time.
+    """
+    if N <= 0 or p <= 0:
+        return
+    if p >= 1:
+        for start in range(0, N, chunksize):
+            yield np.arange(start, min(start + chunksize, N), dtype=np.int64)
+        return
+    last = -1
+    while True:
+        # Draw a few more skips than expected to reach the end.
+        expected = (N - 1 - last) * p
+        size = int(min(chunksize, expected + 3 * expected ** 0.5 + 16))
+        idx = last + np.cumsum(rs.geometric(p, size=size))
+        if idx[-1] >= N:
+            idx = idx[idx < N]
+            if len(idx):
+                yield idx
+            return
+        last = idx[-1]
+        yield idx
+
+
+def _unique_sample(np, N, m, rs):
+    """Return a sorted array of m distinct indices drawn uniformly from
+    range(N)."""
+    if 2 * m > N:
+        keep = np.ones(N, dtype=bool)
+        keep[_unique_sample(np, N, N - m, rs)] = False
+        return np.flatnonzero(keep)
+    idx = np.unique(rs.randint(0, N, size=m))
+    while len(idx) < m:
+        idx = np.union1d(idx, rs.randint(0, N, size=m - len(idx)))
+    return idx
+
+
+def _triangle(np, idx, diagonal):
+    """Map the linear indices of the pairs (u, v) with v < u, or v <= u
+    if diagonal is True, in row major order to the arrays u and v."""
+    if not diagonal:
+        u, v = _triangle(np, idx, True)
+        return u + 1, v
+    u = ((np.sqrt(8.0 * idx + 1) - 1) // 2).astype(np.int64)
+    # Correct the rounding errors of the floating point square root.
+    u -= u * (u + 1) // 2 > idx
+    u += (u + 1) * (u + 2) // 2 <= idx
+    return u, idx - u * (u + 1) // 2
+
+
+def _pairs(np, n, idx, directed):
+    """Map the linear indices of the ordered (directed) or unordered
+    pairs of distinct nodes in range(n) to the arrays u and v."""
+    if directed:
+        u, v = np.divmod(idx, n - 1)
+        return u, v + (v >= u)
+    return _triangle(np, idx, False)
+
+
+def _rechunk(np, chunks, chunksize):
+    """Merge the (u, v) chunks smaller than chunksize, skipping empty
+    ones."""
+    us, vs, size = [], [], 0
+    for u, v in chunks:
+        if not len(u):
+            continue
+        us.append(u)
+        vs.append(v)
+        size += len(u)
+        if size >= chunksize:
+            yield np.concatenate(us), np.concatenate(vs)
+            us, vs, size = [], [], 0
+    if size:
+        yield np.concatenate(us), np.concatenate(vs)
+
+
+def gnp_random_edges(n, p, seed=None, directed=False, chunksize=CHUNKSIZE):
+    """Generate the edges of a `G_{n,p}` random graph in chunks.
+
+    Each of the possible edges among the nodes ``0, ..., n - 1`` is
+    present independently with probability p.  As in
+    fast_gnp_random_graph() the possible edges are skipped over with
+    geometric random variables, but here the skips are drawn in blocks
+    with NumPy.  The expected running time is `O(n + m)`.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    p : float
+        Probability for edge creation.
+    seed : int, optional
+        Seed for the random number generator (default=None).
+    directed : bool, optional (default=False)
+        If True generate the arcs of a directed graph.
+    chunksize : int, optional
+        The number of random numbers drawn at a time, and so the number
+        of edges in each chunk, at most.
+
+    Returns
+    -------
+    chunks : generator
+        A generator of pairs ``(u, v)`` of integer arrays; the edges of
+        a chunk are ``zip(u, v)``.
+
+    Examples
+    --------
+    >>> G = nx.graph_from_edge_chunks(100, nx.gnp_random_edges(100, 0.1,
+    ...                                                        seed=42))
+    >>> len(G)
+    100
+
+    See Also
+    --------
+    fast_gnp_random_graph
+    graph_from_edge_chunks
+    """
+    np = _import_numpy()
+    rs = np.random.RandomState(seed)
+    N = n * (n - 1) if directed else n * (n - 1) // 2
+    for idx in _skip_sample(np, N, p, rs, chunksize):
+        yield _pairs(np, n, idx, directed)
+
+
+def gnm_random_edges(n, m, seed=None, directed=False, chunksize=CHUNKSIZE):
+    """Generate the edges of a `G_{n,m}` random graph in chunks.
+
+    The graph is chosen uniformly at random from the set of all graphs
+    with ``n`` nodes and ``m`` edges.  The edges are drawn in blocks
+    with NumPy, with repetitions replaced until m distinct edges are
+    found; when m is more than half the possible edges, the missing
+    edges are drawn instead.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    m : int
+        The number of edges.
+    seed : int, optional
+        Seed for the random number generator (default=None).
+    directed : bool, optional (default=False)
+        If True generate the arcs of a directed graph.
+    chunksize : int, optional
+        The number of edges in each chunk, at most.
+
+    Returns
+    -------
+    chunks : generator
+        A generator of pairs ``(u, v)`` of integer arrays; the edges of
+        a chunk are ``zip(u, v)``.
+
+    Raises
+    ------
+    NetworkXError
+        If m is larger than the number of possible edges.
+
+    Examples
+    --------
+    >>> G = nx.graph_from_edge_chunks(100, nx.gnm_random_edges(100, 300,
+    ...                                                        seed=42))
+    >>> G.number_of_edges()
+    300
+
+    Notes
+    -----
+    All the edges are drawn before the first chunk is generated, which
+    takes memory for m integers.
+
+    See Also
+    --------
+    gnm_random_graph
+    graph_from_edge_chunks
+    """
+    np = _import_numpy()
+    rs = np.random.RandomState(seed)
+    N = n * (n - 1) if directed else n * (n - 1) // 2
+    if m > N:
+        raise nx.NetworkXError("There are only %d possible edges." % N)
+    idx = _unique_sample(np, N, m, rs)
+    return (_pairs(np, n, idx[start:start + chunksize], directed)
+            for start in range(0, m, chunksize))
+
+
+def expected_degree_edges(w, seed=None, selfloops=True, chunksize=CHUNKSIZE):
+    r"""Generate the edges of a random graph with given expected degrees
+    in chunks.
+
+    Given a sequence of expected degrees `W=(w_0,w_1,\ldots,w_{n-1}`)
+    of length `n` this generates the edges of the Chung-Lu random graph
+    of expected_degree_graph(), where an edge between nodes `u` and `v`
+    is present with probability
+
+    .. math::
+
+       p_{uv} = \min\left(1, \frac{w_u w_v}{\sum_k w_k}\right).
+
+    Parameters
+    ----------
+    w : list
+        The list of expected degrees.
+    seed : int, optional
+        Seed for the random number generator (default=None).
+    selfloops : bool, optional (default=True)
+        Set to False to remove the possibility of self-loop edges.
+    chunksize : int, optional
+        The number of random numbers drawn at a time, and the least
+        number of edges in each chunk but the last one.
+
+    Returns
+    -------
+    chunks : generator
+        A generator of pairs ``(u, v)`` of integer arrays; the edges of
+        a chunk are ``zip(u, v)``.
+
+    Examples
+    --------
+    >>> z = [10 for i in range(100)]
+    >>> G = nx.graph_from_edge_chunks(100, nx.expected_degree_edges(z,
+    ...                                                             seed=42))
+
+    Notes
+    -----
+    The nodes are grouped by their weights, the weights in a group being
+    within a factor two of each other.  The pairs of nodes between two
+    groups are skipped over with geometric random variables for the
+    largest probability among them, as in gnp_random_edges(), and the
+    pairs found are then kept with the ratio of their own probability to
+    the largest one.  At least a quarter of the pairs found are kept, and
+    the expected running time is `O(n + m + g^2)` for `g` groups.
+
+    See Also
+    --------
+    expected_degree_graph
+    graph_from_edge_chunks
+    """
+    np = _import_numpy()
+    rs = np.random.RandomState(seed)
+    w = np.asarray(w, dtype=float)
+    if not len(w) or w.sum() == 0:
+        return
+    rho = 1.0 / w.sum()
+    order = np.argsort(-w, kind='mergesort')
+    seq = w[order]
+    seq = seq[seq > 0]
+    group = np.floor(np.log2(seq[0] / seq))
+    bounds = [0] + (np.flatnonzero(np.diff(group)) + 1).tolist() + [len(seq)]
+
+    def chunks():
+        for i in range(len(bounds) - 1):
+            a, b = bounds[i], bounds[i + 1]
+            for j in range(i + 1):
+                c, d = bounds[j], bounds[j + 1]
+                p = min(1.0, seq[a] * seq[c] * rho)
+                if i == j:
+                    N = (b - a) * (b - a + (1 if selfloops else -1)) // 2
+                else:
+                    N = (b - a) * (d - c)
+                for idx in _skip_sample(np, N, p, rs, chunksize):
+                    if i == j:
+                        u, v = _triangle(np, idx, selfloops)
+                        u += a
+                        v += a
+                    else:
+                        u, v = np.divmod(idx, d - c)
+                        u += a
+                        v += c
+                    q = np.minimum(seq[u] * seq[v] * rho, 1.0)
+                    keep = rs.random_sample(len(idx)) * p < q
+                    yield order[u[keep]], order[v[keep]]
+
+    for chunk in _rechunk(np, chunks(), chunksize):
+        yield chunk
+
+
+def barabasi_albert_edges(n, m, seed=None, chunksize=CHUNKSIZE):
+    """Generate the edges of a Barabási-Albert preferential attachment
+    graph in chunks.
+
+    As in barabasi_albert_graph(), the nodes ``m, ..., n - 1`` are
+    added one at a time, each with ``m`` edges to distinct existing
+    nodes chosen with probability proportional to their degree, the
+    first one being attached to the nodes ``0, ..., m - 1``.
+
+    Parameters
+    ----------
+    n : int
+        Number of nodes.
+    m : int
+        Number of edges to attach from a new node to existing nodes.
+    seed : int, optional
+        Seed for the random number generator (default=None).
+    chunksize : int, optional
+        The number of edges drawn at a time, and so the number of edges
+        in each chunk, roughly.
+
+    Returns
+    -------
+    chunks : generator
+        A generator of pairs ``(u, v)`` of integer arrays; the edges of
+        a chunk are ``zip(u, v)``.
+
+    Raises
+    ------
+    NetworkXError
+        If `m` does not satisfy ``1 <= m < n``.
+
+    Examples
+    --------
+    >>> G = nx.graph_from_edge_chunks(100, nx.barabasi_albert_edges(100, 3,
+    ...                                                             seed=42))
+    >>> G.number_of_edges()
+    291
+
+    Notes
+    -----
+    Choosing a node with probability proportional to its degree amounts
+    to choosing a uniformly random entry of the list of the ends of all
+    the edges so far.  The ``2 m`` entries added with each new node are
+    its ``m`` targets followed by ``m`` copies of itself, so the node at
+    any position of the list can be found from the targets of earlier
+    nodes without building the list.  The positions for a block of new
+    nodes are drawn at once and resolved together; positions that
+    repeat a target already chosen for the same node are drawn again.
+    The targets of all the nodes are kept, which takes memory for the
+    ``m (n - m)`` edges of the graph.
+
+    See Also
+    --------
+    barabasi_albert_graph
+    graph_from_edge_chunks
+    """
+    if m < 1 or m >= n:
+        raise nx.NetworkXError("Barabási-Albert network must have m>=1"
+                               " and m<n, m=%d,n=%d" % (m, n))
+    np = _import_numpy()
+    return _barabasi_albert_chunks(np, n, m, np.random.RandomState(seed),
+                                   chunksize)
+
+
+def _barabasi_albert_chunks(np, n, m, rs, chunksize):
+    # Row r of targets holds the targets of node m + r.
+    rows = n - m
+    targets = np.empty((rows, m), dtype=np.int64)
+    targets[0] = np.arange(m)
+    yield np.repeat(m, m), targets[0].copy()
+    start = 1
+    while start < rows:
+        # Few positions refer to nodes in the block when its length is a
+        # small fraction of the number of earlier nodes.
+        stop = min(rows, start + max(1, min(start // 4, chunksize // m)))
+        _attach_block(np, rs, targets, start, stop, m)
+        sources = np.repeat(np.arange(m + start, m + stop), m)
+        yield sources, targets[start:stop].ravel()
+        start = stop
+
+
+def _attach_block(np, rs, targets, start, stop, m):
+    """Choose the targets of the nodes of rows start to stop - 1 of the
+    array targets, all earlier rows being done."""
+    size = stop - start
+    rows = np.arange(start, stop)
+    value = np.empty((size, m), dtype=np.int64)
+    done = np.zeros((size, m), dtype=bool)
+    # Entry o of block b in the list is the o-th target of node m + b if
+    # o < m, otherwise node m + b itself.
+    ref_row = np.empty((size, m), dtype=np.int64)
+    ref_col = np.empty((size, m), dtype=np.int64)
+
+    def draw(ri, ci):
+        b, o = np.divmod(rs.randint(0, 2 * m * rows[ri]), 2 * m)
+        own = o >= m
+        ref_row[ri, ci] = b
+        ref_col[ri, ci] = o
+        value[ri[own], ci[own]] = m + b[own]
+        done[ri, ci] = own
+
+    draw(*np.nonzero(np.ones((size, m), dtype=bool)))
+    final = np.zeros(size, dtype=bool)
+    while not final.all():
+        ri, ci = np.nonzero(~done)
+        r = ref_row[ri, ci]
+        ready = (r < start) | final[np.maximum(r - start, 0)]
+        ri, ci, r = ri[ready], ci[ready], r[ready]
+        value[ri, ci] = targets[r, ref_col[ri, ci]]
+        done[ri, ci] = True
+        idx = np.flatnonzero(~final & done.all(axis=1))
+        if not len(idx):
+            continue
+        perm = np.argsort(value[idx], axis=1, kind='mergesort')
+        ordered = np.take_along_axis(value[idx], perm, axis=1)
+        repeat = np.zeros(perm.shape, dtype=bool)
+        np.put_along_axis(repeat, perm[:, 1:],
+                          ordered[:, 1:] == ordered[:, :-1], axis=1)
+        clean = ~repeat.any(axis=1)
+        final[idx[clean]] = True
+        targets[start + idx[clean]] = value[idx[clean]]
+        ri, ci = np.nonzero(repeat)
+        draw(idx[ri], ci)
+
+
+def graph_from_edge_chunks(n, chunks, directed=False, csr=False):
+    """Return the graph on the nodes ``0, ..., n - 1`` with the edges
+    generated in chunks.
+
+    Parameters
+    ----------
+    n : int
+        The number of nodes.
+    chunks : iterable
+        Pairs ``(u, v)`` of integer arrays, as generated by
+        gnp_random_edges() and the other generators of this module.
+    directed : bool, optional (default=False)
+        If True return a directed graph.
+    csr : bool, optional (default=False)
+        If True return a CSRGraph or CSRDiGraph built directly from the
+        arrays, otherwise a Graph or DiGraph built with add_edges_from.
+
+    Returns
+    -------
+    G : graph
+        The graph with nodes ``0, ..., n - 1`` and the given edges.
+
+    Examples
+    --------
+    >>> chunks = nx.gnp_random_edges(1000, 0.01, seed=1)
+    >>> G = nx.graph_from_edge_chunks(1000, chunks, csr=True)
+    >>> type(G).__name__
+    'CSRGraph'
+
+    Notes
+    -----
+    The edges of a CSR graph are gathered in arrays of two or, for
+    undirected graphs, four integers per edge while the graph is built,
+    instead of the dictionaries of a Graph.
+
+    See Also
+    --------
+    CSRGraph.from_arrays
+    """
+    if not csr:
+        G = nx.DiGraph() if directed else nx.Graph()
+        G.add_nodes_from(range(n))
+        for u, v in chunks:
+            G.add_edges_from(zip(u.tolist(), v.tolist()))
+        return G
+    np = _import_numpy()
+    us, vs = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    for u, v in chunks:
+        us.append(np.asarray(u, dtype=np.int64))
+        vs.append(np.asarray(v, dtype=np.int64))
+        if not directed:
+            # Both directions of the edges are stored, loops once.
+            loop = us[-1] != vs[-1]
+            us.append(vs[-1][loop])
+            vs.append(us[-2][loop])
+    u = np.concatenate(us)
+    v = np.concatenate(vs)
+    del us, vs
+    order = np.lexsort((v, u))
+    indices = v[order]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(u, minlength=n), out=indptr[1:])
+    cls = nx.CSRDiGraph if directed else nx.CSRGraph
+    return cls.from_arrays(np.arange(n), indptr, indices)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+from nose import SkipTest
+from nose.tools import *
+import networkx as nx
+
+
+def edge_set(G):
+    return set(tuple(sorted(e)) for e in G.edges())
+
+
+class TestRandomEdges(object):
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def test_pairs(self):
+        from networkx.generators.random_edges import _pairs, _triangle
+        n = 30
+        u, v = _pairs(np, n, np.arange(n * (n - 1) // 2), False)
+        assert_equal(list(zip(u.tolist(), v.tolist())),
+                     [(a, b) for a in range(n) for b in range(a)])
+        u, v = _pairs(np, n, np.arange(n * (n - 1)), True)
+        assert_equal(list(zip(u.tolist(), v.tolist())),
+                     [(a, b) for a in range(n) for b in range(n) if a != b])
+        u, v = _triangle(np, np.arange(n * (n + 1) // 2), True)
+        assert_equal(list(zip(u.tolist(), v.tolist())),
+                     [(a, b) for a in range(n) for b in range(a + 1)])
+        idx = np.array([10 ** 15 + 12345, 4 * 10 ** 17 + 7])
+        u, v = _triangle(np, idx, False)
+        assert_true(((u * (u - 1) // 2 + v) == idx).all())
+        assert_true((v < u).all())
+
+    def test_gnp(self):
+        chunks = list(nx.gnp_random_edges(200, 0.1, seed=1, chunksize=100))
+        assert_true(all(len(u) <= 100 for u, v in chunks))
+        G = nx.graph_from_edge_chunks(200, chunks)
+        assert_equal(len(G), 200)
+        assert_equal(G.number_of_selfloops(), 0)
+        assert_true(abs(G.number_of_edges() - 1990) < 200)
+        H = nx.graph_from_edge_chunks(200, nx.gnp_random_edges(200, 0.1,
+                                                               seed=1))
+        assert_equal(edge_set(G), edge_set(H))
+        G = nx.graph_from_edge_chunks(10, nx.gnp_random_edges(10, 1))
+        assert_equal(G.number_of_edges(), 45)
+        G = nx.graph_from_edge_chunks(10, nx.gnp_random_edges(10, 0))
+        assert_equal(G.number_of_edges(), 0)
+        D = nx.graph_from_edge_chunks(10, nx.gnp_random_edges(10, 1,
+                                                              directed=True),
+                                      directed=True)
+        assert_true(D.is_directed())
+        assert_equal(D.number_of_edges(), 90)
+
+    def test_gnm(self):
+        for m in (0, 20, 30, 45):
+            G = nx.graph_from_edge_chunks(10, nx.gnm_random_edges(10, m,
+                                                                  seed=2,
+                                                                  chunksize=7))
+            assert_equal(G.number_of_edges(), m)
+            assert_equal(G.number_of_selfloops(), 0)
+        D = nx.graph_from_edge_chunks(10, nx.gnm_random_edges(10, 60,
+                                                              directed=True),
+                                      directed=True)
+        assert_equal(D.number_of_edges(), 60)
+        assert_raises(nx.NetworkXError, nx.gnm_random_edges, 10, 46)
+
+    def test_expected_degree(self):
+        w = [5, 3, 3, 1, 0.5, 0]
+        for selfloops in (True, False):
+            G = nx.graph_from_edge_chunks(6, nx.expected_degree_edges(
+                w, seed=1, selfloops=selfloops))
+            # Pairs of probability one are always present.
+            assert_true(set([(0, 1), (0, 2)]) <= edge_set(G))
+            assert_equal(G.degree(5), 0)
+            if not selfloops:
+                assert_equal(G.number_of_selfloops(), 0)
+        w = [10] * 1000
+        G = nx.graph_from_edge_chunks(1000, nx.expected_degree_edges(w,
+                                                                     seed=3))
+        assert_true(abs(G.number_of_edges() - 5000) < 300)
+        assert_equal(list(nx.expected_degree_edges([])), [])
+
+    def test_barabasi_albert(self):
+        n, m = 2000, 3
+        chunks = nx.barabasi_albert_edges(n, m, seed=5, chunksize=300)
+        G = nx.graph_from_edge_chunks(n, chunks)
+        assert_equal(G.number_of_edges(), m * (n - m))
+        assert_equal(G.number_of_selfloops(), 0)
+        assert_true(all(G.degree(v) >= m for v in range(m, n)))
+        assert_true(nx.is_connected(G))
+        assert_raises(nx.NetworkXError, nx.barabasi_albert_edges, 10, 0)
+        assert_raises(nx.NetworkXError, nx.barabasi_albert_edges, 10, 10)
+
+    def test_csr(self):
+        chunks = list(nx.gnp_random_edges(100, 0.1, seed=4))
+        G = nx.graph_from_edge_chunks(100, chunks)
+        C = nx.graph_from_edge_chunks(100, chunks, csr=True)
+        assert_true(isinstance(C, nx.CSRGraph))
+        assert_equal(sorted(C), sorted(G))
+        assert_equal(edge_set(C), edge_set(G))
+        chunks = list(nx.expected_degree_edges([4] * 50, seed=4))
+        G = nx.graph_from_edge_chunks(50, chunks)
+        C = nx.graph_from_edge_chunks(50, chunks, csr=True)
+        assert_equal(edge_set(C), edge_set(G))
+        chunks = list(nx.gnp_random_edges(50, 0.1, seed=4, directed=True))
+        D = nx.graph_from_edge_chunks(50, chunks, directed=True)
+        C = nx.graph_from_edge_chunks(50, chunks, directed=True, csr=True)
+        assert_true(isinstance(C, nx.CSRDiGraph))
+        assert_equal(sorted(C.edges()), sorted(D.edges()))
@@ -1,3 +1,5 @@
+from networkx.linalg.matrixcache import *
+import networkx.linalg.matrixcache
 from networkx.linalg.attrmatrix import *
 import networkx.linalg.attrmatrix
 from networkx.linalg.spectrum import *
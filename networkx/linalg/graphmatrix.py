@@ -8,6 +8,7 @@ Adjacency matrix and incidence matrix of graphs.
 #    All rights reserved.
 #    BSD license.
 import networkx as nx
+from networkx.linalg.matrixcache import _cached_matrix, _nodes_key
 __author__ = "\n".join(['Aric Hagberg (hagberg@lanl.gov)',
                         'Pieter Swart (swart@lanl.gov)',
                         'Dan Schult(dschult@colgate.edu)'])
@@ -67,7 +68,23 @@ def incidence_matrix(G, nodelist=None, edgelist=None,
     ----------
     .. [1] Gil Strang, Network applications: A = incidence matrix,
        http://academicearth.org/lectures/network-applications-incidence-matrix
+
+    See Also
+    --------
+    cache_matrices
     """
+    def key():
+        edges = None
+        if edgelist is not None:
+            # the nodes and keys of the edges, without their data
+            end = 3 if G.is_multigraph() else 2
+            edges = tuple(tuple(e[:end]) for e in edgelist)
+        return ('incidence', _nodes_key(nodelist), edges, weight, 'csc',
+                oriented)
+    return _cached_matrix(G, key, lambda: _incidence_matrix(
+        G, nodelist, edgelist, oriented, weight))
+
+def _incidence_matrix(G, nodelist, edgelist, oriented, weight):
     import scipy.sparse
     if nodelist is None:
         nodelist = G.nodes()
@@ -154,8 +171,11 @@ def adjacency_matrix(G, nodelist=None, weight='weight'):
     to_numpy_matrix
     to_scipy_sparse_matrix
     to_dict_of_dicts
+    cache_matrices
     """
-    return nx.to_scipy_sparse_matrix(G,nodelist=nodelist,weight=weight)
+    key = lambda: ('adjacency', _nodes_key(nodelist), weight, 'csr')
+    return _cached_matrix(G, key, lambda: nx.to_scipy_sparse_matrix(
+        G, nodelist=nodelist, weight=weight))
 
 adj_matrix=adjacency_matrix
 
@@ -8,6 +8,7 @@
 #    BSD license.
 import networkx as nx
 from networkx.utils import not_implemented_for
+from networkx.linalg.matrixcache import _cached_matrix, _nodes_key
 __author__ = "\n".join(['Aric Hagberg <aric.hagberg@gmail.com>',
                         'Pieter Swart (swart@lanl.gov)',
                         'Dan Schult (dschult@colgate.edu)',
@@ -49,7 +50,13 @@ def laplacian_matrix(G, nodelist=None, weight='weight'):
     --------
     to_numpy_matrix
     normalized_laplacian_matrix
+    cache_matrices
     """
+    key = lambda: ('laplacian', _nodes_key(nodelist), weight, 'csr')
+    return _cached_matrix(G, key,
+                          lambda: _laplacian_matrix(G, nodelist, weight))
+
+def _laplacian_matrix(G, nodelist, weight):
     import scipy.sparse
     if nodelist is None:
         nodelist = G.nodes()
@@ -102,6 +109,7 @@ def normalized_laplacian_matrix(G, nodelist=None, weight='weight'):
     See Also
     --------
     laplacian_matrix
+    cache_matrices
 
     References
     ----------
@@ -111,6 +119,12 @@ def normalized_laplacian_matrix(G, nodelist=None, weight='weight'):
        Laplacian, Electronic Journal of Linear Algebra, Volume 16, pp. 90-98,
        March 2007.
     """
+    key = lambda: ('normalized_laplacian', _nodes_key(nodelist), weight,
+                   'csr')
+    return _cached_matrix(
+        G, key, lambda: _normalized_laplacian_matrix(G, nodelist, weight))
+
+def _normalized_laplacian_matrix(G, nodelist, weight):
     import scipy
     import scipy.sparse
     if nodelist is None:
@@ -191,6 +205,7 @@ def directed_laplacian_matrix(G, nodelist=None, weight='weight',
     See Also
     --------
     laplacian_matrix
+    cache_matrices
 
     References
     ----------
@@ -198,6 +213,12 @@ def directed_laplacian_matrix(G, nodelist=None, weight='weight',
        Laplacians and the Cheeger inequality for directed graphs.
        Annals of Combinatorics, 9(1), 2005
     """
+    key = lambda: ('directed_laplacian', _nodes_key(nodelist), weight,
+                   'dense', walk_type, alpha)
+    return _cached_matrix(G, key, lambda: _directed_laplacian_matrix(
+        G, nodelist, weight, walk_type, alpha))
+
+def _directed_laplacian_matrix(G, nodelist, weight, walk_type, alpha):
     import scipy as sp
     from scipy.sparse import identity, spdiags, linalg
     if walk_type is None:
@@ -0,0 +1,162 @@
+"""
+Matrices of graphs cached until the graph changes.
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import networkx as nx
+from networkx.classes.function import _attach_index, _detach_index
+__all__ = ['MatrixCache', 'cache_matrices', 'uncache_matrices']
+
+
+class MatrixCache(object):
+    """Matrices of a graph kept until the graph changes.
+
+    The matrices built by adjacency_matrix(), incidence_matrix() and the
+    Laplacian functions of a graph with a cache are stored under the
+    function and its arguments, such as the node list, the weight and
+    the format, and later calls return a copy of the stored matrix.
+    Adding or removing nodes and edges through the methods of the graph
+    empties the cache.
+
+    A cache is created and attached to a graph with cache_matrices().
+
+    See Also
+    --------
+    cache_matrices
+    """
+
+    def __init__(self):
+        self._matrices = {}
+
+    def __len__(self):
+        return len(self._matrices)
+
+    def clear(self):
+        """Remove all matrices from the cache."""
+        self._matrices.clear()
+
+    def get(self, key, build):
+        """Return a copy of the matrix stored under key, which is built
+        with build() if it is not in the cache."""
+        try:
+            M = self._matrices[key]
+        except KeyError:
+            M = self._matrices[key] = build()
+        return M.copy()
+
+    # updates, called by the methods of an indexed graph
+
+    def _add_nodes(self, nodes):
+        self.clear()
+
+    def _add_edges(self, edges):
+        # Also called when existing edges are updated, e.g. their weight.
+        self.clear()
+
+    def _remove_edges(self, edges):
+        self.clear()
+
+    def _remove_nodes(self, nbrs):
+        self.clear()
+
+    def _clear(self):
+        self.clear()
+
+
+def _cached_matrix(G, key, build):
+    """Return build(), through the matrix cache of G if it has one.
+
+    key is the key of the matrix in the cache, or a function returning it
+    that is only called if G has a cache.  Matrices with unhashable keys
+    are built without the cache.
+    """
+    cache = getattr(G, 'matrix_cache', None)
+    if cache is None:
+        return build()
+    if callable(key):
+        key = key()
+    try:
+        hash(key)
+    except TypeError:
+        return build()
+    return cache.get(key, build)
+
+
+def _nodes_key(nodes):
+    return None if nodes is None else tuple(nodes)
+
+
+def cache_matrices(G):
+    """Attach a matrix cache to G that is emptied when G changes.
+
+    After this call the sparse matrices of G built by adjacency_matrix(),
+    incidence_matrix(), laplacian_matrix(), normalized_laplacian_matrix()
+    and directed_laplacian_matrix(), and by the spectrum functions that
+    use them, are built once for each set of arguments and copied on the
+    following calls.  Adding or removing nodes and edges through the
+    methods of G empties the cache.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    Returns
+    -------
+    cache : MatrixCache
+       The cache, also available as G.matrix_cache.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> cache = nx.cache_matrices(G)
+    >>> L = nx.laplacian_matrix(G)
+    >>> A = nx.adjacency_matrix(G)
+    >>> len(cache)
+    2
+    >>> G.add_edge(3, 0)
+    >>> len(cache)
+    0
+
+    Notes
+    -----
+    The cache is attached by replacing the mutating methods of G on the
+    instance, like freeze() does; a frozen graph keeps its cache as it
+    cannot change.  Changes made to the adjacency or edge attribute
+    dictionaries directly, such as G[u][v]['weight'] = 2 or
+    set_edge_attributes(), are not seen by the cache; call
+    G.matrix_cache.clear() after them.
+
+    See Also
+    --------
+    uncache_matrices
+    MatrixCache
+    """
+    cache = getattr(G, 'matrix_cache', None)
+    if cache is not None:
+        return cache
+    if nx.is_frozen(G):
+        G.matrix_cache = MatrixCache()
+    else:
+        _attach_index(G, 'matrix_cache', MatrixCache())
+    return G.matrix_cache
+
+
+def uncache_matrices(G):
+    """Remove the matrix cache attached to G, if any.
+
+    Parameters
+    ----------
+    G : NetworkX graph
+
+    See Also
+    --------
+    cache_matrices
+    """
+    if nx.is_frozen(G):
+        G.__dict__.pop('matrix_cache', None)
+    else:
+        _detach_index(G, 'matrix_cache')
@@ -0,0 +1,131 @@
+from nose import SkipTest
+from nose.tools import assert_equal, assert_true, assert_false
+
+import networkx as nx
+
+
+class TestMatrixCache(object):
+    numpy=1 # nosetests attribute, use nosetests -a 'not numpy' to skip test
+    @classmethod
+    def setupClass(cls):
+        global numpy
+        global np_assert_equal
+        try:
+            import numpy
+            import scipy
+            from numpy.testing import assert_equal as np_assert_equal
+        except ImportError:
+             raise SkipTest('SciPy not available.')
+
+    def check(self, G):
+        H = nx.Graph(G) if not G.is_directed() else nx.DiGraph(G)
+        np_assert_equal(nx.adjacency_matrix(G).todense(),
+                        nx.adjacency_matrix(H).todense())
+        np_assert_equal(nx.incidence_matrix(G, oriented=True).todense(),
+                        nx.incidence_matrix(H, oriented=True).todense())
+        if not G.is_directed():
+            np_assert_equal(nx.laplacian_matrix(G).todense(),
+                            nx.laplacian_matrix(H).todense())
+            np_assert_equal(nx.normalized_laplacian_matrix(G).todense(),
+                            nx.normalized_laplacian_matrix(H).todense())
+
+    def test_incidence_edgelist(self):
+        G = nx.path_graph(4)
+        G.add_edge(0, 1, weight=3)
+        expected = nx.incidence_matrix(G, edgelist=G.edges(data=True),
+                                       weight='weight').todense()
+        cache = nx.cache_matrices(G)
+        for i in range(2):
+            M = nx.incidence_matrix(G, edgelist=G.edges(data=True),
+                                    weight='weight')
+            np_assert_equal(M.todense(), expected)
+        assert_equal(len(cache), 1)
+        # a key that cannot be hashed builds the matrix without the cache
+        from networkx.linalg.matrixcache import _cached_matrix
+        M = _cached_matrix(G, ('test', {}),
+                           lambda: nx.to_scipy_sparse_matrix(G))
+        assert_equal(M.shape, (4, 4))
+        assert_equal(len(cache), 1)
+
+    def test_cache(self):
+        G = nx.path_graph(4)
+        cache = nx.cache_matrices(G)
+        assert_true(G.matrix_cache is cache)
+        assert_true(nx.cache_matrices(G) is cache)
+        A = nx.adjacency_matrix(G)
+        assert_equal(len(cache), 1)
+        nx.adjacency_matrix(G)
+        nx.adjacency_matrix(G, weight=None)
+        nx.adjacency_matrix(G, nodelist=[3, 2, 1, 0])
+        assert_equal(len(cache), 3)
+        # the cached matrices are copied
+        A[0, 1] = 5
+        assert_equal(nx.adjacency_matrix(G)[0, 1], 1)
+        nx.laplacian_spectrum(G)
+        nx.adjacency_spectrum(G)
+        assert_equal(len(cache), 4)
+        self.check(G)
+
+    def test_invalidation(self):
+        G = nx.path_graph(4)
+        cache = nx.cache_matrices(G)
+        self.check(G)
+        G.add_edge(0, 3)
+        assert_equal(len(cache), 0)
+        self.check(G)
+        G.add_edge(0, 3, weight=4)
+        self.check(G)
+        G.add_nodes_from([5, 6])
+        self.check(G)
+        G.add_edges_from([(5, 6, {'weight': 2}), (6, 0)])
+        self.check(G)
+        G.remove_edge(1, 2)
+        self.check(G)
+        G.remove_edges_from([(5, 6)])
+        self.check(G)
+        G.remove_node(0)
+        self.check(G)
+        G.remove_nodes_from([5, 6])
+        self.check(G)
+        G[2][3]['weight'] = 7
+        cache.clear()
+        self.check(G)
+        G.clear()
+        assert_equal(len(cache), 0)
+
+    def test_directed(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+        cache = nx.cache_matrices(G)
+        L = nx.directed_laplacian_matrix(G)
+        np_assert_equal(nx.directed_laplacian_matrix(G), L)
+        assert_equal(len(cache), 1)
+        self.check(G)
+        G.add_edge(0, 2)
+        self.check(G)
+        assert_false(numpy.allclose(nx.directed_laplacian_matrix(G), L))
+
+    def test_frozen_uncache(self):
+        G = nx.freeze(nx.path_graph(3))
+        cache = nx.cache_matrices(G)
+        nx.adjacency_matrix(G)
+        assert_equal(len(cache), 1)
+        assert_true(nx.is_frozen(G))
+        nx.uncache_matrices(G)
+        assert_false(hasattr(G, 'matrix_cache'))
+        G = nx.path_graph(3)
+        nx.cache_matrices(G)
+        nx.uncache_matrices(G)
+        assert_false(hasattr(G, 'matrix_cache'))
+        G.add_edge(0, 2)
+        assert_equal(nx.adjacency_matrix(G)[0, 2], 1)
+
+    def test_pickle(self):
+        import pickle
+        G = nx.path_graph(3)
+        nx.cache_matrices(G)
+        nx.adjacency_matrix(G)
+        H = pickle.loads(pickle.dumps(G))
+        H.add_edge(0, 2)
+        assert_equal(len(H.matrix_cache), 0)
+        assert_equal(nx.adjacency_matrix(H)[0, 2], 1)
+        assert_equal(nx.adjacency_matrix(G)[0, 2], 0)
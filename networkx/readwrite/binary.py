@@ -0,0 +1,421 @@
+"""
+*************
+Binary Graphs
+*************
+Read and write NetworkX graphs in a binary format that can be
+memory-mapped.
+
+The graph structure is stored as arrays: the node labels, the edge list
+and a compressed sparse row (CSR) adjacency structure.  Node and edge
+attributes whose values are all booleans, all integers or all floats are
+stored as typed columns; other attributes, node labels that are not
+integers and the graph attributes are pickled in the file header.
+Integer and float edge attributes are also stored in the order of the
+CSR structure, so that they serve as the weights of a CSR graph without
+being copied.
+
+Reading a file maps the arrays into memory with numpy.memmap instead of
+parsing it, so opening even a large graph as a read-only
+:class:`~networkx.CSRGraph` or :class:`~networkx.CSRDiGraph` takes
+almost no time.  The file can also be read into an ordinary graph.
+
+Format
+------
+The file starts with the 8 byte magic string ``NXBIN\\x00\\x01\\x00``,
+followed by the length of the header as a little-endian 64 bit integer
+and the pickled header.  The arrays follow, each one aligned to 64
+bytes, at the offsets given in the header.
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+import numbers
+import struct
+import networkx as nx
+from networkx.utils import open_file, is_string_like
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+__all__ = ['read_binary', 'write_binary']
+
+_MAGIC = b'NXBIN\x00\x01\x00'
+_ALIGN = 64
+
+
+def _import_numpy(name):
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("%s() requires numpy: http://scipy.org/ " % name)
+    return numpy
+
+
+def _column_kind(values):
+    """Return the type of column that stores values without loss."""
+    if all(type(v) is bool for v in values):
+        return 'bool'
+    if all(isinstance(v, numbers.Integral) and not isinstance(v, bool) and
+           -2**63 <= v < 2**63 for v in values):
+        return 'int'
+    if all(type(v) is float for v in values):
+        return 'float'
+    return 'object'
+
+
+def _columns(np, dicts, prefix, arrays):
+    """Split attribute dicts into columns.
+
+    Typed columns and their masks of present values are added to arrays.
+    Return a list of (key, column, mask, values) tuples describing the
+    attributes, where values maps positions to the values of attributes
+    that are not stored in a typed column.
+    """
+    keys = set()
+    for d in dicts:
+        keys.update(d)
+    dtypes = {'bool': '|b1', 'int': '<i8', 'float': '<f8'}
+    attrs = []
+    for j, key in enumerate(keys):
+        present = [i for i, d in enumerate(dicts) if key in d]
+        values = [dicts[i][key] for i in present]
+        kind = _column_kind(values)
+        if kind == 'object':
+            attrs.append((key, None, None, dict(zip(present, values))))
+            continue
+        column = '%s%d' % (prefix, j)
+        arrays[column] = np.zeros(len(dicts), dtype=dtypes[kind])
+        arrays[column][present] = values
+        mask = None
+        if len(present) < len(dicts):
+            mask = column + '_mask'
+            arrays[mask] = np.zeros(len(dicts), dtype='|b1')
+            arrays[mask][present] = True
+        attrs.append((key, column, mask, None))
+    return attrs
+
+
+def _csr(np, n, rows, cols, ids):
+    """Return indptr, indices and edge ids of the CSR structure."""
+    order = np.lexsort((cols, rows))
+    counts = np.bincount(rows, minlength=n) if n else np.zeros(0, int)
+    indptr = np.zeros(n + 1, dtype='<i8')
+    np.cumsum(counts, out=indptr[1:])
+    return (indptr, cols[order].astype('<i8'), ids[order].astype('<i8'))
+
+
+@open_file(1, mode='wb')
+def write_binary(G, path):
+    """Write graph G in binary format.
+
+    Parameters
+    ----------
+    G : graph
+       A NetworkX graph
+
+    path : file or string
+       File or filename to write.  Filenames ending in .gz or .bz2 will
+       be compressed, but such files cannot be memory-mapped.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_binary(G, "test.nxb")
+
+    See Also
+    --------
+    read_binary
+    """
+    np = _import_numpy('write_binary')
+    directed = G.is_directed()
+    multigraph = G.is_multigraph()
+    arrays = {}
+    header = {'directed': directed, 'multigraph': multigraph,
+              'graph': G.graph}
+
+    nodes = G.nodes()
+    n = len(nodes)
+    if _column_kind(nodes) == 'int':
+        arrays['nodes'] = np.array(nodes, dtype='<i8')
+        header['nodes'] = None
+    else:
+        header['nodes'] = nodes
+    index = dict(zip(nodes, range(n)))
+    header['node_attrs'] = _columns(np, [G.node[v] for v in nodes],
+                                    'node_attr', arrays)
+
+    if multigraph:
+        edges = G.edges(keys=True, data=True)
+        keys = [e[2] for e in edges]
+        if _column_kind(keys) == 'int':
+            arrays['edge_keys'] = np.array(keys, dtype='<i8')
+            header['edge_keys'] = None
+        else:
+            header['edge_keys'] = keys
+    else:
+        edges = G.edges(data=True)
+    m = len(edges)
+    u = np.array([index[e[0]] for e in edges], dtype='<i8')
+    v = np.array([index[e[1]] for e in edges], dtype='<i8')
+    arrays['edge_u'] = u
+    arrays['edge_v'] = v
+    header['edge_attrs'] = _columns(np, [e[-1] for e in edges],
+                                    'edge_attr', arrays)
+
+    ids = np.arange(m, dtype='<i8')
+    if directed:
+        (arrays['indptr'], arrays['indices'],
+         arrays['edge_ids']) = _csr(np, n, u, v, ids)
+        (arrays['in_indptr'], arrays['in_indices'],
+         arrays['in_edge_ids']) = _csr(np, n, v, u, ids)
+    else:
+        loop = u == v
+        rows = np.concatenate([u, v[~loop]])
+        cols = np.concatenate([v, u[~loop]])
+        (arrays['indptr'], arrays['indices'],
+         arrays['edge_ids']) = _csr(np, n, rows, cols,
+                                    np.concatenate([ids, ids[~loop]]))
+    for key, column, mask, values in header['edge_attrs']:
+        if column is None or arrays[column].dtype.kind == 'b':
+            continue
+        a = arrays[column]
+        if mask is not None:
+            a = np.where(arrays[mask], a, 1).astype(a.dtype)
+        arrays[column + '_csr'] = a[arrays['edge_ids']]
+        if directed:
+            arrays[column + '_in_csr'] = a[arrays['in_edge_ids']]
+
+    layout = {}
+    offset = 0
+    for name in sorted(arrays):
+        a = np.ascontiguousarray(arrays[name])
+        arrays[name] = a
+        layout[name] = (a.dtype.str, a.shape, offset)
+        offset += -(-a.nbytes // _ALIGN) * _ALIGN
+    header['arrays'] = layout
+
+    data = pickle.dumps(header, 2)
+    start = len(_MAGIC) + 8 + len(data)
+    path.write(_MAGIC)
+    path.write(struct.pack('<Q', len(data)))
+    path.write(data)
+    path.write(b'\x00' * (-start % _ALIGN))
+    for name in sorted(arrays):
+        a = arrays[name]
+        path.write(a.tobytes())
+        path.write(b'\x00' * (-a.nbytes % _ALIGN))
+
+
+def read_binary(path, csr=False, weight='weight', mmap=True):
+    """Read a graph in binary format from path.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read.  A file must be opened in 'rb' mode.
+
+    csr : bool, optional (default=False)
+       If True return a read-only CSRGraph or CSRDiGraph backed by the
+       arrays of the file.  Otherwise return a Graph, DiGraph,
+       MultiGraph or MultiDiGraph, as written.
+
+    weight : string or None, optional (default='weight')
+       The numeric edge attribute used as the weights of a CSR graph;
+       edges without it get weight 1.  If None the CSR graph has no
+       weights.  Other edge attributes are not available on CSR graphs.
+
+    mmap : bool, optional (default=True)
+       If True map the arrays into memory instead of reading them.
+
+    Returns
+    -------
+    G : graph
+       A NetworkX graph
+
+    Raises
+    ------
+    NetworkXError
+       If the file is not in binary format, or csr is True and the graph
+       is a multigraph or the weight attribute is not numeric.
+
+    Examples
+    --------
+    >>> G = nx.path_graph(4)
+    >>> nx.write_binary(G, "test.nxb")
+    >>> H = nx.read_binary("test.nxb")
+    >>> C = nx.read_binary("test.nxb", csr=True)
+    >>> sorted(C.neighbors(1))
+    [0, 2]
+
+    Notes
+    -----
+    Files are mapped read-only, so the arrays of a CSR graph can be
+    shared by processes that read the same file.  Files compressed with
+    .gz or .bz2 cannot be mapped; open them and pass the file with
+    mmap=False.
+
+    See Also
+    --------
+    write_binary
+    CSRGraph
+    """
+    np = _import_numpy('read_binary')
+    if is_string_like(path):
+        fh = open(path, 'rb')
+    else:
+        fh = path
+    try:
+        magic = fh.read(len(_MAGIC))
+        if magic != _MAGIC:
+            raise nx.NetworkXError('Not a NetworkX binary graph file.')
+        size = struct.unpack('<Q', fh.read(8))[0]
+        header = pickle.loads(fh.read(size))
+        start = len(_MAGIC) + 8 + size
+        start += -start % _ALIGN
+        if mmap:
+            buf = np.memmap(fh, dtype=np.uint8, mode='r')
+        else:
+            fh.read(start - len(_MAGIC) - 8 - size)
+            buf = np.frombuffer(fh.read(), dtype=np.uint8)
+            start = 0
+    finally:
+        if fh is not path:
+            fh.close()
+    arrays = {}
+    for name, (dtype, shape, offset) in header['arrays'].items():
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        a = buf[start + offset:start + offset + nbytes]
+        arrays[name] = a.view(dtype).reshape(shape)
+    if csr:
+        return _csr_graph(np, header, arrays, weight)
+    return _graph(np, header, arrays)
+
+
+def _nodes(header, arrays):
+    if header['nodes'] is None:
+        return arrays['nodes'].tolist()
+    return header['nodes']
+
+
+def _attr_dicts(attrs, arrays, count):
+    """Return a list of count attribute dicts from attribute columns."""
+    dicts = [{} for i in range(count)]
+    for key, column, mask, values in attrs:
+        if column is None:
+            for i, value in values.items():
+                dicts[i][key] = value
+            continue
+        values = arrays[column].tolist()
+        if mask is None:
+            for d, value in zip(dicts, values):
+                d[key] = value
+        else:
+            for i in arrays[mask].nonzero()[0].tolist():
+                dicts[i][key] = values[i]
+    return dicts
+
+
+def _graph(np, header, arrays):
+    if header['multigraph']:
+        G = nx.MultiDiGraph() if header['directed'] else nx.MultiGraph()
+    else:
+        G = nx.DiGraph() if header['directed'] else nx.Graph()
+    G.graph.update(header['graph'])
+    nodes = _nodes(header, arrays)
+    if header['node_attrs']:
+        node_data = _attr_dicts(header['node_attrs'], arrays, len(nodes))
+        G.add_nodes_from(zip(nodes, node_data))
+    else:
+        G.add_nodes_from(nodes)
+    u = arrays['edge_u'].tolist()
+    v = arrays['edge_v'].tolist()
+    u = [nodes[i] for i in u]
+    v = [nodes[i] for i in v]
+    if header['multigraph']:
+        edge_data = _attr_dicts(header['edge_attrs'], arrays, len(u))
+        keys = header['edge_keys']
+        if keys is None:
+            keys = arrays['edge_keys'].tolist()
+        G.add_edges_from(zip(u, v, keys, edge_data))
+    elif header['edge_attrs']:
+        edge_data = _attr_dicts(header['edge_attrs'], arrays, len(u))
+        G.add_edges_from(zip(u, v, edge_data))
+    else:
+        G.add_edges_from(zip(u, v))
+    return G
+
+
+def _csr_weights(np, header, arrays, weight, edge_ids, suffix):
+    if weight is None:
+        return None
+    for key, column, mask, values in header['edge_attrs']:
+        if key != weight:
+            continue
+        if column is not None and column + suffix in arrays:
+            # stored in CSR order, used as it is mapped
+            return arrays[column + suffix]
+        if column is None:
+            # mixed numeric types, or not numeric at all
+            column = np.ones(len(arrays['edge_u']))
+            try:
+                for i, value in values.items():
+                    column[i] = value
+            except (TypeError, ValueError):
+                raise nx.NetworkXError('Edge attribute %r is not numeric.'
+                                       % (weight,))
+            return column[edge_ids]
+        values = arrays[column][edge_ids]
+        if mask is not None:
+            values = np.where(arrays[mask][edge_ids], values, 1)
+        return values
+    return None
+
+
+def _csr_graph(np, header, arrays, weight):
+    if header['multigraph']:
+        raise nx.NetworkXError('CSR graphs do not support multigraphs.')
+    nodes = _nodes(header, arrays)
+    node_attr = {}
+    if header['node_attrs']:
+        node_data = _attr_dicts(header['node_attrs'], arrays, len(nodes))
+        node_attr = dict((n, d) for n, d in zip(nodes, node_data) if d)
+    weights = _csr_weights(np, header, arrays, weight, arrays['edge_ids'],
+                           '_csr')
+    if not header['directed']:
+        C = nx.CSRGraph.from_arrays(nodes, arrays['indptr'],
+                                    arrays['indices'], weights, weight,
+                                    node_attr)
+    else:
+        in_weights = _csr_weights(np, header, arrays, weight,
+                                  arrays['in_edge_ids'], '_in_csr')
+        C = nx.CSRDiGraph.from_arrays(nodes, arrays['indptr'],
+                                      arrays['indices'], weights, weight,
+                                      node_attr,
+                                      in_indptr=arrays['in_indptr'],
+                                      in_indices=arrays['in_indices'],
+                                      in_weights=in_weights)
+    # graph attributes may have any key, so they are not passed as
+    # keyword arguments
+    C.graph.update(header['graph'])
+    return C
+
+
+# fixture for nose tests
+def setup_module(module):
+    from nose import SkipTest
+    try:
+        import numpy
+    except:
+        raise SkipTest("NumPy not available")
+
+
+def teardown_module(module):
+    import os
+    if os.path.isfile('test.nxb'):
+        os.unlink('test.nxb')
@@ -37,11 +37,16 @@ __author__ = """Aric Hagberg (hagberg@lanl.gov)\nDan Schult (dschult@colgate.edu
 __all__ = ['generate_edgelist',
            'write_edgelist',
            'parse_edgelist',
+           'parse_edgelist_chunks',
            'read_edgelist',
+           'read_edgelist_chunks',
            'read_weighted_edgelist',
            'write_weighted_edgelist']
 
-from networkx.utils import open_file, make_str
+from itertools import islice
+from os.path import splitext
+from networkx.utils import open_file, make_str, is_string_like
+from networkx.utils.decorators import _dispatch_dict
 import networkx as nx
 
 def generate_edgelist(G, delimiter=' ', data=True):
@@ -172,7 +177,8 @@ def write_edgelist(G, path, comments="#", delimiter=' ', data=True,
         path.write(line.encode(encoding))
 
 def parse_edgelist(lines, comments='#', delimiter=None,
-                   create_using=None, nodetype=None, data=True):
+                   create_using=None, nodetype=None, data=True,
+                   chunksize=100000):
     """Parse lines of an edge list representation of a graph.
 
     Parameters
@@ -191,6 +197,8 @@ def parse_edgelist(lines, comments='#', delimiter=None,
        If False generate no edge data or if True use a dictionary
        representation of edge data or a list tuples specifying dictionary
        key names and types for edge data.
+    chunksize : int, optional
+       Number of lines parsed and added to the graph at once.
 
     Returns
     -------
@@ -235,9 +243,9 @@ def parse_edgelist(lines, comments='#', delimiter=None,
     See Also
     --------
     read_weighted_edgelist
+    parse_edgelist_chunks
 
     """
-    from ast import literal_eval
     if create_using is None:
         G=nx.Graph()
     else:
@@ -247,6 +255,157 @@ def parse_edgelist(lines, comments='#', delimiter=None,
         except:
             raise TypeError("create_using input is not a NetworkX graph type")
 
+    for edges in parse_edgelist_chunks(lines, comments=comments,
+                                       delimiter=delimiter,
+                                       nodetype=nodetype, data=data,
+                                       chunksize=chunksize):
+        G.add_edges_from(edges)
+    return G
+
+
+def parse_edgelist_chunks(lines, comments='#', delimiter=None,
+                          nodetype=None, data=True, chunksize=100000):
+    """Generate lists of edges parsed from lines of an edge list.
+
+    The lines are parsed in blocks of chunksize lines and the edges of
+    each block are yielded as one list, suitable for add_edges_from().
+    No graph is built, so this can be used to aggregate over edge lists
+    that do not fit in memory as a graph.
+
+    Parameters
+    ----------
+    lines : list or iterator of strings
+        Input data in edgelist format
+    comments : string, optional
+       Marker for comment lines
+    delimiter : string, optional
+       Separator for node labels
+    nodetype : Python type, optional
+       Convert nodes to this type.
+    data : bool or list of (label,type) tuples
+       If False generate no edge data or if True use a dictionary
+       representation of edge data or a list tuples specifying dictionary
+       key names and types for edge data.
+    chunksize : int, optional
+       Number of lines parsed at once.
+
+    Returns
+    -------
+    chunks : generator
+       A generator of lists of edges.  Edges are (u, v) tuples if data
+       is False and (u, v, d) tuples with an edge data dictionary d
+       otherwise.
+
+    Examples
+    --------
+    >>> lines = ["1 2 3",
+    ...          "2 3 27",
+    ...          "3 4 3.0"]
+    >>> chunks = nx.parse_edgelist_chunks(lines, nodetype=int,
+    ...                                   data=(('weight',float),),
+    ...                                   chunksize=2)
+    >>> [len(edges) for edges in chunks]
+    [2, 1]
+
+    Notes
+    -----
+    If nodetype is int or float and data is False or a list of int and
+    float types, blocks without comments in which every line has the
+    same number of columns are parsed with NumPy, when available,
+    instead of line by line.
+
+    See Also
+    --------
+    parse_edgelist
+    read_edgelist_chunks
+    """
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    numeric = (numpy is not None and nodetype in (int, float) and
+               (data is False or data is not True and
+                all(t in (int, float) for k, t in data)))
+    lines = iter(lines)
+    while True:
+        block = list(islice(lines, chunksize))
+        if not block:
+            return
+        edges = None
+        if numeric:
+            edges = _parse_numeric(numpy, block, comments, delimiter,
+                                   nodetype, data)
+        if edges is None:
+            edges = list(_parse_lines(block, comments, delimiter, nodetype,
+                                      data))
+        yield edges
+
+
+def _parse_numeric(numpy, block, comments, delimiter, nodetype, data):
+    """Parse a block of lines with numeric columns using NumPy.
+
+    Return None if the block cannot be parsed this way.
+    """
+    import warnings
+    if delimiter is None:
+        text = ' '.join(block)
+    else:
+        text = delimiter.join(block)
+    if comments in text:
+        return None
+    if data is False:
+        types = (nodetype, nodetype)
+    else:
+        types = (nodetype, nodetype) + tuple(t for k, t in data)
+    ncols = len(types)
+    # NumPy does not see the ends of lines, so lines with a different
+    # number of columns are left to the line by line parser.
+    if any(len(line.strip().split(delimiter)) != ncols for line in block):
+        return None
+    dtype = numpy.int64 if all(t is int for t in types) else float
+    with warnings.catch_warnings():
+        # malformed input stops parsing early and is caught below
+        warnings.simplefilter('ignore')
+        try:
+            values = numpy.fromstring(text, dtype=dtype,
+                                      sep=delimiter or ' ')
+        except ValueError:
+            return None
+    if values.size != ncols * len(block):
+        return None
+    values = values.reshape(len(block), ncols)
+    # NumPy clamps integers that do not fit in int64, and floats hold
+    # integers exactly only up to 2**53; such blocks are left to the line
+    # by line parser, which keeps Python integers exact.
+    if dtype is numpy.int64:
+        info = numpy.iinfo(numpy.int64)
+        if values.size and (values.max() == info.max or
+                            values.min() == info.min):
+            return None
+    columns = []
+    for i, t in enumerate(types):
+        column = values[:, i]
+        if t is int and dtype is float:
+            if not (column == numpy.floor(column)).all():
+                return None
+            if column.size and abs(column).max() >= 2 ** 53:
+                return None
+            column = column.astype(numpy.int64)
+        columns.append(column.tolist())
+    if data is False:
+        return list(zip(columns[0], columns[1]))
+    keys = [k for k, t in data]
+    if len(keys) == 1:
+        key = keys[0]
+        edgedata = [{key: d} for d in columns[2]]
+    else:
+        edgedata = [dict(zip(keys, d)) for d in zip(*columns[2:])]
+    return list(zip(columns[0], columns[1], edgedata))
+
+
+def _parse_lines(lines, comments, delimiter, nodetype, data):
+    """Generate the edges of lines of an edge list one line at a time."""
+    from ast import literal_eval
     for line in lines:
         p=line.find(comments)
         if p>=0:
@@ -268,8 +427,11 @@ def parse_edgelist(lines, comments='#', delimiter=None,
                 raise TypeError("Failed to convert nodes %s,%s to type %s."
                                 %(u,v,nodetype))
 
-        if len(d)==0 or data is False:
-            # no data or data type specified
+        if data is False:
+            yield (u, v)
+            continue
+        if len(d)==0:
+            # no data
             edgedata={}
         elif data is True:
             # no edge types specified
@@ -293,12 +455,12 @@ def parse_edgelist(lines, comments='#', delimiter=None,
                         "Failed to convert %s data %s to type %s."
                         %(edge_key, edge_value, edge_type))
                 edgedata.update({edge_key:edge_value})
-        G.add_edge(u, v, attr_dict=edgedata)
-    return G
+        yield (u, v, edgedata)
 
 @open_file(0,mode='rb')
 def read_edgelist(path, comments="#", delimiter=None, create_using=None,
-                  nodetype=None, data=True, edgetype=None, encoding='utf-8'):
+                  nodetype=None, data=True, edgetype=None, encoding='utf-8',
+                  chunksize=100000):
     """Read a graph from a list of edges.
 
     Parameters
@@ -322,6 +484,8 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None,
        Convert edge data from strings to specified type and use as 'weight'
     encoding: string, optional
        Specify which encoding to use when reading file.
+    chunksize : int, optional
+       Number of lines parsed and added to the graph at once.
 
     Returns
     -------
@@ -357,6 +521,7 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None,
     See Also
     --------
     parse_edgelist
+    read_edgelist_chunks
 
     Notes
     -----
@@ -366,7 +531,76 @@ def read_edgelist(path, comments="#", delimiter=None, create_using=None,
     lines = (line.decode(encoding) for line in path)
     return parse_edgelist(lines,comments=comments, delimiter=delimiter,
                           create_using=create_using, nodetype=nodetype,
-                          data=data)
+                          data=data, chunksize=chunksize)
+
+
+def read_edgelist_chunks(path, comments="#", delimiter=None, nodetype=None,
+                         data=True, encoding='utf-8', chunksize=100000):
+    """Generate lists of edges read from an edge list file.
+
+    The file is read and parsed in blocks of chunksize lines without
+    building a graph.  See parse_edgelist_chunks() for details.
+
+    Parameters
+    ----------
+    path : file or string
+       File or filename to read. If a file is provided, it must be
+       opened in 'rb' mode.
+       Filenames ending in .gz or .bz2 will be uncompressed.
+    comments : string, optional
+       The character used to indicate the start of a comment.
+    delimiter : string, optional
+       The string used to separate values.  The default is whitespace.
+    nodetype : int, float, str, Python type, optional
+       Convert node data from strings to specified type
+    data : bool or list of (label,type) tuples
+       Tuples specifying dictionary key names and types for edge data
+    encoding: string, optional
+       Specify which encoding to use when reading file.
+    chunksize : int, optional
+       Number of lines parsed at once.
+
+    Returns
+    -------
+    chunks : generator
+       A generator of lists of edges.  Edges are (u, v) tuples if data
+       is False and (u, v, d) tuples with an edge data dictionary d
+       otherwise.
+
+    Examples
+    --------
+    >>> nx.write_edgelist(nx.path_graph(4), "test.edgelist", data=False)
+    >>> chunks = nx.read_edgelist_chunks("test.edgelist", nodetype=int,
+    ...                                  data=False)
+    >>> sum(len(edges) for edges in chunks)
+    3
+
+    Notes
+    -----
+    A file named by path is opened when iteration starts and closed when
+    the generator is exhausted or closed.
+
+    See Also
+    --------
+    read_edgelist
+    parse_edgelist_chunks
+    """
+    if is_string_like(path):
+        fh = _dispatch_dict[splitext(path)[1]](path, mode='rb')
+        close_fh = True
+    else:
+        fh = path
+        close_fh = False
+    try:
+        lines = (line.decode(encoding) for line in fh)
+        for edges in parse_edgelist_chunks(lines, comments=comments,
+                                           delimiter=delimiter,
+                                           nodetype=nodetype, data=data,
+                                           chunksize=chunksize):
+            yield edges
+    finally:
+        if close_fh:
+            fh.close()
 
 
 def write_weighted_edgelist(G, path, comments="#",
@@ -0,0 +1,142 @@
+"""
+    Unit tests for the binary graph format.
+"""
+import io
+import os
+import tempfile
+from nose import SkipTest
+from nose.tools import *
+import networkx as nx
+from networkx.testing import assert_edges_equal
+
+
+def _buffer(a):
+    # the array owning the memory of a
+    while isinstance(a.base, np.ndarray):
+        a = a.base
+    return a
+
+
+class TestBinary(object):
+    @classmethod
+    def setupClass(cls):
+        global np
+        try:
+            import numpy as np
+        except ImportError:
+            raise SkipTest('NumPy not available.')
+
+    def setUp(self):
+        G = nx.Graph(name='test')
+        G.add_edge('a', 'b', weight=2.5, color='red')
+        G.add_edge('b', 'c', weight=3, flag=True)
+        G.add_edge('c', 'c', weight=1.0)
+        G.add_edge('c', 'd', capacity=10 ** 18)
+        G.add_node('e', size=7, label=('x', 1))
+        self.G = G
+        (fd, self.fname) = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.unlink(self.fname)
+
+    def roundtrip(self, G, **kwds):
+        nx.write_binary(G, self.fname)
+        return nx.read_binary(self.fname, **kwds)
+
+    def assert_same(self, G, H):
+        assert_equal(G.is_directed(), H.is_directed())
+        assert_equal(G.is_multigraph(), H.is_multigraph())
+        assert_equal(G.graph, H.graph)
+        assert_equal(sorted(G.nodes(data=True), key=str),
+                     sorted(H.nodes(data=True), key=str))
+        if G.is_multigraph():
+            assert_equal(sorted(G.edges(keys=True, data=True), key=str),
+                         sorted(H.edges(keys=True, data=True), key=str))
+        else:
+            assert_edges_equal(G.edges(data=True), H.edges(data=True))
+
+    def test_graph(self):
+        H = self.roundtrip(self.G)
+        self.assert_same(self.G, H)
+        assert_equal(type(H['b']['c']['weight']), int)
+        assert_equal(type(H['a']['b']['weight']), float)
+        assert_equal(H['b']['c']['flag'], True)
+        H = self.roundtrip(self.G, mmap=False)
+        self.assert_same(self.G, H)
+
+    def test_graph_types(self):
+        G = nx.DiGraph(self.G)
+        self.assert_same(G, self.roundtrip(G))
+        G = nx.MultiGraph(self.G)
+        G.add_edge('a', 'b', key='other', weight=4)
+        self.assert_same(G, self.roundtrip(G))
+        G = nx.MultiDiGraph(nx.gnm_random_graph(20, 50, seed=1))
+        G.add_edges_from(G.edges())
+        self.assert_same(G, self.roundtrip(G))
+        for G in [nx.Graph(), nx.DiGraph(), nx.MultiGraph()]:
+            self.assert_same(G, self.roundtrip(G))
+
+    def test_file_object(self):
+        fh = io.BytesIO()
+        nx.write_binary(self.G, fh)
+        fh.seek(0)
+        H = nx.read_binary(fh, mmap=False)
+        self.assert_same(self.G, H)
+        fh = io.BytesIO(b'not a graph')
+        assert_raises(nx.NetworkXError, nx.read_binary, fh, mmap=False)
+
+    def test_csr(self):
+        C = self.roundtrip(self.G, csr=True)
+        assert_true(isinstance(C, nx.CSRGraph))
+        assert_equal(C.graph, {'name': 'test'})
+        assert_equal(C.node['e'], {'size': 7, 'label': ('x', 1)})
+        assert_equal(C.degree(weight='weight'),
+                     self.G.degree(weight='weight'))
+        assert_equal(C['c']['d'], {'weight': 1})
+        C = self.roundtrip(self.G, csr=True, weight='capacity')
+        assert_equal(C['c']['d'], {'capacity': 10 ** 18})
+        assert_raises(nx.NetworkXError, self.roundtrip, self.G, csr=True,
+                      weight='color')
+        assert_raises(nx.NetworkXError, self.roundtrip, nx.MultiGraph(),
+                      csr=True)
+
+    def test_csr_directed(self):
+        G = nx.gnm_random_graph(30, 100, seed=2, directed=True)
+        for u, v in G.edges():
+            G[u][v]['weight'] = u * v
+        C = self.roundtrip(G, csr=True)
+        assert_true(isinstance(C, nx.CSRDiGraph))
+        # the arrays, weights included, are views of the mapped file
+        assert_false(C.indices.flags.owndata)
+        assert_true(_buffer(C.weights) is _buffer(C.indices))
+        assert_true(_buffer(C.in_weights) is _buffer(C.indices))
+        assert_edges_equal(C.edges(data=True), G.edges(data=True))
+        assert_edges_equal(C.in_edges(data=True), G.in_edges(data=True))
+        assert_equal(nx.single_source_dijkstra_path_length(C, 0),
+                     nx.single_source_dijkstra_path_length(G, 0))
+
+    def test_csr_missing_weights(self):
+        G = nx.DiGraph([(0, 1), (1, 2), (2, 0)])
+        G[0][1]['weight'] = 5
+        G[1][2]['weight'] = 7
+        C = self.roundtrip(G, csr=True)
+        assert_true(_buffer(C.weights) is _buffer(C.indices))
+        assert_equal(C[2][0], {'weight': 1})
+        assert_equal(C.pred[1][0], {'weight': 5})
+        assert_edges_equal(C.edges(data=True),
+                           [(0, 1, {'weight': 5}), (1, 2, {'weight': 7}),
+                            (2, 0, {'weight': 1})])
+        C = self.roundtrip(nx.path_graph(4), csr=True)
+        assert_equal(C.node[0], {})
+        assert_equal(C[0][1], {})
+
+    def test_csr_graph_attributes(self):
+        # graph attributes named like arguments of from_arrays(), or not
+        # named by strings, are kept
+        attrs = {'weight': 'x', 'node_attr': 1, 'in_indptr': 2, 3: 'three'}
+        for G in (nx.path_graph(3), nx.DiGraph([(0, 1)])):
+            G.graph.update(attrs)
+            C = self.roundtrip(G, csr=True)
+            assert_equal(C.graph, G.graph)
+            assert_equal(C[0][1], {})
@@ -1,7 +1,8 @@
 """
     Unit tests for edgelists.
 """
-from nose.tools import assert_equal, assert_raises, assert_not_equal
+from nose.tools import assert_equal, assert_raises, assert_not_equal, \
+    assert_true
 import io
 import tempfile
 import os
@@ -223,3 +224,68 @@ class TestEdgelist:
         assert_edges_equal(H.edges(),G.edges())
         os.close(fd)
         os.unlink(fname)
+
+    def test_parse_edgelist_chunks(self):
+        lines = ["1 2 2.0", "2 3 3.5", "3 4 1", "", "4 5 2"]
+        chunks = list(nx.parse_edgelist_chunks(lines, nodetype=int,
+                                               data=(('weight', float),),
+                                               chunksize=2))
+        assert_equal(chunks, [[(1, 2, {'weight': 2.0}),
+                               (2, 3, {'weight': 3.5})],
+                              [(3, 4, {'weight': 1.0})],
+                              [(4, 5, {'weight': 2.0})]])
+        assert_equal(type(chunks[0][0][0]), int)
+        chunks = list(nx.parse_edgelist_chunks(lines, nodetype=int,
+                                               data=False))
+        assert_equal(chunks, [[(1, 2), (2, 3), (3, 4), (4, 5)]])
+        lines = ["1,2,7", "2,3,8 # comment", "3,4,x"]
+        assert_raises(TypeError, list,
+                      nx.parse_edgelist_chunks(lines, nodetype=int,
+                                               delimiter=',',
+                                               data=(('w', int),)))
+        chunks = nx.parse_edgelist_chunks(lines[:2], nodetype=int,
+                                          delimiter=',', data=(('w', int),),
+                                          chunksize=1)
+        assert_equal(list(chunks), [[(1, 2, {'w': 7})], [(2, 3, {'w': 8})]])
+
+    def test_parse_edgelist_uneven_columns(self):
+        # The number of values fits two columns but the lines do not.
+        G = nx.parse_edgelist(["1 2 7", "3 4", "5"], nodetype=int, data=False)
+        assert_edges_equal(G.edges(), [(1, 2), (3, 4)])
+        lines = ["1 2 7 8", "3 4", "5 6 2"]
+        assert_raises(IndexError, list,
+                      nx.parse_edgelist_chunks(lines, nodetype=int,
+                                               data=(('w', float),)))
+
+    def test_parse_edgelist_large_integers(self):
+        # Integers that NumPy would clamp or round are kept exact.
+        big = 10 ** 19 + 1
+        G = nx.read_edgelist(io.BytesIO(b"10000000000000000001 2\n"),
+                             nodetype=int, data=False)
+        assert_edges_equal(G.edges(), [(big, 2)])
+        G = nx.parse_edgelist(["%d 2 3" % big, "1 2 -%d" % big],
+                              nodetype=int, data=[('w', int)])
+        assert_edges_equal(G.edges(data=True),
+                           [(big, 2, {'w': 3}), (1, 2, {'w': -big})])
+        G = nx.parse_edgelist(["%d 2 0.5" % (2 ** 53 + 1)], nodetype=int,
+                              data=[('w', float)])
+        assert_edges_equal(G.edges(), [(2 ** 53 + 1, 2)])
+
+    def test_read_edgelist_chunks(self):
+        G = nx.gnm_random_graph(50, 200, seed=1)
+        for u, v in G.edges():
+            G[u][v]['weight'] = u + v
+        (fd, fname) = tempfile.mkstemp(suffix='.gz')
+        nx.write_edgelist(G, fname, data=['weight'])
+        H = nx.Graph()
+        for edges in nx.read_edgelist_chunks(fname, nodetype=int,
+                                             data=(('weight', int),),
+                                             chunksize=30):
+            assert_true(len(edges) <= 30)
+            H.add_edges_from(edges)
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+        H = nx.read_edgelist(fname, nodetype=int, data=(('weight', int),),
+                             chunksize=7)
+        assert_edges_equal(H.edges(data=True), G.edges(data=True))
+        os.close(fd)
+        os.unlink(fname)
@@ -187,3 +187,46 @@ class TestConvertNumpy(object):
         G = nx.DiGraph([(1,1)])
         M = nx.to_scipy_sparse_matrix(G)
         np_assert_equal(M.todense(), np.matrix([[1]]))
+
+    def test_multigraph(self):
+        G = nx.MultiGraph([(0, 1), (0, 1), (1, 1), (1, 1), (1, 2)])
+        G.add_edge(1, 2, weight=5)
+        M = nx.to_scipy_sparse_matrix(G)
+        np_assert_equal(M.todense(),
+                        np.matrix([[0, 2, 0], [2, 2, 6], [0, 6, 0]]))
+        M = nx.to_scipy_sparse_matrix(G, weight=None, nodelist=[2, 1])
+        np_assert_equal(M.todense(), np.matrix([[0, 2], [2, 2]]))
+
+    def test_node_index_cache(self):
+        G = nx.path_graph(4)
+        M = nx.to_scipy_sparse_matrix(G)
+        cached = G._node_index
+        nx.to_scipy_sparse_matrix(G)
+        assert_true(G._node_index is cached)
+        G.add_edge(3, 4)
+        M = nx.to_scipy_sparse_matrix(G)
+        assert_equal(M.shape, (5, 5))
+        np_assert_equal(M.todense(), nx.to_numpy_matrix(G))
+        G.remove_node(0)
+        M = nx.to_scipy_sparse_matrix(G)
+        np_assert_equal(M.todense(), nx.to_numpy_matrix(path_graph(4)))
+
+    def test_from_formats(self):
+        G = nx.gnm_random_graph(20, 40, seed=1, directed=True)
+        for e, (u, v) in enumerate(G.edges()):
+            G[u][v]['weight'] = e + 1
+        A = nx.to_scipy_sparse_matrix(G)
+        for format in ('csr', 'csc', 'coo', 'dok', 'lil'):
+            H = nx.from_scipy_sparse_matrix(A.asformat(format),
+                                            create_using=nx.DiGraph())
+            assert_equal(sorted(H.edges(data=True)),
+                         sorted(G.edges(data=True)))
+
+    def test_nan_weight_int_dtype(self):
+        for G in (nx.Graph(), nx.MultiGraph()):
+            G.add_edge(0, 1, weight=float('nan'))
+            G.add_edge(1, 2, weight=2.0)
+            assert_raises(ValueError, nx.to_scipy_sparse_matrix, G,
+                          dtype=int)
+            M = nx.to_scipy_sparse_matrix(G, dtype=float)
+            assert_true(np.isnan(M[0, 1]))
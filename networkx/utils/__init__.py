@@ -5,3 +5,4 @@ from networkx.utils.union_find import *
 from networkx.utils.rcm import *
 from networkx.utils.heaps import *
 from networkx.utils.contextmanagers import *
+from networkx.utils.parallel import *
@@ -0,0 +1,139 @@
+"""
+Helpers for running graph computations in a pool of worker processes.
+"""
+#    Copyright (C) 2004-2014 by
+#    Aric Hagberg <hagberg@lanl.gov>
+#    Dan Schult <dschult@colgate.edu>
+#    Pieter Swart <swart@lanl.gov>
+#    All rights reserved.
+#    BSD license.
+from itertools import islice
+
+__all__ = ['parallel_imap', 'n_processes']
+
+# Default number of items per task and number of tasks per worker process
+# in flight at once; together they bound the results waiting in memory.
+CHUNKSIZE = 8
+TASKS_PER_PROCESS = 2
+
+# The graph of the current worker process, set once by the pool initializer.
+_worker_graph = None
+
+
+def _init_worker(G):
+    global _worker_graph
+    _worker_graph = G
+
+
+def _run_chunk(task):
+    func, chunk = task
+    G = _worker_graph
+    return [(item, func(G, item)) for item in chunk]
+
+
+def _chunks(items, size):
+    items = iter(items)
+    while True:
+        chunk = list(islice(items, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def n_processes(n_jobs):
+    """Return the number of worker processes requested by n_jobs.
+
+    Parameters
+    ----------
+    n_jobs : int
+        The number of processes.  Negative values count back from the
+        number of CPUs, so -1 means all CPUs and -2 all CPUs but one.
+
+    Returns
+    -------
+    n : int
+        The number of processes, at least 1.
+
+    Raises
+    ------
+    ValueError
+        If n_jobs is 0.
+    """
+    if n_jobs == 0:
+        raise ValueError('n_jobs must not be 0.')
+    if n_jobs < 0:
+        from multiprocessing import cpu_count
+        return max(cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
+def parallel_imap(func, G, items, n_jobs=-1, chunksize=None):
+    """Generate (item, func(G, item)) for all items using worker processes.
+
+    The graph is sent once to each worker process when the pool starts,
+    not with every task.  Items are sent to the workers in chunks and
+    results are yielded as soon as a chunk is done, so they arrive in no
+    particular order.  At most two chunks per worker are submitted ahead
+    of the results consumed, so only a bounded number of results is held
+    in memory however many items there are.
+
+    Parameters
+    ----------
+    func : callable
+        A function func(G, item).  It must be picklable, e.g. a module
+        level function or a functools.partial of one.
+    G : NetworkX graph
+        The graph passed to func.  It must be picklable.
+    items : iterable
+        The items, e.g. source nodes, to process.
+    n_jobs : int, optional (default=-1)
+        The number of worker processes, see n_processes().  With one
+        process func runs in the calling process and no pool is created.
+    chunksize : int, optional (default=None)
+        The number of items sent to a worker at once, 8 by default.
+
+    Returns
+    -------
+    results : generator
+        A generator of (item, func(G, item)) pairs.
+
+    Examples
+    --------
+    >>> from functools import partial
+    >>> import networkx as nx
+    >>> G = nx.path_graph(4)
+    >>> f = partial(nx.single_source_shortest_path_length, cutoff=1)
+    >>> lengths = dict(nx.utils.parallel_imap(f, G, [0, 3], n_jobs=1))
+    >>> lengths[3][2]
+    1
+    """
+    processes = n_processes(n_jobs)
+    if processes == 1:
+        return ((item, func(G, item)) for item in items)
+    if chunksize is None:
+        chunksize = CHUNKSIZE
+    return _parallel_imap(func, G, items, processes, chunksize,
+                          TASKS_PER_PROCESS * processes)
+
+
+def _parallel_imap(func, G, items, processes, chunksize, max_tasks):
+    from multiprocessing import Pool
+    pool = Pool(processes, initializer=_init_worker, initargs=(G,))
+    try:
+        chunks = _chunks(items, chunksize)
+        pending = []
+        while True:
+            for chunk in islice(chunks, max_tasks - len(pending)):
+                pending.append(pool.apply_async(_run_chunk, ((func, chunk),)))
+            if not pending:
+                break
+            # Wait for the oldest task only if none is done yet.
+            done = [r for r in pending if r.ready()] or pending[:1]
+            for r in done:
+                pending.remove(r)
+                for result in r.get():
+                    yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
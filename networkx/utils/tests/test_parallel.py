@@ -0,0 +1,48 @@
+from nose.tools import *
+import networkx as nx
+from networkx.utils import parallel_imap, n_processes
+
+
+def _degree(G, n):
+    return G.degree(n)
+
+
+def test_parallel_imap():
+    G = nx.path_graph(10)
+    expected = [(n, G.degree(n)) for n in G]
+    assert_equal(sorted(parallel_imap(_degree, G, G.nodes(), n_jobs=2)),
+                 expected)
+    assert_equal(sorted(parallel_imap(_degree, G, iter(G), n_jobs=2,
+                                      chunksize=3)),
+                 expected)
+    assert_equal(list(parallel_imap(_degree, G, G.nodes(), n_jobs=1)),
+                 expected)
+    assert_equal(list(parallel_imap(_degree, G, [], n_jobs=2)), [])
+
+
+def _first(G, n):
+    return n
+
+
+def test_parallel_imap_bounded():
+    # Items are drawn from the iterator only as results are consumed:
+    # at most two chunks per process ahead of them.
+    G = nx.path_graph(3)
+    drawn = []
+
+    def items():
+        for i in range(1000):
+            drawn.append(i)
+            yield i
+
+    results = parallel_imap(_first, G, items(), n_jobs=2, chunksize=4)
+    first = [next(results)[1]]
+    assert_true(len(drawn) <= 2 * 2 * 4 + 1)
+    assert_equal(sorted(first + [r for i, r in results]), list(range(1000)))
+
+
+def test_n_processes():
+    assert_equal(n_processes(3), 3)
+    assert_true(n_processes(-1) >= 1)
+    assert_true(n_processes(-2) >= 1)
+    assert_raises(ValueError, n_processes, 0)